@@ -6,6 +6,7 @@ metrics including:
 - Net exposure by instrument
 - Portfolio drawdown statistics
 - Instrument count aggregation
+- Weighted portfolio equity curve (from per-strategy equity curves)
 
 Per FR-013 and FR-014, supports configurable weights with equal-weight fallback.
 """
@@ -14,9 +15,56 @@ from __future__ import annotations
 import logging
 from typing import Any, Mapping, Sequence
 
+import numpy as np
+
+from .trade_ledger import EquityCurve, equity_arrays
+
 logger = logging.getLogger(__name__)
 
 
+def combine_equity_curves(
+    curves: Sequence[Any], weights: Sequence[float]
+) -> EquityCurve | None:
+    """
+    Weighted portfolio equity from per-strategy equity curves.
+
+    Curves are aligned on the union of their timestamps; each strategy
+    contributes its last equity at or before every timestamp (its first
+    equity before it starts). Strategies without a curve are left out and
+    the remaining weights are renormalized.
+
+    Args:
+        curves: Per-strategy EquityCurve, MarkToMarketEquity, list of
+            (timestamp, equity) tuples, or None.
+        weights: Strategy weights, aligned with curves.
+
+    Returns:
+        EquityCurve of the weighted equity, or None if no strategy has one.
+
+    Examples:
+        >>> from datetime import datetime
+        >>> a = [(datetime(2025, 1, 1), 100.0), (datetime(2025, 1, 3), 110.0)]
+        >>> b = [(datetime(2025, 1, 2), 200.0)]
+        >>> combine_equity_curves([a, b], [0.5, 0.5]).equity.tolist()
+        [150.0, 150.0, 155.0]
+    """
+    present = [
+        (weight, equity_arrays(curve))
+        for weight, curve in zip(weights, curves)
+        if curve is not None and len(curve)
+    ]
+    total_weight = sum(weight for weight, _ in present)
+    if not present or total_weight <= 0:
+        return None
+
+    timeline = np.unique(np.concatenate([ns for _, (ns, _) in present]))
+    combined = np.zeros(timeline.size)
+    for weight, (epoch_ns, equity) in present:
+        last = np.maximum(np.searchsorted(epoch_ns, timeline, side="right") - 1, 0)
+        combined += weight * np.asarray(equity, dtype=np.float64)[last]
+    return EquityCurve(timeline, combined / total_weight)
+
+
 class PortfolioAggregator:
     """
     Aggregate per-strategy results into portfolio-level metrics.
@@ -45,7 +93,8 @@ class PortfolioAggregator:
 
         Args:
             results: Sequence of strategy result dicts with keys: name, pnl,
-                max_drawdown (optional), exposure (optional dict).
+                max_drawdown (optional), exposure (optional dict),
+                equity_curve (optional, see combine_equity_curves).
             weights: Strategy weights (must sum to ~1.0).
 
         Returns:
@@ -56,6 +105,8 @@ class PortfolioAggregator:
                 - net_exposure_by_instrument: Aggregated net exposure
                 - weights_applied: Normalized weights used
                 - instruments_count: Distinct instruments
+                - equity_curve: Weighted portfolio EquityCurve, or None if
+                  no strategy reported one
 
         Raises:
             ValueError: If results is empty.
@@ -118,6 +169,9 @@ class PortfolioAggregator:
             "net_exposure_by_instrument": net_exposure,
             "weights_applied": use_weights,
             "instruments_count": instruments_count,
+            "equity_curve": combine_equity_curves(
+                [result.get("equity_curve") for result in results], use_weights
+            ),
         }
 
         logger.info(
@@ -129,4 +183,4 @@ class PortfolioAggregator:
         return summary
 
 
-__all__ = ["PortfolioAggregator"]
+__all__ = ["PortfolioAggregator", "combine_equity_curves"]
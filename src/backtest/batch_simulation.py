@@ -13,6 +13,7 @@ from typing import Optional
 
 import numpy as np
 
+from src.backtest.exit_search import find_first_exits, find_sequential_exits
 from src.backtest.progress import ProgressDispatcher
 from src.backtest.sim_eval import (
     apply_slippage_vectorized,
@@ -21,6 +22,7 @@ from src.backtest.sim_eval import (
     evaluate_stops_vectorized,
     evaluate_targets_vectorized,
 )
+from src.models.signal_batch import SignalBatch
 
 
 logger = logging.getLogger(__name__)
@@ -116,6 +118,7 @@ class BatchSimulation:
         risk_per_trade: float = 0.01,
         enable_progress: bool = True,
         max_concurrent_positions: int | None = 1,
+        max_holding_bars: int | None = None,
     ):
         """Initialize batch simulator.
 
@@ -124,10 +127,13 @@ class BatchSimulation:
             enable_progress: Whether to emit progress updates (default: True)
             max_concurrent_positions: Maximum concurrent positions (default: 1).
                 Set to None for unlimited positions.
+            max_holding_bars: Maximum bars a trade is held before it times out
+                at the close (default: None = until stop/target or end of data)
         """
         self.risk_per_trade = risk_per_trade
         self.enable_progress = enable_progress
         self.max_concurrent_positions = max_concurrent_positions
+        self.max_holding_bars = max_holding_bars
 
     def simulate(
         self,
@@ -172,6 +178,9 @@ class BatchSimulation:
             logger.info("Zero signals - simulation complete in %.3fs", sim_duration)
             return self._create_zero_result(sim_duration)
 
+        # Exits found while filtering are reused by the simulation
+        accepted_exits = None
+
         # Initialize progress tracking
         progress: Optional[ProgressDispatcher] = None
         if self.enable_progress:
@@ -196,26 +205,22 @@ class BatchSimulation:
             and self.max_concurrent_positions > 0
         ):
             original_count = len(signal_indices)
-            original_signal_indices = signal_indices.copy()
 
-            signal_indices = self._filter_signals_vectorized(
+            # Positions of the accepted signals; overlapping signals are
+            # skipped during the exit search rather than simulated
+            kept, accepted_exits = self._filter_signals_vectorized(
                 signal_indices, stop_prices, target_prices, ohlc_arrays, direction
             )
+            signal_indices = signal_indices[kept]
             n_signals = len(signal_indices)
 
-            # Create boolean mask of which positions were kept
-            # Find positions in original array that match kept signal indices
-            kept_mask = np.isin(original_signal_indices, signal_indices)
-
-            # Filter stop/target/position_sizes arrays using the mask
-            stop_prices = (
-                stop_prices[kept_mask] if len(stop_prices) > 0 else stop_prices
-            )
+            # Filter stop/target/position_sizes arrays to the kept positions
+            stop_prices = stop_prices[kept] if len(stop_prices) > 0 else stop_prices
             target_prices = (
-                target_prices[kept_mask] if len(target_prices) > 0 else target_prices
+                target_prices[kept] if len(target_prices) > 0 else target_prices
             )
             position_sizes = (
-                position_sizes[kept_mask] if len(position_sizes) > 0 else position_sizes
+                position_sizes[kept] if len(position_sizes) > 0 else position_sizes
             )
 
             filter_elapsed = time_module.perf_counter() - filter_start
@@ -254,7 +259,12 @@ class BatchSimulation:
         sim_start_trade = time_module.perf_counter()
         logger.info("Starting trade simulation for %d positions...", n_signals)
         trade_outcomes = self._simulate_trades(
-            position_state, timestamps, ohlc_arrays, progress, direction
+            position_state,
+            timestamps,
+            ohlc_arrays,
+            progress,
+            direction,
+            exits=accepted_exits,
         )
         sim_elapsed = time_module.perf_counter() - sim_start_trade
         logger.info("Trade simulation complete in %.2fs", sim_elapsed)
@@ -282,6 +292,42 @@ class BatchSimulation:
 
         return result
 
+    def simulate_signal_batch(
+        self,
+        batch: SignalBatch,
+        timestamps: np.ndarray,
+        ohlc_arrays: tuple[np.ndarray, ...],
+        direction: str = "LONG",
+    ) -> SimulationResult:
+        """Execute batch simulation on the signals of a SignalBatch.
+
+        Reads row indices, stop/target prices and position sizes straight
+        from the batch columns (no TradeSignal objects are created). Only
+        the batch's signals in ``direction`` are simulated.
+
+        Args:
+            batch: SignalBatch whose row indices refer to the OHLC arrays
+            timestamps: Array of all timestamps
+            ohlc_arrays: Tuple of (timestamps, open, high, low, close) arrays
+            direction: Trade direction - "LONG" or "SHORT"
+
+        Returns:
+            SimulationResult with trade outcomes and performance metrics
+
+        Raises:
+            ValueError: If input arrays invalid or misaligned
+        """
+        signals = batch.direction(direction)
+        return self.simulate(
+            signal_indices=signals.indices,
+            stop_prices=signals.stop_prices,
+            target_prices=signals.target_prices,
+            position_sizes=signals.position_sizes,
+            timestamps=timestamps,
+            ohlc_arrays=ohlc_arrays,
+            direction=direction,
+        )
+
     def _validate_inputs(
         self,
         signal_indices: np.ndarray,
@@ -361,11 +407,14 @@ class BatchSimulation:
         target_prices: np.ndarray,
         ohlc_arrays: tuple[np.ndarray, ...],
         direction: str = "LONG",
-    ) -> np.ndarray:
-        """Vectorized position filter for one-trade-at-a-time enforcement.
+    ) -> tuple[np.ndarray, tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Sequential-acceptance position filter (one trade at a time).
 
-        Uses numpy array slicing to quickly estimate exit points for all signals.
-        Uses strategy-provided stop/target prices for accurate exit estimation.
+        Uses the strategy-provided stop/target prices and the same early-exit
+        search as the simulation itself. For sorted signals the search jumps
+        from each accepted trade's exit to the next signal after it, so
+        overlapping signals are never simulated; unsorted input falls back to
+        searching every signal and filtering greedily.
 
         Args:
             signal_indices: Indices of signal candles
@@ -375,70 +424,65 @@ class BatchSimulation:
             direction: Trade direction ("LONG" or "SHORT")
 
         Returns:
-            Filtered signal indices respecting max_concurrent_positions
+            Tuple of (kept, exits): positions (into signal_indices) of the
+            signals kept under max_concurrent_positions, and their
+            (exit_indices, exit_prices, exit_reasons) from find_first_exits
         """
         if len(signal_indices) == 0:
-            return signal_indices
-
-        n_candles = len(ohlc_arrays[0])
-        _, open_prices, high_prices, low_prices, _ = ohlc_arrays
-
-        # Use strategy's stop/target prices (already calculated with ATR)
+            empty = np.array([], dtype=np.int64)
+            return empty, (empty, np.array([]), np.array([], dtype=np.int8))
 
-        # Estimate exit indices for all signals (still need loop but with vectorized checks)
-        max_bars = 100
-        exit_indices = np.zeros(len(signal_indices), dtype=np.int64)
+        _, _open_prices, high_prices, low_prices, close_prices = ohlc_arrays
 
-        for idx, (signal_idx, stop, target) in enumerate(
-            zip(signal_indices, stop_prices, target_prices)
-        ):
-            end_idx = min(signal_idx + max_bars, n_candles)
-            if end_idx <= signal_idx + 1:
-                exit_indices[idx] = signal_idx + 1
-                continue
-
-            # Vectorized check: find first bar where stop OR target hit
-            future_lows = low_prices[signal_idx + 1 : end_idx]
-            future_highs = high_prices[signal_idx + 1 : end_idx]
-
-            # Direction-aware exit detection
-            if direction == "LONG":
-                stop_hit = future_lows <= stop
-                target_hit = future_highs >= target
-            else:  # SHORT
-                stop_hit = future_highs >= stop
-                target_hit = future_lows <= target
-            exit_hit = stop_hit | target_hit
-
-            if exit_hit.any():
-                # Find first hit (argmax returns first True)
-                exit_offset = np.argmax(exit_hit) + 1
-                exit_indices[idx] = signal_idx + exit_offset
-            else:
-                exit_indices[idx] = end_idx - 1
-
-        # Now filter: keep only signals that don't overlap
-        kept_signals = []
-        current_exit_idx = -1
-
-        for signal_idx, exit_idx in zip(signal_indices, exit_indices):
-            if signal_idx <= current_exit_idx:
-                continue
-            kept_signals.append(signal_idx)
-            current_exit_idx = exit_idx
+        direction_value = 1 if direction == "LONG" else -1
+        directions = np.full(len(signal_indices), direction_value, dtype=np.int8)
+
+        if np.all(signal_indices[1:] >= signal_indices[:-1]):
+            kept, *exits = find_sequential_exits(
+                signal_indices,
+                stop_prices,
+                target_prices,
+                directions,
+                high_prices,
+                low_prices,
+                close_prices,
+                max_holding_bars=self.max_holding_bars,
+            )
+        else:
+            exit_indices, exit_prices, exit_reasons = find_first_exits(
+                signal_indices,
+                stop_prices,
+                target_prices,
+                directions,
+                high_prices,
+                low_prices,
+                close_prices,
+                max_holding_bars=self.max_holding_bars,
+            )
+            kept_positions = []
+            current_exit_idx = -1
+            for position, (signal_idx, exit_idx) in enumerate(
+                zip(signal_indices, exit_indices)
+            ):
+                if signal_idx <= current_exit_idx:
+                    continue
+                kept_positions.append(position)
+                current_exit_idx = exit_idx
+            kept = np.array(kept_positions, dtype=np.int64)
+            exits = [exit_indices[kept], exit_prices[kept], exit_reasons[kept]]
 
         original_count = len(signal_indices)
-        filtered_count = len(kept_signals)
+        filtered_count = len(kept)
 
         if filtered_count < original_count:
             logger.info(
-                "Position filter (vectorized): %d -> %d signals (removed %d)",
+                "Position filter (sequential): %d -> %d signals (removed %d)",
                 original_count,
                 filtered_count,
                 original_count - filtered_count,
             )
 
-        return np.array(kept_signals, dtype=np.int64)
+        return kept, tuple(exits)
 
     def _filter_signals_sequential(
         self,
@@ -635,12 +679,16 @@ class BatchSimulation:
     def _simulate_trades(
         self,
         position_state: PositionState,
-        timestamps: np.ndarray,
+        timestamps: np.ndarray,  # pylint: disable=unused-argument
         ohlc_arrays: tuple[np.ndarray, ...],
         progress: Optional[ProgressDispatcher],
-        direction: str = "LONG",
+        direction: str = "LONG",  # pylint: disable=unused-argument
+        exits: Optional[tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
     ) -> dict:
-        """Simulate trades using fully vectorized exit detection.
+        """Simulate trades with an early-exit search per position.
+
+        Per-trade cost scales with holding time rather than a fixed lookahead
+        window (see src.backtest.exit_search).
 
         Args:
             position_state: Position state arrays
@@ -648,15 +696,16 @@ class BatchSimulation:
             ohlc_arrays: OHLC price arrays
             progress: Optional progress dispatcher
             direction: Trade direction - "LONG" or "SHORT"
+            exits: Raw (exit_indices, exit_prices, exit_reasons) already
+                found by the position filter, or None to search here
 
         Returns:
             Dictionary of trade outcomes with PnL and win/loss classification
         """
-        n_candles = len(timestamps)
         n_trades = len(position_state.entry_indices)
 
         # Extract OHLC arrays
-        _, _open_prices, high_prices, low_prices, _close_prices = ohlc_arrays
+        _, _open_prices, high_prices, low_prices, close_prices = ohlc_arrays
 
         # Apply slippage to entry prices
         adjusted_entries = apply_slippage_vectorized(
@@ -665,71 +714,29 @@ class BatchSimulation:
             slippage_pips=0.5,
         )
 
-        # Arrays to track trades
-        exit_prices = np.zeros(n_trades)
-        exit_reasons = np.zeros(n_trades, dtype=np.int8)
-        exit_indices = np.full(n_trades, -1, dtype=np.int64)
-
-        # Vectorized exit detection
-        max_lookahead = 100
-
-        for i in range(n_trades):
-            entry_idx = position_state.entry_indices[i]
-            end_idx = min(entry_idx + max_lookahead, n_candles)
-
-            if end_idx <= entry_idx + 1:
-                # No room to exit
-                exit_indices[i] = entry_idx
-                exit_prices[i] = adjusted_entries[i]
-                exit_reasons[i] = 0  # No exit
-                continue
+        # Early-exit search: stops at each trade's first SL/TP hit
+        # (stop takes priority on the same candle; timeouts exit at the close)
+        if exits is None:
+            exits = find_first_exits(
+                position_state.entry_indices,
+                position_state.stop_prices,
+                position_state.target_prices,
+                position_state.directions,
+                high_prices,
+                low_prices,
+                close_prices,
+                max_holding_bars=self.max_holding_bars,
+            )
+        exit_indices, exit_prices, exit_reasons = (
+            np.array(values, copy=True) for values in exits
+        )
 
-            # Get price slices for this trade's lookahead window
-            future_highs = high_prices[entry_idx + 1 : end_idx]
-            future_lows = low_prices[entry_idx + 1 : end_idx]
-
-            # Check stop and target hits (direction-aware!)
-            stop_price = position_state.stop_prices[i]
-            target_price = position_state.target_prices[i]
-
-            if direction == "LONG":
-                # LONG: stop hit when low <= stop, target hit when high >= target
-                stop_hits = future_lows <= stop_price
-                target_hits = future_highs >= target_price
-            else:  # SHORT
-                # SHORT: stop hit when high >= stop (price goes UP past stop)
-                #        target hit when low <= target (price goes DOWN to target)
-                stop_hits = future_highs >= stop_price
-                target_hits = future_lows <= target_price
-
-            # Find first exit (stop takes priority if both hit same candle)
-            if stop_hits.any() or target_hits.any():
-                stop_idx = np.argmax(stop_hits) if stop_hits.any() else len(future_lows)
-                target_idx = (
-                    np.argmax(target_hits) if target_hits.any() else len(future_highs)
-                )
+        # Trades entered on the final candle have no room to exit
+        no_room = exit_indices == position_state.entry_indices
+        exit_prices[no_room] = adjusted_entries[no_room]
 
-                if stop_idx <= target_idx:
-                    # Stop hit first
-                    exit_offset = stop_idx + 1
-                    exit_indices[i] = entry_idx + exit_offset
-                    exit_prices[i] = stop_price
-                    exit_reasons[i] = 1  # Stop loss
-                else:
-                    # Target hit first
-                    exit_offset = target_idx + 1
-                    exit_indices[i] = entry_idx + exit_offset
-                    exit_prices[i] = target_price
-                    exit_reasons[i] = 2  # Take profit
-            else:
-                # No exit within lookahead - use last price
-                exit_indices[i] = end_idx - 1
-                exit_prices[i] = future_highs[-1]  # Use last high as proxy
-                exit_reasons[i] = 0  # Timeout
-
-            # Update progress periodically
-            if progress is not None and (i + 1) % 5000 == 0:
-                progress.update(i + 1)
+        if progress is not None:
+            progress.update(n_trades)
 
         # Update position state
         position_state.exit_indices = exit_indices
@@ -12,6 +12,7 @@ SC-003 (≤60s load+slice).
 
 from typing import Tuple, Optional, List, TypeVar, Union
 import pandas as pd
+import polars as pl
 
 T = TypeVar("T")
 
@@ -70,11 +71,14 @@ def slice_dataset_list(
 
 
 def slice_dataset(
-    data: Union[pd.DataFrame, List[T]], fraction: float = 1.0, portion: Optional[int] = None
-) -> Union[pd.DataFrame, List[T]]:
+    data: Union[pd.DataFrame, pl.DataFrame, List[T]],
+    fraction: float = 1.0,
+    portion: Optional[int] = None,
+) -> Union[pd.DataFrame, pl.DataFrame, List[T]]:
     """Slice dataset to specified fraction and optional portion.
 
-    Supports both DataFrame and List inputs, dispatching to appropriate handler.
+    Supports pandas/Polars DataFrame and List inputs, dispatching to the
+    appropriate handler.
 
     Args:
         data: Full chronological dataset (DataFrame or List).
@@ -90,6 +94,8 @@ def slice_dataset(
     """
     if isinstance(data, list):
         return slice_dataset_list(data, fraction, portion)
+    if isinstance(data, pl.DataFrame):
+        return slice_dataset_polars(data, fraction, portion)
     return slice_dataset_dataframe(data, fraction, portion)
 
 
@@ -132,6 +138,42 @@ def slice_dataset_dataframe(
     return data.iloc[start_idx:end_idx]
 
 
+def slice_dataset_polars(
+    data: pl.DataFrame, fraction: float = 1.0, portion: Optional[int] = None
+) -> pl.DataFrame:
+    """Slice a Polars DataFrame to specified fraction and optional portion.
+
+    Same row selection as slice_dataset_dataframe; the result is a zero-copy
+    view of the source frame.
+
+    Args:
+        data: Full chronological Polars DataFrame.
+        fraction: Fraction of dataset to use (0 < fraction ≤ 1.0).
+        portion: Optional portion index (1-indexed) when fraction < 1.0.
+
+    Returns:
+        Sliced DataFrame containing selected rows.
+
+    Raises:
+        ValueError: If fraction invalid or portion out of range.
+    """
+    if not 0 < fraction <= 1.0:
+        raise ValueError(f"Fraction must be in (0, 1.0], got {fraction}")
+
+    slice_size = int(data.height * fraction)
+
+    if fraction == 1.0 or portion is None:
+        return data.slice(0, slice_size)
+
+    num_portions = int(1.0 / fraction)
+    if not 1 <= portion <= num_portions:
+        raise ValueError(
+            f"Portion must be in [1, {num_portions}] for fraction={fraction}, got {portion}"
+        )
+
+    return data.slice((portion - 1) * slice_size, slice_size)
+
+
 def chunk_data(data: pd.DataFrame, chunk_size: int) -> Tuple[pd.DataFrame, ...]:
     """Split dataset into fixed-size chunks for streaming processing.
 
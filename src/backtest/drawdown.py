@@ -15,6 +15,8 @@ import numpy as np
 from numpy.typing import NDArray
 
 from ..models.core import TradeExecution
+from .metrics_kernel import compute_performance, performance_from_arrays
+from .trade_ledger import trade_column
 
 
 logger = logging.getLogger(__name__)
@@ -72,7 +74,7 @@ def compute_drawdown_curve(executions: Sequence[TradeExecution]) -> NDArray[np.f
         return np.array([], dtype=np.float64)
 
     # Extract PnL values
-    pnl_r_values = np.array([ex.pnl_r for ex in executions], dtype=np.float64)
+    pnl_r_values = trade_column(executions, "pnl_r")
 
     # Compute cumulative equity curve
     cumulative_equity = np.cumsum(pnl_r_values)
@@ -155,12 +157,7 @@ def compute_max_drawdown(executions: Sequence[TradeExecution]) -> float:
         logger.debug("No executions provided for max drawdown computation")
         return 0.0
 
-    drawdown_curve = compute_drawdown_curve(executions)
-
-    if len(drawdown_curve) == 0:
-        return 0.0
-
-    max_dd = float(np.min(drawdown_curve))
+    max_dd = compute_performance(executions, breakdowns=False).max_drawdown_r
 
     logger.info("Maximum drawdown: %.2fR from %d trades", max_dd, len(executions))
 
@@ -235,7 +232,7 @@ def find_drawdown_periods(
         logger.debug("No executions provided for drawdown period analysis")
         return []
 
-    pnl_r_values = np.array([ex.pnl_r for ex in executions], dtype=np.float64)
+    pnl_r_values = trade_column(executions, "pnl_r")
     cumulative_equity = np.cumsum(pnl_r_values)
     running_max = np.maximum.accumulate(cumulative_equity)
     drawdown_curve = cumulative_equity - running_max
@@ -336,7 +333,7 @@ def compute_recovery_time(
         logger.warning("Invalid drawdown indices for recovery calculation")
         return 0
 
-    pnl_r_values = np.array([ex.pnl_r for ex in executions], dtype=np.float64)
+    pnl_r_values = trade_column(executions, "pnl_r")
     cumulative_equity = np.cumsum(pnl_r_values)
 
     # Peak equity before drawdown
@@ -359,3 +356,67 @@ def compute_recovery_time(
     # No recovery occurred
     logger.debug("No recovery from drawdown starting at %d", drawdown_start_idx)
     return 0
+
+
+def compute_equity_drawdown_curve(
+    equity: NDArray[np.floating],
+    starting_equity: float | None = None,
+) -> NDArray[np.floating]:
+    """
+    Compute the dollar drawdown curve of a per-bar equity series.
+
+    Works on the bar-resolution equity of a mark-to-market run
+    (``MarkToMarketEquity.equity``), so drawdown from open positions is
+    included. The result keeps the input dtype (float32 for a compact
+    mark-to-market series).
+
+    Args:
+        equity: Equity per bar.
+        starting_equity: Equity before the first bar; counts as the first
+            peak when given.
+
+    Returns:
+        Equity minus its running peak per bar (all ≤ 0). Empty array if no
+        bars provided.
+
+    Examples:
+        >>> compute_equity_drawdown_curve(np.array([100.0, 110.0, 95.0, 120.0]))
+        array([  0.,   0., -15.,   0.])
+    """
+    equity = np.asarray(equity)
+    if equity.size == 0:
+        return equity.copy()
+
+    running_max = np.maximum.accumulate(equity)
+    if starting_equity is not None:
+        running_max = np.maximum(running_max, equity.dtype.type(starting_equity))
+    return equity - running_max
+
+
+def compute_max_equity_drawdown(
+    equity: NDArray[np.floating],
+    starting_equity: float | None = None,
+) -> float:
+    """
+    Compute the maximum dollar drawdown of a per-bar equity series.
+
+    Args:
+        equity: Equity per bar.
+        starting_equity: Equity before the first bar (see
+            compute_equity_drawdown_curve).
+
+    Returns:
+        Largest peak-to-trough decline in dollars (≤ 0), 0.0 if empty.
+
+    Examples:
+        >>> compute_max_equity_drawdown(np.array([100.0, 110.0, 95.0, 120.0]))
+        -15.0
+    """
+    equity = np.asarray(equity)
+    if equity.size == 0:
+        return 0.0
+    # Bar positions stand in for timestamps; only the drawdown is used
+    performance = performance_from_arrays(
+        np.empty(0), np.arange(equity.size), equity, starting_equity
+    )
+    return performance.max_drawdown
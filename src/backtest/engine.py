@@ -8,7 +8,8 @@ interface to allow programmatic usage (e.g., parameter sweeps).
 
 import logging
 import sys
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
@@ -17,17 +18,26 @@ import polars as pl
 # Adjust relative imports for being in src/backtest/
 from ..config.parameters import StrategyParameters
 from ..data_io.ingestion import ingest_ohlcv_data
-from ..indicators.dispatcher import calculate_indicators
+from ..data_io.ingestion.load import load_parquet_lazy
+from ..data_io.schema import CORE_COLUMNS
+from ..indicators.dispatcher import (
+    calculate_indicators,
+    indicator_requirements,
+    source_data_hash,
+)
 from ..models.core import TradeExecution
 from ..models.directional import BacktestResult
 from ..models.enums import DirectionMode
+from ..models.signal_batch import SignalBatch
 from ..strategy.trend_pullback.signal_generator_vectorized import (
-    generate_signals_vectorized,
+    generate_signal_batch,
 )
 from ..strategy.trend_pullback.strategy import TREND_PULLBACK_STRATEGY
 from ..strategy.zscore_mean_reversion import ZSCORE_STRATEGY
 
+from .indicator_cache import IndicatorCache, merge_cache_stats
 from .orchestrator import BacktestOrchestrator
+from .parallel import get_worker_count
 from .portfolio.portfolio_simulator import PortfolioSimulator
 
 logger = logging.getLogger(__name__)
@@ -35,6 +45,10 @@ logger = logging.getLogger(__name__)
 # Default account balance for multi-symbol concurrent PnL calculation (FR-003)
 DEFAULT_ACCOUNT_BALANCE: float = 2500.0
 
+# Indicator warm-up kept before a requested start date, in multiples of the
+# longest indicator lookback (EMA weights decay below 1e-8 by then)
+WARMUP_LOOKBACKS = 10
+
 # Map of available strategy instances
 STRATEGY_MAP = {
     "trend-pullback": TREND_PULLBACK_STRATEGY,
@@ -118,6 +132,512 @@ def construct_data_paths(
     return pair_paths
 
 
+def load_symbol_data(data_path: Path, show_progress: bool = True) -> pl.DataFrame:
+    """Ingest one symbol's OHLCV file into a Polars frame.
+
+    Args:
+        data_path: Path to the processed Parquet or CSV file
+        show_progress: If True, show ingestion progress
+
+    Returns:
+        Polars DataFrame with a timestamp_utc column and OHLCV columns
+    """
+    use_arrow = data_path.suffix.lower() == ".parquet"
+    ingestion_result = ingest_ohlcv_data(
+        path=data_path,
+        timeframe_minutes=1,
+        mode="columnar",
+        downcast=False,
+        use_arrow=use_arrow,
+        strict_cadence=False,
+        fill_gaps=False,
+        return_polars=True,
+        show_progress=show_progress,
+    )
+
+    df = ingestion_result.data
+    if not isinstance(df, pl.DataFrame):
+        df = pl.from_pandas(df)
+
+    # Rename timestamp if needed
+    if "timestamp" in df.columns:
+        df = df.rename({"timestamp": "timestamp_utc"})
+
+    return df
+
+
+def _match_timezone(value: datetime | None, dtype: pl.DataType) -> datetime | None:
+    """Express a bound (naive = UTC) in a timestamp column's timezone style."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    if getattr(dtype, "time_zone", None) is None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def window_frame(
+    df: pl.DataFrame,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    warmup_bars: int = 0,
+) -> pl.DataFrame:
+    """Zero-copy slice of a sorted frame to a date range.
+
+    Args:
+        df: Frame sorted by timestamp_utc
+        start: First timestamp to keep (None = from the beginning)
+        end: Last timestamp to keep, inclusive (None = to the end)
+        warmup_bars: Extra bars kept before start
+
+    Returns:
+        Sliced DataFrame
+    """
+    timestamps = df["timestamp_utc"]
+    lower = 0
+    if start is not None:
+        first = timestamps.search_sorted(_match_timezone(start, timestamps.dtype))
+        lower = max(first - warmup_bars, 0)
+    upper = len(df)
+    if end is not None:
+        upper = timestamps.search_sorted(
+            _match_timezone(end, timestamps.dtype), side="right"
+        )
+    return df.slice(lower, max(upper - lower, 0))
+
+
+def _warmup_start(
+    scan: pl.LazyFrame, timestamp_col: str, start: datetime, warmup_bars: int
+) -> datetime:
+    """Timestamp ``warmup_bars`` bars before start in a sorted Parquet scan.
+
+    Widens a time window before start until it holds enough bars, so only
+    the row groups around start are read (gaps like weekends just take
+    another doubling).
+    """
+    timestamp = pl.col(timestamp_col)
+    first = scan.select(timestamp).head(1).collect()[timestamp_col]
+    if warmup_bars <= 0 or first.is_empty() or first[0] >= start:
+        return start
+    span = timedelta(minutes=warmup_bars)
+    while True:
+        lower = max(start - span, first[0])
+        bars = (
+            scan.filter((timestamp >= lower) & (timestamp < start))
+            .select(timestamp)
+            .collect()[timestamp_col]
+            .sort()
+        )
+        if len(bars) >= warmup_bars:
+            return bars[-warmup_bars]
+        if lower == first[0]:
+            return lower
+        span *= 2
+
+
+def load_symbol_window(
+    data_path: Path,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    columns: frozenset[str] | None = None,
+    warmup_bars: int = 0,
+    show_progress: bool = True,
+) -> pl.DataFrame:
+    """Load only the rows and columns a date-range backtest needs.
+
+    Sorted Parquet files (see write_parquet_sorted) are scanned lazily: the
+    date range becomes a predicate that skips row groups outside it via
+    their statistics, and only the timestamp plus ``columns`` are decoded.
+    Other files are ingested in full and sliced.
+
+    Args:
+        data_path: Path to the processed Parquet or CSV file
+        start: First timestamp to trade (naive values are UTC)
+        end: Last timestamp to include, inclusive
+        columns: Price columns to read (None = the core OHLCV columns)
+        warmup_bars: Bars kept before start for indicator warm-up
+        show_progress: If True, show ingestion progress (full loads only)
+
+    Returns:
+        Polars DataFrame sorted by timestamp_utc, deduplicated, with
+        is_gap when all core columns are read
+    """
+    wanted = [
+        c
+        for c in CORE_COLUMNS
+        if c != "timestamp_utc" and (columns is None or c in columns)
+    ]
+    scan, schema = None, {}
+    if data_path.suffix.lower() == ".parquet":
+        scan = pl.scan_parquet(data_path)
+        schema = scan.collect_schema()
+    timestamp_col = "timestamp_utc" if "timestamp_utc" in schema else "timestamp"
+
+    # String timestamps cannot be compared against row-group statistics
+    if not isinstance(schema.get(timestamp_col), pl.Datetime):
+        df = window_frame(
+            load_symbol_data(data_path, show_progress=show_progress),
+            start,
+            end,
+            warmup_bars,
+        )
+        return df.select(["timestamp_utc", *(c for c in wanted if c in df.columns)])
+
+    timestamp = pl.col(timestamp_col)
+    dtype = schema[timestamp_col]
+    predicate = pl.lit(True)
+    if start is not None:
+        start = _match_timezone(start, dtype)
+        lower = _warmup_start(scan, timestamp_col, start, warmup_bars)
+        predicate = predicate & (timestamp >= lower)
+    if end is not None:
+        predicate = predicate & (timestamp <= _match_timezone(end, dtype))
+
+    df = (
+        load_parquet_lazy(
+            str(data_path),
+            columns=[timestamp_col, *(c for c in wanted if c in schema)],
+            predicate=predicate,
+        )
+        .rename({timestamp_col: "timestamp_utc"})
+        .sort("timestamp_utc")
+        .unique(subset="timestamp_utc", keep="first", maintain_order=True)
+        .collect()
+    )
+    if "is_gap" in wanted and "is_gap" not in df.columns:
+        df = df.with_columns(pl.lit(False).alias("is_gap"))
+
+    logger.info(
+        "Loaded %d bars (%d columns) from %s for the requested range",
+        len(df),
+        len(df.columns),
+        data_path,
+    )
+    return df
+
+
+def resolve_indicator_overrides(
+    strategy_params,
+    indicator_overrides: dict[str, dict[str, Any]] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Indicator overrides implied by strategy parameters plus explicit ones.
+
+    Args:
+        strategy_params: Strategy parameters (EMA/ATR/RSI periods)
+        indicator_overrides: Optional explicit overrides (e.g. from a sweep)
+
+    Returns:
+        Indicator name -> parameter overrides for calculate_indicators
+    """
+    # Map strategy parameters to indicator overrides
+    overrides = {
+        "fast_ema": {"period": getattr(strategy_params, "ema_fast", 20)},
+        "slow_ema": {"period": getattr(strategy_params, "ema_slow", 50)},
+        "atr": {"period": getattr(strategy_params, "atr_length", 14)},
+        "rsi": {"period": getattr(strategy_params, "rsi_length", 14)},
+    }
+
+    # Apply explicit overrides (e.g. from parameter sweep)
+    if indicator_overrides:
+        for ind, params in indicator_overrides.items():
+            if ind not in overrides:
+                overrides[ind] = {}
+            overrides[ind].update(params)
+    return overrides
+
+
+def get_custom_registry(strategy) -> dict[str, Any]:
+    """Strategy-specific indicator functions (empty if none)."""
+    # Feature 026: Get custom indicators from strategy
+    # Use getattr for safety with strategies that might not implement the protocol fully yet
+    custom_registry = getattr(strategy, "get_custom_indicators", lambda: {})()
+    if not isinstance(custom_registry, dict):
+        custom_registry = {}
+    return custom_registry
+
+
+def enrich_symbol_data(
+    df: pl.DataFrame,
+    strategy,
+    strategy_params,
+    indicator_overrides: dict[str, dict[str, Any]] | None = None,
+    risk_config: Any = None,
+    use_gpu: bool = False,
+    indicator_cache: IndicatorCache | None = None,
+    data_hash: str | None = None,
+) -> pl.DataFrame:
+    """Calculate the strategy's indicators (and trailing-stop MA) for one symbol.
+
+    Args:
+        df: Raw OHLCV frame from load_symbol_data
+        strategy: Strategy whose metadata lists the required indicators
+        strategy_params: Strategy parameters (EMA/ATR/RSI periods)
+        indicator_overrides: Optional overrides for indicator parameters
+        risk_config: Optional risk config (adds MA column for MA_Trailing)
+        use_gpu: Whether to use GPU acceleration
+        indicator_cache: Optional cache of previously computed indicator
+            columns for this symbol's data
+        data_hash: Optional precomputed source_data_hash of df (e.g. shared
+            across sweep combinations); computed once here if omitted
+
+    Returns:
+        Enriched Polars DataFrame
+    """
+    required_indicators = strategy.metadata.required_indicators
+    overrides = resolve_indicator_overrides(strategy_params, indicator_overrides)
+    custom_registry = get_custom_registry(strategy)
+    if (
+        indicator_cache is not None
+        and data_hash is None
+        and "timestamp_utc" in df.columns
+    ):
+        # Both indicator passes below read the same raw columns
+        data_hash = source_data_hash(df)
+
+    enriched_df = calculate_indicators(
+        df,
+        required_indicators,
+        overrides=overrides,
+        custom_registry=custom_registry,
+        use_gpu=use_gpu,
+        cache=indicator_cache,
+        data_hash=data_hash,
+    )
+
+    # Add dynamic trailing indicator if needed
+    if risk_config and risk_config.stop_policy.type == "MA_Trailing":
+        ma_type = risk_config.stop_policy.ma_type.lower()  # "sma" or "ema"
+        ma_period = risk_config.stop_policy.ma_period
+        # Construct indicator string e.g. "sma50" or "ema200"
+        ind_str = f"{ma_type}{ma_period}"
+
+        # Override output name to be explicit "sma_50" to match simple logic elsewhere
+        ma_overrides = {ind_str: {"output_col": f"{ma_type}_{ma_period}"}}
+
+        ind_df = calculate_indicators(
+            enriched_df,
+            [ind_str],
+            overrides=ma_overrides,
+            custom_registry=custom_registry,
+            use_gpu=use_gpu,
+            cache=indicator_cache,
+            data_hash=data_hash,
+        )
+
+        # Join the new column(s)
+        new_cols = [c for c in ind_df.columns if c not in enriched_df.columns]
+        if new_cols:
+            enriched_df = enriched_df.hstack(ind_df.select(new_cols))
+
+    return enriched_df
+
+
+def _iter_symbol_frames(
+    pair_paths: list[tuple[str, Path]],
+    preloaded_data: dict[str, pl.DataFrame] | None,
+    show_progress: bool,
+    window: dict[str, Any] | None = None,
+):
+    """Yield (pair, raw OHLCV frame) in order, prefetching the next load.
+
+    While the caller processes pair N, pair N+1 is loaded on a background
+    thread (parquet reads release the GIL). Preloaded frames are yielded
+    as-is, or sliced to the window.
+
+    Args:
+        pair_paths: List of (pair, path) tuples
+        preloaded_data: Optional symbol -> already loaded frame
+        show_progress: If True, show loading progress bars
+        window: Optional load_symbol_window arguments (start, end, columns,
+            warmup_bars) restricting what is read
+
+    Yields:
+        Tuples of (pair, raw OHLCV DataFrame)
+    """
+    preloaded_data = preloaded_data or {}
+
+    def _load(pair: str, data_path: Path) -> pl.DataFrame:
+        if pair in preloaded_data:
+            logger.info("Using preloaded data for %s", pair)
+            if window:
+                return window_frame(
+                    preloaded_data[pair],
+                    window["start"],
+                    window["end"],
+                    window["warmup_bars"],
+                )
+            return preloaded_data[pair]
+        logger.info("Loading data for %s from %s", pair, data_path)
+        if window:
+            return load_symbol_window(
+                data_path, show_progress=show_progress, **window
+            )
+        return load_symbol_data(data_path, show_progress=show_progress)
+
+    if len(pair_paths) < 2:
+        for pair, data_path in pair_paths:
+            yield pair, _load(pair, data_path)
+        return
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch") as pool:
+        pending = pool.submit(_load, *pair_paths[0])
+        for i, (pair, _) in enumerate(pair_paths):
+            frame = pending.result()
+            if i + 1 < len(pair_paths):
+                pending = pool.submit(_load, *pair_paths[i + 1])
+            yield pair, frame
+
+
+def _build_blackout_index(blackout_config: Any, first_df: pl.DataFrame):
+    """Build the merged blackout index over the first symbol's date range.
+
+    Args:
+        blackout_config: BlackoutConfig with at least one source enabled
+        first_df: Enriched frame of the first symbol
+
+    Returns:
+        BlackoutIndex, or None if no windows were produced
+    """
+    from ..risk.blackout.windows import (
+        BlackoutIndex,
+        BlackoutWindow,
+        expand_news_windows,
+        expand_session_windows,
+        merge_overlapping_windows,
+    )
+    from ..risk.blackout.calendar import generate_news_calendar
+
+    blackout_windows: list = []
+    data_start = first_df["timestamp_utc"][0]
+    data_end = first_df["timestamp_utc"][-1]
+
+    # Build news windows if enabled
+    if blackout_config.news.enabled:
+        # Convert datetime to date for calendar generation
+        start_date = data_start.date() if hasattr(data_start, "date") else data_start
+        end_date = data_end.date() if hasattr(data_end, "date") else data_end
+        news_events = generate_news_calendar(
+            start_date, end_date, blackout_config.news.event_types
+        )
+        news_windows = expand_news_windows(news_events, blackout_config.news)
+        blackout_windows.extend(news_windows)
+        logger.info("Built %d news blackout windows", len(news_windows))
+
+    # Build session windows if enabled
+    if blackout_config.sessions.enabled:
+        session_windows = expand_session_windows(
+            data_start, data_end, blackout_config.sessions
+        )
+        blackout_windows.extend(session_windows)
+        logger.info("Built %d session blackout windows", len(session_windows))
+
+    # Build session-only windows if enabled (whitelist approach)
+    if blackout_config.session_only.enabled:
+        from ..risk.blackout.sessions import build_session_only_blackouts
+
+        start_date = data_start.date() if hasattr(data_start, "date") else data_start
+        end_date = data_end.date() if hasattr(data_end, "date") else data_end
+        session_only_windows = build_session_only_blackouts(
+            start_date, end_date, blackout_config.session_only.allowed_sessions
+        )
+        # session_only_windows are tuples, convert to BlackoutWindow
+        for start_utc, end_utc in session_only_windows:
+            blackout_windows.append(
+                BlackoutWindow(
+                    start_utc=start_utc, end_utc=end_utc, source="session_only"
+                )
+            )
+        logger.info(
+            "Built %d session-only blackout windows for sessions: %s",
+            len(session_only_windows),
+            blackout_config.session_only.allowed_sessions,
+        )
+
+    if not blackout_windows:
+        return None
+
+    # Merge overlapping windows into a sorted index for vectorized lookups
+    merged = merge_overlapping_windows(blackout_windows)
+    blackout_index = BlackoutIndex.from_windows(merged)
+    logger.info("Total blackout windows after merge: %d", len(blackout_index))
+    return blackout_index
+
+
+def generate_pair_signals(
+    pair: str,
+    df: pl.DataFrame,
+    strategy,
+    strategy_name: str,
+    strategy_params,
+    direction_mode: DirectionMode,
+    use_gpu: bool,
+    blackout_index=None,
+) -> list:
+    """Generate (and blackout-filter) signals for one enriched symbol.
+
+    Args:
+        pair: Symbol name
+        df: Enriched frame for the symbol
+        strategy: Strategy instance
+        strategy_name: Registered strategy name
+        strategy_params: Strategy parameters
+        direction_mode: Direction mode (LONG/SHORT/BOTH)
+        use_gpu: Whether to use GPU acceleration
+        blackout_index: Optional BlackoutIndex of blocked periods
+
+    Returns:
+        Signals for the symbol (a SignalBatch for vectorized strategies)
+    """
+    logger.info("Generating signals for %s", pair)
+
+    # Include pair in parameters for position sizing (JPY has different pip value)
+    params = strategy_params.model_dump()
+    params["pair"] = pair
+
+    # Vectorized or standard signal generation
+    if strategy_name == "trend-pullback" and hasattr(strategy, 'scan_vectorized'):
+        # Columnar batch: TradeSignal objects are never built on this path
+        signals = generate_signal_batch(
+            df,
+            parameters=params,
+            direction_mode=direction_mode.value,
+            use_gpu=use_gpu,
+        )
+    else:
+        # Fallback to standard generate_signals if scan_vectorized not available or different strategy
+        # For zscore and others, wrap df in a columnar candle sequence
+        # (rows are read lazily instead of materializing Candle objects)
+        from ..models.candle_series import CandleSeries
+
+        candles = CandleSeries(df)
+
+        signals = strategy.generate_signals(
+            candles=candles,
+            parameters=params,
+            direction=direction_mode.value
+        )
+
+    # Apply blackout filtering if windows exist
+    if blackout_index is not None and signals:
+        original_count = len(signals)
+        if isinstance(signals, SignalBatch):
+            blocked = blackout_index.contains(signals.timestamps)
+            signals = signals.filter(~blocked)
+        else:
+            blocked = blackout_index.contains([s.timestamp_utc for s in signals])
+            signals = [s for s, is_blocked in zip(signals, blocked) if not is_blocked]
+        logger.info(
+            "Blackout filtering for %s: %d blocked, %d remaining",
+            pair,
+            original_count - len(signals),
+            len(signals),
+        )
+
+    logger.info("Generated %d signals for %s", len(signals), pair)
+    return signals
+
+
 def run_portfolio_backtest(
     pair_paths: list[tuple[str, Path]],
     direction_mode: DirectionMode,
@@ -130,6 +650,14 @@ def run_portfolio_backtest(
     risk_config: Any = None,
     indicator_overrides: dict[str, dict[str, Any]] | None = None,
     use_gpu: bool = False,
+    preloaded_data: dict[str, pl.DataFrame] | None = None,
+    indicator_caches: dict[str, IndicatorCache] | None = None,
+    use_indicator_cache: bool = True,
+    indicator_cache_dir: Path | None = None,
+    data_hashes: dict[str, str] | None = None,
+    max_workers: int | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
 ):
     """Run time-synchronized portfolio backtest with shared equity.
 
@@ -146,6 +674,24 @@ def run_portfolio_backtest(
         show_progress: If True, show progress bars
         indicator_overrides: Optional overrides for indicator parameters (for sweeps)
         use_gpu: Whether to use GPU acceleration
+        preloaded_data: Optional symbol -> raw OHLCV frame (from
+            load_symbol_data) that skips ingestion for those symbols (for sweeps)
+        indicator_caches: Optional symbol -> IndicatorCache used to reuse
+            indicator columns computed by earlier runs on the same data
+        use_indicator_cache: If True and indicator_caches is None, use
+            per-symbol in-memory caches for this run
+        indicator_cache_dir: Optional directory for the caches created via
+            use_indicator_cache to also persist entries across runs (opt-in;
+            disk entries are never evicted)
+        data_hashes: Optional symbol -> source_data_hash of the preloaded
+            frame, so repeated runs on the same data skip rehashing it
+        max_workers: Threads used to simulate symbols concurrently (None =
+            one less than the logical core count, 1 = serial). Results are
+            identical to the serial path.
+        start: Optional first timestamp to trade (naive values are UTC).
+            Only the range plus an indicator warm-up margin, and only the
+            columns the strategy's indicators need, are read from disk.
+        end: Optional last timestamp to trade, inclusive
 
     Returns:
         Tuple of (PortfolioResult, enriched_data dict) where enriched_data maps
@@ -157,81 +703,62 @@ def run_portfolio_backtest(
         starting_equity,
     )
 
-    # Phase 1: Load and enrich ALL symbol data first
+    # Phase 1+2: Load, enrich and generate signals per symbol. Loading the
+    # next symbol is prefetched on a background thread so parquet I/O
+    # overlaps indicator and signal work for the current one.
     symbol_data: dict[str, pl.DataFrame] = {}
+    symbol_signals: dict[str, list] = {}
 
-    # Define trailing indicator if needed
-    trailing_indicator_def = None
-    if risk_config and risk_config.stop_policy.type == "MA_Trailing":
-        # e.g. "sma_50" or "ema_200"
-        ma_type = risk_config.stop_policy.ma_type.lower()  # "sma" or "ema"
-        period = risk_config.stop_policy.ma_period
-        param_name = f"{ma_type}_{period}"
-        # Store definition for appending to required_indicators
-        # Indicator format: IndicatorConfig(name="sma", params={"period": 50}, output_overrides={"sma": "sma_50"})
-        # Simplified for calculate_indicators: we might need to manually add to dict if not using metadata
-        pass
+    # Get strategy from map or fallback to TREND_PULLBACK
+    strategy_name = strategy_params.strategy_name if hasattr(strategy_params, 'strategy_name') else "trend-pullback"
+    strategy = STRATEGY_MAP.get(strategy_name, TREND_PULLBACK_STRATEGY)
 
-    for pair, data_path in pair_paths:
-        logger.info("Loading data for %s from %s", pair, data_path)
+    if indicator_caches is None and use_indicator_cache:
+        indicator_caches = {
+            pair: IndicatorCache(dataset_id=pair, cache_dir=indicator_cache_dir)
+            for pair, _ in pair_paths
+        }
 
-        use_arrow = data_path.suffix.lower() == ".parquet"
-        ingestion_result = ingest_ohlcv_data(
-            path=data_path,
-            timeframe_minutes=1,
-            mode="columnar",
-            downcast=False,
-            use_arrow=use_arrow,
-            strict_cadence=False,
-            fill_gaps=False,
-            return_polars=True,
-            show_progress=show_progress,
+    # Date range: read the range plus warm-up, and only the needed columns
+    window = None
+    if start is not None or end is not None:
+        requirements = indicator_requirements(
+            strategy.metadata.required_indicators,
+            resolve_indicator_overrides(strategy_params, indicator_overrides),
+            get_custom_registry(strategy),
         )
-
-        enriched_df = ingestion_result.data
-        if not isinstance(enriched_df, pl.DataFrame):
-            enriched_df = pl.from_pandas(enriched_df)
-
-        # Rename timestamp if needed
-        if "timestamp" in enriched_df.columns:
-            enriched_df = enriched_df.rename({"timestamp": "timestamp_utc"})
-
-        # Get strategy from map or fallback to TREND_PULLBACK
-        strategy_name = strategy_params.strategy_name if hasattr(strategy_params, 'strategy_name') else "trend-pullback"
-        strategy = STRATEGY_MAP.get(strategy_name, TREND_PULLBACK_STRATEGY)
-        
-        # Calculate indicators
-        required_indicators = strategy.metadata.required_indicators
-
-        # Map strategy parameters to indicator overrides
-        overrides = {
-            "fast_ema": {"period": getattr(strategy_params, "ema_fast", 20)},
-            "slow_ema": {"period": getattr(strategy_params, "ema_slow", 50)},
-            "atr": {"period": getattr(strategy_params, "atr_length", 14)},
-            "rsi": {"period": getattr(strategy_params, "rsi_length", 14)},
+        window = {
+            "start": start,
+            "end": end,
+            "columns": requirements.columns,
+            "warmup_bars": WARMUP_LOOKBACKS * requirements.lookback,
         }
 
-        # Apply explicit overrides (e.g. from parameter sweep)
-        if indicator_overrides:
-            for ind, params in indicator_overrides.items():
-                if ind not in overrides:
-                    overrides[ind] = {}
-                overrides[ind].update(params)
-
-        # Feature 026: Get custom indicators from strategy
-        # Use getattr for safety with strategies that might not implement the protocol fully yet
-        custom_registry = getattr(strategy, "get_custom_indicators", lambda: {})()
-        if not isinstance(custom_registry, dict):
-            custom_registry = {}
-
-        enriched_df = calculate_indicators(
-            enriched_df,
-            required_indicators,
-            overrides=overrides,
-            custom_registry=custom_registry,
+    # Blackout windows span the first symbol's data range (Feature 023)
+    blackout_index = None
+
+    for pair, base_df in _iter_symbol_frames(
+        pair_paths, preloaded_data, show_progress, window
+    ):
+        enriched_df = enrich_symbol_data(
+            base_df,
+            strategy,
+            strategy_params,
+            indicator_overrides=indicator_overrides,
+            risk_config=risk_config,
             use_gpu=use_gpu,
+            indicator_cache=(indicator_caches or {}).get(pair),
+            # Preloaded hashes only describe unsliced frames
+            data_hash=None if window else (data_hashes or {}).get(pair),
         )
 
+        if start is not None:
+            # Drop the warm-up bars: signals and trades start at the range
+            enriched_df = window_frame(enriched_df, start)
+        if enriched_df.is_empty():
+            logger.warning("No %s data in the requested range; skipping", pair)
+            continue
+
         symbol_data[pair] = enriched_df
         logger.info(
             "Loaded %s: %d bars, %s to %s",
@@ -241,183 +768,66 @@ def run_portfolio_backtest(
             enriched_df["timestamp_utc"][-1],
         )
 
-        # Add dynamic trailing indicator if needed
-        if risk_config and risk_config.stop_policy.type == "MA_Trailing":
-            ma_type = risk_config.stop_policy.ma_type.lower()  # "sma" or "ema"
-            ma_period = risk_config.stop_policy.ma_period
-            # Construct indicator string e.g. "sma50" or "ema200"
-            ind_str = f"{ma_type}{ma_period}"
+        if len(symbol_data) == 1 and blackout_config and blackout_config.any_enabled:
+            blackout_index = _build_blackout_index(blackout_config, enriched_df)
 
-            # Override output name to be explicit "sma_50" to match simple logic elsewhere
-            overrides = {ind_str: {"output_col": f"{ma_type}_{ma_period}"}}
-
-            custom_registry = getattr(strategy, "get_custom_indicators", lambda: {})()
-            if not isinstance(custom_registry, dict):
-                custom_registry = {}
-
-            ind_df = calculate_indicators(
-                enriched_df,
-                [ind_str],
-                overrides=overrides,
-                custom_registry=custom_registry,
-                use_gpu=use_gpu,
-            )
-
-            # Join the new column(s)
-            new_cols = [c for c in ind_df.columns if c not in enriched_df.columns]
-            if new_cols:
-                enriched_df = enriched_df.hstack(ind_df.select(new_cols))
-
-        symbol_data[pair] = enriched_df
-    symbol_signals: dict[str, list] = {}
-
-    # Build blackout windows if config provided (Feature 023)
-    blackout_windows: list[tuple] = []
-    if blackout_config and blackout_config.any_enabled:
-        from ..risk.blackout.windows import (
-            expand_news_windows,
-            expand_session_windows,
-            merge_overlapping_windows,
+        symbol_signals[pair] = generate_pair_signals(
+            pair,
+            enriched_df,
+            strategy,
+            strategy_name,
+            strategy_params,
+            direction_mode,
+            use_gpu,
+            blackout_index,
         )
-        from ..risk.blackout.calendar import generate_news_calendar
-
-        # Get date range from first symbol's data
-        first_df = next(iter(symbol_data.values()))
-        data_start = first_df["timestamp_utc"][0]
-        data_end = first_df["timestamp_utc"][-1]
-
-        # Build news windows if enabled
-        if blackout_config.news.enabled:
-            # Convert datetime to date for calendar generation
-            start_date = (
-                data_start.date() if hasattr(data_start, "date") else data_start
-            )
-            end_date = data_end.date() if hasattr(data_end, "date") else data_end
-            news_events = generate_news_calendar(
-                start_date, end_date, blackout_config.news.event_types
-            )
-            news_windows = expand_news_windows(news_events, blackout_config.news)
-            blackout_windows.extend(news_windows)
-            logger.info("Built %d news blackout windows", len(news_windows))
-
-        # Build session windows if enabled
-        if blackout_config.sessions.enabled:
-            session_windows = expand_session_windows(
-                data_start, data_end, blackout_config.sessions
-            )
-            blackout_windows.extend(session_windows)
-            logger.info("Built %d session blackout windows", len(session_windows))
-
-        # Build session-only windows if enabled (whitelist approach)
-        if blackout_config.session_only.enabled:
-            from ..risk.blackout.sessions import build_session_only_blackouts
-
-            start_date = (
-                data_start.date() if hasattr(data_start, "date") else data_start
-            )
-            end_date = data_end.date() if hasattr(data_end, "date") else data_end
-            session_only_windows = build_session_only_blackouts(
-                start_date, end_date, blackout_config.session_only.allowed_sessions
-            )
-            # session_only_windows are already tuples, need to convert to BlackoutWindow
-            from ..risk.blackout.windows import BlackoutWindow
 
-            for start_utc, end_utc in session_only_windows:
-                blackout_windows.append(
-                    BlackoutWindow(
-                        start_utc=start_utc, end_utc=end_utc, source="session_only"
-                    )
-                )
-            logger.info(
-                "Built %d session-only blackout windows for sessions: %s",
-                len(session_only_windows),
-                blackout_config.session_only.allowed_sessions,
-            )
+    if indicator_caches:
+        logger.info("Indicator cache: %s", merge_cache_stats(indicator_caches))
 
-        # Merge overlapping windows, then convert to tuples for filter function
-        if blackout_windows:
-            merged = merge_overlapping_windows(blackout_windows)
-            blackout_windows = [(w.start_utc, w.end_utc) for w in merged]
-            logger.info("Total blackout windows after merge: %d", len(blackout_windows))
-
-    for pair, df in symbol_data.items():
-        logger.info("Generating signals for %s", pair)
-
-        # Include pair in parameters for position sizing (JPY has different pip value)
-        params = strategy_params.model_dump()
-        params["pair"] = pair
-
-        # Get strategy
-        strategy_name = strategy_params.strategy_name if hasattr(strategy_params, 'strategy_name') else "trend-pullback"
-        strategy = STRATEGY_MAP.get(strategy_name, TREND_PULLBACK_STRATEGY)
-
-        # Vectorized or standard signal generation
-        if strategy_name == "trend-pullback" and hasattr(strategy, 'scan_vectorized'):
-             signals = generate_signals_vectorized(
-                df,
-                parameters=params,
-                direction_mode=direction_mode.value,
-                use_gpu=use_gpu,
-            )
-        else:
-            # Fallback to standard generate_signals if scan_vectorized not available or different strategy
-            # For zscore and others, we convert df to list of candles for generate_signals
-            from ..models.core import Candle
-            
-            # Map Polars rows to Candle objects
-            records = df.to_dicts()
-            candles = []
-            for r in records:
-                # Extract indicators
-                indicator_keys = [k for k in r.keys() if k not in ["timestamp_utc", "open", "high", "low", "close", "volume"]]
-                indicators = {k: r[k] for k in indicator_keys}
-                
-                candles.append(Candle(
-                    timestamp_utc=r["timestamp_utc"],
-                    open=r["open"],
-                    high=r["high"],
-                    low=r["low"],
-                    close=r["close"],
-                    volume=r["volume"],
-                    indicators=indicators
-                ))
-            
-            signals = strategy.generate_signals(
-                candles=candles,
-                parameters=params,
-                direction=direction_mode.value
-            )
+    if window is not None and not symbol_data:
+        raise ValueError("No price data for any symbol in the requested range")
 
-        # Apply blackout filtering if windows exist
-        if blackout_windows and signals:
-            original_count = len(signals)
-            filtered_signals = []
-
-            for signal in signals:
-                signal_ts = signal.timestamp_utc
-                in_blackout = False
+    # Phase 3: Run portfolio simulation
+    result = simulate_portfolio(
+        symbol_data,
+        symbol_signals,
+        direction_mode,
+        strategy_params,
+        starting_equity=starting_equity,
+        timeframe=timeframe,
+        risk_config=risk_config,
+        max_workers=get_worker_count(max_workers),
+    )
 
-                for start_utc, end_utc in blackout_windows:
-                    if start_utc <= signal_ts <= end_utc:
-                        in_blackout = True
-                        break
+    return result, symbol_data
 
-                if not in_blackout:
-                    filtered_signals.append(signal)
 
-            blocked_count = original_count - len(filtered_signals)
-            signals = filtered_signals
-            logger.info(
-                "Blackout filtering for %s: %d blocked, %d remaining",
-                pair,
-                blocked_count,
-                len(signals),
-            )
+def simulate_portfolio(
+    symbol_data: dict[str, pl.DataFrame],
+    symbol_signals: dict[str, Any],
+    direction_mode: DirectionMode,
+    strategy_params,
+    starting_equity: float = 2500.0,
+    timeframe: str = "1m",
+    risk_config: Any = None,
+    max_workers: int = 1,
+):
+    """Simulate enriched symbols and their signals against shared equity.
 
-        symbol_signals[pair] = signals
-        logger.info("Generated %d signals for %s", len(signals), pair)
+    Args:
+        symbol_data: Symbol -> enriched Polars DataFrame
+        symbol_signals: Symbol -> SignalBatch or signal list for that frame
+        direction_mode: Direction mode (LONG/SHORT/BOTH)
+        strategy_params: Strategy parameters (target R-multiple)
+        starting_equity: Starting portfolio capital
+        timeframe: Timeframe of the data (e.g., "1m")
+        risk_config: Optional risk config (trailing stop policy)
+        max_workers: Threads used to simulate symbols concurrently
 
-    # Phase 3: Run portfolio simulation
+    Returns:
+        PortfolioResult for the run
+    """
     simulator = PortfolioSimulator(
         starting_equity=starting_equity,
         risk_per_trade=0.0025,  # 0.25%
@@ -431,16 +841,15 @@ def run_portfolio_backtest(
         f"{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
     )
 
-    result = simulator.simulate(
+    return simulator.simulate(
         symbol_data=symbol_data,
         symbol_signals=symbol_signals,
         direction_mode=direction_mode.value,
         run_id=run_id,
         timeframe=timeframe,
+        max_workers=max_workers,
     )
 
-    return result, symbol_data
-
 
 def run_multi_symbol_backtest(
     pair_paths: list[tuple[str, Path]],
@@ -0,0 +1,446 @@
+"""Early-exit search for first stop-loss / take-profit hits.
+
+Given entry indices with absolute stop and target prices, finds the first bar
+after each entry where the stop or target is touched. Work per trade scales
+with its holding time rather than a fixed lookahead window:
+
+- With numba installed, a compiled loop walks bars from each entry and stops
+  at the first hit.
+- Otherwise, unresolved trades are scanned together in geometrically growing
+  chunks (16, 32, 64, ... bars), so each trade touches at most ~2x the bars
+  it was actually held.
+
+Both paths apply the same rules: the stop takes priority when stop and target
+hit on the same bar, and trades that never hit exit on the real close of the
+last bar in their horizon (or the last bar of data when unbounded).
+
+find_sequential_exits applies one-position-at-a-time acceptance while
+searching, jumping from each accepted exit to the next admissible entry
+instead of simulating every signal and filtering afterwards.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+# Optional numba JIT for the bar-walking loop
+_NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+
+
+# Exit reason codes (match BatchSimulation.exit_reasons)
+EXIT_TIMEOUT = 0
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+
+# Chunked scan tuning: first chunk width and cap on gathered cells per round
+_INITIAL_CHUNK = 16
+_MAX_CHUNK_CELLS = 1 << 22
+
+
+def _walk_one(
+    entry: int,
+    last: int,
+    stop: float,
+    target: float,
+    direction: int,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+) -> tuple[int, float, int]:
+    """Walk bars entry+1 .. last for one trade and return its first exit."""
+    if direction == 1:
+        for i in range(entry + 1, last + 1):
+            if low_prices[i] <= stop:
+                return i, stop, EXIT_STOP_LOSS
+            if high_prices[i] >= target:
+                return i, target, EXIT_TAKE_PROFIT
+    else:
+        for i in range(entry + 1, last + 1):
+            if high_prices[i] >= stop:
+                return i, stop, EXIT_STOP_LOSS
+            if low_prices[i] <= target:
+                return i, target, EXIT_TAKE_PROFIT
+    return last, close_prices[last], EXIT_TIMEOUT
+
+
+if _NUMBA_AVAILABLE:
+    # Rebound so the compiled loops below call the compiled walker
+    _walk_one = njit(cache=True, nogil=True)(_walk_one)
+
+
+def _walk_exits(
+    entry_indices: np.ndarray,
+    stop_prices: np.ndarray,
+    target_prices: np.ndarray,
+    directions: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    last_indices: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bar-walking exit loop (compiled with numba when available)."""
+    n_trades = entry_indices.shape[0]
+    exit_indices = np.empty(n_trades, dtype=np.int64)
+    exit_prices = np.empty(n_trades, dtype=np.float64)
+    exit_reasons = np.empty(n_trades, dtype=np.int8)
+
+    for t in range(n_trades):
+        exit_indices[t], exit_prices[t], exit_reasons[t] = _walk_one(
+            entry_indices[t],
+            last_indices[t],
+            stop_prices[t],
+            target_prices[t],
+            directions[t],
+            high_prices,
+            low_prices,
+            close_prices,
+        )
+
+    return exit_indices, exit_prices, exit_reasons
+
+
+def _walk_accepted(
+    entry_indices: np.ndarray,
+    stop_prices: np.ndarray,
+    target_prices: np.ndarray,
+    directions: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    last_indices: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """One-position-at-a-time exit loop over sorted entries.
+
+    After each accepted trade the loop jumps (binary search) to the first
+    entry strictly after its exit bar, so skipped signals are never walked.
+    """
+    n_trades = entry_indices.shape[0]
+    accepted = np.empty(n_trades, dtype=np.int64)
+    exit_indices = np.empty(n_trades, dtype=np.int64)
+    exit_prices = np.empty(n_trades, dtype=np.float64)
+    exit_reasons = np.empty(n_trades, dtype=np.int8)
+
+    n_accepted = 0
+    t = 0
+    while t < n_trades:
+        x_idx, x_price, x_reason = _walk_one(
+            entry_indices[t],
+            last_indices[t],
+            stop_prices[t],
+            target_prices[t],
+            directions[t],
+            high_prices,
+            low_prices,
+            close_prices,
+        )
+        accepted[n_accepted] = t
+        exit_indices[n_accepted] = x_idx
+        exit_prices[n_accepted] = x_price
+        exit_reasons[n_accepted] = x_reason
+        n_accepted += 1
+        t = max(t + 1, np.searchsorted(entry_indices, x_idx, side="right"))
+
+    return (
+        accepted[:n_accepted],
+        exit_indices[:n_accepted],
+        exit_prices[:n_accepted],
+        exit_reasons[:n_accepted],
+    )
+
+
+if _NUMBA_AVAILABLE:
+    _walk_exits_jit = njit(cache=True, nogil=True)(_walk_exits)
+    _walk_accepted_jit = njit(cache=True, nogil=True)(_walk_accepted)
+else:
+    _walk_exits_jit = None
+    _walk_accepted_jit = None
+
+
+def _scan_exits_chunked(
+    entry_indices: np.ndarray,
+    stop_prices: np.ndarray,
+    target_prices: np.ndarray,
+    directions: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    last_indices: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized exit search over geometrically growing chunks.
+
+    All unresolved trades are gathered into one (trades x width) block per
+    round; trades that hit are resolved and dropped, the rest advance their
+    cursor and the chunk width doubles.
+    """
+    n_trades = len(entry_indices)
+    n_bars = len(high_prices)
+
+    # Default: timeout on the close of the last bar in the horizon
+    exit_indices = last_indices.copy()
+    exit_prices = close_prices[last_indices].astype(np.float64)
+    exit_reasons = np.full(n_trades, EXIT_TIMEOUT, dtype=np.int8)
+
+    cursor = entry_indices + 1
+    pending = np.flatnonzero(cursor <= last_indices)
+    chunk = _INITIAL_CHUNK
+
+    while pending.size > 0:
+        width = max(1, min(chunk, _MAX_CHUNK_CELLS // pending.size))
+        starts = cursor[pending]
+        cols = starts[:, None] + np.arange(width)[None, :]
+        in_window = cols <= last_indices[pending][:, None]
+        np.minimum(cols, n_bars - 1, out=cols)
+
+        highs = high_prices[cols]
+        lows = low_prices[cols]
+        stops = stop_prices[pending][:, None]
+        targets = target_prices[pending][:, None]
+        is_long = (directions[pending] == 1)[:, None]
+
+        stop_hits = np.where(is_long, lows <= stops, highs >= stops) & in_window
+        target_hits = np.where(is_long, highs >= targets, lows <= targets)
+        target_hits &= in_window
+        any_hits = stop_hits | target_hits
+
+        has_hit = any_hits.any(axis=1)
+        hit_rows = np.flatnonzero(has_hit)
+        if hit_rows.size > 0:
+            first = np.argmax(any_hits[hit_rows], axis=1)
+            trades = pending[hit_rows]
+            is_stop = stop_hits[hit_rows, first]
+            exit_indices[trades] = starts[hit_rows] + first
+            exit_prices[trades] = np.where(
+                is_stop, stop_prices[trades], target_prices[trades]
+            )
+            exit_reasons[trades] = np.where(is_stop, EXIT_STOP_LOSS, EXIT_TAKE_PROFIT)
+
+        cursor[pending] = starts + width
+        still_open = ~has_hit & (starts + width <= last_indices[pending])
+        pending = pending[still_open]
+        chunk *= 2
+
+    return exit_indices, exit_prices, exit_reasons
+
+
+def find_first_exits(
+    entry_indices: np.ndarray,
+    stop_prices: np.ndarray,
+    target_prices: np.ndarray,
+    directions: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    max_holding_bars: Optional[int] = None,
+    use_jit: Optional[bool] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the first stop/target hit after each entry.
+
+    Bars entry+1 .. entry+max_holding_bars are searched (clipped to the end
+    of data). Trades with no hit exit on the close of the last searched bar;
+    trades entered on the final bar exit immediately at that bar.
+
+    Args:
+        entry_indices: Entry candle indices
+        stop_prices: Absolute stop-loss prices per trade
+        target_prices: Absolute take-profit prices per trade
+        directions: Trade directions (1=LONG, -1=SHORT)
+        high_prices: High price array
+        low_prices: Low price array
+        close_prices: Close price array
+        max_holding_bars: Maximum bars held after entry (None = unbounded)
+        use_jit: Force (True) or disable (False) the numba loop. None selects
+            it automatically when numba is available.
+
+    Returns:
+        Tuple of (exit_indices, exit_prices, exit_reasons) where exit_prices
+        are raw stop/target/close prices (no slippage) and exit_reasons use
+        EXIT_TIMEOUT / EXIT_STOP_LOSS / EXIT_TAKE_PROFIT codes.
+
+    Raises:
+        ValueError: If max_holding_bars is not positive
+    """
+    use_jit = _resolve_use_jit(max_holding_bars, use_jit)
+
+    entry_indices = np.ascontiguousarray(entry_indices, dtype=np.int64)
+    if len(entry_indices) == 0:
+        return (
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.float64),
+            np.array([], dtype=np.int8),
+        )
+
+    search = _walk_exits_jit if use_jit else _scan_exits_chunked
+    return search(
+        *_kernel_arrays(
+            entry_indices,
+            stop_prices,
+            target_prices,
+            directions,
+            high_prices,
+            low_prices,
+            close_prices,
+            max_holding_bars,
+        )
+    )
+
+
+def find_sequential_exits(
+    entry_indices: np.ndarray,
+    stop_prices: np.ndarray,
+    target_prices: np.ndarray,
+    directions: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    max_holding_bars: Optional[int] = None,
+    use_jit: Optional[bool] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Accept trades one at a time and find the exits of accepted trades only.
+
+    Walks entries in order: the first entry is accepted, its exit is found,
+    and the search jumps straight to the first entry strictly after that
+    exit bar. Signals overlapping an open position are never simulated, so
+    work scales with the number of accepted trades. Equivalent to running
+    find_first_exits on every entry and then greedily dropping entries at
+    or before the previous accepted exit.
+
+    Args:
+        entry_indices: Entry candle indices, sorted ascending
+        stop_prices: Absolute stop-loss prices per trade
+        target_prices: Absolute take-profit prices per trade
+        directions: Trade directions (1=LONG, -1=SHORT)
+        high_prices: High price array
+        low_prices: Low price array
+        close_prices: Close price array
+        max_holding_bars: Maximum bars held after entry (None = unbounded)
+        use_jit: Force (True) or disable (False) the numba loop. None selects
+            it automatically when numba is available.
+
+    Returns:
+        Tuple of (accepted, exit_indices, exit_prices, exit_reasons) where
+        accepted holds the positions (into entry_indices) of accepted trades
+        and the exit arrays are aligned with it.
+
+    Raises:
+        ValueError: If max_holding_bars is not positive or entries are not
+            sorted
+    """
+    use_jit = _resolve_use_jit(max_holding_bars, use_jit)
+
+    entry_indices = np.ascontiguousarray(entry_indices, dtype=np.int64)
+    if len(entry_indices) == 0:
+        return (
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.int64),
+            np.array([], dtype=np.float64),
+            np.array([], dtype=np.int8),
+        )
+    if np.any(entry_indices[1:] < entry_indices[:-1]):
+        raise ValueError("entry_indices must be sorted ascending")
+
+    arrays = _kernel_arrays(
+        entry_indices,
+        stop_prices,
+        target_prices,
+        directions,
+        high_prices,
+        low_prices,
+        close_prices,
+        max_holding_bars,
+    )
+    if use_jit:
+        return _walk_accepted_jit(*arrays)
+    return _accept_chunked(*arrays)
+
+
+def _accept_chunked(
+    entry_indices: np.ndarray,
+    stop_prices: np.ndarray,
+    target_prices: np.ndarray,
+    directions: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    last_indices: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sequential acceptance using the chunked scan for each accepted trade."""
+    accepted = []
+    exits = []
+    prices = []
+    reasons = []
+
+    t = 0
+    n_trades = len(entry_indices)
+    while t < n_trades:
+        one = slice(t, t + 1)
+        x_idx, x_price, x_reason = _scan_exits_chunked(
+            entry_indices[one],
+            stop_prices[one],
+            target_prices[one],
+            directions[one],
+            high_prices,
+            low_prices,
+            close_prices,
+            last_indices[one],
+        )
+        accepted.append(t)
+        exits.append(x_idx[0])
+        prices.append(x_price[0])
+        reasons.append(x_reason[0])
+        t = max(t + 1, int(np.searchsorted(entry_indices, x_idx[0], side="right")))
+
+    return (
+        np.array(accepted, dtype=np.int64),
+        np.array(exits, dtype=np.int64),
+        np.array(prices, dtype=np.float64),
+        np.array(reasons, dtype=np.int8),
+    )
+
+
+def _resolve_use_jit(max_holding_bars: Optional[int], use_jit: Optional[bool]) -> bool:
+    """Validate the horizon and decide whether the numba loop is used."""
+    if max_holding_bars is not None and max_holding_bars < 1:
+        raise ValueError(f"max_holding_bars must be >= 1, got {max_holding_bars}")
+
+    if use_jit is None:
+        return _NUMBA_AVAILABLE
+    if use_jit and not _NUMBA_AVAILABLE:
+        raise RuntimeError("use_jit=True requested but numba is not installed")
+    return use_jit
+
+
+def _kernel_arrays(
+    entry_indices: np.ndarray,
+    stop_prices: np.ndarray,
+    target_prices: np.ndarray,
+    directions: np.ndarray,
+    high_prices: np.ndarray,
+    low_prices: np.ndarray,
+    close_prices: np.ndarray,
+    max_holding_bars: Optional[int],
+) -> tuple[np.ndarray, ...]:
+    """Contiguous, typed search arguments plus the last searchable bar."""
+    n_bars = len(high_prices)
+    if max_holding_bars is None:
+        last_indices = np.full(len(entry_indices), n_bars - 1, dtype=np.int64)
+    else:
+        last_indices = np.minimum(entry_indices + max_holding_bars, n_bars - 1)
+    # Entry on the final bar: no room to exit
+    last_indices = np.maximum(last_indices, entry_indices)
+
+    return (
+        entry_indices,
+        np.ascontiguousarray(stop_prices, dtype=np.float64),
+        np.ascontiguousarray(target_prices, dtype=np.float64),
+        np.ascontiguousarray(directions, dtype=np.int8),
+        np.ascontiguousarray(high_prices, dtype=np.float64),
+        np.ascontiguousarray(low_prices, dtype=np.float64),
+        np.ascontiguousarray(close_prices, dtype=np.float64),
+        last_indices,
+    )
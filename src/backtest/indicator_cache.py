@@ -1,87 +1,244 @@
 """Indicator caching and precomputation utilities.
 
 This module provides caching mechanisms for derived technical indicators
-to eliminate redundant computation across parameter combinations within
-a single backtest run.
+to eliminate redundant computation across parameter combinations and
+across process restarts.
+
+Two tiers:
+- Memory: LRU bounded by an approximate byte budget.
+- Disk (opt-in via cache_dir, e.g. INDICATOR_CACHE_DIR): one Parquet file
+  per entry, content-addressed by the entry key (Polars DataFrames only).
+  Entries are never evicted; delete the directory to reclaim space.
+
+Keys built by make_indicator_key combine the source data hash
+(dispatcher.source_data_hash) with the normalized indicator name and
+kwargs, so they stay valid across processes for the same data.
 
 Performance target: ≥80% reduction in repeated indicator compute time.
 """
 
 # pylint: disable=unused-import
 
+from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, Any, Optional, Callable
 import hashlib
 import json
+import logging
+import os
+
+import numpy as np
 import pandas as pd
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+# Default disk tier location when persistence is enabled (relative to
+# project root, like .time_cache)
+INDICATOR_CACHE_DIR = Path(".indicator_cache")
+
+# Default in-memory budget per cache
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when indicator implementations change to invalidate disk entries
+CACHE_FORMAT_VERSION = 1
+
+
+def make_indicator_key(
+    data_hash: str,
+    name: str,
+    kwargs: Dict[str, Any],
+    dataset_id: Optional[str] = None,
+) -> str:
+    """Build a stable cache key for one indicator computation.
+
+    Args:
+        data_hash: Hash of the source data (dispatcher.source_data_hash).
+        name: Normalized indicator name (e.g. "ema").
+        kwargs: Effective keyword arguments passed to the indicator function.
+        dataset_id: Optional dataset identifier (e.g. symbol).
+
+    Returns:
+        Canonical JSON key.
+    """
+    return json.dumps(
+        [CACHE_FORMAT_VERSION, dataset_id, data_hash, name, kwargs],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def _estimate_bytes(value: Any) -> int:
+    """Approximate in-memory size of a cached value."""
+    if isinstance(value, pl.DataFrame):
+        return int(value.estimated_size())
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(deep=True)))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    return 0
 
 
 class IndicatorCache:
-    """Lazy-computed cache for technical indicator series.
+    """Two-tier (memory LRU + optional disk) cache for indicator outputs.
 
     Attributes:
-        _cache: Internal storage for computed indicator series.
+        _cache: In-memory LRU storage (most recently used last).
         _dataset_id: Identifier for source dataset to invalidate on data changes.
         _param_signatures: List of parameter combinations cached.
+        max_bytes: In-memory byte budget (None = unbounded).
+        cache_dir: Directory for the disk tier (None = memory only).
     """
 
-    def __init__(self, dataset_id: Optional[str] = None):
+    def __init__(
+        self,
+        dataset_id: Optional[str] = None,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        cache_dir: Optional[Path] = None,
+    ):
         """Initialize empty indicator cache.
 
         Args:
             dataset_id: Optional identifier for the source dataset.
+            max_bytes: In-memory byte budget; least recently used entries
+                are evicted beyond it (None disables eviction).
+            cache_dir: Optional directory for persistent Parquet entries.
         """
-        self._cache: Dict[str, pd.Series] = {}
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
         self._dataset_id = dataset_id
         self._param_signatures: list = []
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes_in_memory = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    @property
+    def dataset_id(self) -> Optional[str]:
+        """Identifier of the source dataset."""
+        return self._dataset_id
+
+    def _disk_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self.cache_dir / f"{digest}.parquet"
 
-    def get(self, key: str) -> Optional[pd.Series]:
-        """Retrieve cached indicator series by key.
+    def _store(self, key: str, value: Any) -> None:
+        """Insert into the memory tier and evict down to the byte budget."""
+        if key in self._cache:
+            self.bytes_in_memory -= self._sizes.pop(key)
+            del self._cache[key]
+
+        size = _estimate_bytes(value)
+        self._cache[key] = value
+        self._sizes[key] = size
+        self.bytes_in_memory += size
+
+        if self.max_bytes is None:
+            return
+        # Keep the newest entry even if it alone exceeds the budget
+        while self.bytes_in_memory > self.max_bytes and len(self._cache) > 1:
+            old_key, _ = self._cache.popitem(last=False)
+            self.bytes_in_memory -= self._sizes.pop(old_key)
+            self.evictions += 1
+
+    def _load_from_disk(self, key: str) -> Optional[pl.DataFrame]:
+        if self.cache_dir is None:
+            return None
+        path = self._disk_path(key)
+        if not path.exists():
+            return None
+        try:
+            df = pl.read_parquet(path)
+        except Exception as exc:
+            logger.warning("Failed to load indicator cache file %s: %s", path, exc)
+            return None
+        self.bytes_read += path.stat().st_size
+        return df
+
+    def _save_to_disk(self, key: str, value: Any) -> None:
+        if self.cache_dir is None or not isinstance(value, pl.DataFrame):
+            return
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Per-process temp name: pool workers may write the same entry
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            value.write_parquet(tmp_path)
+            tmp_path.replace(path)
+            self.bytes_written += path.stat().st_size
+        except Exception as exc:
+            logger.warning("Failed to save indicator cache file %s: %s", path, exc)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Retrieve cached indicator output by key.
+
+        Checks memory first, then the disk tier (promoting hits to memory).
 
         Args:
-            key: Unique identifier for the indicator series.
+            key: Unique identifier for the indicator output.
 
         Returns:
-            Cached series if exists, None otherwise.
+            Cached value if exists, None otherwise.
         """
-        return self._cache.get(key)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key]
+
+        cached = self._load_from_disk(key)
+        if cached is not None:
+            self.disk_hits += 1
+            self._store(key, cached)
+        return cached
 
-    def put(self, key: str, series: pd.Series) -> None:
-        """Store indicator series in cache.
+    def put(self, key: str, series: Any) -> None:
+        """Store indicator output in cache (and on disk if enabled).
 
         Args:
-            key: Unique identifier for the indicator series.
-            series: Computed indicator series to cache.
+            key: Unique identifier for the indicator output.
+            series: Computed series/array/DataFrame to cache.
         """
-        self._cache[key] = series
+        self._store(key, series)
+        self._save_to_disk(key, series)
 
     def clear(self) -> None:
-        """Clear all cached indicators."""
+        """Clear all in-memory cached indicators (disk entries are kept)."""
         self._cache.clear()
+        self._sizes.clear()
+        self.bytes_in_memory = 0
         self._param_signatures.clear()
 
     def get_or_compute(
         self,
         key: str,
-        compute_fn: Callable[[], pd.Series],
+        compute_fn: Callable[[], Any],
         params: Optional[Dict[str, Any]] = None,
-    ) -> pd.Series:
-        """Retrieve cached series or compute if missing (lazy evaluation).
+    ) -> Any:
+        """Retrieve cached output or compute if missing (lazy evaluation).
 
         This is the primary method for cache-aware indicator computation.
 
         Args:
-            key: Unique identifier for the indicator series.
+            key: Unique identifier for the indicator output.
             compute_fn: Function to compute the indicator if not cached.
             params: Optional parameter dict to track for invalidation.
 
         Returns:
-            Cached or freshly computed indicator series.
+            Cached or freshly computed indicator output.
         """
         cached = self.get(key)
         if cached is not None:
             return cached
 
         # Cache miss: compute and store
+        self.misses += 1
         series = compute_fn()
         self.put(key, series)
 
@@ -106,10 +263,10 @@ class IndicatorCache:
         return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()[:16]
 
     def cache_size(self) -> int:
-        """Return number of cached indicator series.
+        """Return number of in-memory cached entries.
 
         Returns:
-            Count of cached series.
+            Count of cached entries.
         """
         return len(self._cache)
 
@@ -120,3 +277,42 @@ class IndicatorCache:
             Count of unique parameter signatures.
         """
         return len(self._param_signatures)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/byte counters.
+
+        Returns:
+            Dictionary of counters suitable for benchmark JSON.
+        """
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._cache),
+            "bytes_in_memory": self.bytes_in_memory,
+            "bytes_written": self.bytes_written,
+            "bytes_read": self.bytes_read,
+        }
+
+
+def merge_cache_stats(caches: Dict[str, IndicatorCache]) -> Dict[str, Any]:
+    """Sum counters across caches (e.g. one per symbol).
+
+    Args:
+        caches: Mapping of name -> IndicatorCache.
+
+    Returns:
+        Totals plus hit_rate (memory + disk hits over lookups).
+    """
+    totals: Dict[str, Any] = {}
+    for cache in caches.values():
+        for name, value in cache.stats().items():
+            totals[name] = totals.get(name, 0) + value
+    lookups = (
+        totals.get("hits", 0) + totals.get("disk_hits", 0) + totals.get("misses", 0)
+    )
+    totals["hit_rate"] = (
+        (totals["hits"] + totals["disk_hits"]) / lookups if lookups else 0.0
+    )
+    return totals
@@ -13,6 +13,7 @@ Supports directional metrics for LONG/SHORT/BOTH mode backtesting.
 
 import logging
 from collections.abc import Sequence
+from typing import Any
 
 import numpy as np
 from numpy.typing import NDArray
@@ -20,6 +21,8 @@ from numpy.typing import NDArray
 from ..models.core import MetricsSummary, TradeExecution
 from ..models.directional import DirectionalMetrics
 from ..models.enums import DirectionMode
+from .metrics_kernel import compute_performance, performance_from_arrays
+from .trade_ledger import TradeLedger
 
 
 logger = logging.getLogger(__name__)
@@ -95,68 +98,30 @@ def compute_metrics(executions: Sequence[TradeExecution]) -> MetricsSummary:
             latency_mean_ms=np.nan,
         )
 
-    # Extract PnL in R multiples
-    pnl_r_values = np.array([ex.pnl_r for ex in executions], dtype=np.float64)
-
-    # Win/loss counts
-    wins = pnl_r_values > 0
-    losses = pnl_r_values < 0
-    win_count = int(np.sum(wins))
-    loss_count = int(np.sum(losses))
-
-    # Win rate
-    win_rate = win_count / trade_count if trade_count > 0 else np.nan
-
-    # Average win/loss
-    avg_win_r = np.mean(pnl_r_values[wins]) if win_count > 0 else np.nan
-    avg_loss_r = np.mean(pnl_r_values[losses]) if loss_count > 0 else np.nan
-
-    # Average R per trade
-    avg_r = float(np.mean(pnl_r_values))
-
-    # Expectancy (R) - expected value per trade
-    expectancy = avg_r
-
-    # Sharpe ratio estimate (assuming independent trades)
-    sharpe_estimate = (
-        float(np.mean(pnl_r_values) / np.std(pnl_r_values))
-        if np.std(pnl_r_values) > 0
-        else np.nan
-    )
-
-    # Profit factor
-    total_wins = np.sum(pnl_r_values[wins]) if win_count > 0 else 0.0
-    total_losses = abs(np.sum(pnl_r_values[losses])) if loss_count > 0 else 0.0
-    profit_factor = float(total_wins / total_losses) if total_losses > 0 else np.inf
-
-    # Maximum drawdown (cumulative R)
-    cumulative_r = np.cumsum(pnl_r_values)
-    running_max = np.maximum.accumulate(cumulative_r)
-    drawdown_r = cumulative_r - running_max
-    max_drawdown_r = float(np.min(drawdown_r)) if len(drawdown_r) > 0 else 0.0
-
-    # Latency metrics (placeholder - requires actual latency data)
-    latency_p95_ms = np.nan
-    latency_mean_ms = np.nan
+    # All trade statistics come from one pass of the metrics kernel
+    performance = compute_performance(executions, breakdowns=False)
+    win_rate = performance.win_rate
+    expectancy = performance.expectancy
 
     metrics = MetricsSummary(
         trade_count=trade_count,
-        win_count=win_count,
-        loss_count=loss_count,
+        win_count=performance.win_count,
+        loss_count=performance.loss_count,
         win_rate=win_rate,
-        avg_win_r=avg_win_r,
-        avg_loss_r=avg_loss_r,
-        avg_r=avg_r,
+        avg_win_r=performance.avg_win_r,
+        avg_loss_r=performance.avg_loss_r,
+        avg_r=performance.avg_r,
         expectancy=expectancy,
-        sharpe_estimate=sharpe_estimate,
-        profit_factor=profit_factor,
-        max_drawdown_r=max_drawdown_r,
-        latency_p95_ms=latency_p95_ms,
-        latency_mean_ms=latency_mean_ms,
-        sortino_ratio=compute_sortino_ratio(pnl_r_values),
-        avg_trade_duration_seconds=compute_avg_duration(executions),
-        max_consecutive_wins=compute_streaks(pnl_r_values, win=True),
-        max_consecutive_losses=compute_streaks(pnl_r_values, win=False),
+        sharpe_estimate=performance.sharpe_estimate,
+        profit_factor=performance.profit_factor,
+        max_drawdown_r=performance.max_drawdown_r,
+        # Latency metrics (placeholder - requires actual latency data)
+        latency_p95_ms=np.nan,
+        latency_mean_ms=np.nan,
+        sortino_ratio=performance.sortino_ratio,
+        avg_trade_duration_seconds=performance.avg_trade_duration_seconds,
+        max_consecutive_wins=performance.max_consecutive_wins,
+        max_consecutive_losses=performance.max_consecutive_losses,
     )
 
     logger.debug(
@@ -173,33 +138,12 @@ def compute_sortino_ratio(pnl_r_series: NDArray[np.float64]) -> float:
     """
     Compute Sortino Ratio (Excess Return / Downside Deviation).
     Assuming Risk Free Rate = 0.
-    """
-    if len(pnl_r_series) < 2:
-        return np.nan
-
-    mean_return = float(np.mean(pnl_r_series))
-
-    # Downside deviation: Standard deviation of negative returns only
-    negative_returns = pnl_r_series[pnl_r_series < 0]
 
-    # If no negative returns, risk is 0 -> Infinite ratio (conceptually).
-    # But usually capped or returned as high value. Or if mean > 0, massive number.
-    # Standard practice: if downside_dev is 0, return NaN or Inf.
-    if len(negative_returns) == 0:
-        return np.inf if mean_return > 0 else np.nan
-
-    # Technically Sortino uses the "Target Return" (0 here) for calculating semi-variance
-    # Semi-variance = sum(min(0, r - target)^2) / N
-    # Here we simplify to std dev of negative returns or use full semi-deviation.
-    # Proper Sortino: sqrt(mean(min(0, returns - target)^2))
-
-    downside_variance = np.mean(np.minimum(0, pnl_r_series) ** 2)
-    downside_dev = np.sqrt(downside_variance)
-
-    if downside_dev == 0:
-        return np.nan
-
-    return float(mean_return / downside_dev)
+    Downside deviation is the semi-deviation over all trades,
+    sqrt(mean(min(0, r)^2)). Returns NaN for fewer than two trades, and inf
+    (positive mean) or NaN when there are no losing trades.
+    """
+    return float(performance_from_arrays(pnl_r_series).sortino_ratio)
 
 
 def compute_avg_duration(executions: Sequence[TradeExecution]) -> float:
@@ -207,6 +151,9 @@ def compute_avg_duration(executions: Sequence[TradeExecution]) -> float:
     if not executions:
         return np.nan
 
+    if isinstance(executions, TradeLedger):
+        return float(np.mean(executions.close_ns - executions.open_ns) / 1e9)
+
     durations = [
         (ex.close_timestamp - ex.open_timestamp).total_seconds() for ex in executions
     ]
@@ -215,24 +162,10 @@ def compute_avg_duration(executions: Sequence[TradeExecution]) -> float:
 
 def compute_streaks(pnl_r_series: NDArray[np.float64], win: bool) -> int:
     """Compute max consecutive wins or losses."""
-    if len(pnl_r_series) == 0:
-        return 0
-
-    # Create boolean array
-    is_hit = (pnl_r_series > 0) if win else (pnl_r_series < 0)
-
-    max_streak = 0
-    current_streak = 0
-
-    for hit in is_hit:
-        if hit:
-            current_streak += 1
-            if current_streak > max_streak:
-                max_streak = current_streak
-        else:
-            current_streak = 0
-
-    return max_streak
+    performance = performance_from_arrays(pnl_r_series)
+    if win:
+        return performance.max_consecutive_wins
+    return performance.max_consecutive_losses
 
 
 def compute_rolling_drawdown(pnl_r_series: NDArray[np.float64]) -> NDArray[np.float64]:
@@ -350,8 +283,12 @@ def calculate_directional_metrics(
         )
     else:  # DirectionMode.BOTH
         # Filter executions by direction
-        long_executions = [e for e in executions if e.direction == "LONG"]
-        short_executions = [e for e in executions if e.direction == "SHORT"]
+        if isinstance(executions, TradeLedger):
+            long_executions = executions.take(executions.direction == 1)
+            short_executions = executions.take(executions.direction == -1)
+        else:
+            long_executions = [e for e in executions if e.direction == "LONG"]
+            short_executions = [e for e in executions if e.direction == "SHORT"]
 
         long_metrics = calculate_metrics(long_executions) if long_executions else None
         short_metrics = (
@@ -370,12 +307,14 @@ def compute_portfolio_metrics(
     runtime_seconds: float,
     strategies_count: int,
     instruments_count: int,
+    equity_curve: Any = None,
 ) -> dict:
     """
     Compute portfolio-level performance metrics for multi-strategy runs.
 
     Calculates portfolio statistics from aggregated results per FR-022.
-    Volatility computation is stubbed initially (returns 0.0).
+    Volatility is annualized from the daily returns of the portfolio equity
+    curve (see metrics_kernel); it is 0.0 without a curve.
 
     Args:
         aggregated_pnl: Weighted portfolio PnL.
@@ -383,12 +322,14 @@ def compute_portfolio_metrics(
         runtime_seconds: Wall-clock runtime.
         strategies_count: Number of strategies executed.
         instruments_count: Distinct instruments traded.
+        equity_curve: Optional portfolio equity (EquityCurve,
+            MarkToMarketEquity or (timestamp, equity) tuples).
 
     Returns:
         Dictionary with portfolio metrics:
             - aggregate_pnl: Total weighted PnL
             - max_drawdown_pct: Maximum portfolio drawdown
-            - volatility_annualized: Annualized volatility (stub: 0.0)
+            - volatility_annualized: Annualized volatility of daily returns
             - runtime_seconds: Execution time
             - strategies_count: Strategy count
             - instruments_count: Instrument count
@@ -406,8 +347,11 @@ def compute_portfolio_metrics(
         >>> metrics["max_drawdown_pct"]
         0.08
     """
-    # Stub volatility (future: compute from PnL time series)
     volatility_annualized = 0.0
+    if equity_curve is not None and len(equity_curve):
+        performance = compute_performance([], equity_curve, breakdowns=False)
+        if np.isfinite(performance.volatility_annualized):
+            volatility_annualized = performance.volatility_annualized
 
     portfolio_metrics = {
         "aggregate_pnl": aggregated_pnl,
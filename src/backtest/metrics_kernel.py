@@ -0,0 +1,680 @@
+"""One-pass performance metrics kernel.
+
+Trade statistics, drawdowns and time-based risk statistics used to be
+recomputed separately by metrics, drawdown, sweep summaries, walk-forward
+stitching and the portfolio formatters, each with its own passes (and its
+own drawdown definition). This module computes all of them from trade
+columns (see TradeLedger) and an optional equity series in two streaming
+passes:
+
+- Trade pass over R-multiples: counts, mean and variance, gross
+  profit/loss, downside deviation, win/loss streaks and the cumulative-R
+  drawdown.
+- Equity pass over (timestamp, equity) points: dollar and percentage
+  drawdown from the running peak, average drawdown depth per episode,
+  time under water, and daily returns (mean and variance, Welford) for
+  daily/annualized volatility and Sharpe.
+
+Both passes are compiled with numba when it is installed; otherwise the
+same statistics are computed with vectorized NumPy. Per-symbol and
+per-direction breakdowns are a bincount group-by over the trade columns.
+
+Conventions:
+- R and dollar drawdowns are <= 0 (as in drawdown.py); percentage
+  drawdowns are positive fractions of the running peak (as in reports).
+- Daily returns are close-to-close returns of UTC calendar days. Weekdays
+  without an equity point between two observed days count as zero-return
+  days, so a closed-balance curve (one point per exit) and a bar-level
+  curve give comparable volatility. Annualization uses 252 trading days.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+
+from src.backtest.trade_ledger import TradeLedger, equity_arrays
+
+# Optional numba JIT for the streaming passes
+_NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+
+
+logger = logging.getLogger(__name__)
+
+TRADING_DAYS_PER_YEAR = 252
+NS_PER_DAY = 86_400 * 10**9
+
+# Slots of the trade-pass result vector
+(
+    _T_COUNT,
+    _T_WINS,
+    _T_LOSSES,
+    _T_SUM,
+    _T_M2,
+    _T_GROSS_PROFIT,
+    _T_GROSS_LOSS,
+    _T_DOWNSIDE_SQ,
+    _T_WIN_STREAK,
+    _T_LOSS_STREAK,
+    _T_MAX_DD_R,
+) = range(11)
+_N_TRADE_SLOTS = 11
+
+# Slots of the equity-pass result vector
+(
+    _E_MAX_DD,
+    _E_MAX_DD_PCT,
+    _E_EPISODE_SUM,
+    _E_EPISODES,
+    _E_UNDERWATER_NS,
+    _E_MAX_UNDERWATER_NS,
+    _E_SPAN_NS,
+    _E_DAYS,
+    _E_DAY_MEAN,
+    _E_DAY_M2,
+) = range(10)
+_N_EQUITY_SLOTS = 10
+
+
+def _trade_pass(pnl_r: np.ndarray) -> np.ndarray:
+    """Streaming pass over R-multiples (compiled with numba when available).
+
+    The variance is accumulated in a second, branch-free loop around the
+    mean, which compiles to SIMD code and avoids a per-trade division.
+    """
+    out = np.zeros(_N_TRADE_SLOTS)
+    n_trades = pnl_r.shape[0]
+    total = 0.0
+    wins = 0
+    losses = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    downside_sq = 0.0
+    win_run = 0
+    loss_run = 0
+    max_win_run = 0
+    max_loss_run = 0
+    peak = -np.inf
+    max_dd = 0.0
+
+    for i in range(n_trades):
+        r = pnl_r[i]
+        if r > 0:
+            wins += 1
+            gross_profit += r
+            win_run += 1
+            loss_run = 0
+            if win_run > max_win_run:
+                max_win_run = win_run
+        elif r < 0:
+            losses += 1
+            gross_loss -= r
+            downside_sq += r * r
+            loss_run += 1
+            win_run = 0
+            if loss_run > max_loss_run:
+                max_loss_run = loss_run
+        else:
+            win_run = 0
+            loss_run = 0
+
+        total += r
+        if total > peak:
+            peak = total
+        elif total - peak < max_dd:
+            max_dd = total - peak
+
+    m2 = 0.0
+    if n_trades:
+        mean = total / n_trades
+        for i in range(n_trades):
+            delta = pnl_r[i] - mean
+            m2 += delta * delta
+
+    out[_T_COUNT] = n_trades
+    out[_T_WINS] = wins
+    out[_T_LOSSES] = losses
+    out[_T_SUM] = total
+    out[_T_M2] = m2
+    out[_T_GROSS_PROFIT] = gross_profit
+    out[_T_GROSS_LOSS] = gross_loss
+    out[_T_DOWNSIDE_SQ] = downside_sq
+    out[_T_WIN_STREAK] = max_win_run
+    out[_T_LOSS_STREAK] = max_loss_run
+    out[_T_MAX_DD_R] = max_dd
+    return out
+
+
+def _weekdays_between(first_day: int, last_day: int) -> int:
+    """Weekdays strictly between two epoch day numbers (day 0 is a Thursday)."""
+    count = 0
+    for day in range(first_day + 1, last_day):
+        if (day + 3) % 7 < 5:
+            count += 1
+    return count
+
+
+def _equity_pass(
+    epoch_ns: np.ndarray,
+    equity: np.ndarray,
+    start_peak: Any,
+    start_equity: float,
+) -> np.ndarray:
+    """Streaming pass over equity points (compiled with numba when available).
+
+    A drawdown episode runs from the first point below the peak to the next
+    point back at the peak. The peak is constant within an episode, so its
+    depth, dollar drawdown and duration are settled once per episode from
+    the episode's lowest point. Dollar drawdowns are computed in the equity
+    dtype, so a float32 mark-to-market series matches float32 array math.
+    """
+    out = np.zeros(_N_EQUITY_SLOTS)
+    n_points = equity.shape[0]
+    peak = start_peak
+    low = start_peak
+    in_drawdown = False
+    episode_start = 0
+    max_dd = 0.0
+    max_dd_pct = 0.0
+    episode_sum = 0.0
+    episodes = 0
+    underwater_ns = 0
+    max_run_ns = 0
+
+    day = epoch_ns[0] // NS_PER_DAY
+    next_day_ns = (day + 1) * NS_PER_DAY
+    day_close = float(equity[0])
+    prev_close = start_equity
+    n_days = 0
+    day_mean = 0.0
+    day_m2 = 0.0
+
+    for i in range(n_points + 1):
+        # Settle the open episode at a recovery and after the last point
+        recovered = i == n_points or equity[i] >= peak
+        if in_drawdown and recovered:
+            end_ns = epoch_ns[i] if i < n_points else epoch_ns[n_points - 1]
+            run_ns = end_ns - episode_start
+            underwater_ns += run_ns
+            if run_ns > max_run_ns:
+                max_run_ns = run_ns
+            drawdown = low - peak
+            if drawdown < max_dd:
+                max_dd = drawdown
+            peak_value = float(peak)
+            pct = (peak_value - float(low)) / peak_value if peak_value > 0 else 0.0
+            if pct > max_dd_pct:
+                max_dd_pct = pct
+            episode_sum += pct
+            episodes += 1
+            in_drawdown = False
+        if i == n_points:
+            break
+
+        value = equity[i]
+        if recovered:
+            peak = value
+        elif not in_drawdown:
+            in_drawdown = True
+            episode_start = epoch_ns[i]
+            low = value
+        elif value < low:
+            low = value
+
+        if epoch_ns[i] >= next_day_ns:
+            current_day = epoch_ns[i] // NS_PER_DAY
+            ret = day_close / prev_close - 1.0 if prev_close > 0 else 0.0
+            n_days += 1
+            delta = ret - day_mean
+            day_mean += delta / n_days
+            day_m2 += delta * (ret - day_mean)
+            # Merge the zero-return weekdays without a point
+            gap = _weekdays_between(day, current_day)
+            if gap > 0:
+                total_days = n_days + gap
+                delta = -day_mean
+                day_m2 += delta * delta * n_days * gap / total_days
+                day_mean += delta * gap / total_days
+                n_days = total_days
+            prev_close = day_close
+            day = current_day
+            next_day_ns = (day + 1) * NS_PER_DAY
+        day_close = float(value)
+
+    ret = day_close / prev_close - 1.0 if prev_close > 0 else 0.0
+    n_days += 1
+    delta = ret - day_mean
+    day_mean += delta / n_days
+    day_m2 += delta * (ret - day_mean)
+
+    out[_E_MAX_DD] = max_dd
+    out[_E_MAX_DD_PCT] = max_dd_pct
+    out[_E_EPISODE_SUM] = episode_sum
+    out[_E_EPISODES] = episodes
+    out[_E_UNDERWATER_NS] = underwater_ns
+    out[_E_MAX_UNDERWATER_NS] = max_run_ns
+    out[_E_SPAN_NS] = epoch_ns[n_points - 1] - epoch_ns[0]
+    out[_E_DAYS] = n_days
+    out[_E_DAY_MEAN] = day_mean
+    out[_E_DAY_M2] = day_m2
+    return out
+
+
+if _NUMBA_AVAILABLE:
+    _trade_pass_jit = njit(cache=True, nogil=True)(_trade_pass)
+    # Rebound so the compiled equity pass calls the compiled helper
+    _weekdays_between = njit(cache=True, nogil=True)(_weekdays_between)
+    _equity_pass_jit = njit(cache=True, nogil=True)(_equity_pass)
+else:
+    _trade_pass_jit = None
+    _equity_pass_jit = None
+
+
+def _longest_run(hits: np.ndarray) -> int:
+    """Longest run of True values."""
+    if not hits.any():
+        return 0
+    padded = np.r_[False, hits, False].astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return int((edges[1::2] - edges[::2]).max())
+
+
+def _trade_stats_numpy(pnl_r: np.ndarray) -> np.ndarray:
+    """Vectorized equivalent of _trade_pass."""
+    out = np.zeros(_N_TRADE_SLOTS)
+    n_trades = pnl_r.size
+    out[_T_COUNT] = n_trades
+    if n_trades == 0:
+        return out
+    wins = pnl_r > 0
+    losses = pnl_r < 0
+    cumulative = np.cumsum(pnl_r)
+    out[_T_WINS] = np.count_nonzero(wins)
+    out[_T_LOSSES] = np.count_nonzero(losses)
+    out[_T_SUM] = cumulative[-1]
+    out[_T_M2] = np.sum((pnl_r - pnl_r.mean()) ** 2)
+    out[_T_GROSS_PROFIT] = pnl_r[wins].sum()
+    out[_T_GROSS_LOSS] = -pnl_r[losses].sum()
+    out[_T_DOWNSIDE_SQ] = np.sum(pnl_r[losses] ** 2)
+    out[_T_WIN_STREAK] = _longest_run(wins)
+    out[_T_LOSS_STREAK] = _longest_run(losses)
+    out[_T_MAX_DD_R] = min(
+        float(np.min(cumulative - np.maximum.accumulate(cumulative))), 0.0
+    )
+    return out
+
+
+def _equity_stats_numpy(
+    epoch_ns: np.ndarray,
+    equity: np.ndarray,
+    start_peak: Any,
+    start_equity: float,
+) -> np.ndarray:
+    """Vectorized equivalent of _equity_pass."""
+    out = np.zeros(_N_EQUITY_SLOTS)
+    peak = np.maximum(np.maximum.accumulate(equity), start_peak)
+    under = equity < peak
+    out[_E_MAX_DD] = min(float(np.min(equity - peak)), 0.0)
+
+    peak64 = peak.astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(
+            under & (peak64 > 0), (peak64 - equity.astype(np.float64)) / peak64, 0.0
+        )
+    out[_E_MAX_DD_PCT] = pct.max()
+
+    if under.any():
+        # Episodes are maximal runs of points below the peak
+        episode_ids = np.cumsum(~under)[under]
+        starts = np.r_[0, np.flatnonzero(np.diff(episode_ids)) + 1]
+        troughs = np.maximum.reduceat(pct[under], starts)
+        out[_E_EPISODE_SUM] = troughs.sum()
+        out[_E_EPISODES] = troughs.size
+
+        spans = np.where(under[:-1], np.diff(epoch_ns), 0)
+        running = np.cumsum(spans)
+        reset = np.maximum.accumulate(np.where(under[:-1], 0, running))
+        out[_E_UNDERWATER_NS] = running[-1] if running.size else 0
+        out[_E_MAX_UNDERWATER_NS] = (running - reset).max() if running.size else 0
+    out[_E_SPAN_NS] = epoch_ns[-1] - epoch_ns[0]
+
+    days = epoch_ns // NS_PER_DAY
+    last_of_day = np.r_[np.flatnonzero(np.diff(days)), days.size - 1]
+    closes = equity[last_of_day].astype(np.float64)
+    previous = np.r_[start_equity, closes[:-1]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(previous > 0, closes / previous - 1.0, 0.0)
+    observed = days[last_of_day].astype("datetime64[D]")
+    zero_days = int(np.busday_count(observed[:-1] + 1, observed[1:]).sum())
+    n_days = returns.size + zero_days
+    mean = returns.sum() / n_days
+    out[_E_DAYS] = n_days
+    out[_E_DAY_MEAN] = mean
+    out[_E_DAY_M2] = np.sum((returns - mean) ** 2) + zero_days * mean * mean
+    return out
+
+
+def group_breakdown(
+    labels: np.ndarray, pnl_r: np.ndarray, pnl_dollars: np.ndarray
+) -> dict[str, dict]:
+    """Per-label trade statistics via a bincount group-by.
+
+    Groups are returned in order of their first trade. A trade is a win if
+    pnl_r > 0; every other trade counts as a loss.
+
+    Args:
+        labels: Group label per trade (symbol, direction name, ...).
+        pnl_r: R-multiple per trade.
+        pnl_dollars: Dollar P&L per trade.
+
+    Returns:
+        Label -> trade_count, win_count, loss_count, total_pnl, total_r,
+        win_rate, avg_r (the PortfolioResult.per_symbol_trades schema).
+    """
+    if len(labels) == 0:
+        return {}
+    names, first, codes = np.unique(
+        np.asarray(labels).astype(str), return_index=True, return_inverse=True
+    )
+    n_groups = names.size
+    wins = pnl_r > 0
+    trade_count = np.bincount(codes, minlength=n_groups)
+    win_count = np.bincount(codes[wins], minlength=n_groups)
+    total_pnl = np.bincount(codes, pnl_dollars, n_groups)
+    total_r = np.bincount(codes, pnl_r, n_groups)
+
+    breakdown = {}
+    for k in np.argsort(first, kind="stable").tolist():
+        tc = int(trade_count[k])
+        wc = int(win_count[k])
+        breakdown[str(names[k])] = {
+            "trade_count": tc,
+            "win_count": wc,
+            "loss_count": tc - wc,
+            "total_pnl": float(total_pnl[k]),
+            "total_r": float(total_r[k]),
+            "win_rate": wc / tc,
+            "avg_r": float(total_r[k]) / tc,
+        }
+    return breakdown
+
+
+@dataclass
+class PerformanceMetrics:
+    """Trade, drawdown and time-based risk statistics of one run.
+
+    Trade statistics are NaN (counts 0) without trades; equity statistics
+    are NaN without an equity series.
+
+    Attributes:
+        trade_count: Number of trades.
+        win_count: Trades with pnl_r > 0.
+        loss_count: Trades with pnl_r < 0 (breakeven trades are neither).
+        win_rate: win_count / trade_count.
+        avg_win_r: Mean R of winning trades.
+        avg_loss_r: Mean R of losing trades (negative).
+        avg_r: Mean R per trade (the expectancy).
+        expectancy: Same as avg_r.
+        r_std: Population standard deviation of R.
+        r_std_sample: Sample standard deviation of R (ddof=1).
+        sharpe_estimate: avg_r / r_std (trades treated as independent).
+        sortino_ratio: avg_r / downside deviation of R (target 0).
+        profit_factor: gross_profit_r / gross_loss_r (inf without losses).
+        gross_profit_r: Sum of winning R.
+        gross_loss_r: Sum of losing R, as a positive number.
+        max_consecutive_wins: Longest run of wins.
+        max_consecutive_losses: Longest run of losses.
+        max_drawdown_r: Largest decline of cumulative R from its peak (<= 0).
+        avg_trade_duration_seconds: Mean holding time.
+        max_drawdown: Largest dollar decline of equity from its peak (<= 0).
+        max_drawdown_pct: Largest decline as a fraction of the peak.
+        avg_drawdown_pct: Mean trough depth over drawdown episodes.
+        time_under_water_pct: Fraction of the curve's time span spent
+            below the running peak.
+        max_time_under_water_seconds: Longest stretch below the peak.
+        trading_days: Daily returns used (including zero-return weekdays).
+        volatility_daily: Sample standard deviation of daily returns.
+        volatility_annualized: volatility_daily * sqrt(252).
+        sharpe_daily: Mean daily return / volatility_daily.
+        sharpe_annualized: sharpe_daily * sqrt(252).
+        per_symbol: Symbol -> group statistics (see group_breakdown).
+        per_direction: 'LONG'/'SHORT' -> group statistics.
+    """
+
+    trade_count: int = 0
+    win_count: int = 0
+    loss_count: int = 0
+    win_rate: float = np.nan
+    avg_win_r: float = np.nan
+    avg_loss_r: float = np.nan
+    avg_r: float = np.nan
+    expectancy: float = np.nan
+    r_std: float = np.nan
+    r_std_sample: float = np.nan
+    sharpe_estimate: float = np.nan
+    sortino_ratio: float = np.nan
+    profit_factor: float = np.nan
+    gross_profit_r: float = 0.0
+    gross_loss_r: float = 0.0
+    max_consecutive_wins: int = 0
+    max_consecutive_losses: int = 0
+    max_drawdown_r: float = np.nan
+    avg_trade_duration_seconds: float = np.nan
+    max_drawdown: float = np.nan
+    max_drawdown_pct: float = np.nan
+    avg_drawdown_pct: float = np.nan
+    time_under_water_pct: float = np.nan
+    max_time_under_water_seconds: float = np.nan
+    trading_days: int = 0
+    volatility_daily: float = np.nan
+    volatility_annualized: float = np.nan
+    sharpe_daily: float = np.nan
+    sharpe_annualized: float = np.nan
+    per_symbol: dict[str, dict] = field(default_factory=dict)
+    per_direction: dict[str, dict] = field(default_factory=dict)
+
+
+def _resolve_jit(use_jit: Optional[bool]) -> bool:
+    if use_jit is None:
+        return _NUMBA_AVAILABLE
+    if use_jit and not _NUMBA_AVAILABLE:
+        logger.warning("numba not installed; using the NumPy metrics path")
+        return False
+    return use_jit
+
+
+def _trade_fields(pnl_r: np.ndarray, use_jit: bool) -> dict[str, Any]:
+    """Trade-pass statistics as PerformanceMetrics fields."""
+    pnl_r = np.ascontiguousarray(pnl_r, dtype=np.float64)
+    stats = _trade_pass_jit(pnl_r) if use_jit else _trade_stats_numpy(pnl_r)
+    (
+        n_trades,
+        wins,
+        losses,
+        total,
+        m2,
+        gross_profit,
+        gross_loss,
+        downside_sq,
+        win_streak,
+        loss_streak,
+        max_dd_r,
+    ) = stats.tolist()
+    n_trades = int(n_trades)
+    if n_trades == 0:
+        return {}
+
+    wins = int(wins)
+    losses = int(losses)
+    avg_r = total / n_trades
+    r_std = math.sqrt(m2 / n_trades)
+    r_std_sample = math.sqrt(m2 / (n_trades - 1)) if n_trades > 1 else np.nan
+
+    # Sortino: downside deviation over all trades with target 0
+    sortino = np.nan
+    if n_trades > 1:
+        if losses == 0:
+            sortino = np.inf if avg_r > 0 else np.nan
+        else:
+            downside_dev = math.sqrt(downside_sq / n_trades)
+            sortino = avg_r / downside_dev if downside_dev > 0 else np.nan
+
+    return {
+        "trade_count": n_trades,
+        "win_count": wins,
+        "loss_count": losses,
+        "win_rate": wins / n_trades,
+        "avg_win_r": gross_profit / wins if wins else np.nan,
+        "avg_loss_r": -gross_loss / losses if losses else np.nan,
+        "avg_r": avg_r,
+        "expectancy": avg_r,
+        "r_std": r_std,
+        "r_std_sample": r_std_sample,
+        "sharpe_estimate": avg_r / r_std if r_std > 0 else np.nan,
+        "sortino_ratio": sortino,
+        "profit_factor": gross_profit / gross_loss if gross_loss > 0 else np.inf,
+        "gross_profit_r": gross_profit,
+        "gross_loss_r": gross_loss,
+        "max_consecutive_wins": int(win_streak),
+        "max_consecutive_losses": int(loss_streak),
+        "max_drawdown_r": max_dd_r,
+    }
+
+
+def _equity_fields(
+    epoch_ns: np.ndarray,
+    equity: np.ndarray,
+    starting_equity: Optional[float],
+    use_jit: bool,
+) -> dict[str, Any]:
+    """Equity-pass statistics as PerformanceMetrics fields."""
+    if equity.size == 0:
+        return {}
+    epoch_ns = np.ascontiguousarray(epoch_ns, dtype=np.int64)
+    if equity.dtype not in (np.float32, np.float64):
+        equity = equity.astype(np.float64)
+    equity = np.ascontiguousarray(equity)
+
+    dtype = equity.dtype.type
+    start_peak = dtype(-np.inf if starting_equity is None else starting_equity)
+    start_equity = float(equity[0] if starting_equity is None else starting_equity)
+    kernel = _equity_pass_jit if use_jit else _equity_stats_numpy
+    (
+        max_dd,
+        max_dd_pct,
+        episode_sum,
+        episodes,
+        underwater_ns,
+        max_underwater_ns,
+        span_ns,
+        n_days,
+        day_mean,
+        day_m2,
+    ) = kernel(epoch_ns, equity, start_peak, start_equity).tolist()
+
+    n_days = int(n_days)
+    volatility = math.sqrt(day_m2 / (n_days - 1)) if n_days > 1 else np.nan
+    sharpe = day_mean / volatility if n_days > 1 and volatility > 0 else np.nan
+    annualize = math.sqrt(TRADING_DAYS_PER_YEAR)
+    return {
+        "max_drawdown": max_dd,
+        "max_drawdown_pct": max_dd_pct,
+        "avg_drawdown_pct": episode_sum / episodes if episodes else 0.0,
+        "time_under_water_pct": underwater_ns / span_ns if span_ns > 0 else 0.0,
+        "max_time_under_water_seconds": max_underwater_ns / 1e9,
+        "trading_days": n_days,
+        "volatility_daily": volatility,
+        "volatility_annualized": volatility * annualize,
+        "sharpe_daily": sharpe,
+        "sharpe_annualized": sharpe * annualize,
+    }
+
+
+def performance_from_arrays(
+    pnl_r: np.ndarray,
+    epoch_ns: Optional[np.ndarray] = None,
+    equity: Optional[np.ndarray] = None,
+    starting_equity: Optional[float] = None,
+    use_jit: Optional[bool] = None,
+) -> PerformanceMetrics:
+    """Compute performance metrics from raw arrays (no breakdowns).
+
+    The lean entry point for callers that rank many runs.
+
+    Args:
+        pnl_r: R-multiple per trade, in trade order.
+        epoch_ns: Equity point timestamps (int64 epoch ns, ascending).
+        equity: Equity per point (float32 or float64).
+        starting_equity: Equity before the first point; counts as the
+            first peak and the reference for the first daily return.
+        use_jit: Force the numba (True) or NumPy (False) path; None picks
+            numba when installed.
+
+    Returns:
+        PerformanceMetrics without per-symbol/direction breakdowns.
+    """
+    jit = _resolve_jit(use_jit)
+    fields = _trade_fields(pnl_r, jit)
+    if equity is not None and epoch_ns is not None:
+        fields.update(
+            _equity_fields(epoch_ns, np.asarray(equity), starting_equity, jit)
+        )
+    return PerformanceMetrics(**fields)
+
+
+def compute_performance(
+    trades: Any,
+    equity_curve: Any = None,
+    starting_equity: Optional[float] = None,
+    breakdowns: bool = True,
+    use_jit: Optional[bool] = None,
+) -> PerformanceMetrics:
+    """Compute all performance metrics of a run.
+
+    Args:
+        trades: TradeLedger, or a sequence of ClosedTrade/TradeExecution
+            objects (collected into a ledger once).
+        equity_curve: Optional EquityCurve, MarkToMarketEquity or list of
+            (timestamp, equity) tuples.
+        starting_equity: Equity before the first point (defaults to a
+            MarkToMarketEquity's starting_equity, else the first point).
+        breakdowns: Also compute per-symbol and per-direction statistics.
+        use_jit: See performance_from_arrays.
+
+    Returns:
+        PerformanceMetrics.
+    """
+    ledger = TradeLedger.from_trades(trades)
+    jit = _resolve_jit(use_jit)
+    fields = _trade_fields(ledger.pnl_r, jit)
+    if len(ledger):
+        durations = ledger.close_ns - ledger.open_ns
+        fields["avg_trade_duration_seconds"] = float(np.mean(durations)) / 1e9
+
+    if equity_curve is not None:
+        if starting_equity is None:
+            starting_equity = getattr(equity_curve, "starting_equity", None)
+        epoch_ns, equity = equity_arrays(equity_curve)
+        fields.update(_equity_fields(epoch_ns, equity, starting_equity, jit))
+
+    if breakdowns and len(ledger):
+        fields["per_symbol"] = group_breakdown(
+            ledger.symbol, ledger.pnl_r, ledger.pnl_dollars
+        )
+        directed = ledger.direction != 0
+        fields["per_direction"] = group_breakdown(
+            np.where(ledger.direction[directed] == 1, "LONG", "SHORT"),
+            ledger.pnl_r[directed],
+            ledger.pnl_dollars[directed],
+        )
+    return PerformanceMetrics(**fields)
@@ -23,7 +23,8 @@ class StructuredMetrics(BaseModel):
         runtime_seconds: Wall-clock runtime from start to aggregation completion.
         aggregate_pnl: Weighted portfolio PnL (base currency).
         max_drawdown_pct: Maximum portfolio drawdown percentage.
-        volatility_annualized: Annualized return volatility (stub initial).
+        volatility_annualized: Annualized volatility of the portfolio equity's
+            daily returns (0.0 when no strategy reports an equity curve).
         net_exposure_by_instrument: Mapping instrument -> net exposure value.
         weights_applied: Final normalized weights used.
         global_drawdown_limit: Configured global drawdown threshold if provided.
@@ -66,7 +67,7 @@ class StructuredMetrics(BaseModel):
         ..., ge=0.0, le=1.0, description="Maximum portfolio drawdown"
     )
     volatility_annualized: float = Field(
-        default=0.0, ge=0.0, description="Annualized volatility (stub)"
+        default=0.0, ge=0.0, description="Annualized volatility"
     )
     net_exposure_by_instrument: dict[str, float] = Field(
         default_factory=dict, description="Net exposure per instrument"
@@ -17,6 +17,7 @@ from contextlib import nullcontext
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import polars as pl
 from rich.progress import (
     BarColumn,
@@ -38,11 +39,10 @@ from ..strategy.trend_pullback.signal_generator import (
     generate_short_signals,
 )
 from ..strategy.trend_pullback.signal_generator_vectorized import (
-    generate_signals_vectorized,
+    generate_signal_batch,
 )
 
 if TYPE_CHECKING:
-    import numpy as np
     import pandas as pd
 
     from ..backtest.batch_scan import ScanResult
@@ -140,80 +140,6 @@ class BacktestOrchestrator:
         if self.enable_profiling and self.profiler:
             self.profiler.end_phase(phase_name)
 
-    def _build_blackout_windows(self, data_start_date, data_end_date) -> list[tuple]:
-        """Build blackout windows from config for the data date range.
-
-        Args:
-            data_start_date: Start date of the backtest data.
-            data_end_date: End date of the backtest data.
-
-        Returns:
-            List of (start_utc, end_utc) tuples for blackout filtering.
-        """
-        if not self.blackout_config or not self.blackout_config.any_enabled:
-            return []
-
-        from src.risk.blackout.calendar import generate_news_calendar
-        from src.risk.blackout.windows import (
-            expand_news_windows,
-            expand_session_windows,
-            merge_overlapping_windows,
-        )
-
-        all_windows = []
-
-        # Get date range for calendar generation
-        from datetime import date
-
-        if hasattr(data_start_date, "date"):
-            start_date = data_start_date.date()
-        else:
-            start_date = date.fromisoformat(str(data_start_date)[:10])
-        if hasattr(data_end_date, "date"):
-            end_date = data_end_date.date()
-        else:
-            end_date = date.fromisoformat(str(data_end_date)[:10])
-
-        # Build news blackout windows
-        if self.blackout_config.news.enabled:
-            events = generate_news_calendar(
-                start_date, end_date, event_types=self.blackout_config.news.event_types
-            )
-            news_windows = expand_news_windows(events, self.blackout_config.news)
-            all_windows.extend(news_windows)
-            logger.info("Built %d news blackout windows", len(news_windows))
-
-        # Build session blackout windows
-        if self.blackout_config.sessions.enabled:
-            session_windows = expand_session_windows(
-                start_date, end_date, self.blackout_config.sessions
-            )
-            all_windows.extend(session_windows)
-            logger.info("Built %d session blackout windows", len(session_windows))
-
-        # Build session-only blackouts (whitelist approach)
-        if self.blackout_config.session_only.enabled:
-            from src.risk.blackout.sessions import build_session_only_blackouts
-
-            session_only_blackouts = build_session_only_blackouts(
-                start_date, end_date, self.blackout_config.session_only.allowed_sessions
-            )
-            logger.info(
-                "Built %d session-only blackout windows for %s",
-                len(session_only_blackouts),
-                self.blackout_config.session_only.allowed_sessions,
-            )
-            # Return directly - session_only is exclusive
-            return session_only_blackouts
-
-        # Merge overlapping windows
-        if all_windows:
-            merged = merge_overlapping_windows(all_windows)
-            logger.info("Merged to %d total blackout windows", len(merged))
-            return [(w.start_utc, w.end_utc) for w in merged]
-
-        return []
-
     def _simulate_batch(
         self,
         signals: Sequence[TradeSignal],
@@ -756,7 +682,7 @@ class BacktestOrchestrator:
                 f"[cyan]Generating signals for {pair}...", total=None
             )
 
-            signals = generate_signals_vectorized(
+            signals = generate_signal_batch(
                 data,
                 parameters={"pair": pair, **signal_params},
                 direction_mode=self.direction_mode.name,
@@ -800,55 +726,37 @@ class BacktestOrchestrator:
                     ["high", "low", "close", "timestamp_utc"]
                 ).to_pandas()
 
-                # Map signals to entry dicts
-                # We need entry_index. Since 'data' is chronologically sorted, we can use row index.
-                # But signals have timestamps.
-                # Efficient way: Map signal timestamp to index.
-                # Since signals were generated from 'data', the timestamp match should be exact.
-
-                # Create a map of timestamp -> index
-                # This is overhead. Ideally signal generator returns indices.
-                # But abstracting TradeSignal is good.
-
-                # Optimization:
-                # If signals are sorted and data is sorted, we can search sorted.
-                timestamp_map = {
-                    ts: idx for idx, ts in enumerate(price_data_pd["timestamp_utc"])
-                }
-
-                entries = []
-                for i, sig in enumerate(signals):
-                    idx = timestamp_map.get(sig.timestamp_utc)
-                    if idx is not None:
-                        # Calculate SL/TP pct
-                        risk_distance = abs(sig.entry_price - sig.initial_stop_price)
-                        # avoid div by zero
-                        if sig.entry_price == 0:
-                            progress.update(sim_task, advance=1)
-                            continue
-
-                        stop_loss_pct = risk_distance / sig.entry_price
-                        # Default 2R target if not specified?
-                        # signal info doesn't have target price explicitly usually, it uses R-multiple.
-                        # existing code used risk_distance * 2.0
-                        target_pct = (
-                            risk_distance * signal_params.get("target_r_mult", 2.0)
-                        ) / sig.entry_price
-
-                        entries.append(
-                            {
-                                "signal": sig,
-                                "entry_index": idx,
-                                "entry_price": sig.entry_price,
-                                "side": sig.direction,
-                                "stop_loss_pct": stop_loss_pct,
-                                "take_profit_pct": target_pct,
-                            }
-                        )
-
-                    # Update progress every 1000 signals to avoid overhead
-                    if i % 1000 == 0 or i == len(signals) - 1:
-                        progress.update(sim_task, completed=i + 1)
+                # Map signals to entry dicts straight from the batch columns:
+                # row indices refer to `data`, so no timestamp lookup is needed
+                entry_prices = signals.entry_prices
+                risk_distance = np.abs(entry_prices - signals.stop_prices)
+                valid = entry_prices != 0
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    stop_loss_pct = risk_distance / entry_prices
+                    target_pct = (
+                        risk_distance * signal_params.get("target_r_mult", 2.0)
+                    ) / entry_prices
+                sides = np.where(signals.directions == 1, "LONG", "SHORT")
+
+                entries = [
+                    {
+                        "signal_position": position,
+                        "entry_index": idx,
+                        "entry_price": entry,
+                        "side": side,
+                        "stop_loss_pct": sl,
+                        "take_profit_pct": tp,
+                    }
+                    for position, idx, entry, side, sl, tp in zip(
+                        np.flatnonzero(valid).tolist(),
+                        signals.indices[valid].tolist(),
+                        entry_prices[valid].tolist(),
+                        sides[valid].tolist(),
+                        stop_loss_pct[valid].tolist(),
+                        target_pct[valid].tolist(),
+                    )
+                ]
+                progress.update(sim_task, completed=len(signals))
 
                 if entries:
                     progress.update(
@@ -887,7 +795,6 @@ class BacktestOrchestrator:
                         if res.get("exit_index") is None:
                             continue
 
-                        sig = entry["signal"]
                         exit_reason_map = {
                             "STOP_LOSS": "STOP_LOSS",
                             "TAKE_PROFIT": "TARGET",
@@ -906,8 +813,8 @@ class BacktestOrchestrator:
 
                         executions.append(
                             TradeExecution(
-                                signal_id=sig.id,
-                                direction=sig.direction,
+                                signal_id=signals.signal_id(entry["signal_position"]),
+                                direction=entry["side"],
                                 open_timestamp=data["timestamp_utc"][
                                     entry["entry_index"]
                                 ],  # expensive lookup? slice.
@@ -955,7 +862,8 @@ class BacktestOrchestrator:
             data_end_date=data_end,
             total_candles=len(data),
             metrics=metrics,
-            signals=signals if self.dry_run else None,  # Optimize memory if executing
+            # TradeSignal objects are only materialized for dry runs
+            signals=signals.to_signals() if self.dry_run else None,
             executions=executions if not self.dry_run else None,
             conflicts=conflicts,
             dry_run=self.dry_run,
@@ -1229,6 +1137,7 @@ class BacktestOrchestrator:
         from ..strategy.weights import parse_and_normalize_weights
         from .aggregation import PortfolioAggregator
         from .manifest_writer import compute_manifest_hash
+        from .metrics import compute_portfolio_metrics
         from .metrics_schema import StructuredMetrics
         from .reproducibility import generate_deterministic_run_id
         from .risk_global import evaluate_portfolio_drawdown, should_abort_portfolio
@@ -1358,13 +1267,22 @@ class BacktestOrchestrator:
         # Compute manifest hash
         manifest_hash = compute_manifest_hash(run_manifest)
 
-        # Build structured metrics
-        structured_metrics = StructuredMetrics(
+        # Build structured metrics (volatility from the weighted equity curve)
+        portfolio_metrics = compute_portfolio_metrics(
+            aggregated_pnl=portfolio_summary["weighted_pnl"],
+            max_drawdown=portfolio_summary["max_drawdown"],
+            runtime_seconds=runtime_seconds,
             strategies_count=len(strategies),
             instruments_count=portfolio_summary["instruments_count"],
-            runtime_seconds=runtime_seconds,
-            aggregate_pnl=portfolio_summary["weighted_pnl"],
-            max_drawdown_pct=portfolio_summary["max_drawdown"],
+            equity_curve=portfolio_summary["equity_curve"],
+        )
+        structured_metrics = StructuredMetrics(
+            strategies_count=portfolio_metrics["strategies_count"],
+            instruments_count=portfolio_metrics["instruments_count"],
+            runtime_seconds=portfolio_metrics["runtime_seconds"],
+            aggregate_pnl=portfolio_metrics["aggregate_pnl"],
+            max_drawdown_pct=portfolio_metrics["max_drawdown_pct"],
+            volatility_annualized=portfolio_metrics["volatility_annualized"],
             net_exposure_by_instrument=portfolio_summary["net_exposure_by_instrument"],
             weights_applied=normalized_weights,
             global_drawdown_limit=global_drawdown_limit,
@@ -1693,6 +1611,7 @@ class BacktestOrchestrator:
             risk_per_trade=signal_params.get("risk_per_trade_pct", 0.01),
             enable_progress=self.enable_progress,
             max_concurrent_positions=max_concurrent,
+            max_holding_bars=getattr(strategy.metadata, "max_holding_bars", None),
         )
 
         # Extract OHLC arrays for simulation
@@ -1815,6 +1734,7 @@ class BacktestOrchestrator:
             max_concurrent_positions=getattr(
                 strategy.metadata, "max_concurrent_positions", 1
             ),
+            max_holding_bars=getattr(strategy.metadata, "max_holding_bars", None),
         )
 
         # Extract OHLC arrays for simulation
@@ -1961,6 +1881,7 @@ class BacktestOrchestrator:
             max_concurrent_positions=getattr(
                 strategy.metadata, "max_concurrent_positions", 1
             ),
+            max_holding_bars=getattr(strategy.metadata, "max_holding_bars", None),
         )
 
         timestamps = df["timestamp_utc"].to_numpy()
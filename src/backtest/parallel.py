@@ -4,6 +4,11 @@ This module provides worker orchestration, shared memory optimization,
 and parallel efficiency tracking for running multiple backtest configurations
 concurrently.
 
+Shared memory lifecycle: the parent publishes read-only arrays once with
+SharedArrays (create/unlink); each pool worker attaches to them in its
+initializer (init_shared_worker), reads them via get_shared_arrays(), and
+detaches when the worker process exits.
+
 Requirements: FR-008 (parallel execution), FR-008a (max-workers cap),
 SC-011 (≥70% efficiency).
 """
@@ -12,12 +17,154 @@ SC-011 (≥70% efficiency).
 
 from typing import List, Dict, Any, Optional, Callable
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from multiprocessing import shared_memory, util
 import multiprocessing
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class SharedArraySpec:
+    """Picklable description of one array published in shared memory.
+
+    Attributes:
+        shm_name: Name of the shared memory block.
+        shape: Array shape.
+        dtype: NumPy dtype string.
+    """
+
+    shm_name: str
+    shape: tuple
+    dtype: str
+
+
+class SharedArrays:
+    """Owner side of a set of read-only arrays in shared memory.
+
+    Each array is copied once into its own shared memory block. The owner
+    must outlive all workers using the arrays; close() (or leaving the
+    context manager) releases and unlinks every block.
+
+    Attributes:
+        specs: Key -> SharedArraySpec, passed to workers to attach.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        """Publish arrays into shared memory.
+
+        Args:
+            arrays: Key -> array to publish (copied once).
+        """
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.specs: Dict[str, SharedArraySpec] = {}
+        try:
+            for key, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                if array.dtype.hasobject:
+                    raise ValueError(f"Cannot share object array for key '{key}'")
+                block = shared_memory.SharedMemory(
+                    create=True, size=max(array.nbytes, 1)
+                )
+                self._blocks.append(block)
+                view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+                view[...] = array
+                self.specs[key] = SharedArraySpec(
+                    block.name, array.shape, array.dtype.str
+                )
+        except Exception:
+            self.close()
+            raise
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held in shared memory."""
+        return sum(block.size for block in self._blocks)
+
+    def close(self) -> None:
+        """Close and unlink all shared memory blocks."""
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# Per-process attachments made by attach_shared_arrays
+_ATTACHED_BLOCKS: List[shared_memory.SharedMemory] = []
+_ATTACHED_ARRAYS: Dict[str, np.ndarray] = {}
+
+
+def attach_shared_arrays(specs: Dict[str, SharedArraySpec]) -> Dict[str, np.ndarray]:
+    """Attach to published arrays as read-only views (worker side).
+
+    Args:
+        specs: Key -> SharedArraySpec from SharedArrays.specs.
+
+    Returns:
+        Key -> read-only NumPy view backed by shared memory.
+    """
+    for key, spec in specs.items():
+        block = shared_memory.SharedMemory(name=spec.shm_name)
+        _ATTACHED_BLOCKS.append(block)
+        view = np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=block.buf)
+        view.flags.writeable = False
+        _ATTACHED_ARRAYS[key] = view
+    return dict(_ATTACHED_ARRAYS)
+
+
+def get_shared_arrays() -> Dict[str, np.ndarray]:
+    """Return the arrays attached in this process.
+
+    Returns:
+        Key -> read-only NumPy view (empty if nothing attached).
+    """
+    return dict(_ATTACHED_ARRAYS)
+
+
+def detach_shared_arrays() -> None:
+    """Drop this process's views and close its shared memory handles.
+
+    Blocks still referenced elsewhere (e.g. by frames wrapping the views)
+    are left open and released when the process exits.
+    """
+    _ATTACHED_ARRAYS.clear()
+    for block in _ATTACHED_BLOCKS:
+        try:
+            block.close()
+        except BufferError:
+            logger.debug("Shared block %s still referenced; not closed", block.name)
+    _ATTACHED_BLOCKS.clear()
+
+
+def init_shared_worker(
+    specs: Dict[str, SharedArraySpec],
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple = (),
+) -> None:
+    """Process-pool initializer: attach shared arrays, then run initializer.
+
+    Detaching is registered to run when the worker process exits.
+
+    Args:
+        specs: Key -> SharedArraySpec from SharedArrays.specs.
+        initializer: Optional per-worker initializer run after attaching.
+        initargs: Arguments for initializer.
+    """
+    attach_shared_arrays(specs)
+    util.Finalize(None, detach_shared_arrays, exitpriority=10)
+    if initializer is not None:
+        initializer(*initargs)
+
+
 def get_worker_count(requested: Optional[int] = None) -> int:
     """Determine worker count with logical core cap.
 
@@ -48,7 +195,12 @@ def get_worker_count(requested: Optional[int] = None) -> int:
 
 
 def run_parallel(
-    worker_fn: Callable[[Any], Any], tasks: List[Any], max_workers: Optional[int] = None
+    worker_fn: Callable[[Any], Any],
+    tasks: List[Any],
+    max_workers: Optional[int] = None,
+    shared_arrays: Optional[Dict[str, np.ndarray]] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple = (),
 ) -> List[Any]:
     """Execute tasks in parallel using process pool.
 
@@ -56,6 +208,11 @@ def run_parallel(
         worker_fn: Function to execute per task (must be picklable).
         tasks: List of task arguments to pass to worker_fn.
         max_workers: Maximum number of parallel workers.
+        shared_arrays: Optional arrays published once in shared memory;
+            workers read them with get_shared_arrays() instead of receiving
+            pickled copies.
+        initializer: Optional per-worker initializer (runs after attaching).
+        initargs: Arguments for initializer.
 
     Returns:
         List of results in same order as tasks.
@@ -63,17 +220,22 @@ def run_parallel(
     worker_count = get_worker_count(max_workers)
     results = [None] * len(tasks)
 
-    with ProcessPoolExecutor(max_workers=worker_count) as executor:
-        future_to_idx = {
-            executor.submit(worker_fn, task): idx for idx, task in enumerate(tasks)
-        }
-
-        for future in as_completed(future_to_idx):
-            idx = future_to_idx[future]
-            try:
-                results[idx] = future.result()
-            except Exception as exc:
-                logger.error("Task %d generated exception: %s", idx, exc)
-                raise
+    with SharedArrays(shared_arrays or {}) as shared:
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            initializer=init_shared_worker,
+            initargs=(shared.specs, initializer, initargs),
+        ) as executor:
+            future_to_idx = {
+                executor.submit(worker_fn, task): idx for idx, task in enumerate(tasks)
+            }
+
+            for future in as_completed(future_to_idx):
+                idx = future_to_idx[future]
+                try:
+                    results[idx] = future.result()
+                except Exception as exc:
+                    logger.error("Task %d generated exception: %s", idx, exc)
+                    raise
 
     return results
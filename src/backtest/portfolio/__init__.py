@@ -7,6 +7,7 @@ pairs in two modes:
 
 Modules:
     correlation_service: Rolling correlation computation
+    rolling_correlation: Incremental/batch rolling correlation kernels
     allocation_engine: Capital allocation with correlation awareness
     orchestrator: Portfolio-level backtest coordination
     snapshot_logger: Periodic portfolio state persistence
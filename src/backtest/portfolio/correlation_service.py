@@ -6,19 +6,26 @@ window logic (minimum 20 periods) that grows to a full 100-period window per
 FR-010 and research Decision 8.
 
 The service manages:
-- Per-pair rolling correlation windows
+- Per-pair rolling correlation windows (RollingCorrelationMatrix, one
+  vectorized update per bar for all pairs)
 - Provisional correlation calculation (≥20 periods)
 - Full window correlation (100 periods)
 - Correlation matrix updates
 - Symbol failure isolation
+- Batch correlation series over a price history (correlation_series)
 """
 import logging
+from datetime import UTC, datetime
 from typing import Optional
 
-from src.models.correlation import (
-    CorrelationMatrix,
-    CorrelationWindowState,
+import numpy as np
+import polars as pl
+
+from src.backtest.portfolio.rolling_correlation import (
+    RollingCorrelationMatrix,
+    rolling_correlation_series,
 )
+from src.models.correlation import CorrelationMatrix
 from src.models.portfolio import CurrencyPair
 
 logger = logging.getLogger(__name__)
@@ -36,7 +43,6 @@ class CorrelationService:
         provisional_min: Minimum length for provisional evaluation (default 20)
         correlation_threshold: Default correlation threshold (default 0.8)
         threshold_overrides: Per-pair threshold overrides
-        windows: Dictionary mapping pair keys to CorrelationWindowState
         active_symbols: Set of currently active symbols (excludes failures)
         correlation_matrix: Current correlation matrix
     """
@@ -70,10 +76,40 @@ class CorrelationService:
         self.provisional_min = provisional_min
         self.correlation_threshold = correlation_threshold
         self.threshold_overrides = threshold_overrides or {}
-        self.windows: dict[str, CorrelationWindowState] = {}
         self.active_symbols: set[str] = set()
         self.correlation_matrix = CorrelationMatrix()
 
+        # Symbol code -> slot in the rolling engine (slots are never reused,
+        # so a failed symbol's pair windows are kept but no longer updated)
+        self._slots: dict[str, int] = {}
+        self._codes: list[str] = []
+        self._engine = RollingCorrelationMatrix(window=window_size)
+        self._keys = np.empty((0, 0), dtype=object)
+        self._ordered = np.empty((0, 0), dtype=bool)
+
+    def _slot(self, code: str) -> int:
+        """Return (allocating if needed) the engine slot for a symbol."""
+        slot = self._slots.get(code)
+        if slot is not None:
+            return slot
+
+        slot = len(self._codes)
+        self._slots[code] = slot
+        self._codes.append(code)
+        if slot >= self._engine.capacity:
+            self._engine.grow(max(2 * self._engine.capacity, slot + 1))
+
+        # Pair keys and "row code sorts first" mask for reporting
+        size = self._engine.capacity
+        codes = np.array(self._codes + [""] * (size - len(self._codes)), dtype=object)
+        self._keys = np.array(
+            [[f"{a}:{b}" for b in codes] for a in codes], dtype=object
+        )
+        self._ordered = codes[:, None] < codes[None, :]
+        self._ordered[len(self._codes) :, :] = False
+        self._ordered[:, len(self._codes) :] = False
+        return slot
+
     def register_symbol(self, symbol: CurrencyPair) -> None:
         """Register a symbol for correlation tracking.
 
@@ -115,42 +151,101 @@ class CorrelationService:
         Returns:
             Updated CorrelationMatrix if any correlations ready, else None
         """
-        active_pairs = [
-            CurrencyPair(code=code) for code in sorted(self.active_symbols)
+        if len(self.active_symbols) < 2:
+            return None
+
+        slots = [
+            self._slot(code) for code in sorted(self.active_symbols) if code in prices
         ]
+        if len(slots) < 2:
+            return None
 
-        if len(active_pairs) < 2:
+        values = np.full(self._engine.capacity, np.nan)
+        values[slots] = [prices[self._codes[slot]] for slot in slots]
+        present = np.zeros(self._engine.capacity, dtype=bool)
+        present[slots] = True
+        pair_mask = present[:, None] & present[None, :]
+        np.fill_diagonal(pair_mask, False)
+
+        rows, cols = self._engine.update(values, pair_mask)
+
+        # Report each unordered pair once, once its provisional window is met
+        ready = self._ordered[rows, cols] & (
+            self._engine.count[rows, cols] >= self.provisional_min
+        )
+        if not ready.any():
             return None
 
-        any_updated = False
+        rows, cols = rows[ready], cols[ready]
+        correlations = self._engine.correlation(rows, cols)
+        self.correlation_matrix.values.update(
+            zip(self._keys[rows, cols].tolist(), correlations.tolist())
+        )
+        self.correlation_matrix.timestamp = datetime.now(UTC)
+        return self.correlation_matrix
+
+    def window_lengths(self) -> dict[str, int]:
+        """Current window length of every tracked pair.
 
-        # Update all pairwise windows
-        for i, pair_a in enumerate(active_pairs):
-            for pair_b in active_pairs[i + 1 :]:
-                if pair_a.code not in prices or pair_b.code not in prices:
-                    continue
+        Returns:
+            Mapping of pair key (e.g. "EURUSD:GBPUSD") to joint observations
+            in its window (capped at window_size).
+        """
+        rows, cols = np.nonzero(self._ordered & (self._engine.count > 0))
+        return dict(
+            zip(
+                self._keys[rows, cols].tolist(),
+                self._engine.count[rows, cols].tolist(),
+            )
+        )
 
-                key = CorrelationMatrix.make_key(pair_a, pair_b)
+    def correlation_series(
+        self,
+        prices: pl.DataFrame,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        timestamp_col: str = "timestamp_utc",
+    ) -> pl.DataFrame:
+        """Compute the full rolling correlation series in one pass (batch mode).
 
-                # Initialize window if needed
-                if key not in self.windows:
-                    self.windows[key] = CorrelationWindowState(
-                        pair_a=pair_a,
-                        pair_b=pair_b,
-                        window=self.window_size,
-                        provisional_min=self.provisional_min,
-                    )
+        Uses the service's window settings and active symbols but does not
+        touch its streaming state. Values match feeding the same rows through
+        update() one bar at a time.
 
-                window = self.windows[key]
-                correlation = window.update(prices[pair_a.code], prices[pair_b.code])
+        Args:
+            prices: Wide frame with a timestamp column and one price column
+                per symbol code (nulls mark missing prices)
+            start: Optional inclusive start of the date range
+            end: Optional inclusive end of the date range
+            timestamp_col: Name of the timestamp column
 
-                if correlation is not None:
-                    self.correlation_matrix.set_correlation(
-                        pair_a, pair_b, correlation
-                    )
-                    any_updated = True
+        Returns:
+            Frame with timestamp_col plus one column per pair key (e.g.
+            "EURUSD:GBPUSD"); null until the provisional window is met
+        """
+        if start is not None:
+            prices = prices.filter(pl.col(timestamp_col) >= start)
+        if end is not None:
+            prices = prices.filter(pl.col(timestamp_col) <= end)
+
+        symbols = sorted(code for code in self.active_symbols if code in prices.columns)
+        matrix = (
+            prices.select(pl.col(symbols).cast(pl.Float64))
+            .to_numpy()
+            .reshape(len(prices), len(symbols))
+        )
+        series = rolling_correlation_series(
+            matrix, window=self.window_size, min_periods=self.provisional_min
+        )
 
-        return self.correlation_matrix if any_updated else None
+        rows, cols = np.triu_indices(len(symbols), 1)
+        columns = {
+            f"{symbols[i]}:{symbols[j]}": series[:, p]
+            for p, (i, j) in enumerate(zip(rows, cols))
+        }
+        return prices.select(timestamp_col).with_columns(
+            pl.DataFrame(columns).fill_nan(None) if columns else []
+        )
 
     def get_correlation(
         self, pair_a: CurrencyPair, pair_b: CurrencyPair
@@ -186,10 +281,11 @@ class CorrelationService:
         Returns:
             True if window at target length, False otherwise
         """
-        key = CorrelationMatrix.make_key(pair_a, pair_b)
-        if key not in self.windows:
+        slot_a = self._slots.get(pair_a.code)
+        slot_b = self._slots.get(pair_b.code)
+        if slot_a is None or slot_b is None:
             return False
-        return self.windows[key].is_ready()
+        return bool(self._engine.count[slot_a, slot_b] >= self.window_size)
 
     def get_threshold(
         self, pair_a: CurrencyPair, pair_b: CurrencyPair
@@ -0,0 +1,237 @@
+"""Bar-resolution mark-to-market equity for portfolio backtests.
+
+PortfolioResult.equity_curve only moves when a trade closes. This module
+rebuilds the portfolio equity on every bar of the master timeline (the union
+of all symbols' bar timestamps), including the unrealized P&L of open
+positions, without a per-bar Python loop:
+
+- A position of ``units`` (signed: + long, - short) entered at ``entry``
+  is worth ``units * (price - entry)`` while open, so the open P&L of all a
+  symbol's positions on bar t is ``price[t] * U[t] - C[t]`` with
+  ``U = sum(units)`` and ``C = sum(units * entry)`` over the positions open
+  on that bar.
+- U and C are step functions: scatter-add (np.bincount) of +units at entry
+  bars and -units at exit bars, then a cumulative sum.
+- Realized P&L is scatter-added at each trade's exit bar and accumulated
+  the same way.
+
+Positions are open on bars [entry_index, exit_index); on the exit bar the
+trade's P&L is realized instead. Symbols without a bar at a master timestamp
+keep their last mark.
+
+Units are recovered from the sizing: a trade risking ``risk_amount`` over a
+stop ``stop_distance`` away holds ``risk_amount / stop_distance`` units, so
+its P&L at the exit price is exactly ``pnl_r * risk_amount``.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from src.backtest.timestamp_index import TimestampIndex
+from src.backtest.trade_ledger import ClosedTrade, TradeLedger
+from src.risk.blackout.windows import to_epoch_ns
+
+logger = logging.getLogger(__name__)
+
+INTRABAR_MARKS = ("close", "worst")
+
+
+@dataclass(frozen=True)
+class MarkToMarketEquity:
+    """Portfolio equity on every bar of the master timeline.
+
+    Attributes:
+        epoch_ns: Master timeline as sorted int64 epoch nanoseconds.
+        equity: Equity (realized + unrealized) per bar, float32.
+        starting_equity: Equity before the first bar.
+    """
+
+    epoch_ns: np.ndarray
+    equity: np.ndarray
+    starting_equity: float
+
+    def __len__(self) -> int:
+        return int(self.epoch_ns.size)
+
+    def equity_at(self, timestamp: Any) -> float:
+        """Equity as of a timestamp (last bar at or before it)."""
+        pos = int(np.searchsorted(self.epoch_ns, to_epoch_ns(timestamp), "right"))
+        return float(self.equity[pos - 1]) if pos else self.starting_equity
+
+    def to_frame(self, name: str = "equity") -> pl.DataFrame:
+        """Equity as a Polars frame with a ``timestamp_utc`` column."""
+        return pl.DataFrame(
+            {
+                "timestamp_utc": pl.Series(self.epoch_ns).cast(
+                    pl.Datetime("ns", "UTC")
+                ),
+                name: self.equity,
+            }
+        )
+
+
+def symbol_open_pnl(
+    entry_idx: np.ndarray,
+    exit_idx: np.ndarray,
+    units: np.ndarray,
+    entry_price: np.ndarray,
+    long_marks: np.ndarray,
+    short_marks: np.ndarray | None = None,
+) -> np.ndarray:
+    """Open P&L of one symbol's positions on each of its bars.
+
+    Args:
+        entry_idx: Entry bar per trade.
+        exit_idx: Exit bar per trade (the position is open before it).
+        units: Signed position size per trade (+ long, - short), P&L per
+            unit of price move.
+        entry_price: Entry fill price per trade.
+        long_marks: Price per bar at which long positions are marked.
+        short_marks: Price per bar for short positions (default: long_marks).
+
+    Returns:
+        Float64 array with the summed open P&L per bar.
+    """
+    n_bars = len(long_marks)
+    entry_idx = np.asarray(entry_idx, dtype=np.int64)
+    exit_idx = np.asarray(exit_idx, dtype=np.int64)
+    units = np.asarray(units, dtype=np.float64)
+    cost = units * np.asarray(entry_price, dtype=np.float64)
+
+    def _open_sum(weights: np.ndarray) -> np.ndarray:
+        deltas = np.bincount(entry_idx, weights, n_bars + 1) - np.bincount(
+            exit_idx, weights, n_bars + 1
+        )
+        return np.cumsum(deltas[:n_bars])
+
+    if short_marks is None:
+        return np.asarray(long_marks) * _open_sum(units) - _open_sum(cost)
+
+    is_long = units > 0
+    long_units = np.where(is_long, units, 0.0)
+    long_cost = np.where(is_long, cost, 0.0)
+    return (
+        np.asarray(long_marks) * _open_sum(long_units)
+        - _open_sum(long_cost)
+        + np.asarray(short_marks) * _open_sum(units - long_units)
+        - _open_sum(cost - long_cost)
+    )
+
+
+def _trade_arrays(trades: TradeLedger) -> dict[str, np.ndarray]:
+    """Bar indices, signed units, entry prices and P&L of trades."""
+    stop_distance = trades.stop_distance
+    with np.errstate(divide="ignore", invalid="ignore"):
+        units = np.where(
+            stop_distance > 0,
+            np.where(trades.direction == 1, 1.0, -1.0)
+            * trades.risk_amount
+            / stop_distance,
+            0.0,
+        )
+    return {
+        "entry_idx": trades.entry_index,
+        "exit_idx": trades.exit_index,
+        "units": units,
+        "entry_price": trades.entry_price,
+        "pnl": trades.pnl_dollars,
+    }
+
+
+def compute_mark_to_market(
+    symbol_data: dict[str, pl.DataFrame],
+    trades: TradeLedger | list[ClosedTrade],
+    starting_equity: float,
+    intrabar: str = "close",
+) -> MarkToMarketEquity:
+    """Build the bar-resolution portfolio equity from taken trades.
+
+    Args:
+        symbol_data: Symbol -> price frame the trades were simulated on
+            (``close``, plus ``high``/``low`` for intrabar="worst").
+        trades: Taken trades with entry_index/exit_index into their
+            symbol's frame, sized (risk_amount, pnl_dollars) and with
+            stop_distance set (PortfolioResult.closed_trades).
+        starting_equity: Portfolio equity before the first trade.
+        intrabar: "close" marks open positions at the bar close; "worst"
+            marks longs at the low and shorts at the high (conservative
+            intraday drawdown).
+
+    Returns:
+        MarkToMarketEquity aligned to the union of all symbols' bars.
+
+    Raises:
+        ValueError: For an unknown intrabar mode, trades on symbols
+            without price data, or price data not sorted by time.
+    """
+    if intrabar not in INTRABAR_MARKS:
+        raise ValueError(f"intrabar must be one of {INTRABAR_MARKS}, got {intrabar!r}")
+
+    indexes = {}
+    for symbol, df in symbol_data.items():
+        ts_col = "timestamp_utc" if "timestamp_utc" in df.columns else "timestamp"
+        index = TimestampIndex.for_frame(df, ts_col)
+        if not index.is_sorted:
+            raise ValueError(f"Price data for {symbol} is not sorted by time")
+        indexes[symbol] = index.epoch_ns
+    if indexes:
+        master = np.unique(np.concatenate(list(indexes.values())))
+    else:
+        master = np.array([], dtype=np.int64)
+
+    ledger = TradeLedger.from_trades(trades)
+    by_symbol = {
+        symbol: ledger.take(ledger.symbol == symbol)
+        for symbol in dict.fromkeys(ledger.symbol.tolist())
+    }
+    missing = set(by_symbol) - set(symbol_data)
+    if missing:
+        raise ValueError(f"No price data for traded symbols: {sorted(missing)}")
+
+    n_bars = len(master)
+    realized = np.zeros(n_bars, dtype=np.float64)
+    open_pnl = np.zeros(n_bars, dtype=np.float64)
+
+    for symbol, symbol_trades in by_symbol.items():
+        df = symbol_data[symbol]
+        arrays = _trade_arrays(symbol_trades)
+        symbol_ns = indexes[symbol]
+        on_master = np.searchsorted(master, symbol_ns)
+
+        realized += np.bincount(on_master[arrays["exit_idx"]], arrays["pnl"], n_bars)
+
+        close = df["close"].to_numpy()
+        if intrabar == "worst":
+            marks = (df["low"].to_numpy(), df["high"].to_numpy())
+        else:
+            marks = (close, None)
+        symbol_open = symbol_open_pnl(
+            arrays["entry_idx"],
+            arrays["exit_idx"],
+            arrays["units"],
+            arrays["entry_price"],
+            *marks,
+        )
+
+        # Carry the last mark over master bars where the symbol has no bar
+        last_bar = np.searchsorted(symbol_ns, master, "right") - 1
+        open_pnl += np.where(last_bar >= 0, symbol_open[last_bar], 0.0)
+
+    equity = starting_equity + np.cumsum(realized) + open_pnl
+    logger.debug(
+        "Mark-to-market equity: %d bars, %d trades, min $%.2f",
+        n_bars,
+        len(ledger),
+        equity.min() if n_bars else starting_equity,
+    )
+    return MarkToMarketEquity(
+        epoch_ns=master,
+        equity=equity.astype(np.float32),
+        starting_equity=starting_equity,
+    )
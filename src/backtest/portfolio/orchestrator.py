@@ -258,13 +258,9 @@ class PortfolioOrchestrator:
         # Get current correlation window size (average across pairs)
         # This is a simplified approach - could be enhanced
         corr_window = 0
-        if self.correlation_service.windows:
-            window_sizes = [
-                len(w.values_a) for w in self.correlation_service.windows.values()
-            ]
-            corr_window = (
-                int(sum(window_sizes) / len(window_sizes)) if window_sizes else 0
-            )
+        window_sizes = list(self.correlation_service.window_lengths().values())
+        if window_sizes:
+            corr_window = int(sum(window_sizes) / len(window_sizes))
 
         # Get diversification ratio from latest allocation
         # This would come from the most recent allocation response
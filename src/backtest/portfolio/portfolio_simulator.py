@@ -5,13 +5,19 @@ against a shared running balance. Uses vectorized simulation per symbol
 then merges results chronologically for equity tracking.
 
 Key features:
-- Vectorized simulation per symbol (fast)
-- Shared portfolio equity updated after each trade closes (chronologically)
-- Position sizing at 0.25% of current equity
-- Maximum one open position per symbol at a time
+- Vectorized simulation per symbol (fast); entries overlapping the symbol's
+  open positions are skipped during the exit search, not simulated
+- Heap-based event loop merging entry and exit events across symbols
+- Position sizing at 0.25% of equity as of each trade's entry time
+- Maximum one open position per symbol at a time (checked at entry)
+- Optional portfolio-wide cap on concurrently open positions
+- Trades and the equity curve are kept as columnar arrays (TradeLedger,
+  EquityCurve)
 """
 
+import heapq
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Any
@@ -19,44 +25,28 @@ import numpy as np
 import polars as pl
 import pandas as pd
 
+from src.backtest.portfolio.mark_to_market import (
+    MarkToMarketEquity,
+    compute_mark_to_market,
+)
+from src.backtest.metrics_kernel import group_breakdown
+from src.backtest.timestamp_index import TimestampIndex
+from src.backtest.trade_ledger import (  # noqa: F401 - ClosedTrade re-exported
+    ClosedTrade,
+    EquityCurve,
+    TradeLedger,
+    direction_codes,
+)
+from src.models.signal_batch import SignalBatch
+from src.risk.blackout.windows import timestamps_to_epoch_ns
+from src.strategy.id_factory import format_signal_id
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class ClosedTrade:
-    """Record of a closed trade.
-
-    Attributes:
-        symbol: Currency pair
-        signal_id: Original signal ID
-        direction: 'LONG' or 'SHORT'
-        entry_timestamp: Entry time
-        exit_timestamp: Exit time
-        entry_price: Entry fill price
-        exit_price: Exit fill price
-        exit_reason: 'stop_loss', 'take_profit', or 'end_of_data'
-        pnl_dollars: Profit/loss in dollars
-        pnl_r: Profit/loss as R-multiple
-        risk_amount: Original risk amount
-        portfolio_balance_at_exit: Portfolio balance after this trade closed
-        risk_percent: Risk percentage used for this trade (e.g., 0.0025 = 0.25%)
-    """
-
-    symbol: str
-    signal_id: str
-    direction: str
-    direction: str
-    open_timestamp: datetime
-    close_timestamp: datetime
-    entry_price: float
-    exit_price: float
-    exit_reason: str
-    pnl_dollars: float
-    pnl_r: float
-    risk_amount: float
-    portfolio_balance_at_exit: float = 0.0
-    risk_percent: float = 0.0025  # Default 0.25%
+# Event kinds; exits sort before entries at the same timestamp so a position
+# closing on a bar frees its capital and slot for entries on that bar
+_EXIT_EVENT = 0
+_ENTRY_EVENT = 1
 
 
 @dataclass
@@ -68,12 +58,15 @@ class PortfolioResult:
         direction_mode: Direction mode (LONG/SHORT/BOTH)
         starting_equity: Initial capital
         final_equity: Ending capital
-        equity_curve: List of (timestamp, equity) tuples
-        closed_trades: All closed trades
+        equity_curve: Closed-balance equity curve (iterates as
+            (timestamp, equity) tuples)
+        closed_trades: All closed trades, in exit order
         total_trades: Total trades across all symbols
         total_pnl: Total P&L in dollars
         per_symbol_trades: Breakdown by symbol
         symbols: List of symbols traded
+        mark_to_market: Bar-resolution equity including open positions
+            (only when requested from simulate)
     """
 
     run_id: str
@@ -82,8 +75,8 @@ class PortfolioResult:
     end_time: datetime
     starting_equity: float
     final_equity: float
-    equity_curve: list[tuple[datetime, float]] = field(default_factory=list)
-    closed_trades: list[ClosedTrade] = field(default_factory=list)
+    equity_curve: EquityCurve = field(default_factory=EquityCurve.empty)
+    closed_trades: TradeLedger = field(default_factory=TradeLedger.empty)
     total_trades: int = 0
     total_pnl: float = 0.0
     per_symbol_trades: dict = field(default_factory=dict)
@@ -91,17 +84,24 @@ class PortfolioResult:
     timeframe: str = "1m"
     data_start_date: Optional[datetime] = None
     data_end_date: Optional[datetime] = None
+    mark_to_market: Optional[MarkToMarketEquity] = None
 
 
 class PortfolioSimulator:
     """Time-synchronized portfolio simulation with shared equity.
 
-    Uses vectorized simulation per symbol (fast), then merges trade
-    results chronologically to update shared equity.
+    Uses vectorized simulation per symbol (fast) to find each candidate
+    trade's exit, then replays entry and exit events across all symbols in
+    time order. Trades are sized from the equity at their entry time, and
+    position limits are enforced as of entry, so concurrent positions on
+    different symbols never see P&L from trades that were still open.
 
     Attributes:
         starting_equity: Initial portfolio capital ($2,500)
         risk_per_trade: Position sizing as fraction of equity (0.0025 = 0.25%)
+        max_positions_per_symbol: Concurrent position limit per symbol
+        max_open_positions: Portfolio-wide concurrent position limit (None =
+            unlimited)
 
     Example:
         >>> simulator = PortfolioSimulator(starting_equity=2500.0)
@@ -116,6 +116,7 @@ class PortfolioSimulator:
         max_positions_per_symbol: int = 1,
         target_r_mult: float = 2.0,  # Default 2:1 reward/risk
         risk_config: Any = None,
+        max_open_positions: Optional[int] = None,
     ):
         """Initialize portfolio simulator.
 
@@ -124,32 +125,47 @@ class PortfolioSimulator:
             risk_per_trade: Position sizing as fraction of equity (0.0025 = 0.25%)
             max_positions_per_symbol: Maximum concurrent positions per symbol
             target_r_mult: Target R-multiple for take profit
+            risk_config: Optional risk config (trailing stop policy)
+            max_open_positions: Maximum concurrent positions across all
+                symbols (None = unlimited)
         """
         self.starting_equity = starting_equity
         self.risk_per_trade = risk_per_trade
         self.max_positions_per_symbol = max_positions_per_symbol
         self.target_r_mult = target_r_mult
         self.risk_config = risk_config
+        self.max_open_positions = max_open_positions
         self.current_equity = starting_equity
-        self.closed_trades: list[ClosedTrade] = []
-        self.equity_curve: list[tuple[datetime, float]] = []
+        self.closed_trades = TradeLedger.empty()
+        self.equity_curve = EquityCurve.empty()
 
     def simulate(
         self,
         symbol_data: dict[str, pl.DataFrame],
-        symbol_signals: dict[str, list],  # symbol -> list of signal dicts
+        symbol_signals: dict[str, Any],  # symbol -> SignalBatch or signal list
         direction_mode: str = "BOTH",
         run_id: str = "portfolio_run",
         timeframe: str = "1m",
+        max_workers: int = 1,
+        mark_to_market: bool = False,
     ) -> PortfolioResult:
-        """Run vectorized simulation per symbol, then merge chronologically.
+        """Run vectorized exit search per symbol, then replay events in time order.
+
+        Per-symbol simulations are independent until the chronological merge,
+        so with max_workers > 1 they run on a thread pool (the exit-search
+        kernel releases the GIL). Trades are collected in symbol order, so
+        the result is identical to the serial path.
 
         Args:
             symbol_data: Dict mapping symbol to enriched Polars DataFrame
-            symbol_signals: Dict mapping symbol to list of signal dicts
+            symbol_signals: Dict mapping symbol to a SignalBatch or a list
+                of signal objects/dicts
             direction_mode: Direction mode (LONG/SHORT/BOTH)
             run_id: Unique run identifier
             timeframe: The timeframe of the data (e.g., "1m", "5m")
+            max_workers: Threads used to simulate symbols concurrently
+            mark_to_market: Also build the bar-resolution equity of the
+                taken trades (see compute_mark_to_market)
 
         Returns:
             PortfolioResult with equity curve and trade breakdown
@@ -163,25 +179,29 @@ class PortfolioSimulator:
 
         # Reset state
         self.current_equity = self.starting_equity
-        self.closed_trades = []
-        self.equity_curve = []
-
-        # Collect all trades from all symbols
-        all_trades: list[ClosedTrade] = []
+        self.closed_trades = TradeLedger.empty()
+        self.equity_curve = EquityCurve.empty()
 
         # Phase 1: Run vectorized simulation for each symbol
-        for symbol, signals in symbol_signals.items():
-            if symbol not in symbol_data:
-                continue
-
-            df = symbol_data[symbol]
-            symbol_trades = self._simulate_symbol_vectorized(symbol, df, signals)
-            all_trades.extend(symbol_trades)
+        tasks = [
+            (symbol, symbol_data[symbol], signals)
+            for symbol, signals in symbol_signals.items()
+            if symbol in symbol_data
+        ]
+        workers = min(max_workers, len(tasks))
+        if workers > 1:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="portfolio-sim"
+            ) as pool:
+                per_symbol = list(
+                    pool.map(lambda t: self._simulate_symbol_vectorized(*t), tasks)
+                )
+        else:
+            per_symbol = [self._simulate_symbol_vectorized(*t) for t in tasks]
+
+        for (symbol, _, _), symbol_trades in zip(tasks, per_symbol):
             logger.info("Simulated %s: %d trades", symbol, len(symbol_trades))
-
-        # Phase 2: Sort all trades by exit timestamp
-        all_trades.sort(key=lambda t: t.close_timestamp)
-        logger.info("Processing %d trades chronologically", len(all_trades))
+        all_trades = TradeLedger.concat(per_symbol)
 
         # Get data bounds
         data_start = None
@@ -201,34 +221,36 @@ class PortfolioSimulator:
         if data_end is None:
             data_end = datetime.now()
 
-        # Record initial equity
-        self.equity_curve.append((data_start, self.current_equity))
-
-        # Phase 3: Update equity chronologically
-        for trade in all_trades:
-            # Calculate P&L based on current equity at trade entry time
-            risk_amount = self.current_equity * self.risk_per_trade
-            pnl_dollars = trade.pnl_r * risk_amount
-            trade.pnl_dollars = pnl_dollars
-            trade.risk_amount = risk_amount
-            trade.risk_percent = self.risk_per_trade
-
-            self.current_equity += pnl_dollars
-
-            # Record portfolio balance AFTER this trade closed
-            trade.portfolio_balance_at_exit = self.current_equity
-
-            self.closed_trades.append(trade)
-            self.equity_curve.append((trade.close_timestamp, self.current_equity))
-
-        # Record final equity
-        self.equity_curve.append((data_end, self.current_equity))
+        # Phase 2: Replay entries and exits across symbols in time order
+        logger.info("Processing %d candidate trades by event time", len(all_trades))
+        self._process_events(all_trades)
+
+        # Initial equity, the balance after each exit, final equity
+        bounds_ns = timestamps_to_epoch_ns([data_start, data_end])
+        self.equity_curve = EquityCurve(
+            np.concatenate(
+                [bounds_ns[:1], self.closed_trades.close_ns, bounds_ns[1:]]
+            ),
+            np.concatenate(
+                [
+                    [self.starting_equity],
+                    self.closed_trades.portfolio_balance_at_exit,
+                    [self.current_equity],
+                ]
+            ),
+        )
 
         end_time = datetime.now()
 
         # Build per-symbol breakdown
         per_symbol_trades = self._build_per_symbol_breakdown()
 
+        mtm = None
+        if mark_to_market:
+            mtm = compute_mark_to_market(
+                symbol_data, self.closed_trades, self.starting_equity
+            )
+
         result = PortfolioResult(
             run_id=run_id,
             direction_mode=direction_mode,
@@ -236,8 +258,8 @@ class PortfolioSimulator:
             end_time=end_time,
             starting_equity=self.starting_equity,
             final_equity=self.current_equity,
-            equity_curve=self.equity_curve.copy(),
-            closed_trades=self.closed_trades.copy(),
+            equity_curve=self.equity_curve,
+            closed_trades=self.closed_trades,
             total_trades=len(self.closed_trades),
             total_pnl=self.current_equity - self.starting_equity,
             per_symbol_trades=per_symbol_trades,
@@ -245,6 +267,7 @@ class PortfolioSimulator:
             timeframe=timeframe,
             data_start_date=data_start,
             data_end_date=data_end,
+            mark_to_market=mtm,
         )
 
         logger.info(
@@ -256,26 +279,108 @@ class PortfolioSimulator:
 
         return result
 
+    def _process_events(self, candidates: TradeLedger | list[ClosedTrade]) -> None:
+        """Merge entry/exit events of all candidate trades through a heap.
+
+        At each entry the position limits are checked and the trade is sized
+        from the equity at that moment; at each exit its P&L is booked. Events
+        at the same timestamp are ordered exits first, then by candidate order
+        (symbol, then entry). Taken trades are appended to closed_trades in
+        exit order with their sizing and balance columns filled.
+
+        Args:
+            candidates: Candidate trades (pnl_r and timestamps set) from the
+                per-symbol exit search, in symbol then entry order.
+        """
+        ledger = TradeLedger.from_trades(candidates)
+        n_candidates = len(ledger)
+        # Python scalars: the heap loop is cheaper on lists than on arrays
+        symbols = ledger.symbol.tolist()
+        pnl_r = ledger.pnl_r.tolist()
+        close_ns = ledger.close_ns.tolist()
+        risk_amount = [0.0] * n_candidates
+        balance = [0.0] * n_candidates
+
+        events = [
+            (ns, _ENTRY_EVENT, seq) for seq, ns in enumerate(ledger.open_ns.tolist())
+        ]
+        heapq.heapify(events)
+
+        open_per_symbol: dict[str, int] = {}
+        open_count = 0
+        skipped = 0
+        taken: list[int] = []
+
+        while events:
+            _, kind, seq = heapq.heappop(events)
+            symbol = symbols[seq]
+
+            if kind == _EXIT_EVENT:
+                self.current_equity += pnl_r[seq] * risk_amount[seq]
+                open_per_symbol[symbol] -= 1
+                open_count -= 1
+
+                # Record portfolio balance AFTER this trade closed
+                balance[seq] = self.current_equity
+                taken.append(seq)
+                continue
+
+            symbol_open = open_per_symbol.get(symbol, 0)
+            if symbol_open >= self.max_positions_per_symbol or (
+                self.max_open_positions is not None
+                and open_count >= self.max_open_positions
+            ):
+                skipped += 1
+                continue
+
+            # Size from the equity available at entry time
+            risk_amount[seq] = self.current_equity * self.risk_per_trade
+
+            open_per_symbol[symbol] = symbol_open + 1
+            open_count += 1
+            heapq.heappush(events, (close_ns[seq], _EXIT_EVENT, seq))
+
+        risk = np.array(risk_amount, dtype=np.float64)
+        closed = ledger.with_columns(
+            risk_amount=risk,
+            risk_percent=np.full(n_candidates, self.risk_per_trade),
+            pnl_dollars=ledger.pnl_r * risk,
+            portfolio_balance_at_exit=np.array(balance, dtype=np.float64),
+        ).take(np.array(taken, dtype=np.int64))
+        self.closed_trades = TradeLedger.concat([self.closed_trades, closed])
+
+        logger.debug(
+            "Event loop: %d trades taken, %d skipped by position limits",
+            len(closed),
+            skipped,
+        )
+
     def _simulate_symbol_vectorized(
         self,
         symbol: str,
         df: pl.DataFrame,
-        signals: list,
-    ) -> list[ClosedTrade]:
+        signals: Any,
+    ) -> TradeLedger:
         """Run vectorized simulation using shared batch engine for consistency.
 
         Delegates to src.backtest.trade_sim_batch.simulate_trades_batch to ensure
         portfolio mode yields identical trade outcomes to independent mode.
+
+        Returns:
+            Candidate trades (unsized) as a TradeLedger, in entry order.
         """
         if not signals:
-            return []
+            return TradeLedger.empty()
 
         # Import shared engine
         try:
-            from src.backtest.trade_sim_batch import simulate_trades_batch
+            from src.backtest.trade_sim_batch import (
+                simulate_trades_batch,
+                simulate_trades_sequential,
+            )
         except ImportError as e:
             logger.error("Failed to import batch engine: %s", e)
-            return []
+            return TradeLedger.empty()
 
         # 1. Prepare Price Data (Pandas/Numpy required for batch engine)
         # Assuming df has 'high', 'low', 'close', 'timestamp_utc'
@@ -321,7 +426,17 @@ class PortfolioSimulator:
                 is_jpy = "JPY" in symbol.upper()
                 trailing_config["pip_size"] = 0.01 if is_jpy else 0.0001
 
-        data_pd = df.select([c for c in cols if c in df.columns]).to_pandas()
+        # Ensure timestamp column exists for mapping
+        ts_col = "timestamp_utc" if "timestamp_utc" in df.columns else "timestamp"
+        if ts_col not in df.columns:
+            logger.error("Missing timestamp column in data for %s", symbol)
+            return TradeLedger.empty()
+
+        # Numeric columns only: timestamps are resolved through the shared
+        # TimestampIndex instead of a per-row {Timestamp: index} dict
+        data_pd = pd.DataFrame(
+            {c: df[c].to_numpy() for c in cols if c in df.columns and c != ts_col}
+        )
 
         # Extract indicator numpy arrays
         indicators = {}
@@ -329,17 +444,164 @@ class PortfolioSimulator:
             if col in data_pd.columns:
                 indicators[col] = data_pd[col].values
 
-        # Ensure timestamp column exists for mapping
-        ts_col = "timestamp_utc" if "timestamp_utc" in data_pd.columns else "timestamp"
-        if ts_col not in data_pd.columns:
-            logger.error("Missing timestamp column in data for %s", symbol)
+        # 2. Prepare Entries
+        ts_index = TimestampIndex.for_frame(df, ts_col)
+        if isinstance(signals, SignalBatch):
+            entries = self._entries_from_batch(symbol, signals, ts_index)
+        else:
+            entries = self._entries_from_signals(symbol, signals, ts_index)
+
+        if not entries:
+            return TradeLedger.empty()
+
+        # 3. Sort entries by entry index and run simulation
+        entries.sort(key=lambda e: e["entry_index"])
+        if self.max_open_positions is None and self.max_positions_per_symbol >= 1:
+            # Only the per-symbol cap can reject an entry, so entries that
+            # overlap this symbol's open positions are skipped during the
+            # exit search instead of simulated (None results)
+            all_results = simulate_trades_sequential(
+                entries,
+                data_pd,
+                max_open_positions=self.max_positions_per_symbol,
+                trailing_config=trailing_config,
+                indicators=indicators,
+            )
+        else:
+            # A portfolio-wide cap depends on other symbols: simulate every
+            # entry and let _process_events choose
+            all_results = simulate_trades_batch(
+                entries,
+                data_pd,
+                trailing_config=trailing_config,
+                indicators=indicators,
+            )
+
+        # 4. Convert results to candidate trade columns (position limits and
+        # sizing are applied at entry time by _process_events)
+        reason_map = {
+            "STOP_LOSS": "stop_loss",
+            "TAKE_PROFIT": "take_profit",
+            "TIMEOUT": "end_of_data",  # Map TIMEOUT to EOD for now
+            "END_OF_DATA": "end_of_data",
+        }
+        columns: dict[str, list] = {
+            "signal_id": [],
+            "direction": [],
+            "entry_index": [],
+            "exit_index": [],
+            "entry_price": [],
+            "exit_price": [],
+            "exit_reason": [],
+            "pnl_r": [],
+            "stop_distance": [],
+        }
+
+        for res, entry in zip(all_results, entries, strict=False):
+            if res is None or res["exit_index"] is None:
+                continue
+
+            # Skip if invalid
+            if res.get("exit_reason") == "INVALID_ENTRY":
+                continue
+
+            # Recalculate PnL in R (engine returns 'pnl' as percentage)
+            # pnl_r = pnl_pct / stop_loss_pct
+            sl_pct = entry["stop_loss_pct"]
+            entry_price = res.get("entry_price", entry["entry_price"])
+
+            columns["signal_id"].append(entry["signal_id"])
+            columns["direction"].append(entry["direction"])
+            columns["entry_index"].append(res["entry_index"])
+            columns["exit_index"].append(res["exit_index"])
+            columns["entry_price"].append(entry_price)
+            columns["exit_price"].append(res["exit_price"])
+            columns["exit_reason"].append(
+                reason_map.get(res["exit_reason"], "end_of_data")
+            )
+            columns["pnl_r"].append(res["pnl"] / sl_pct if sl_pct > 0 else 0.0)
+            columns["stop_distance"].append(sl_pct * entry_price)
+
+        entry_index = np.asarray(columns["entry_index"], dtype=np.int64)
+        exit_index = np.asarray(columns["exit_index"], dtype=np.int64)
+        return TradeLedger(
+            {
+                **columns,
+                "symbol": np.full(len(entry_index), symbol, dtype=object),
+                "direction": direction_codes(columns["direction"]),
+                "open_ns": ts_index.epoch_ns[entry_index],
+                "close_ns": ts_index.epoch_ns[exit_index],
+                "entry_index": entry_index,
+                "exit_index": exit_index,
+            }
+        )
+
+    def _entries_from_batch(
+        self,
+        symbol: str,
+        batch: SignalBatch,
+        ts_index: TimestampIndex,
+    ) -> list[dict]:
+        """Build batch-engine entries from a SignalBatch's columns.
+
+        The batch's row indices are used directly when they point at the
+        same timestamps in this frame; otherwise (batch built from another
+        frame) the timestamps are resolved through ts_index.
+        """
+        if len(batch) == 0:
             return []
 
-        # create map for O(1) index lookup
-        ts_map = {ts: i for i, ts in enumerate(data_pd[ts_col])}
+        entry_prices = batch.entry_prices
+        indices = batch.indices
+        signal_ns = timestamps_to_epoch_ns(batch.timestamps)
+        aligned = indices.max() < len(ts_index) and np.array_equal(
+            ts_index.epoch_ns[indices], signal_ns
+        )
+        if not aligned:
+            lookup = ts_index.resolve(signal_ns)
+            if lookup.miss_count:
+                logger.debug(
+                    "%s: %d signal timestamps not found in price data",
+                    symbol,
+                    lookup.miss_count,
+                )
+            indices = lookup.indices
+
+        valid = (indices >= 0) & (entry_prices != 0)
+        risk_dist = np.abs(entry_prices - batch.stop_prices)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sl_pct = risk_dist / entry_prices
+            tp_pct = (risk_dist * self.target_r_mult) / entry_prices
+        sides = np.where(batch.directions == 1, "LONG", "SHORT")
+
+        return [
+            {
+                "signal_id": format_signal_id(signal_hash),
+                "direction": side,
+                "entry_index": idx,
+                "entry_price": entry,
+                "side": side,
+                "stop_loss_pct": sl,
+                "take_profit_pct": tp,
+            }
+            for idx, entry, sl, tp, side, signal_hash in zip(
+                indices[valid].tolist(),
+                entry_prices[valid].tolist(),
+                sl_pct[valid].tolist(),
+                tp_pct[valid].tolist(),
+                sides[valid].tolist(),
+                batch.ids[valid].tolist(),
+            )
+        ]
 
-        # 2. Prepare Entries
-        entries = []
+    def _entries_from_signals(
+        self,
+        symbol: str,
+        signals: list,
+        ts_index: TimestampIndex,
+    ) -> list[dict]:
+        """Build batch-engine entries from TradeSignal objects or dicts."""
+        parsed = []
         for signal in signals:
             # Handle both object and dict signals
             if hasattr(signal, "timestamp_utc"):
@@ -361,9 +623,24 @@ class PortfolioSimulator:
                 direction = signal.get("direction")
                 signal_id = signal.get("id", f"{symbol}_{sig_ts}")
 
-            # Lookup index
-            idx = ts_map.get(sig_ts)
-            if idx is None or sig_entry is None or sig_stop is None:
+            if sig_ts is None or sig_entry is None or sig_stop is None:
+                continue
+            parsed.append((signal, sig_ts, sig_entry, sig_stop, direction, signal_id))
+
+        # Lookup indices for all signals in one searchsorted pass
+        lookup = ts_index.resolve([p[1] for p in parsed])
+        if lookup.miss_count:
+            logger.debug(
+                "%s: %d signal timestamps not found in price data",
+                symbol,
+                lookup.miss_count,
+            )
+
+        entries = []
+        for (signal, _, sig_entry, sig_stop, direction, signal_id), idx, found in zip(
+            parsed, lookup.indices.tolist(), lookup.found.tolist()
+        ):
+            if not found:
                 continue
 
             # Calculate percentages
@@ -387,122 +664,9 @@ class PortfolioSimulator:
                 }
             )
 
-        if not entries:
-            return []
-
-        # 3. Sort entries by entry index and run simulation
-        entries.sort(key=lambda e: e["entry_index"])
-        # 3. Sort entries by entry index and run simulation
-        entries.sort(key=lambda e: e["entry_index"])
-        all_results = simulate_trades_batch(
-            entries, data_pd, trailing_config=trailing_config, indicators=indicators
-        )
-
-        # 4. Filter overlapping trades to enforce max_positions_per_symbol
-        # Iterate through trades chronologically, only keeping those that don't
-        # exceed the concurrent position limit
-        filtered_entries = []
-        filtered_results = []
-        open_positions = []  # List of exit_idx for currently open trades
-
-        for entry, result in zip(entries, all_results, strict=False):
-            entry_idx = entry["entry_index"]
-            exit_idx = result.get("exit_index") or entry_idx
-
-            # Remove closed positions (those that exited before current entry)
-            open_positions = [x for x in open_positions if x > entry_idx]
-
-            # Check if we can open a new position
-            if len(open_positions) < self.max_positions_per_symbol:
-                filtered_entries.append(entry)
-                filtered_results.append(result)
-                open_positions.append(exit_idx)
-
-        logger.debug(
-            "Position filter for %s: %d -> %d signals (max_concurrent=%d)",
-            symbol,
-            len(entries),
-            len(filtered_entries),
-            self.max_positions_per_symbol,
-        )
-
-        # Use filtered results
-        results = filtered_results
-        entries = filtered_entries
-
-        # 4. Convert Results to ClosedTrade
-        closed_trades = []
-        timestamps = data_pd[ts_col].values  # numpy array for fast access
-
-        for res, entry in zip(results, entries, strict=False):
-            if res["exit_index"] is None:
-                continue
-
-            # Skip if invalid
-            if res.get("exit_reason") == "INVALID_ENTRY":
-                continue
-
-            entry_idx = res["entry_index"]
-            exit_idx = res["exit_index"]
-
-            # Recalculate PnL in R (engine returns 'pnl' as percentage)
-            # pnl_r = pnl_pct / stop_loss_pct
-            sl_pct = entry["stop_loss_pct"]
-            pnl_r = res["pnl"] / sl_pct if sl_pct > 0 else 0.0
-
-            # Exit Reason Map
-            reason_map = {
-                "STOP_LOSS": "stop_loss",
-                "TAKE_PROFIT": "take_profit",
-                "TIMEOUT": "end_of_data",  # Map TIMEOUT to EOD for now
-                "END_OF_DATA": "end_of_data",
-            }
-            exit_reason = reason_map.get(res["exit_reason"], "end_of_data")
-
-            trade = ClosedTrade(
-                symbol=symbol,
-                signal_id=entry["signal_id"],
-                direction=entry["direction"],
-                open_timestamp=pd.Timestamp(timestamps[entry_idx]),
-                close_timestamp=pd.Timestamp(timestamps[exit_idx]),
-                entry_price=res.get("entry_price", entry["entry_price"]),
-                exit_price=res["exit_price"],
-                exit_reason=exit_reason,
-                pnl_dollars=0.0,  # Calculated later
-                pnl_r=pnl_r,
-                risk_amount=0.0,
-            )
-            closed_trades.append(trade)
-
-        return closed_trades
+        return entries
 
     def _build_per_symbol_breakdown(self) -> dict:
-        """Build per-symbol trade breakdown."""
-        breakdown = {}
-
-        for trade in self.closed_trades:
-            if trade.symbol not in breakdown:
-                breakdown[trade.symbol] = {
-                    "trade_count": 0,
-                    "win_count": 0,
-                    "loss_count": 0,
-                    "total_pnl": 0.0,
-                    "total_r": 0.0,
-                }
-
-            breakdown[trade.symbol]["trade_count"] += 1
-            breakdown[trade.symbol]["total_pnl"] += trade.pnl_dollars
-            breakdown[trade.symbol]["total_r"] += trade.pnl_r
-
-            if trade.pnl_r > 0:
-                breakdown[trade.symbol]["win_count"] += 1
-            else:
-                breakdown[trade.symbol]["loss_count"] += 1
-
-        # Calculate derived metrics
-        for stats in breakdown.values():
-            tc = stats["trade_count"]
-            stats["win_rate"] = stats["win_count"] / tc if tc > 0 else 0.0
-            stats["avg_r"] = stats["total_r"] / tc if tc > 0 else 0.0
-
-        return breakdown
+        """Build per-symbol trade breakdown (symbols in first-close order)."""
+        trades = self.closed_trades
+        return group_breakdown(trades.symbol, trades.pnl_r, trades.pnl_dollars)
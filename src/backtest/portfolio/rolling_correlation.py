@@ -0,0 +1,231 @@
+"""Incremental rolling correlation for all symbol pairs.
+
+RollingCorrelationMatrix keeps, for every ordered symbol pair (i, j), a ring
+of the last ``window`` joint observations of symbol i together with running
+sums, sums of squares and cross-products. A bar updates every pair that has
+both prices with one vectorized NumPy step (O(pairs), independent of the
+window length), replacing per-pair deque -> array -> np.corrcoef work.
+
+Prices are shifted by each symbol's first observed price before
+accumulating (correlation is shift invariant) and a pair's sums are rebuilt
+from its ring whenever the ring wraps, which bounds floating point drift.
+
+rolling_correlation_series computes the same correlations for a whole price
+history in one pass per pair (cumulative sums over joint observations).
+"""
+
+import numpy as np
+
+# Variance at or below this fraction of the mean square is treated as zero
+_ZERO_VARIANCE_RTOL = 1e-12
+
+
+def _correlation_from_moments(
+    count: np.ndarray,
+    sum_a: np.ndarray,
+    sum_b: np.ndarray,
+    sq_a: np.ndarray,
+    sq_b: np.ndarray,
+    cross: np.ndarray,
+) -> np.ndarray:
+    """Pearson correlation from running moments (0.0 for zero variance)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_a = sum_a / count
+        mean_b = sum_b / count
+        var_a = sq_a / count - mean_a * mean_a
+        var_b = sq_b / count - mean_b * mean_b
+        cov = cross / count - mean_a * mean_b
+        flat = (var_a <= _ZERO_VARIANCE_RTOL * (sq_a / count)) | (
+            var_b <= _ZERO_VARIANCE_RTOL * (sq_b / count)
+        )
+        corr = cov / np.sqrt(var_a * var_b)
+    corr = np.where(flat, 0.0, corr)
+    return np.clip(corr, -1.0, 1.0)
+
+
+class RollingCorrelationMatrix:
+    """Rolling pairwise correlation over a fixed set of symbol slots.
+
+    Attributes:
+        window: Number of joint observations per pair window.
+        capacity: Number of symbol slots allocated.
+        count: (capacity, capacity) joint observation counts (capped at window).
+    """
+
+    def __init__(self, window: int = 100, capacity: int = 8):
+        """Allocate state for up to ``capacity`` symbols (grows on demand).
+
+        Args:
+            window: Number of joint observations per pair window.
+            capacity: Initial number of symbol slots.
+
+        Raises:
+            ValueError: If window < 1.
+        """
+        if window < 1:
+            raise ValueError(f"window must be >= 1, got {window}")
+        self.window = window
+        self.capacity = 0
+        self._shift = np.empty(0)
+        self._shift_set = np.empty(0, dtype=bool)
+        self._ring = np.empty((0, 0, window))
+        self._pos = np.empty((0, 0), dtype=np.int64)
+        self.count = np.empty((0, 0), dtype=np.int64)
+        self._sum = np.empty((0, 0))
+        self._sq = np.empty((0, 0))
+        self._cross = np.empty((0, 0))
+        self.grow(capacity)
+
+    def grow(self, capacity: int) -> None:
+        """Ensure at least ``capacity`` symbol slots, preserving state."""
+        if capacity <= self.capacity:
+            return
+        old = self.capacity
+
+        def _pad(arr: np.ndarray, fill=0) -> np.ndarray:
+            shape = (capacity, capacity) + arr.shape[2:]
+            out = np.full(shape, fill, dtype=arr.dtype)
+            out[:old, :old] = arr
+            return out
+
+        shift = np.zeros(capacity)
+        shift[:old] = self._shift
+        shift_set = np.zeros(capacity, dtype=bool)
+        shift_set[:old] = self._shift_set
+        self._shift, self._shift_set = shift, shift_set
+        self._ring = _pad(self._ring)
+        self._pos = _pad(self._pos)
+        self.count = _pad(self.count)
+        self._sum = _pad(self._sum)
+        self._sq = _pad(self._sq)
+        self._cross = _pad(self._cross)
+        self.capacity = capacity
+
+    def update(self, prices: np.ndarray, pair_mask: np.ndarray) -> tuple:
+        """Add one bar of prices for every pair selected by pair_mask.
+
+        Args:
+            prices: (capacity,) prices; entries outside pair_mask are ignored.
+            pair_mask: (capacity, capacity) boolean mask of pairs to update
+                (should be symmetric with a False diagonal).
+
+        Returns:
+            Tuple (rows, cols) of the updated ordered pair indices.
+        """
+        rows, cols = np.nonzero(pair_mask)
+        if rows.size == 0:
+            return rows, cols
+
+        present = np.zeros(self.capacity, dtype=bool)
+        present[rows] = True
+        new_shift = present & ~self._shift_set
+        self._shift[new_shift] = prices[new_shift]
+        self._shift_set |= new_shift
+        x = np.where(present, prices - self._shift, 0.0)
+
+        pos = self._pos[rows, cols]
+        full = self.count[rows, cols] >= self.window
+        old_a = np.where(full, self._ring[rows, cols, pos], 0.0)
+        old_b = np.where(full, self._ring[cols, rows, pos], 0.0)
+        new_a = x[rows]
+        new_b = x[cols]
+
+        self._sum[rows, cols] += new_a - old_a
+        self._sq[rows, cols] += new_a * new_a - old_a * old_a
+        self._cross[rows, cols] += new_a * new_b - old_a * old_b
+        self._ring[rows, cols, pos] = new_a
+
+        pos = (pos + 1) % self.window
+        self._pos[rows, cols] = pos
+        self.count[rows, cols] = np.minimum(self.count[rows, cols] + 1, self.window)
+
+        # Rebuild sums from the ring once per full cycle to cancel drift
+        wrapped = full & (pos == 0)
+        if wrapped.any():
+            r, c = rows[wrapped], cols[wrapped]
+            ring_a = self._ring[r, c]
+            ring_b = self._ring[c, r]
+            self._sum[r, c] = ring_a.sum(axis=1)
+            self._sq[r, c] = (ring_a * ring_a).sum(axis=1)
+            self._cross[r, c] = (ring_a * ring_b).sum(axis=1)
+
+        return rows, cols
+
+    def correlation(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Current correlation for the given ordered pairs.
+
+        Args:
+            rows: Row (first symbol) slot indices.
+            cols: Column (second symbol) slot indices.
+
+        Returns:
+            Correlations (NaN where a pair has no observations).
+        """
+        return _correlation_from_moments(
+            self.count[rows, cols].astype(np.float64),
+            self._sum[rows, cols],
+            self._sum[cols, rows],
+            self._sq[rows, cols],
+            self._sq[cols, rows],
+            self._cross[rows, cols],
+        )
+
+
+def rolling_correlation_series(
+    prices: np.ndarray,
+    window: int = 100,
+    min_periods: int = 20,
+) -> np.ndarray:
+    """Rolling correlation of every symbol pair over a price history.
+
+    Matches feeding the rows one by one into RollingCorrelationMatrix: each
+    pair's window holds its last ``window`` joint (both non-NaN)
+    observations, and a pair's value is carried forward across bars where
+    either price is missing.
+
+    Args:
+        prices: (bars, symbols) price array; NaN marks a missing price.
+        window: Number of joint observations per pair window.
+        min_periods: Minimum joint observations before a value is reported.
+
+    Returns:
+        (bars, pairs) array, pairs ordered (0,1), (0,2), ..., (n-2,n-1) as in
+        np.triu_indices(symbols, 1); NaN until min_periods is reached.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n_bars, n_symbols = prices.shape
+    rows, cols = np.triu_indices(n_symbols, 1)
+    out = np.full((n_bars, rows.size), np.nan)
+
+    valid = ~np.isnan(prices)
+    for p, (i, j) in enumerate(zip(rows, cols)):
+        idx = np.flatnonzero(valid[:, i] & valid[:, j])
+        if idx.size < min_periods:
+            continue
+        a = prices[idx, i] - prices[idx[0], i]
+        b = prices[idx, j] - prices[idx[0], j]
+
+        def _windowed(values: np.ndarray) -> np.ndarray:
+            total = np.cumsum(values)
+            total[window:] -= total[:-window].copy()
+            return total
+
+        count = np.minimum(np.arange(1, idx.size + 1), window).astype(np.float64)
+        corr = _correlation_from_moments(
+            count,
+            _windowed(a),
+            _windowed(b),
+            _windowed(a * a),
+            _windowed(b * b),
+            _windowed(a * b),
+        )
+        corr[: min_periods - 1] = np.nan
+
+        # Carry each joint observation's value forward to the next one
+        last = np.full(n_bars, -1, dtype=np.int64)
+        last[idx] = np.arange(idx.size)
+        last = np.maximum.accumulate(last)
+        has_value = last >= 0
+        out[has_value, p] = corr[last[has_value]]
+
+    return out
@@ -191,6 +191,8 @@ def write_benchmark_record(
                  - fraction (float): Dataset fraction used (0.0-1.0)
                  - parallel_efficiency (float): Parallel speedup / num_workers (0.0-1.0)
                  - hotspots (List[Dict]): cProfile hotspot data
+                 - indicator_cache (Dict): IndicatorCache hit/miss/byte
+                   counters (see indicator_cache.merge_cache_stats)
                  - custom fields as needed
 
     Examples:
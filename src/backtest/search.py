@@ -0,0 +1,519 @@
+"""Adaptive parameter search behind SweepConfig.
+
+Exhaustive sweeps backtest the full Cartesian product of every
+ParameterRange, which explodes for grids over five or six parameters.
+run_search picks the search method from SweepConfig.search:
+
+- "grid": every valid combination on the full data (the classic sweep).
+- "halving": successive halving. All candidates (or as many as the budget
+  allows) are backtested on a small leading fraction of the data; the best
+  1/reduction_factor advance to a fraction reduction_factor times larger,
+  until the survivors run on the full data.
+- "hyperband": several successive-halving brackets that trade the number
+  of candidates against the starting fraction, hedging against rankings
+  on little data being misleading.
+- "tpe": Tree-structured Parzen Estimator over the grid. After a random
+  start, each batch picks the unevaluated combinations with the best ratio
+  of "good" to "bad" kernel densities of the results so far.
+
+Budgets (SweepConfig.max_evaluations in full-data backtest equivalents,
+SweepConfig.time_budget_seconds) are checked between batches. With
+SweepConfig.compare_exhaustive, small grids are also evaluated
+exhaustively and the Spearman rank correlation between the two rankings is
+reported, so an adaptive method can be validated before it is trusted on
+grids too large to sweep.
+"""
+
+import logging
+import math
+import time
+from collections.abc import Callable
+
+import numpy as np
+import polars as pl
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+)
+
+from .sweep import (
+    ParameterSet,
+    PreloadedSweepData,
+    SingleResult,
+    SweepConfig,
+    SweepEvaluator,
+    SweepResult,
+    filter_invalid_combinations,
+    generate_combinations,
+    rank_results,
+)
+
+logger = logging.getLogger(__name__)
+
+SEARCH_METHODS = ("grid", "halving", "hyperband", "tpe")
+
+# Largest grid compare_exhaustive will sweep exhaustively
+EXHAUSTIVE_COMPARE_LIMIT = 256
+
+# TPE: fraction of results treated as "good" and candidates scored per pick
+TPE_GAMMA = 0.25
+TPE_CANDIDATES = 24
+
+
+class _Budget:
+    """Evaluation-cost and wall-clock limits of one search."""
+
+    def __init__(self, config: SweepConfig, evaluator: SweepEvaluator):
+        self.max_cost = config.max_evaluations
+        self.deadline = (
+            None
+            if config.time_budget_seconds is None
+            else time.monotonic() + config.time_budget_seconds
+        )
+        self.evaluator = evaluator
+        self.start_cost = evaluator.cost
+
+    @property
+    def spent(self) -> float:
+        return self.evaluator.cost - self.start_cost
+
+    def remaining(self) -> float:
+        """Remaining evaluation cost (inf when unlimited)."""
+        if self.max_cost is None:
+            return math.inf
+        return self.max_cost - self.spent
+
+    def exhausted(self) -> bool:
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            return True
+        return self.remaining() <= 1e-9
+
+
+def halving_fractions(min_fraction: float, reduction_factor: int) -> list[float]:
+    """Data fractions of the successive-halving rungs, ending at 1.0.
+
+    Args:
+        min_fraction: Smallest fraction to evaluate on.
+        reduction_factor: Growth factor between rungs (>= 2).
+
+    Returns:
+        Increasing fractions reduction_factor**-k, ..., 1/reduction_factor, 1.
+
+    Raises:
+        ValueError: If the arguments are out of range.
+    """
+    if not 0 < min_fraction <= 1.0:
+        raise ValueError(f"min_fraction must be in (0, 1], got {min_fraction}")
+    if reduction_factor < 2:
+        raise ValueError(f"reduction_factor must be >= 2, got {reduction_factor}")
+    rungs = int(math.floor(math.log(1.0 / min_fraction, reduction_factor) + 1e-9))
+    return [float(reduction_factor) ** (k - rungs) for k in range(rungs + 1)]
+
+
+def _score(result: SingleResult, metric: str) -> float:
+    """Ranking score of a result (failed runs rank last)."""
+    if result.error is not None:
+        return -math.inf
+    return float(getattr(result, metric, 0.0))
+
+
+def _halving_cost(n: int, fractions: list[float], eta: int) -> float:
+    """Evaluation cost of successive halving started with n candidates."""
+    cost = 0.0
+    for fraction in fractions:
+        cost += n * fraction
+        n = max(1, math.ceil(n / eta))
+    return cost
+
+
+def _successive_halving(
+    candidates: list[int],
+    combinations: list[ParameterSet],
+    evaluator: SweepEvaluator,
+    fractions: list[float],
+    eta: int,
+    metric: str,
+    budget: _Budget,
+    latest: dict[int, SingleResult],
+    on_rung: Callable[[int, float], None],
+) -> None:
+    """Run one successive-halving bracket, recording each candidate's result.
+
+    Rungs are cut short when the budget runs out: the best survivors that
+    still fit are promoted, and the bracket stops when none fit.
+    """
+    survivors = list(candidates)
+    for rung, fraction in enumerate(fractions):
+        if rung > 0:
+            if budget.exhausted():
+                return
+            affordable = int(budget.remaining() / fraction + 1e-9)
+            survivors = survivors[: max(1, min(len(survivors), affordable))]
+        on_rung(len(survivors), fraction)
+        results = evaluator.evaluate([combinations[i] for i in survivors], fraction)
+        latest.update(zip(survivors, results))
+        if rung == len(fractions) - 1:
+            return
+        # Stable sort: ties keep candidate order
+        survivors.sort(key=lambda i: _score(latest[i], metric), reverse=True)
+        survivors = survivors[: max(1, math.ceil(len(survivors) / eta))]
+
+
+def _halving_search(
+    combinations, evaluator, config, metric, budget, latest, rng, on_rung
+) -> None:
+    """Successive halving over as many candidates as the budget allows."""
+    eta = config.reduction_factor
+    fractions = halving_fractions(config.min_fraction, eta)
+    # Largest starting population whose bracket fits the budget (cost grows in n)
+    lo, hi = 1, len(combinations)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if _halving_cost(mid, fractions, eta) <= budget.remaining():
+            lo = mid
+        else:
+            hi = mid - 1
+    n = lo
+    candidates = (
+        list(range(n))
+        if n == len(combinations)
+        else sorted(rng.choice(len(combinations), n, replace=False).tolist())
+    )
+    _successive_halving(
+        candidates,
+        combinations,
+        evaluator,
+        fractions,
+        eta,
+        metric,
+        budget,
+        latest,
+        on_rung,
+    )
+
+
+def _hyperband_search(
+    combinations, evaluator, config, metric, budget, latest, rng, on_rung
+) -> None:
+    """Hyperband brackets over candidates sampled without replacement.
+
+    One pass of brackets is run without a budget; with a budget, passes
+    repeat until it is spent or every combination has been evaluated.
+    """
+    eta = config.reduction_factor
+    fractions = halving_fractions(config.min_fraction, eta)
+    s_max = len(fractions) - 1
+    pool = rng.permutation(len(combinations)).tolist()
+    unlimited = config.max_evaluations is None and config.time_budget_seconds is None
+
+    while pool and not budget.exhausted():
+        for s in range(s_max, -1, -1):
+            if not pool or budget.exhausted():
+                return
+            n = math.ceil((s_max + 1) / (s + 1) * eta**s)
+            bracket, pool = sorted(pool[:n]), pool[n:]
+            _successive_halving(
+                bracket,
+                combinations,
+                evaluator,
+                fractions[s_max - s :],
+                eta,
+                metric,
+                budget,
+                latest,
+                on_rung,
+            )
+        if unlimited:
+            return
+
+
+def _value_indices(combinations: list[ParameterSet]) -> np.ndarray:
+    """Ordinal index of each combination's value per swept parameter."""
+    keys = sorted(
+        {
+            (ind, param)
+            for ps in combinations
+            for ind, vals in ps.params.items()
+            for param in vals
+        }
+    )
+    columns = []
+    for ind, param in keys:
+        values = [ps.params.get(ind, {}).get(param) for ps in combinations]
+        levels = sorted(set(values), key=lambda v: (v is None, v))
+        if len(levels) > 1:
+            lookup = {v: k for k, v in enumerate(levels)}
+            columns.append([lookup[v] for v in values])
+    if not columns:
+        return np.zeros((len(combinations), 0), dtype=np.int64)
+    return np.array(columns, dtype=np.int64).T
+
+
+def _parzen_log_density(observed: np.ndarray, levels: int) -> np.ndarray:
+    """Log density over ordinal levels: Gaussian kernels plus a uniform prior."""
+    grid = np.arange(levels)[:, None]
+    bandwidth = max(1.0, (levels - 1) / 5)
+    kernels = np.exp(-0.5 * ((grid - observed[None, :]) / bandwidth) ** 2)
+    kernels /= kernels.sum(axis=0, keepdims=True)
+    density = (kernels.sum(axis=1) + 1.0 / levels) / (observed.size + 1.0)
+    return np.log(density)
+
+
+def _tpe_search(combinations, evaluator, metric, budget, latest, rng, on_rung) -> None:
+    """TPE over the grid: evaluate batches maximizing l(x) / g(x)."""
+    indices = _value_indices(combinations)
+    levels = indices.max(axis=0) + 1 if indices.size else np.zeros(0, np.int64)
+    batch = max(1, evaluator.worker_count)
+    n_startup = min(len(combinations), max(batch, 2 * indices.shape[1] + 1))
+    evaluated = np.zeros(len(combinations), dtype=bool)
+
+    def run(chosen: list[int]) -> None:
+        on_rung(len(chosen), 1.0)
+        results = evaluator.evaluate([combinations[i] for i in chosen])
+        latest.update(zip(chosen, results))
+        evaluated[chosen] = True
+
+    start = int(min(n_startup, max(1, budget.remaining())))
+    run(sorted(rng.choice(len(combinations), start, replace=False).tolist()))
+
+    while not evaluated.all() and not budget.exhausted():
+        done = np.flatnonzero(evaluated)
+        scores = np.array([_score(latest[i], metric) for i in done])
+        order = done[np.argsort(-scores, kind="stable")]
+        n_good = max(1, math.ceil(TPE_GAMMA * order.size))
+        good, bad = order[:n_good], order[n_good:]
+        if bad.size == 0:
+            bad = good
+
+        open_ = np.flatnonzero(~evaluated)
+        log_l = np.zeros(open_.size)
+        log_g = np.zeros(open_.size)
+        for d, n_levels in enumerate(levels):
+            column = indices[open_, d]
+            log_l += _parzen_log_density(indices[good, d], int(n_levels))[column]
+            log_g += _parzen_log_density(indices[bad, d], int(n_levels))[column]
+
+        # Draw candidates from l(x), keep those with the best l(x) / g(x)
+        size = min(open_.size, TPE_CANDIDATES * batch)
+        weights = np.exp(log_l - log_l.max())
+        drawn = rng.choice(open_.size, size, replace=False, p=weights / weights.sum())
+        ratio = (log_l - log_g)[drawn]
+        take = int(min(batch, max(1, budget.remaining())))
+        picks = drawn[np.argsort(-ratio, kind="stable")[:take]]
+        run(sorted(open_[picks].tolist()))
+
+
+def spearman_correlation(a: np.ndarray, b: np.ndarray) -> float:
+    """Spearman rank correlation (average ranks for ties; NaN if undefined)."""
+    if len(a) < 2:
+        return math.nan
+    rank_a = pl.Series(np.asarray(a, dtype=np.float64)).rank("average").to_numpy()
+    rank_b = pl.Series(np.asarray(b, dtype=np.float64)).rank("average").to_numpy()
+    if rank_a.std() == 0 or rank_b.std() == 0:
+        return math.nan
+    return float(np.corrcoef(rank_a, rank_b)[0, 1])
+
+
+def compare_rankings(
+    search_results: list[SingleResult],
+    exhaustive_results: list[SingleResult],
+    metric: str = "sharpe_ratio",
+) -> tuple[float, int | None]:
+    """Agreement between a search ranking and the exhaustive ranking.
+
+    The search ranking orders results by data fraction reached, then by
+    metric (rank_results); it is correlated with the full-data metric of
+    the same combinations.
+
+    Args:
+        search_results: Latest result per combination from the search.
+        exhaustive_results: Full-data results for every combination.
+        metric: Ranking metric.
+
+    Returns:
+        Tuple of (Spearman correlation, exhaustive rank of the search's best
+        combination with 1 = best, or None if the search found nothing).
+    """
+    exhaustive = {r.params.label: _score(r, metric) for r in exhaustive_results}
+    ranked = [
+        r for r in rank_results(search_results, metric) if r.params.label in exhaustive
+    ]
+    if not ranked:
+        return math.nan, None
+
+    search_order = -np.arange(len(ranked), dtype=np.float64)
+    truth = np.array([exhaustive[r.params.label] for r in ranked])
+    correlation = spearman_correlation(
+        search_order, np.nan_to_num(truth, neginf=-1e300)
+    )
+
+    exhaustive_ranked = rank_results(exhaustive_results, metric)
+    labels = [r.params.label for r in exhaustive_ranked]
+    best_label = ranked[0].params.label
+    best_rank = labels.index(best_label) + 1 if best_label in labels else None
+    return correlation, best_rank
+
+
+_SEARCHES = {
+    "halving": _halving_search,
+    "hyperband": _hyperband_search,
+}
+
+
+def run_search(
+    config: SweepConfig,
+    pairs: list[str],
+    dataset: str = "test",
+    direction: str = "LONG",
+    max_workers: int | None = None,
+    sequential: bool = False,
+    metric: str = "sharpe_ratio",
+    constraints: list[Callable[[ParameterSet], bool]] | None = None,
+    data: PreloadedSweepData | None = None,
+) -> SweepResult:
+    """Search the parameter space described by a SweepConfig.
+
+    Args:
+        config: Ranges, search method and budgets. Its combination counts
+            are filled in.
+        pairs: List of currency pairs.
+        dataset: Dataset partition.
+        direction: Trading direction.
+        max_workers: Worker processes (None = auto-detect).
+        sequential: If True, evaluate in-process.
+        metric: Ranking metric (higher is better).
+        constraints: Validity constraints (default: fast EMA < slow EMA).
+        data: Optional preloaded frames (skips ingestion).
+
+    Returns:
+        SweepResult with the latest result of every evaluated combination
+        (SingleResult.fraction tells how much data it ran on), the best
+        full-data combination and, if requested, the rank correlation with
+        the exhaustive sweep.
+
+    Raises:
+        ValueError: If the search method is unknown.
+    """
+    if config.search not in SEARCH_METHODS:
+        raise ValueError(
+            f"Unknown search method '{config.search}'. Choose from {SEARCH_METHODS}"
+        )
+
+    combinations = generate_combinations(config.ranges)
+    config.total_combinations = len(combinations)
+    combinations, config.skipped_count = filter_invalid_combinations(
+        combinations, constraints
+    )
+    config.valid_combinations = len(combinations)
+    logger.info(
+        "Starting %s search over %d combinations", config.search, len(combinations)
+    )
+
+    start_time = time.time()
+    rng = np.random.default_rng(config.seed)
+    latest: dict[int, SingleResult] = {}
+    correlation, best_rank = None, None
+
+    with (
+        Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            transient=True,
+        ) as progress,
+        SweepEvaluator(
+            pairs,
+            dataset,
+            direction,
+            max_workers=max_workers,
+            sequential=sequential,
+            data=data,
+        ) as evaluator,
+    ):
+        task_id = progress.add_task(f"Running {config.search} search...", total=None)
+
+        def on_rung(count: int, fraction: float) -> None:
+            progress.update(
+                task_id,
+                description=(
+                    f"{config.search}: {count} candidates on {fraction:.0%} of data"
+                ),
+            )
+
+        budget = _Budget(config, evaluator)
+        if combinations:
+            if config.search == "grid":
+                chunk = max(1, evaluator.worker_count) * 4
+                for i in range(0, len(combinations), chunk):
+                    if i and budget.exhausted():
+                        break
+                    take = int(min(chunk, max(1, budget.remaining())))
+                    chosen = list(range(i, min(i + take, len(combinations))))
+                    on_rung(len(chosen), 1.0)
+                    results = evaluator.evaluate([combinations[j] for j in chosen])
+                    latest.update(zip(chosen, results))
+            elif config.search == "tpe":
+                _tpe_search(
+                    combinations, evaluator, metric, budget, latest, rng, on_rung
+                )
+            else:
+                _SEARCHES[config.search](
+                    combinations,
+                    evaluator,
+                    config,
+                    metric,
+                    budget,
+                    latest,
+                    rng,
+                    on_rung,
+                )
+        search_cost = budget.spent
+
+        if config.compare_exhaustive and combinations:
+            if len(combinations) > EXHAUSTIVE_COMPARE_LIMIT:
+                logger.warning(
+                    "Skipping exhaustive comparison: %d combinations exceeds %d",
+                    len(combinations),
+                    EXHAUSTIVE_COMPARE_LIMIT,
+                )
+            else:
+                # Reuse full-data results the search already computed
+                exhaustive = {i: r for i, r in latest.items() if r.fraction >= 1.0}
+                missing = [i for i in range(len(combinations)) if i not in exhaustive]
+                on_rung(len(missing), 1.0)
+                exhaustive.update(
+                    zip(missing, evaluator.evaluate([combinations[i] for i in missing]))
+                )
+                correlation, best_rank = compare_rankings(
+                    [latest[i] for i in sorted(latest)],
+                    [exhaustive[i] for i in range(len(combinations))],
+                    metric,
+                )
+                logger.info(
+                    "%s vs exhaustive: Spearman %.3f, best is exhaustive rank %s",
+                    config.search,
+                    correlation,
+                    best_rank,
+                )
+
+    results = [latest[i] for i in sorted(latest)]
+    ranked = rank_results(results, metric)
+    failed = sum(1 for r in results if r.error)
+
+    return SweepResult(
+        results=results,
+        best_params=ranked[0].params if ranked else None,
+        ranking_metric=metric,
+        execution_time_seconds=time.time() - start_time,
+        total_combinations=len(combinations),
+        successful_count=len(results) - failed,
+        failed_count=failed,
+        search=config.search,
+        evaluation_cost=search_cost,
+        rank_correlation=correlation,
+        exhaustive_best_rank=best_rank,
+    )
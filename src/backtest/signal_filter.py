@@ -8,6 +8,8 @@ import logging
 
 import numpy as np
 
+from src.risk.blackout.windows import BlackoutIndex
+
 
 logger = logging.getLogger(__name__)
 
@@ -158,20 +160,22 @@ def _filter_simple_window(
 def filter_blackout_signals(
     signal_indices: np.ndarray,
     timestamps: np.ndarray,
-    blackout_windows: list[tuple],
+    blackout_windows: "list[tuple] | BlackoutIndex",
 ) -> tuple[np.ndarray, int]:
     """
     Vectorized filter to remove signals falling within blackout windows.
 
-    This function uses NumPy boolean masks for O(n*w) complexity where
-    n = number of signals and w = number of windows. NO per-candle loops.
+    Windows are merged into a sorted BlackoutIndex and every signal is
+    located with one searchsorted pass: O(n log w) where n = number of
+    signals and w = number of windows. NO per-candle loops.
 
     Args:
         signal_indices: Array of signal indices to filter.
         timestamps: Array of UTC timestamps (as np.datetime64 or float epoch).
             Must have same length as signal_indices.
         blackout_windows: List of (start_utc, end_utc) tuples representing
-            blackout periods. Timestamps can be datetime objects or np.datetime64.
+            blackout periods (datetime objects or np.datetime64), or a
+            prebuilt BlackoutIndex.
 
     Returns:
         Tuple of (filtered_indices, blocked_count):
@@ -197,19 +201,9 @@ def filter_blackout_signals(
     if len(blackout_windows) == 0:
         return signal_indices.copy(), 0
 
-    # Start with all signals allowed
-    mask = np.ones(len(signal_indices), dtype=bool)
-
-    for start, end in blackout_windows:
-        # Convert datetime to numpy datetime64 if needed
-        if hasattr(start, "timestamp"):
-            start = np.datetime64(int(start.timestamp()), "s")
-        if hasattr(end, "timestamp"):
-            end = np.datetime64(int(end.timestamp()), "s")
-
-        # Vectorized comparison - no per-candle loop
-        in_window = (timestamps >= start) & (timestamps <= end)
-        mask &= ~in_window
+    if not isinstance(blackout_windows, BlackoutIndex):
+        blackout_windows = BlackoutIndex.from_windows(blackout_windows)
+    mask = ~blackout_windows.contains(timestamps)
 
     filtered_indices = signal_indices[mask]
     blocked_count = len(signal_indices) - len(filtered_indices)
@@ -6,15 +6,19 @@ parallel parameter sweeps across indicator configurations.
 
 import csv
 import logging
+import multiprocessing
 import re
 import time
 from collections.abc import Callable
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from datetime import datetime
 from itertools import product
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+import polars as pl
 from rich.progress import (
     BarColumn,
     Progress,
@@ -24,9 +28,31 @@ from rich.progress import (
 )
 
 from ..config.parameters import StrategyParameters
+from ..indicators.dispatcher import calculate_indicator_variants, source_data_hash
 from ..models.enums import DirectionMode
-from .engine import construct_data_paths, run_portfolio_backtest
-from .parallel import get_worker_count
+from ..strategy.trend_pullback.signal_generator_vectorized import (
+    generate_signal_batches,
+)
+from .engine import (
+    STRATEGY_MAP,
+    construct_data_paths,
+    get_custom_registry,
+    load_symbol_data,
+    load_symbol_window,
+    resolve_indicator_overrides,
+    run_portfolio_backtest,
+    simulate_portfolio,
+)
+from .chunking import slice_dataset
+from .indicator_cache import IndicatorCache
+from .metrics_kernel import PerformanceMetrics, compute_performance
+from .parallel import (
+    SharedArrays,
+    get_shared_arrays,
+    get_worker_count,
+    init_shared_worker,
+)
+from .trade_ledger import trade_column
 
 
 logger = logging.getLogger(__name__)
@@ -83,6 +109,17 @@ class SweepConfig:
         total_combinations: Total size of cartesian product.
         valid_combinations: Combinations remaining after constraint filtering.
         skipped_count: Number of combinations filtered by constraints.
+        search: Search method: "grid" (exhaustive), "halving" (successive
+            halving), "hyperband" or "tpe" (see search.run_search).
+        max_evaluations: Evaluation budget in full-dataset backtests (a run
+            on a quarter of the data costs 0.25). None = unlimited.
+        time_budget_seconds: Wall-clock budget; no new batch starts after it
+            is spent. None = unlimited.
+        min_fraction: Smallest data fraction halving/Hyperband evaluate on.
+        reduction_factor: Halving rate (keep 1/reduction_factor per rung).
+        seed: Seed for candidate sampling.
+        compare_exhaustive: If True, also run the full grid on small grids
+            and report the rank correlation of the adaptive ranking.
     """
 
     strategy_name: str
@@ -90,6 +127,13 @@ class SweepConfig:
     total_combinations: int = 0
     valid_combinations: int = 0
     skipped_count: int = 0
+    search: str = "grid"
+    max_evaluations: float | None = None
+    time_budget_seconds: float | None = None
+    min_fraction: float = 1 / 9
+    reduction_factor: int = 3
+    seed: int = 0
+    compare_exhaustive: bool = False
 
 
 # Range parsing patterns
@@ -266,6 +310,7 @@ class SingleResult:
         trade_count: Number of trades executed.
         max_drawdown: Maximum drawdown percentage.
         error: Error message if backtest failed, None otherwise.
+        fraction: Fraction of the dataset the backtest ran on.
     """
 
     params: ParameterSet
@@ -275,6 +320,7 @@ class SingleResult:
     trade_count: int = 0
     max_drawdown: float = 0.0
     error: str | None = None
+    fraction: float = 1.0
 
 
 @dataclass
@@ -289,6 +335,12 @@ class SweepResult:
         total_combinations: Number of combinations tested.
         successful_count: Number that completed without error.
         failed_count: Number that failed with error.
+        search: Search method that produced the results.
+        evaluation_cost: Backtests run, in full-dataset equivalents.
+        rank_correlation: Spearman correlation between the search ranking
+            and the exhaustive ranking (None unless compared).
+        exhaustive_best_rank: Exhaustive rank (1 = best) of best_params
+            (None unless compared).
     """
 
     results: list[SingleResult] = field(default_factory=list)
@@ -298,6 +350,10 @@ class SweepResult:
     total_combinations: int = 0
     successful_count: int = 0
     failed_count: int = 0
+    search: str = "grid"
+    evaluation_cost: float = 0.0
+    rank_correlation: float | None = None
+    exhaustive_best_rank: int | None = None
 
 
 def rank_results(
@@ -307,6 +363,9 @@ def rank_results(
 ) -> list[SingleResult]:
     """Rank results by specified metric.
 
+    Results computed on a larger data fraction (adaptive searches) always
+    rank ahead of results on a smaller one.
+
     Args:
         results: List of SingleResult objects.
         metric: Metric to sort by (sharpe_ratio, total_pnl, win_rate).
@@ -317,12 +376,13 @@ def rank_results(
     """
     # Filter out failed results
     successful = [r for r in results if r.error is None]
+    sign = -1.0 if ascending else 1.0
 
-    # Sort by metric
+    # Sort by data fraction, then metric
     return sorted(
         successful,
-        key=lambda r: getattr(r, metric, 0.0),
-        reverse=not ascending,
+        key=lambda r: (r.fraction, sign * getattr(r, metric, 0.0)),
+        reverse=True,
     )
 
 
@@ -349,6 +409,7 @@ def display_results_table(
     table.add_column("Win Rate", style="yellow")
     table.add_column("PnL", style="magenta")
     table.add_column("Trades", style="dim")
+    table.add_column("Data", style="dim")
 
     for i, result in enumerate(results[:top_n], 1):
         fast_period = result.params.params.get("fast_ema", {}).get("period", "-")
@@ -362,18 +423,264 @@ def display_results_table(
             f"{result.win_rate:.1%}",
             f"${result.total_pnl:.2f}",
             str(result.trade_count),
+            f"{result.fraction:.0%}",
         )
 
     console.print()
     console.print(table)
 
 
+@dataclass
+class PreloadedSweepData:
+    """Price data and indicator columns shared across sweep combinations.
+
+    Each pair is ingested once; indicator columns are cached per pair keyed
+    by their effective parameters, so combinations only recompute the
+    indicators whose parameters differ from ones already seen. The caches
+    are in-memory only, so sweeps leave nothing on disk.
+
+    Attributes:
+        frames: Pair -> raw OHLCV Polars frame.
+        indicator_caches: Pair -> cache of computed indicator columns.
+        data_hashes: Pair -> source data hash of its frame, filled on first
+            use by data_hash so combinations do not rehash the frame.
+    """
+
+    frames: dict[str, pl.DataFrame] = field(default_factory=dict)
+    indicator_caches: dict[str, IndicatorCache] = field(default_factory=dict)
+    data_hashes: dict[str, str] = field(default_factory=dict)
+    _slices: dict[float, "PreloadedSweepData"] = field(
+        default_factory=dict, repr=False
+    )
+
+    def data_hash(self, pair: str) -> str:
+        """Source data hash of one pair's frame (computed once).
+
+        Args:
+            pair: Pair whose frame to hash.
+
+        Returns:
+            source_data_hash of the frame.
+        """
+        if pair not in self.data_hashes:
+            self.data_hashes[pair] = source_data_hash(self.frames[pair])
+        return self.data_hashes[pair]
+
+    @classmethod
+    def load(
+        cls,
+        pair_paths: list[tuple[str, Path]],
+        show_progress: bool = False,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> "PreloadedSweepData":
+        """Ingest every pair once.
+
+        Args:
+            pair_paths: List of (pair, path) tuples.
+            show_progress: If True, show ingestion progress.
+            start: Optional first timestamp to load (naive values are UTC).
+            end: Optional last timestamp to load, inclusive. With either
+                bound only the date range is read (indicators warm up
+                inside it, since sweeps vary the periods).
+
+        Returns:
+            PreloadedSweepData with one frame and an empty cache per pair.
+        """
+        data = cls()
+        for pair, data_path in pair_paths:
+            logger.info("Preloading sweep data for %s from %s", pair, data_path)
+            if start is not None or end is not None:
+                data.frames[pair] = load_symbol_window(
+                    data_path, start, end, show_progress=show_progress
+                )
+            else:
+                data.frames[pair] = load_symbol_data(
+                    data_path, show_progress=show_progress
+                )
+            data.indicator_caches[pair] = IndicatorCache(dataset_id=pair)
+        return data
+
+    def to_shared_arrays(
+        self,
+    ) -> tuple[dict[str, Any], dict[str, list[tuple[str, pl.DataType]]]]:
+        """Flatten frames into arrays for publishing in shared memory.
+
+        Returns:
+            Tuple of ("pair/column" -> physical NumPy array, pair -> column
+            schema needed to rebuild each frame).
+
+        Raises:
+            ValueError: If a column contains nulls (no NumPy representation).
+        """
+        arrays: dict[str, Any] = {}
+        schemas: dict[str, list[tuple[str, pl.DataType]]] = {}
+        for pair, frame in self.frames.items():
+            schemas[pair] = []
+            for series in frame.get_columns():
+                if series.null_count():
+                    raise ValueError(
+                        f"Cannot share column '{series.name}' for {pair}: "
+                        "contains nulls"
+                    )
+                arrays[f"{pair}/{series.name}"] = series.to_physical().to_numpy()
+                schemas[pair].append((series.name, series.dtype))
+        return arrays, schemas
+
+    @classmethod
+    def from_shared_arrays(
+        cls,
+        arrays: dict[str, Any],
+        schemas: dict[str, list[tuple[str, pl.DataType]]],
+    ) -> "PreloadedSweepData":
+        """Rebuild frames as zero-copy wrappers over shared arrays.
+
+        Args:
+            arrays: "pair/column" -> read-only array (from get_shared_arrays).
+            schemas: Pair -> column schema from to_shared_arrays.
+
+        Returns:
+            PreloadedSweepData whose frames reference the shared buffers.
+        """
+        data = cls()
+        for pair, schema in schemas.items():
+            columns = []
+            for name, dtype in schema:
+                series = pl.Series(name, arrays[f"{pair}/{name}"])
+                if series.dtype != dtype:
+                    series = series.cast(dtype)
+                columns.append(series)
+            data.frames[pair] = pl.DataFrame(columns)
+            data.indicator_caches[pair] = IndicatorCache(dataset_id=pair)
+        return data
+
+    def sliced(self, fraction: float) -> "PreloadedSweepData":
+        """Leading ``fraction`` of every frame (zero-copy), sharing the caches.
+
+        Slices are kept per fraction, so their data hashes are computed once
+        for all combinations run on them.
+
+        Args:
+            fraction: Fraction of rows to keep (0 < fraction <= 1).
+
+        Returns:
+            PreloadedSweepData over the sliced frames.
+        """
+        if fraction >= 1.0:
+            return self
+        if fraction not in self._slices:
+            self._slices[fraction] = PreloadedSweepData(
+                frames={
+                    pair: slice_dataset(frame, fraction)
+                    for pair, frame in self.frames.items()
+                },
+                indicator_caches=self.indicator_caches,
+            )
+        return self._slices[fraction]
+
+
+def build_strategy_params(params: ParameterSet) -> StrategyParameters:
+    """Default strategy parameters with the sweep's indicator periods applied.
+
+    Args:
+        params: Parameter set being tested.
+
+    Returns:
+        StrategyParameters with EMA/ATR/RSI periods taken from params.
+    """
+    strategy_params = StrategyParameters()
+
+    # StrategyParameters works with 'ema_fast', 'ema_slow', 'atr_length', 'rsi_length'
+    # ParameterSet uses 'fast_ema', 'slow_ema', 'atr', 'rsi'.
+    # All params are also passed to the engine as indicator overrides, so
+    # semantic names are preserved for other indicators.
+    fast_ema_period = params.params.get("fast_ema", {}).get("period")
+    if fast_ema_period:
+        strategy_params.ema_fast = int(fast_ema_period)
+
+    slow_ema_period = params.params.get("slow_ema", {}).get("period")
+    if slow_ema_period:
+        strategy_params.ema_slow = int(slow_ema_period)
+
+    atr_period = params.params.get("atr", {}).get("period")
+    if atr_period:
+        strategy_params.atr_length = int(atr_period)
+
+    rsi_period = params.params.get("rsi", {}).get("period")
+    if rsi_period:
+        strategy_params.rsi_length = int(rsi_period)
+
+    return strategy_params
+
+
+def ranking_metrics(performance: PerformanceMetrics) -> tuple[float, float]:
+    """Sharpe ratio and max drawdown used to rank sweep results.
+
+    The Sharpe ratio is trade-based (mean R over the sample standard
+    deviation of R); the drawdown is the largest peak-relative decline of
+    the equity curve as a positive fraction. Both are 0.0 when undefined.
+
+    Args:
+        performance: Metrics kernel output of one run.
+
+    Returns:
+        (sharpe_ratio, max_drawdown).
+    """
+    sharpe_ratio = 0.0
+    if performance.trade_count > 1 and performance.r_std_sample > 0:
+        sharpe_ratio = performance.avg_r / performance.r_std_sample
+    max_drawdown = performance.max_drawdown_pct
+    if not np.isfinite(max_drawdown):
+        max_drawdown = 0.0
+    return sharpe_ratio, max_drawdown
+
+
+def summarize_portfolio_result(params: ParameterSet, result: Any) -> SingleResult:
+    """Reduce a PortfolioResult to the sweep's ranking metrics.
+
+    Args:
+        params: Parameter set that produced the result.
+        result: PortfolioResult from the portfolio simulator.
+
+    Returns:
+        SingleResult with Sharpe, PnL, win rate, trade count and drawdown.
+    """
+    # Note: PortfolioResult has flat attributes, not a metrics object
+    trade_count = getattr(result, "total_trades", 0)
+    total_pnl = getattr(result, "total_pnl", 0.0)
+
+    # Calculate derived metrics
+    closed_trades = getattr(result, "closed_trades", [])
+    wins = int(np.count_nonzero(trade_column(closed_trades, "pnl_dollars") > 0))
+    win_rate = wins / trade_count if trade_count > 0 else 0.0
+
+    # Sharpe (trade-based: mean R / sample std of R) and peak-relative max
+    # drawdown of the equity curve, from one pass of the metrics kernel
+    performance = compute_performance(
+        closed_trades,
+        getattr(result, "equity_curve", None),
+        breakdowns=False,
+    )
+    sharpe_ratio, max_drawdown = ranking_metrics(performance)
+
+    return SingleResult(
+        params=params,
+        sharpe_ratio=sharpe_ratio,
+        total_pnl=total_pnl,
+        win_rate=win_rate,
+        trade_count=trade_count,
+        max_drawdown=max_drawdown,
+    )
+
+
 def run_single_backtest(
     params: ParameterSet,
     pair_paths: list[tuple[str, Path]],
     direction_mode: DirectionMode = DirectionMode.LONG,
     starting_equity: float = 2500.0,
     dataset: str = "test",
+    preloaded: PreloadedSweepData | None = None,
+    fraction: float = 1.0,
 ) -> SingleResult:
     """Run a single backtest with specific parameters.
 
@@ -383,37 +690,19 @@ def run_single_backtest(
         direction_mode: Trading direction (LONG/SHORT/BOTH).
         starting_equity: Starting capital.
         dataset: Dataset name (for logging).
+        preloaded: Optional shared data; skips ingestion and reuses cached
+            indicator columns.
+        fraction: Leading fraction of the data to backtest on.
 
     Returns:
         SingleResult object with performance metrics.
     """
     try:
-        # Create base strategy params (with defaults)
-        strategy_params = StrategyParameters()
-
-        # Inject parameter sweep values into strategy parameters
-        # Note: StrategyParameters works with 'ema_fast', 'ema_slow', 'atr_length', 'rsi_length'
-        # ParameterSet uses 'fast_ema', 'slow_ema', 'atr', 'rsi'
-
-        # Mapping: indicator_name -> strategy_param_field
-        # (Only mapping fields that exist in StrategyParameters for consistency)
-        # Note: We also pass all params as override dict to engine, so semantic names are preserved.
-
-        fast_ema_period = params.params.get("fast_ema", {}).get("period")
-        if fast_ema_period:
-            strategy_params.ema_fast = int(fast_ema_period)
-
-        slow_ema_period = params.params.get("slow_ema", {}).get("period")
-        if slow_ema_period:
-            strategy_params.ema_slow = int(slow_ema_period)
-
-        atr_period = params.params.get("atr", {}).get("period")
-        if atr_period:
-            strategy_params.atr_length = int(atr_period)
-
-        rsi_period = params.params.get("rsi", {}).get("period")
-        if rsi_period:
-            strategy_params.rsi_length = int(rsi_period)
+        strategy_params = build_strategy_params(params)
+        if fraction < 1.0:
+            if preloaded is None:
+                preloaded = PreloadedSweepData.load(pair_paths)
+            preloaded = preloaded.sliced(fraction)
 
         # Run backtest using the engine
         # We pass params.params as indicator_overrides to support arbitrary indicator sweeping
@@ -425,59 +714,138 @@ def run_single_backtest(
             dry_run=False,
             show_progress=False,  # Suppress inner progress bars
             indicator_overrides=params.params,
+            preloaded_data=preloaded.frames if preloaded else None,
+            indicator_caches=preloaded.indicator_caches if preloaded else None,
+            data_hashes=(
+                {pair: preloaded.data_hash(pair) for pair in preloaded.frames}
+                if preloaded
+                else None
+            ),
+            max_workers=1,  # Sweeps parallelize across combinations instead
         )
 
-        # Extract metrics
-        # Extract metrics
-        # Note: PortfolioResult has flat attributes, not a metrics object
-        trade_count = getattr(result, "total_trades", 0)
-        total_pnl = getattr(result, "total_pnl", 0.0)
+        summary = summarize_portfolio_result(params, result)
+        summary.fraction = fraction
+        return summary
+
+    except Exception as e:
+        logger.exception("Backtest failed for params %s", params.label)
+        return SingleResult(params=params, error=str(e), fraction=fraction)
 
-        # Calculate derived metrics
-        closed_trades = getattr(result, "closed_trades", [])
-        wins = sum(1 for t in closed_trades if t.pnl_dollars > 0)
-        win_rate = wins / trade_count if trade_count > 0 else 0.0
 
-        # Calculate Max Drawdown from equity curve
-        max_drawdown = 0.0
-        equity_curve = getattr(result, "equity_curve", [])
-        if equity_curve:
-            peak = equity_curve[0][1]
-            for _, equity in equity_curve:
-                if equity > peak:
-                    peak = equity
-                dd = (peak - equity) / peak
-                if dd > max_drawdown:
-                    max_drawdown = dd
-
-        # Calculate Sharpe (Simple trade-based approximation)
-        sharpe_ratio = 0.0
-        if trade_count > 1:
-            # Use pnl_r for return distribution
-            returns = [t.pnl_r for t in closed_trades]
-            if len(returns) > 1:
-                import statistics
+# Memory budget for one group's indicator columns (see group_size)
+GROUP_BYTES = 512 * 1024 * 1024
 
-                try:
-                    avg_ret = statistics.mean(returns)
-                    std_dev = statistics.stdev(returns)
-                    if std_dev > 0:
-                        sharpe_ratio = avg_ret / std_dev
-                except statistics.StatisticsError:
-                    pass
-
-        return SingleResult(
-            params=params,
-            sharpe_ratio=sharpe_ratio,
-            total_pnl=total_pnl,
-            win_rate=win_rate,
-            trade_count=trade_count,
-            max_drawdown=max_drawdown,
-        )
 
-    except Exception as e:
-        logger.exception("Backtest failed for params %s", params.label)
-        return SingleResult(params=params, error=str(e))
+def group_size(n_rows: int, max_size: int = 64) -> int:
+    """Combinations per run_backtest_group call for frames of n_rows bars.
+
+    Bounded so the group's distinct indicator columns (at most five
+    float64 columns per combination) fit in GROUP_BYTES.
+    """
+    return max(1, min(max_size, GROUP_BYTES // max(1, n_rows * 8 * 5)))
+
+
+def run_backtest_group(
+    combinations: list[ParameterSet],
+    pair_paths: list[tuple[str, Path]],
+    direction_mode: DirectionMode = DirectionMode.LONG,
+    starting_equity: float = 2500.0,
+    dataset: str = "test",
+    preloaded: PreloadedSweepData | None = None,
+    fraction: float = 1.0,
+) -> list[SingleResult]:
+    """Backtest several parameter sets, sharing indicator and signal passes.
+
+    For the vectorized trend-pullback strategy the indicators of every
+    combination are computed by the batched kernels (one pass per
+    indicator family over the distinct periods) and all entry conditions
+    are evaluated in one query; each combination is then simulated on its
+    own. Results equal run_single_backtest per combination, which is used
+    for other strategies and if the shared passes fail.
+
+    Args:
+        combinations: Parameter sets to test.
+        pair_paths: Pre-constructed lists of (pair, path) tuples.
+        direction_mode: Trading direction (LONG/SHORT/BOTH).
+        starting_equity: Starting capital.
+        dataset: Dataset name (for logging).
+        preloaded: Optional shared data (skips ingestion).
+        fraction: Leading fraction of the data to backtest on.
+
+    Returns:
+        One SingleResult per combination, in input order.
+    """
+
+    def one_by_one() -> list[SingleResult]:
+        return [
+            run_single_backtest(
+                params,
+                pair_paths,
+                direction_mode=direction_mode,
+                starting_equity=starting_equity,
+                dataset=dataset,
+                preloaded=preloaded,
+                fraction=fraction,
+            )
+            for params in combinations
+        ]
+
+    strategy_params = [build_strategy_params(params) for params in combinations]
+    names = {getattr(sp, "strategy_name", "trend-pullback") for sp in strategy_params}
+    strategy = STRATEGY_MAP.get(next(iter(names), ""))
+    if (
+        len(combinations) < 2
+        or names != {"trend-pullback"}
+        or not hasattr(strategy, "scan_vectorized")
+    ):
+        return one_by_one()
+
+    try:
+        if preloaded is None:
+            preloaded = PreloadedSweepData.load(pair_paths)
+        data = preloaded.sliced(fraction) if fraction < 1.0 else preloaded
+
+        overrides = [
+            resolve_indicator_overrides(sp, params.params)
+            for sp, params in zip(strategy_params, combinations)
+        ]
+        variants = {}
+        batches = {}
+        for pair, frame in data.frames.items():
+            variants[pair] = calculate_indicator_variants(
+                frame,
+                strategy.metadata.required_indicators,
+                overrides,
+                custom_registry=get_custom_registry(strategy),
+            )
+            batches[pair] = generate_signal_batches(
+                variants[pair].frame,
+                [sp.model_dump() | {"pair": pair} for sp in strategy_params],
+                variants[pair].mappings,
+                direction_mode=direction_mode.value,
+            )
+    except Exception:
+        logger.exception("Grouped evaluation failed; running combinations singly")
+        return one_by_one()
+
+    results = []
+    for k, (params, sp) in enumerate(zip(combinations, strategy_params)):
+        try:
+            result = simulate_portfolio(
+                {pair: group.variant(k) for pair, group in variants.items()},
+                {pair: pair_batches[k] for pair, pair_batches in batches.items()},
+                direction_mode,
+                sp,
+                starting_equity=starting_equity,
+            )
+            summary = summarize_portfolio_result(params, result)
+            summary.fraction = fraction
+        except Exception as e:
+            logger.exception("Backtest failed for params %s", params.label)
+            summary = SingleResult(params=params, error=str(e), fraction=fraction)
+        results.append(summary)
+    return results
 
 
 @dataclass
@@ -489,6 +857,32 @@ class SweepTask:
     direction_mode: DirectionMode
     dataset: str
     starting_equity: float
+    fraction: float = 1.0
+
+
+@dataclass
+class SweepGroupTask:
+    """Parameter sets a worker backtests together (run_backtest_group)."""
+
+    combinations: list[ParameterSet]
+    pair_paths: list[tuple[str, Path]]
+    direction_mode: DirectionMode
+    dataset: str
+    starting_equity: float
+    fraction: float = 1.0
+
+
+# Per-process sweep data, populated by init_sweep_worker in pool workers
+_WORKER_DATA: PreloadedSweepData | None = None
+
+
+def init_sweep_worker(schemas: dict[str, list[tuple[str, pl.DataType]]]) -> None:
+    """Process-pool initializer: wrap the attached shared price arrays.
+
+    Runs after parallel.init_shared_worker has attached the arrays.
+    """
+    global _WORKER_DATA  # pylint: disable=global-statement
+    _WORKER_DATA = PreloadedSweepData.from_shared_arrays(get_shared_arrays(), schemas)
 
 
 def execute_sweep_task(task: SweepTask) -> SingleResult:
@@ -499,9 +893,184 @@ def execute_sweep_task(task: SweepTask) -> SingleResult:
         direction_mode=task.direction_mode,
         starting_equity=task.starting_equity,
         dataset=task.dataset,
+        preloaded=_WORKER_DATA,
+        fraction=task.fraction,
     )
 
 
+def execute_sweep_group(task: SweepGroupTask) -> list[SingleResult]:
+    """Worker function to execute a group of backtests."""
+    return run_backtest_group(
+        task.combinations,
+        task.pair_paths,
+        direction_mode=task.direction_mode,
+        starting_equity=task.starting_equity,
+        dataset=task.dataset,
+        preloaded=_WORKER_DATA,
+        fraction=task.fraction,
+    )
+
+
+class SweepEvaluator:
+    """Backtests batches of parameter sets against data ingested once.
+
+    With more than one worker the OHLCV columns are published in shared
+    memory and one spawn process pool serves every batch, so adaptive
+    searches that evaluate many small batches pay the start-up cost once.
+    Combinations are backtested in groups (run_backtest_group) so their
+    indicators and signals are computed together. Use as a context manager.
+
+    Attributes:
+        pair_paths: (pair, path) tuples being backtested.
+        worker_count: Worker processes (1 = in-process).
+        evaluations: Backtests run so far.
+        cost: Backtests run so far, weighted by data fraction.
+    """
+
+    def __init__(
+        self,
+        pairs: list[str],
+        dataset: str = "test",
+        direction: str = "LONG",
+        max_workers: int | None = None,
+        sequential: bool = False,
+        starting_equity: float = 2500.0,
+        data: PreloadedSweepData | None = None,
+    ):
+        """Configure the evaluator.
+
+        Args:
+            pairs: List of currency pairs.
+            dataset: Dataset partition.
+            direction: Trading direction.
+            max_workers: Worker processes (None = auto-detect).
+            sequential: If True, evaluate in-process.
+            starting_equity: Starting capital per backtest.
+            data: Optional preloaded frames (skips ingestion).
+        """
+        self.dataset = dataset
+        self.direction_mode = DirectionMode[direction]
+        self.starting_equity = starting_equity
+        self.worker_count = 1 if sequential else get_worker_count(max_workers)
+        if data is None:
+            self.pair_paths = construct_data_paths(pairs, dataset)
+        else:
+            self.pair_paths = [(pair, Path(pair)) for pair in data.frames]
+        self.evaluations = 0
+        self.cost = 0.0
+        self._data = data
+        self._shared: SharedArrays | None = None
+        self._executor: ProcessPoolExecutor | None = None
+        self._n_rows = 0
+
+    def __enter__(self) -> "SweepEvaluator":
+        # Every pair is ingested only once
+        data = self._data or PreloadedSweepData.load(self.pair_paths)
+        self._n_rows = max((f.height for f in data.frames.values()), default=0)
+        if self.worker_count > 1:
+            # Publish OHLCV columns once; workers attach read-only views
+            arrays, schemas = data.to_shared_arrays()
+            self._shared = SharedArrays(arrays)
+            # Spawn: forking after Polars has started its thread pool can deadlock
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.worker_count,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_shared_worker,
+                initargs=(self._shared.specs, init_sweep_worker, (schemas,)),
+            )
+            self._data = None
+        else:
+            self._data = data
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def _groups(self, count: int) -> list[list[int]]:
+        """Split combination indices into run_backtest_group batches."""
+        size = group_size(self._n_rows)
+        if self.worker_count > 1:
+            # Keep several groups per worker for load balancing
+            size = min(size, max(1, -(-count // (self.worker_count * 4))))
+        return [list(range(i, min(i + size, count))) for i in range(0, count, size)]
+
+    def evaluate(
+        self,
+        combinations: list[ParameterSet],
+        fraction: float = 1.0,
+        on_result: Callable[[SingleResult], None] | None = None,
+    ) -> list[SingleResult]:
+        """Backtest parameter sets on the leading fraction of the data.
+
+        Args:
+            combinations: Parameter sets to test.
+            fraction: Fraction of the data to backtest on.
+            on_result: Optional callback invoked as each result completes.
+
+        Returns:
+            One SingleResult per combination, in input order.
+        """
+        results: list[SingleResult | None] = [None] * len(combinations)
+        groups = self._groups(len(combinations))
+
+        if self._executor is not None:
+            futures = {
+                self._executor.submit(
+                    execute_sweep_group,
+                    SweepGroupTask(
+                        combinations=[combinations[i] for i in group],
+                        pair_paths=self.pair_paths,
+                        direction_mode=self.direction_mode,
+                        dataset=self.dataset,
+                        starting_equity=self.starting_equity,
+                        fraction=fraction,
+                    ),
+                ): group
+                for group in groups
+            }
+            for future in as_completed(futures):
+                group = futures[future]
+                try:
+                    group_results = future.result()
+                except Exception as e:
+                    # This should be caught inside the worker, but just in case
+                    logger.error("Parallel task failed: %s", e)
+                    group_results = [
+                        SingleResult(
+                            params=combinations[i], error=str(e), fraction=fraction
+                        )
+                        for i in group
+                    ]
+                for i, result in zip(group, group_results):
+                    results[i] = result
+                    if on_result is not None:
+                        on_result(result)
+        else:
+            for group in groups:
+                group_results = run_backtest_group(
+                    [combinations[i] for i in group],
+                    self.pair_paths,
+                    direction_mode=self.direction_mode,
+                    starting_equity=self.starting_equity,
+                    dataset=self.dataset,
+                    preloaded=self._data,
+                    fraction=fraction,
+                )
+                for i, result in zip(group, group_results):
+                    results[i] = result
+                    if on_result is not None:
+                        on_result(result)
+
+        self.evaluations += len(combinations)
+        self.cost += len(combinations) * fraction
+        return results
+
+
 def run_sweep(
     combinations: list[ParameterSet],
     pairs: list[str],
@@ -510,13 +1079,15 @@ def run_sweep(
     max_workers: int | None = None,
     sequential: bool = False,
 ) -> SweepResult:
-    """Run parameter sweep backtests sequentially (Phase 4 MVP).
+    """Run an exhaustive parameter sweep over every combination.
 
     Args:
         combinations: List of parameter sets to test.
         pairs: List of currency pairs.
         dataset: Dataset partition.
         direction: Trading direction.
+        max_workers: Worker processes (None = auto-detect).
+        sequential: If True, run in-process (for debugging).
 
     Returns:
         SweepResult containing all results and metadata.
@@ -524,22 +1095,6 @@ def run_sweep(
     logger.info("Starting sweep with %d combinations", len(combinations))
 
     start_time = time.time()
-    results = []
-
-    # Construct data paths once (though engine currently reloads data, unfortunately)
-    # TODO: Optimize engine to accept preloaded data
-    pair_paths = construct_data_paths(pairs, dataset)
-    direction_mode = DirectionMode[direction]
-
-    successful = 0
-    failed = 0
-
-    # Determine execution mode
-    worker_count = 1
-    if not sequential:
-        worker_count = get_worker_count(max_workers)
-
-    logger.info("Running sweep with %d workers (concurrent)", worker_count)
 
     with Progress(
         SpinnerColumn(),
@@ -547,69 +1102,25 @@ def run_sweep(
         BarColumn(),
         TaskProgressColumn(),
         transient=True,
-    ) as progress:
+    ) as progress, SweepEvaluator(
+        pairs, dataset, direction, max_workers=max_workers, sequential=sequential
+    ) as evaluator:
+        logger.info("Running sweep with %d workers", evaluator.worker_count)
         task_id = progress.add_task("Running sweep...", total=len(combinations))
+        done = 0
+
+        def advance(_result: SingleResult) -> None:
+            nonlocal done
+            done += 1
+            progress.advance(task_id)
+            progress.update(
+                task_id, description=f"Tested {done}/{len(combinations)}"
+            )
 
-        if worker_count > 1:
-            # Parallel Execution
-            tasks = [
-                SweepTask(
-                    params=params,
-                    pair_paths=pair_paths,
-                    direction_mode=direction_mode,
-                    dataset=dataset,
-                    starting_equity=2500.0,  # pass default for now
-                )
-                for params in combinations
-            ]
-
-            with ProcessPoolExecutor(max_workers=worker_count) as executor:
-                futures = {
-                    executor.submit(execute_sweep_task, task): i
-                    for i, task in enumerate(tasks)
-                }
-
-                for future in as_completed(futures):
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        if result.error:
-                            failed += 1
-                        else:
-                            successful += 1
-                    except Exception as e:
-                        # This should be caught inside execute_sweep_task, but just in case
-                        logger.error("Parallel task failed: %s", e)
-                        failed += 1
-
-                    progress.advance(task_id)
-                    description = f"Tested {len(results)}/{len(combinations)}"
-                    progress.update(task_id, description=description)
-
-        else:
-            # Sequential Execution
-            for i, params in enumerate(combinations):
-                progress.update(
-                    task_id,
-                    description=f"Testing {params.label} ({i+1}/{len(combinations)})",
-                )
-
-                result = run_single_backtest(
-                    params=params,
-                    pair_paths=pair_paths,
-                    direction_mode=direction_mode,
-                    dataset=dataset,
-                )
-
-                results.append(result)
-                if result.error:
-                    failed += 1
-                else:
-                    successful += 1
-
-                progress.advance(task_id)
+        results = evaluator.evaluate(combinations, on_result=advance)
 
     execution_time = time.time() - start_time
+    failed = sum(1 for r in results if r.error)
 
     # Rank results
     ranked = rank_results(results)
@@ -620,8 +1131,9 @@ def run_sweep(
         best_params=best,
         execution_time_seconds=execution_time,
         total_combinations=len(combinations),
-        successful_count=successful,
+        successful_count=len(results) - failed,
         failed_count=failed,
+        evaluation_cost=float(len(combinations)),
     )
 
 
@@ -652,6 +1164,7 @@ def export_results_to_csv(result: SweepResult, output_path: Path) -> None:
         "win_rate",
         "trade_count",
         "max_drawdown",
+        "data_fraction",
         "error",
     ] + param_keys
 
@@ -660,12 +1173,9 @@ def export_results_to_csv(result: SweepResult, output_path: Path) -> None:
             writer = csv.DictWriter(f, fieldnames=headers)
             writer.writeheader()
 
-            # Sort by Sharpe Descending
-            sorted_results = sorted(
-                result.results,
-                key=lambda x: (x.sharpe_ratio if x.sharpe_ratio is not None else -999),
-                reverse=True,
-            )
+            # Full-data results first, then by the ranking metric; failures last
+            sorted_results = rank_results(result.results, result.ranking_metric)
+            sorted_results += [r for r in result.results if r.error is not None]
 
             for i, r in enumerate(sorted_results):
                 row = {
@@ -677,6 +1187,7 @@ def export_results_to_csv(result: SweepResult, output_path: Path) -> None:
                     "win_rate": f"{r.win_rate:.4f}",
                     "trade_count": r.trade_count,
                     "max_drawdown": f"{r.max_drawdown:.4f}",
+                    "data_fraction": f"{r.fraction:.4f}",
                     "error": r.error or "",
                 }
 
@@ -0,0 +1,180 @@
+"""Sorted timestamp index for resolving timestamps to row positions.
+
+TimestampIndex stores a dataset's timestamp column as int64 epoch
+nanoseconds and resolves whole batches of timestamps to row indices with one
+np.searchsorted pass, replacing per-row ``{timestamp: index}`` dicts built
+from pandas Timestamps. Misses (timestamps that are not bars of the
+dataset) are reported exactly rather than silently dropped. Lookups keep
+the semantics of the dict they replace: unsorted columns are supported and
+a duplicated timestamp resolves to its last row.
+
+Indexes over Polars frames are cached per frame (weakly), so the simulator,
+mark-to-market and walk-forward code share one index per symbol dataset.
+Polars frames are treated as immutable; pandas frames can be modified in
+place and are never cached:
+
+    >>> index = TimestampIndex.for_frame(df)
+    >>> lookup = index.resolve([signal.timestamp_utc for signal in signals])
+    >>> lookup.indices[lookup.found]
+"""
+
+import weakref
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import polars as pl
+
+from src.risk.blackout.windows import timestamps_to_epoch_ns
+
+# id(pl.DataFrame) -> {timestamp column: TimestampIndex}; DataFrames are not
+# hashable, so entries are keyed by id and dropped when the frame is collected
+_FRAME_INDEXES: dict[int, dict[str, "TimestampIndex"]] = {}
+
+
+@dataclass(frozen=True)
+class TimestampLookup:
+    """Result of resolving a batch of timestamps.
+
+    Attributes:
+        indices: Row index per query timestamp (-1 where missing).
+        found: Boolean mask of query timestamps present in the index.
+    """
+
+    indices: np.ndarray
+    found: np.ndarray
+
+    @property
+    def missing(self) -> np.ndarray:
+        """Positions (in the query batch) of timestamps not in the index."""
+        return np.flatnonzero(~self.found)
+
+    @property
+    def miss_count(self) -> int:
+        """Number of query timestamps not in the index."""
+        return int(self.found.size - np.count_nonzero(self.found))
+
+
+class TimestampIndex:
+    """Int64 epoch-nanosecond index over a timestamp column.
+
+    Attributes:
+        epoch_ns: The column's timestamps as int64 nanoseconds, in row order
+            (epoch_ns[row] is the timestamp of that row).
+    """
+
+    __slots__ = ("epoch_ns", "_sorted_ns", "_order")
+
+    def __init__(self, timestamps: Any):
+        """Build an index from a timestamp column.
+
+        Args:
+            timestamps: Polars/pandas datetime column, datetime64 or int64
+                epoch-ns array, or sequence of datetimes (naive = UTC). An
+                unsorted column is searched through a sort permutation.
+        """
+        epoch_ns = timestamps_to_epoch_ns(timestamps)
+        self.epoch_ns = epoch_ns
+        self._sorted_ns = epoch_ns
+        self._order = None
+        if epoch_ns.size > 1 and np.any(epoch_ns[1:] < epoch_ns[:-1]):
+            self._order = np.argsort(epoch_ns, kind="stable")
+            self._sorted_ns = epoch_ns[self._order]
+
+    @classmethod
+    def for_frame(
+        cls, df: Any, timestamp_col: str = "timestamp_utc"
+    ) -> "TimestampIndex":
+        """Return the index for a DataFrame's timestamp column.
+
+        For a Polars frame the index is built once per frame object and
+        reused until the frame is garbage collected. A pandas frame gets a
+        fresh index on every call, since it may have been modified in place.
+
+        Args:
+            df: Polars or pandas DataFrame.
+            timestamp_col: Name of the timestamp column.
+
+        Returns:
+            TimestampIndex over df[timestamp_col].
+        """
+        if not isinstance(df, pl.DataFrame):
+            return cls(df[timestamp_col])
+        key = id(df)
+        per_frame = _FRAME_INDEXES.get(key)
+        if per_frame is None:
+            per_frame = {}
+            _FRAME_INDEXES[key] = per_frame
+            weakref.finalize(df, _FRAME_INDEXES.pop, key, None)
+        index = per_frame.get(timestamp_col)
+        if index is None:
+            index = cls(df[timestamp_col])
+            per_frame[timestamp_col] = index
+        return index
+
+    def __len__(self) -> int:
+        return int(self.epoch_ns.size)
+
+    @property
+    def is_sorted(self) -> bool:
+        """True if the indexed column was sorted ascending."""
+        return self._order is None
+
+    def resolve(self, timestamps: Any) -> TimestampLookup:
+        """Resolve a batch of timestamps to row indices (exact matches only).
+
+        A timestamp that occurs on several rows resolves to the last of
+        them, as with a ``{timestamp: row}`` dict built over the column.
+
+        Args:
+            timestamps: Query timestamps (any form accepted by __init__;
+                need not be sorted).
+
+        Returns:
+            TimestampLookup with per-query indices and a found mask.
+        """
+        query = timestamps_to_epoch_ns(timestamps)
+        positions = np.searchsorted(self._sorted_ns, query, side="right") - 1
+        positions = np.maximum(positions, 0)
+        found = np.zeros(query.shape, dtype=bool)
+        if self._sorted_ns.size:
+            found = self._sorted_ns[positions] == query
+        rows = positions if self._order is None else self._order[positions]
+        indices = np.where(found, rows, -1).astype(np.int64, copy=False)
+        return TimestampLookup(indices=indices, found=found)
+
+    def get(self, timestamp: Any) -> int | None:
+        """Row index of a single timestamp, or None if absent."""
+        lookup = self.resolve([timestamp])
+        return int(lookup.indices[0]) if lookup.found[0] else None
+
+    def within(self, timestamps: Any) -> np.ndarray:
+        """Mask of timestamps inside [first, last] of the index (inclusive)."""
+        query = timestamps_to_epoch_ns(timestamps)
+        if self._sorted_ns.size == 0:
+            return np.zeros(query.shape, dtype=bool)
+        return (query >= self._sorted_ns[0]) & (query <= self._sorted_ns[-1])
+
+    def rows_between(self, start: Any, end: Any) -> tuple[int, int]:
+        """Row range [lo, hi) of the timestamps in [start, end).
+
+        Args:
+            start: Inclusive lower bound (any single timestamp form).
+            end: Exclusive upper bound.
+
+        Returns:
+            Tuple (lo, hi) suitable for ``df.slice(lo, hi - lo)``.
+
+        Raises:
+            ValueError: If the indexed column is not sorted (its rows in a
+                time range are not contiguous).
+        """
+        if self._order is not None:
+            raise ValueError("rows_between requires timestamps sorted ascending")
+        bounds = timestamps_to_epoch_ns([start, end])
+        lo, hi = np.searchsorted(self.epoch_ns, bounds, side="left")
+        return int(lo), int(max(lo, hi))
+
+    def to_series(self, name: str = "timestamp_utc") -> pl.Series:
+        """Timestamps as a Polars Datetime(ns) series (UTC)."""
+        return pl.Series(name, self.epoch_ns).cast(pl.Datetime("ns", "UTC"))
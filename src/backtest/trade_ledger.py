@@ -0,0 +1,397 @@
+"""Columnar trade ledger.
+
+Simulators used to return one ``ClosedTrade`` object per trade, and every
+consumer rebuilt NumPy arrays from them with list comprehensions. A
+TradeLedger stores the trades as a struct of NumPy arrays instead (one array
+per field, timestamps as int64 epoch nanoseconds), so:
+
+- Simulators write whole columns at once.
+- Metrics, drawdown and prop-firm evaluation read columns directly.
+- ``ClosedTrade`` objects are only built when a caller iterates or indexes
+  the ledger (reports, JSON output). They are snapshots: changing one does
+  not change the ledger.
+
+A TradeLedger is a ``Sequence[ClosedTrade]``, so code written against
+``list[ClosedTrade]`` keeps working. ``TradeLedger.from_trades`` accepts
+``ClosedTrade``/``TradeExecution`` objects (or a ledger, returned as is),
+which lets column consumers accept either form.
+
+EquityCurve does the same for the closed-balance curve: epoch-ns and equity
+arrays that iterate as ``(timestamp, equity)`` tuples.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from src.risk.blackout.windows import timestamps_to_epoch_ns
+
+
+@dataclass
+class ClosedTrade:
+    """Record of a closed trade.
+
+    Attributes:
+        symbol: Currency pair
+        signal_id: Original signal ID
+        direction: 'LONG' or 'SHORT'
+        entry_timestamp: Entry time
+        exit_timestamp: Exit time
+        entry_price: Entry fill price
+        exit_price: Exit fill price
+        exit_reason: 'stop_loss', 'take_profit', or 'end_of_data'
+        pnl_dollars: Profit/loss in dollars
+        pnl_r: Profit/loss as R-multiple
+        risk_amount: Original risk amount
+        portfolio_balance_at_exit: Portfolio balance after this trade closed
+        risk_percent: Risk percentage used for this trade (e.g., 0.0025 = 0.25%)
+        entry_index: Entry bar in the symbol's price frame (-1 if unknown)
+        exit_index: Exit bar in the symbol's price frame (-1 if unknown)
+        stop_distance: Price distance from entry to the initial stop
+    """
+
+    symbol: str
+    signal_id: str
+    direction: str
+    open_timestamp: datetime
+    close_timestamp: datetime
+    entry_price: float
+    exit_price: float
+    exit_reason: str
+    pnl_dollars: float
+    pnl_r: float
+    risk_amount: float
+    portfolio_balance_at_exit: float = 0.0
+    risk_percent: float = 0.0025  # Default 0.25%
+    entry_index: int = -1
+    exit_index: int = -1
+    stop_distance: float = 0.0
+
+
+# Column -> dtype. Strings are object arrays sharing the str objects;
+# direction is +1 (LONG), -1 (SHORT) or 0 (unknown).
+LEDGER_COLUMNS: dict[str, Any] = {
+    "symbol": object,
+    "signal_id": object,
+    "direction": np.int8,
+    "open_ns": np.int64,
+    "close_ns": np.int64,
+    "entry_price": np.float64,
+    "exit_price": np.float64,
+    "exit_reason": object,
+    "pnl_dollars": np.float64,
+    "pnl_r": np.float64,
+    "risk_amount": np.float64,
+    "portfolio_balance_at_exit": np.float64,
+    "risk_percent": np.float64,
+    "entry_index": np.int64,
+    "exit_index": np.int64,
+    "stop_distance": np.float64,
+}
+
+# Column defaults for missing values (match ClosedTrade's defaults)
+_DEFAULTS: dict[str, Any] = {
+    "symbol": "",
+    "signal_id": "",
+    "exit_reason": "",
+    "risk_percent": 0.0025,
+    "entry_index": -1,
+    "exit_index": -1,
+}
+
+_DIRECTION_NAMES = {1: "LONG", -1: "SHORT", 0: ""}
+
+# Columns computed from trade object fields of another name/type
+_DERIVED_COLUMNS = ("direction", "open_ns", "close_ns")
+
+
+def direction_codes(directions: Any) -> np.ndarray:
+    """Map 'LONG'/'SHORT' labels to +1/-1 (0 for anything else)."""
+    labels = np.asarray(directions, dtype=object)
+    return ((labels == "LONG").astype(np.int8) - (labels == "SHORT")).astype(np.int8)
+
+
+class TradeLedger(Sequence):
+    """Trades as a struct of NumPy arrays.
+
+    Column arrays are available as attributes (``ledger.pnl_r``,
+    ``ledger.close_ns``, ...; see LEDGER_COLUMNS). Indexing with an int
+    returns a ClosedTrade view; a slice, index array or boolean mask
+    returns a new ledger.
+
+    Attributes:
+        columns: Column name -> array, all of equal length.
+        tz: Time zone of materialized timestamps (None = naive UTC, as the
+            portfolio simulator reports them).
+    """
+
+    __slots__ = ("columns", "tz")
+
+    def __init__(self, columns: dict[str, np.ndarray], tz: str | None = None):
+        """Build a ledger from column arrays.
+
+        Args:
+            columns: Arrays for (a subset of) LEDGER_COLUMNS; ``pnl_r`` is
+                required, missing columns are filled with defaults.
+            tz: Time zone for materialized timestamps.
+
+        Raises:
+            ValueError: For unknown columns or columns of unequal length.
+        """
+        unknown = set(columns) - set(LEDGER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown ledger columns: {sorted(unknown)}")
+        n_trades = len(columns["pnl_r"])
+        full = {}
+        for name, dtype in LEDGER_COLUMNS.items():
+            if name in columns:
+                array = np.asarray(columns[name], dtype=dtype)
+                if len(array) != n_trades:
+                    raise ValueError(
+                        f"Column {name!r} has {len(array)} values, expected {n_trades}"
+                    )
+            else:
+                array = np.full(n_trades, _DEFAULTS.get(name, 0), dtype=dtype)
+            full[name] = array
+        self.columns = full
+        self.tz = tz
+
+    @classmethod
+    def empty(cls) -> TradeLedger:
+        """Ledger without trades."""
+        return cls({"pnl_r": np.empty(0)})
+
+    @classmethod
+    def concat(cls, ledgers: Iterable[TradeLedger]) -> TradeLedger:
+        """Concatenate ledgers in order."""
+        ledgers = [ledger for ledger in ledgers if len(ledger)]
+        if not ledgers:
+            return cls.empty()
+        return cls(
+            {
+                name: np.concatenate([ledger.columns[name] for ledger in ledgers])
+                for name in LEDGER_COLUMNS
+            },
+            tz=ledgers[0].tz,
+        )
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Any]) -> TradeLedger:
+        """Collect trade objects into a ledger (a ledger is returned as is).
+
+        Accepts ClosedTrade and TradeExecution-like objects; fields a type
+        does not have (symbol, indices, ...) get the column default, and
+        TradeExecution's fill prices map to entry/exit_price.
+        """
+        if isinstance(trades, TradeLedger):
+            return trades
+        trades = list(trades)
+        if not trades:
+            return cls.empty()
+
+        def values(name: str, fallback: str | None = None) -> list:
+            default = _DEFAULTS.get(name, 0)
+            if fallback is None:
+                return [getattr(t, name, default) for t in trades]
+            return [getattr(t, name, getattr(t, fallback, default)) for t in trades]
+
+        columns = {
+            name: values(name)
+            for name in LEDGER_COLUMNS
+            if name not in _DERIVED_COLUMNS
+        }
+        columns["entry_price"] = values("entry_price", "entry_fill_price")
+        columns["exit_price"] = values("exit_price", "exit_fill_price")
+        columns["direction"] = direction_codes(values("direction"))
+        opens = [t.open_timestamp for t in trades]
+        columns["open_ns"] = timestamps_to_epoch_ns(opens)
+        columns["close_ns"] = timestamps_to_epoch_ns(
+            [t.close_timestamp for t in trades]
+        )
+        if not hasattr(trades[0], "pnl_dollars"):
+            columns["pnl_dollars"] = np.multiply(
+                columns["pnl_r"], columns["risk_amount"], dtype=np.float64
+            )
+        tzinfo = getattr(opens[0], "tzinfo", None)
+        return cls(columns, tz="UTC" if tzinfo is not None else None)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        # Only reached for names that are not slots/methods: column access
+        if name.startswith("_") or name == "columns":
+            raise AttributeError(name)
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} has no column {name!r}"
+            ) from None
+
+    def __getstate__(self) -> tuple:
+        return self.columns, self.tz
+
+    def __setstate__(self, state: tuple) -> None:
+        self.columns, self.tz = state
+
+    def __len__(self) -> int:
+        return int(self.columns["pnl_r"].size)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, (int, np.integer)):
+            return self.trade(int(key))
+        return self.take(key)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.trade(i)
+
+    def __repr__(self) -> str:
+        return f"TradeLedger({len(self)} trades)"
+
+    def _timestamp(self, ns: int) -> pd.Timestamp:
+        return pd.Timestamp(ns, tz=self.tz) if self.tz else pd.Timestamp(ns)
+
+    def trade(self, i: int) -> ClosedTrade:
+        """Materialize trade ``i`` as a ClosedTrade snapshot."""
+        n_trades = len(self)
+        if not -n_trades <= i < n_trades:
+            raise IndexError(f"trade index {i} out of range for {n_trades} trades")
+        c = self.columns
+        return ClosedTrade(
+            symbol=c["symbol"][i],
+            signal_id=c["signal_id"][i],
+            direction=_DIRECTION_NAMES[int(c["direction"][i])],
+            open_timestamp=self._timestamp(int(c["open_ns"][i])),
+            close_timestamp=self._timestamp(int(c["close_ns"][i])),
+            entry_price=float(c["entry_price"][i]),
+            exit_price=float(c["exit_price"][i]),
+            exit_reason=c["exit_reason"][i],
+            pnl_dollars=float(c["pnl_dollars"][i]),
+            pnl_r=float(c["pnl_r"][i]),
+            risk_amount=float(c["risk_amount"][i]),
+            portfolio_balance_at_exit=float(c["portfolio_balance_at_exit"][i]),
+            risk_percent=float(c["risk_percent"][i]),
+            entry_index=int(c["entry_index"][i]),
+            exit_index=int(c["exit_index"][i]),
+            stop_distance=float(c["stop_distance"][i]),
+        )
+
+    def take(self, indices: Any) -> TradeLedger:
+        """Rows selected by a slice, index array or boolean mask."""
+        return TradeLedger(
+            {name: array[indices] for name, array in self.columns.items()},
+            tz=self.tz,
+        )
+
+    def with_columns(self, **arrays: np.ndarray) -> TradeLedger:
+        """Copy of the ledger with some columns replaced."""
+        return TradeLedger({**self.columns, **arrays}, tz=self.tz)
+
+    def sort_by_close(self) -> TradeLedger:
+        """Trades in close-time order (stable for equal close times)."""
+        order = np.argsort(self.columns["close_ns"], kind="stable")
+        return self.take(order)
+
+    def to_polars(self) -> pl.DataFrame:
+        """Ledger as a Polars frame (timestamps as Datetime columns)."""
+        columns = dict(self.columns)
+        frame = pl.DataFrame(
+            {
+                name: (
+                    pl.Series(name, array, dtype=pl.String)
+                    if array.dtype == object
+                    else array
+                )
+                for name, array in columns.items()
+            }
+        )
+        dtype = pl.Datetime("ns", self.tz)
+        return frame.with_columns(
+            pl.col("open_ns").cast(dtype).alias("open_timestamp"),
+            pl.col("close_ns").cast(dtype).alias("close_timestamp"),
+        ).drop("open_ns", "close_ns")
+
+
+class EquityCurve(Sequence):
+    """Closed-balance equity curve as arrays, iterable as (timestamp, equity).
+
+    Attributes:
+        epoch_ns: Point timestamps as int64 epoch nanoseconds.
+        equity: Equity at each point.
+    """
+
+    __slots__ = ("epoch_ns", "equity")
+
+    def __init__(self, epoch_ns: Any, equity: Any):
+        self.epoch_ns = np.asarray(epoch_ns, dtype=np.int64)
+        self.equity = np.asarray(equity, dtype=np.float64)
+
+    @classmethod
+    def empty(cls) -> EquityCurve:
+        """Curve without points."""
+        return cls(np.empty(0, np.int64), np.empty(0, np.float64))
+
+    def __len__(self) -> int:
+        return int(self.equity.size)
+
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, (int, np.integer)):
+            return pd.Timestamp(int(self.epoch_ns[key])), float(self.equity[key])
+        return EquityCurve(self.epoch_ns[key], self.equity[key])
+
+    def __iter__(self):
+        for ns, equity in zip(self.epoch_ns.tolist(), self.equity.tolist()):
+            yield pd.Timestamp(ns), equity
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EquityCurve):
+            return np.array_equal(self.epoch_ns, other.epoch_ns) and np.array_equal(
+                self.equity, other.equity
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"EquityCurve({len(self)} points)"
+
+
+def trade_column(trades: Any, name: str) -> np.ndarray:
+    """One column of a ledger or of a sequence of trade objects.
+
+    Plain numeric/string fields of trade objects are gathered directly;
+    derived columns (direction codes, epoch-ns timestamps) go through
+    TradeLedger.from_trades.
+    """
+    if isinstance(trades, TradeLedger):
+        return getattr(trades, name)
+    if name in _DERIVED_COLUMNS or name in ("entry_price", "exit_price"):
+        return getattr(TradeLedger.from_trades(trades), name)
+    return np.array(
+        [getattr(t, name) for t in trades], dtype=LEDGER_COLUMNS.get(name, object)
+    )
+
+
+def equity_arrays(curve: Any) -> tuple[np.ndarray, np.ndarray]:
+    """(epoch_ns, equity) arrays of an equity series.
+
+    Accepts an EquityCurve, any object with epoch_ns/equity arrays (such as
+    MarkToMarketEquity, whose float32 equity is returned as is) or a list
+    of (timestamp, equity) tuples.
+    """
+    if isinstance(curve, EquityCurve) or (
+        hasattr(curve, "epoch_ns") and hasattr(curve, "equity")
+    ):
+        return curve.epoch_ns, curve.equity
+    if not curve:
+        return np.empty(0, np.int64), np.empty(0, np.float64)
+    return (
+        timestamps_to_epoch_ns([ts for ts, _ in curve]),
+        np.array([equity for _, equity in curve], dtype=np.float64),
+    )
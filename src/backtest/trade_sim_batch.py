@@ -3,6 +3,10 @@
 This module provides batched trade simulation avoiding per-trade full-dataset
 iteration. Implements vectorized baseline with optional numba JIT paths.
 
+simulate_trades_sequential adds concurrency-aware acceptance: signals that
+overlap the open positions are skipped during the search instead of being
+simulated and filtered afterwards.
+
 Performance target: ≥10× speedup vs baseline O(trades × bars) approach.
 Scaling target: optimized_sim_time ≤ 0.30 × baseline_sim_time.
 
@@ -24,6 +28,51 @@ from typing import Any, Optional
 import numpy as np
 import pandas as pd
 
+# Optional numba JIT for the exit-search kernel
+_NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+
+# Restrict exit search to ~10 days of 1-minute data
+MAX_LOOKAHEAD_BARS = 14400
+
+# Trailing stop type codes understood by the compiled kernel
+_TRAIL_NONE = 0
+_TRAIL_ATR = 1
+_TRAIL_FIXED = 2
+_TRAIL_MA = 3
+
+# Exit reason codes returned by the compiled kernel
+_REASON_STOP_LOSS = 0
+_REASON_TAKE_PROFIT = 1
+_REASON_TIMEOUT = 2
+_REASON_END_OF_DATA = 3
+_REASON_INVALID = 4
+
+EXIT_REASON_NAMES = (
+    "STOP_LOSS",
+    "TAKE_PROFIT",
+    "TIMEOUT",
+    "END_OF_DATA",
+    "INVALID_ENTRY",
+)
+
+# Structured result layout returned by simulate_trades_batch_jit
+SIM_RESULT_DTYPE = np.dtype(
+    [
+        ("entry_index", np.int64),
+        ("exit_index", np.int64),
+        ("exit_price", np.float64),
+        ("exit_reason", np.int8),
+        ("holding_duration", np.int64),
+        ("pnl", np.float64),
+    ]
+)
+
 
 def simulate_trades_batch(
     entries: list[dict[str, Any]],
@@ -32,22 +81,260 @@ def simulate_trades_batch(
     take_profit_pct: Optional[float] = None,  # Deprecated: use per-trade values
     trailing_config: Optional[dict[str, Any]] = None,
     indicators: Optional[dict[str, np.ndarray]] = None,
+    use_jit: Optional[bool] = None,
 ) -> list[dict[str, Any]]:
     """Simulate trade exits in batched/vectorized mode.
 
     Avoids per-trade iteration over full dataset by processing trades
-    in batch with vectorized exit condition checks.
+    in batch with vectorized exit condition checks. When numba is installed
+    the exit search runs in a compiled bar-walking kernel that stops at the
+    first SL/TP hit; otherwise the per-trade vectorized path is used. Both
+    paths produce identical results.
 
     Args:
         entries: List of trade entry records with entry_index, side, entry_price.
         price_data: DataFrame with OHLC columns and chronological index.
         stop_loss_pct: Stop loss threshold as decimal (e.g., 0.02 = 2%).
         take_profit_pct: Take profit threshold as decimal (e.g., 0.04 = 4%).
+        trailing_config: Optional trailing stop settings (type, multiplier,
+            pips, pip_size, ma_col, trigger_r).
+        indicators: Indicator arrays aligned with price_data (ATR/MA series).
+        use_jit: Force (True) or disable (False) the numba kernel. None
+            selects it automatically when numba is available.
 
     Returns:
         List of simulation results with exit_index, exit_price, exit_reason,
         holding_duration, pnl, flags.
     """
+    if use_jit is None:
+        use_jit = _NUMBA_AVAILABLE
+    elif use_jit and not _NUMBA_AVAILABLE:
+        raise RuntimeError("use_jit=True requested but numba is not installed")
+
+    if use_jit:
+        return _simulate_trades_jit(
+            entries,
+            price_data,
+            stop_loss_pct,
+            take_profit_pct,
+            trailing_config,
+            indicators,
+        )
+    return _simulate_trades_vectorized(
+        entries,
+        price_data,
+        stop_loss_pct,
+        take_profit_pct,
+        trailing_config,
+        indicators,
+    )
+
+
+def simulate_trades_sequential(
+    entries: list[dict[str, Any]],
+    price_data: pd.DataFrame,
+    max_open_positions: int = 1,
+    trailing_config: Optional[dict[str, Any]] = None,
+    indicators: Optional[dict[str, np.ndarray]] = None,
+    use_jit: Optional[bool] = None,
+) -> list[Optional[dict[str, Any]]]:
+    """Simulate trade exits with sequential (concurrency-aware) acceptance.
+
+    Entries are taken in order while fewer than max_open_positions accepted
+    trades are still open on the entry bar; a trade exiting on a bar frees
+    its slot for entries on that bar. Once every slot is taken the search
+    jumps straight to the first entry at or after the earliest open exit,
+    so overlapping entries are never simulated and work scales with the
+    number of accepted trades. Accepted trades get exactly the results
+    simulate_trades_batch would give them.
+
+    Args:
+        entries: Trade entry records (as for simulate_trades_batch) sorted
+            by entry_index, each with per-trade stop_loss_pct and
+            take_profit_pct.
+        price_data: DataFrame with OHLC columns and chronological index.
+        max_open_positions: Maximum concurrently open accepted trades.
+        trailing_config: Optional trailing stop settings (see
+            simulate_trades_batch).
+        indicators: Indicator arrays aligned with price_data (ATR/MA series).
+        use_jit: Force (True) or disable (False) the numba kernel. None
+            selects it automatically when numba is available.
+
+    Returns:
+        List aligned with entries: a result dict (as from
+        simulate_trades_batch) for accepted and invalid entries, None for
+        entries skipped because max_open_positions trades were open.
+
+    Raises:
+        ValueError: If max_open_positions < 1, an entry lacks SL/TP, or
+            entries are not sorted by entry_index.
+    """
+    if max_open_positions < 1:
+        raise ValueError(f"max_open_positions must be >= 1, got {max_open_positions}")
+    if use_jit is None:
+        use_jit = _NUMBA_AVAILABLE
+    elif use_jit and not _NUMBA_AVAILABLE:
+        raise RuntimeError("use_jit=True requested but numba is not installed")
+
+    results: list[Optional[dict[str, Any]]] = [None] * len(entries)
+    positions = []
+    kernel_idx = []
+    kernel_price = []
+    kernel_long = []
+    kernel_sl = []
+    kernel_tp = []
+
+    for pos, entry in enumerate(entries):
+        entry_idx = entry.get("entry_index")
+        entry_price = entry.get("entry_price")
+        if entry_idx is None or entry_price is None:
+            results[pos] = _invalid_result(entry_idx)
+            continue
+
+        sl_pct = entry.get("stop_loss_pct")
+        tp_pct = entry.get("take_profit_pct")
+        if sl_pct is None or tp_pct is None:
+            raise ValueError(
+                f"Missing SL/TP for entry at index {entry_idx}: "
+                f"stop_loss_pct={sl_pct}, take_profit_pct={tp_pct}. "
+                "Per-trade SL/TP values are required."
+            )
+
+        positions.append(pos)
+        kernel_idx.append(entry_idx)
+        kernel_price.append(entry_price)
+        kernel_long.append(entry.get("side", "LONG") == "LONG")
+        kernel_sl.append(sl_pct)
+        kernel_tp.append(tp_pct)
+
+    if not positions:
+        return results
+
+    entry_indices = np.asarray(kernel_idx, dtype=np.int64)
+    if np.any(entry_indices[1:] < entry_indices[:-1]):
+        raise ValueError("entries must be sorted by entry_index")
+
+    if not use_jit:
+        # Reference path: vectorized search for each accepted entry only
+        open_exits: list[int] = []
+        k = 0
+        while k < len(positions):
+            open_exits = [x for x in open_exits if x > kernel_idx[k]]
+            if len(open_exits) >= max_open_positions:
+                first_free = int(
+                    np.searchsorted(entry_indices, min(open_exits), side="left")
+                )
+                k = max(k + 1, first_free)
+                continue
+            result = _simulate_trades_vectorized(
+                [entries[positions[k]]],
+                price_data,
+                trailing_config=trailing_config,
+                indicators=indicators,
+            )[0]
+            results[positions[k]] = result
+            open_exits.append(result["exit_index"])
+            k += 1
+        return results
+
+    trail_type, trail_series, trail_dist, trigger_r = _resolve_trailing(
+        trailing_config, indicators
+    )
+    accepted, exit_idx, exit_price, reasons = _sequential_exit_kernel_jit(
+        entry_indices,
+        np.asarray(kernel_price, dtype=np.float64),
+        np.asarray(kernel_long, dtype=np.bool_),
+        np.asarray(kernel_sl, dtype=np.float64),
+        np.asarray(kernel_tp, dtype=np.float64),
+        np.ascontiguousarray(price_data["high"].values, dtype=np.float64),
+        np.ascontiguousarray(price_data["low"].values, dtype=np.float64),
+        np.ascontiguousarray(price_data["close"].values, dtype=np.float64),
+        trail_type,
+        trail_series,
+        trail_dist,
+        trigger_r,
+        MAX_LOOKAHEAD_BARS,
+        int(max_open_positions),
+    )
+
+    for k in np.flatnonzero(accepted).tolist():
+        results[positions[k]] = _kernel_result(
+            kernel_idx[k],
+            kernel_price[k],
+            kernel_long[k],
+            int(exit_idx[k]),
+            float(exit_price[k]),
+            int(reasons[k]),
+        )
+
+    return results
+
+
+def _invalid_result(entry_idx: Optional[int]) -> dict[str, Any]:
+    """Result record for an entry without index or price."""
+    return {
+        "entry_index": entry_idx,
+        "exit_index": None,
+        "exit_price": None,
+        "exit_reason": "INVALID_ENTRY",
+        "holding_duration": 0,
+        "pnl": 0.0,
+        "flags": ["INVALID"],
+    }
+
+
+def _kernel_result(
+    entry_idx: int,
+    entry_price: float,
+    is_long: bool,
+    x_idx: int,
+    x_price: float,
+    reason: int,
+) -> dict[str, Any]:
+    """Shape one compiled-kernel exit like the vectorized path's records."""
+    if x_idx == entry_idx and reason == _REASON_END_OF_DATA:
+        # Entered on the final bar: no room to exit
+        return {
+            "entry_index": entry_idx,
+            "exit_index": entry_idx,
+            "exit_price": entry_price,
+            "exit_reason": "END_OF_DATA",
+            "holding_duration": 0,
+            "pnl": 0.0,
+            "flags": ["NO_EXIT"],
+        }
+
+    if is_long:
+        pnl_pct = (x_price - entry_price) / entry_price
+    else:
+        pnl_pct = (entry_price - x_price) / entry_price
+
+    return {
+        "entry_index": entry_idx,
+        "exit_index": x_idx,
+        "exit_price": x_price,
+        "exit_reason": EXIT_REASON_NAMES[reason],
+        "holding_duration": int(x_idx - entry_idx),
+        "pnl": float(pnl_pct),
+        "flags": [],
+    }
+
+
+def _simulate_trades_vectorized(
+    entries: list[dict[str, Any]],
+    price_data: pd.DataFrame,
+    stop_loss_pct: Optional[float] = None,
+    take_profit_pct: Optional[float] = None,
+    trailing_config: Optional[dict[str, Any]] = None,
+    indicators: Optional[dict[str, np.ndarray]] = None,
+    max_lookahead: int = MAX_LOOKAHEAD_BARS,
+) -> list[dict[str, Any]]:
+    """Per-trade vectorized exit search (reference path without numba).
+
+    Slices a lookahead window for every entry and locates the first SL/TP
+    hit with boolean masks. Kept as the fallback and as the reference the
+    compiled kernel is tested against.
+    """
     if not entries:
         return []
 
@@ -58,9 +345,6 @@ def simulate_trades_batch(
 
     results = []
 
-    # Optimize: Restrict search window to max_lookahead candles
-    max_lookahead = 14400  # ~10 days of 1-minute data
-
     for entry in entries:
         entry_idx = entry.get("entry_index")
         entry_price = entry.get("entry_price")
@@ -332,29 +616,532 @@ def simulate_trades_batch(
     return results
 
 
+def _walk_trade(
+    entry_idx: int,
+    entry_price: float,
+    is_long: bool,
+    sl_pct: float,
+    tp_pct: float,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    trail_type: int,
+    trail_series: np.ndarray,
+    trail_dist: float,
+    trigger_r: float,
+    max_lookahead: int,
+) -> tuple[int, float, int]:
+    """Walk bars forward from one entry and stop at its first exit.
+
+    Mirrors the ratchet semantics of the vectorized path bar by bar (including
+    NaN propagation of np.maximum/np.minimum accumulate) so results are
+    bit-identical, but without allocating per-trade window arrays. Compiled
+    with numba when available.
+
+    For ATR trailing, trail_series holds the pre-scaled ATR distance
+    (atr * multiplier); for MA trailing it holds the MA values.
+
+    Returns:
+        Tuple of (exit index, exit price, exit reason code).
+    """
+    n_bars = highs.shape[0]
+    start = entry_idx + 1
+
+    if start >= n_bars:
+        return entry_idx, entry_price, _REASON_END_OF_DATA
+
+    end = min(start + max_lookahead, n_bars)
+    risk_dist = entry_price * sl_pct
+
+    if is_long:
+        sl_initial = entry_price * (1 - sl_pct)
+        tp_price = entry_price * (1 + tp_pct)
+        trigger_price = entry_price + (risk_dist * trigger_r)
+        dynamic_sl = -np.inf
+        extreme = -np.inf
+
+        for i in range(start, end):
+            high = highs[i]
+            low = lows[i]
+            if trail_type == _TRAIL_NONE:
+                dynamic_sl = sl_initial
+            else:
+                if np.isnan(high) or np.isnan(extreme):
+                    extreme = np.nan
+                elif high > extreme:
+                    extreme = high
+
+                potential = -np.inf
+                if extreme >= trigger_price:
+                    if trail_type == _TRAIL_ATR:
+                        potential = high - trail_series[i]
+                    elif trail_type == _TRAIL_FIXED:
+                        potential = high - trail_dist
+                    else:
+                        potential = trail_series[i]
+
+                if np.isnan(potential) or np.isnan(dynamic_sl):
+                    dynamic_sl = np.nan
+                else:
+                    if potential < sl_initial:
+                        potential = sl_initial
+                    if potential > dynamic_sl:
+                        dynamic_sl = potential
+
+            if low <= dynamic_sl:
+                return i, dynamic_sl, _REASON_STOP_LOSS
+            if high >= tp_price:
+                return i, tp_price, _REASON_TAKE_PROFIT
+    else:
+        sl_initial = entry_price * (1 + sl_pct)
+        tp_price = entry_price * (1 - tp_pct)
+        trigger_price = entry_price - (risk_dist * trigger_r)
+        dynamic_sl = np.inf
+        extreme = np.inf
+
+        for i in range(start, end):
+            high = highs[i]
+            low = lows[i]
+            if trail_type == _TRAIL_NONE:
+                dynamic_sl = sl_initial
+            else:
+                if np.isnan(low) or np.isnan(extreme):
+                    extreme = np.nan
+                elif low < extreme:
+                    extreme = low
+
+                potential = np.inf
+                if extreme <= trigger_price:
+                    if trail_type == _TRAIL_ATR:
+                        potential = low + trail_series[i]
+                    elif trail_type == _TRAIL_FIXED:
+                        potential = low + trail_dist
+                    else:
+                        potential = trail_series[i]
+
+                if np.isnan(potential) or np.isnan(dynamic_sl):
+                    dynamic_sl = np.nan
+                else:
+                    if potential > sl_initial:
+                        potential = sl_initial
+                    if potential < dynamic_sl:
+                        dynamic_sl = potential
+
+            if high >= dynamic_sl:
+                return i, dynamic_sl, _REASON_STOP_LOSS
+            if low <= tp_price:
+                return i, tp_price, _REASON_TAKE_PROFIT
+
+    return end - 1, closes[end - 1], _REASON_TIMEOUT
+
+
+if _NUMBA_AVAILABLE:
+    # Rebound so the compiled kernels below call the compiled walker
+    _walk_trade = njit(cache=True, nogil=True)(_walk_trade)
+
+
+def _exit_search_kernel(
+    entry_idx: np.ndarray,
+    entry_price: np.ndarray,
+    is_long: np.ndarray,
+    sl_pct: np.ndarray,
+    tp_pct: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    trail_type: int,
+    trail_series: np.ndarray,
+    trail_dist: float,
+    trigger_r: float,
+    max_lookahead: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find the first exit of every trade (see _walk_trade)."""
+    n_trades = entry_idx.shape[0]
+    exit_idx = np.empty(n_trades, dtype=np.int64)
+    exit_price = np.empty(n_trades, dtype=np.float64)
+    reasons = np.empty(n_trades, dtype=np.int8)
+
+    for t in range(n_trades):
+        exit_idx[t], exit_price[t], reasons[t] = _walk_trade(
+            entry_idx[t],
+            entry_price[t],
+            is_long[t],
+            sl_pct[t],
+            tp_pct[t],
+            highs,
+            lows,
+            closes,
+            trail_type,
+            trail_series,
+            trail_dist,
+            trigger_r,
+            max_lookahead,
+        )
+
+    return exit_idx, exit_price, reasons
+
+
+def _sequential_exit_kernel(
+    entry_idx: np.ndarray,
+    entry_price: np.ndarray,
+    is_long: np.ndarray,
+    sl_pct: np.ndarray,
+    tp_pct: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    trail_type: int,
+    trail_series: np.ndarray,
+    trail_dist: float,
+    trigger_r: float,
+    max_lookahead: int,
+    max_open: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Sequential acceptance over entries sorted by entry index.
+
+    An entry is accepted while fewer than max_open accepted trades are still
+    open on its bar (a trade exiting on that bar frees its slot). When every
+    slot is taken the loop jumps straight to the first entry at or after the
+    earliest open exit, so overlapping entries are never walked.
+    """
+    n_trades = entry_idx.shape[0]
+    accepted = np.zeros(n_trades, dtype=np.bool_)
+    exit_idx = np.full(n_trades, -1, dtype=np.int64)
+    exit_price = np.full(n_trades, np.nan, dtype=np.float64)
+    reasons = np.full(n_trades, _REASON_INVALID, dtype=np.int8)
+    open_exits = np.full(max_open, -1, dtype=np.int64)
+
+    t = 0
+    while t < n_trades:
+        slot = -1
+        earliest = open_exits[0]
+        for k in range(max_open):
+            if open_exits[k] <= entry_idx[t]:
+                slot = k
+                break
+            if open_exits[k] < earliest:
+                earliest = open_exits[k]
+
+        if slot < 0:
+            t = max(t + 1, np.searchsorted(entry_idx, earliest, side="left"))
+            continue
+
+        exit_idx[t], exit_price[t], reasons[t] = _walk_trade(
+            entry_idx[t],
+            entry_price[t],
+            is_long[t],
+            sl_pct[t],
+            tp_pct[t],
+            highs,
+            lows,
+            closes,
+            trail_type,
+            trail_series,
+            trail_dist,
+            trigger_r,
+            max_lookahead,
+        )
+        accepted[t] = True
+        open_exits[slot] = exit_idx[t]
+        t += 1
+
+    return accepted, exit_idx, exit_price, reasons
+
+
+if _NUMBA_AVAILABLE:
+    _exit_search_kernel_jit = njit(cache=True, nogil=True)(_exit_search_kernel)
+    _sequential_exit_kernel_jit = njit(cache=True, nogil=True)(_sequential_exit_kernel)
+else:
+    _exit_search_kernel_jit = None
+    _sequential_exit_kernel_jit = None
+
+
+def _resolve_trailing(
+    trailing_config: Optional[dict[str, Any]],
+    indicators: Optional[dict[str, np.ndarray]],
+) -> tuple[int, np.ndarray, float, float]:
+    """Translate a trailing_config dict into kernel arguments.
+
+    Returns:
+        Tuple of (trail_type code, trail_series, trail_dist, trigger_r). A
+        trailing type whose indicator series is missing degrades to a static
+        stop, exactly as in the vectorized path.
+    """
+    empty = np.empty(0, dtype=np.float64)
+    if not trailing_config or trailing_config.get("type") not in (
+        "ATR_Trailing",
+        "FixedPips_Trailing",
+        "MA_Trailing",
+    ):
+        return _TRAIL_NONE, empty, 0.0, 1.0
+
+    indicators = indicators or {}
+    trigger_r = float(trailing_config.get("trigger_r", 1.0))
+    trail_type = trailing_config["type"]
+
+    if trail_type == "ATR_Trailing":
+        atr_key = "atr" if "atr" in indicators else "atr_14"
+        if atr_key not in indicators:
+            return _TRAIL_NONE, empty, 0.0, trigger_r
+        # Scale with NumPy (same dtype rules as the vectorized path)
+        scaled = np.asarray(indicators[atr_key]) * trailing_config["multiplier"]
+        return (
+            _TRAIL_ATR,
+            np.ascontiguousarray(scaled, dtype=np.float64),
+            0.0,
+            trigger_r,
+        )
+
+    if trail_type == "FixedPips_Trailing":
+        dist = trailing_config["pips"] * trailing_config.get("pip_size", 0.0001)
+        return _TRAIL_FIXED, empty, float(dist), trigger_r
+
+    ma_col = trailing_config.get("ma_col")
+    if not ma_col or ma_col not in indicators:
+        return _TRAIL_NONE, empty, 0.0, trigger_r
+    return (
+        _TRAIL_MA,
+        np.ascontiguousarray(indicators[ma_col], dtype=np.float64),
+        0.0,
+        trigger_r,
+    )
+
+
+def _run_exit_kernel(
+    entry_idx: np.ndarray,
+    entry_price: np.ndarray,
+    is_long: np.ndarray,
+    sl_pct: np.ndarray,
+    tp_pct: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    trailing_config: Optional[dict[str, Any]],
+    indicators: Optional[dict[str, np.ndarray]],
+    max_lookahead: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Normalize array dtypes and invoke the compiled exit kernel."""
+    trail_type, trail_series, trail_dist, trigger_r = _resolve_trailing(
+        trailing_config, indicators
+    )
+    return _exit_search_kernel_jit(
+        np.ascontiguousarray(entry_idx, dtype=np.int64),
+        np.ascontiguousarray(entry_price, dtype=np.float64),
+        np.ascontiguousarray(is_long, dtype=np.bool_),
+        np.ascontiguousarray(sl_pct, dtype=np.float64),
+        np.ascontiguousarray(tp_pct, dtype=np.float64),
+        np.ascontiguousarray(highs, dtype=np.float64),
+        np.ascontiguousarray(lows, dtype=np.float64),
+        np.ascontiguousarray(closes, dtype=np.float64),
+        trail_type,
+        trail_series,
+        trail_dist,
+        trigger_r,
+        int(max_lookahead),
+    )
+
+
+def _simulate_trades_jit(
+    entries: list[dict[str, Any]],
+    price_data: pd.DataFrame,
+    stop_loss_pct: Optional[float] = None,
+    take_profit_pct: Optional[float] = None,
+    trailing_config: Optional[dict[str, Any]] = None,
+    indicators: Optional[dict[str, np.ndarray]] = None,
+) -> list[dict[str, Any]]:
+    """Run the compiled exit kernel and shape results like the vectorized path."""
+    if not entries:
+        return []
+
+    n_bars = len(price_data)
+    results: list[Optional[dict[str, Any]]] = [None] * len(entries)
+
+    positions = []
+    kernel_idx = []
+    kernel_price = []
+    kernel_long = []
+    kernel_sl = []
+    kernel_tp = []
+
+    for pos, entry in enumerate(entries):
+        entry_idx = entry.get("entry_index")
+        entry_price = entry.get("entry_price")
+
+        if entry_idx is None or entry_price is None:
+            results[pos] = _invalid_result(entry_idx)
+            continue
+
+        if entry_idx + 1 >= n_bars:
+            results[pos] = {
+                "entry_index": entry_idx,
+                "exit_index": entry_idx,
+                "exit_price": entry_price,
+                "exit_reason": "END_OF_DATA",
+                "holding_duration": 0,
+                "pnl": 0.0,
+                "flags": ["NO_EXIT"],
+            }
+            continue
+
+        sl_pct = entry.get("stop_loss_pct")
+        tp_pct = entry.get("take_profit_pct")
+        if sl_pct is None:
+            sl_pct = stop_loss_pct
+        if tp_pct is None:
+            tp_pct = take_profit_pct
+        if sl_pct is None or tp_pct is None:
+            raise ValueError(
+                f"Missing SL/TP for entry at index {entry.get('entry_index')}: "
+                f"stop_loss_pct={sl_pct}, take_profit_pct={tp_pct}. "
+                "Per-trade SL/TP values are required."
+            )
+
+        positions.append(pos)
+        kernel_idx.append(entry_idx)
+        kernel_price.append(entry_price)
+        kernel_long.append(entry.get("side", "LONG") == "LONG")
+        kernel_sl.append(sl_pct)
+        kernel_tp.append(tp_pct)
+
+    if positions:
+        exit_idx, exit_price, reasons = _run_exit_kernel(
+            np.asarray(kernel_idx),
+            np.asarray(kernel_price),
+            np.asarray(kernel_long),
+            np.asarray(kernel_sl),
+            np.asarray(kernel_tp),
+            price_data["high"].values,
+            price_data["low"].values,
+            price_data["close"].values,
+            trailing_config,
+            indicators,
+            MAX_LOOKAHEAD_BARS,
+        )
+
+        for k, pos in enumerate(positions):
+            results[pos] = _kernel_result(
+                kernel_idx[k],
+                kernel_price[k],
+                kernel_long[k],
+                int(exit_idx[k]),
+                float(exit_price[k]),
+                int(reasons[k]),
+            )
+
+    return results
+
+
 def simulate_trades_batch_jit(
     entries: np.ndarray,
     prices_high: np.ndarray,
     prices_low: np.ndarray,
     prices_close: np.ndarray,
-    stop_loss_pct: float,
-    take_profit_pct: float,
+    stop_loss_pct: Optional[float] = None,
+    take_profit_pct: Optional[float] = None,
+    trailing_config: Optional[dict[str, Any]] = None,
+    indicators: Optional[dict[str, np.ndarray]] = None,
+    max_lookahead: int = MAX_LOOKAHEAD_BARS,
 ) -> np.ndarray:
     """JIT-accelerated batch simulation (optional numba path).
 
     Uses numba if available; falls back to pure vectorization otherwise.
 
     Args:
-        entries: Structured array with entry_index, side, entry_price fields.
+        entries: Structured array with entry_index, side, entry_price fields
+            and optional per-trade stop_loss_pct/take_profit_pct fields. Side
+            is either a string ("LONG"/"SHORT") or a signed int (+1/-1).
         prices_high: High prices array.
         prices_low: Low prices array.
         prices_close: Close prices array.
-        stop_loss_pct: Stop loss threshold.
-        take_profit_pct: Take profit threshold.
+        stop_loss_pct: Stop loss threshold (used when entries lack the field).
+        take_profit_pct: Take profit threshold (used when entries lack the field).
+        trailing_config: Optional trailing stop settings (see
+            simulate_trades_batch).
+        indicators: Indicator arrays aligned with the price arrays.
+        max_lookahead: Maximum number of bars searched after each entry.
 
     Returns:
-        Structured array with exit results.
+        Structured array with entry_index, exit_index, exit_price,
+        exit_reason (code into EXIT_REASON_NAMES), holding_duration and pnl.
+
+    Raises:
+        ValueError: If SL/TP is neither given per-trade nor globally.
     """
-    # Placeholder for optional JIT path
-    # TODO: Add guarded numba import and JIT-compiled inner loop
-    raise NotImplementedError("JIT path not yet implemented")
+    names = entries.dtype.names or ()
+    n_trades = len(entries)
+
+    def _pct_column(field: str, default: Optional[float]) -> np.ndarray:
+        if field in names:
+            return np.asarray(entries[field], dtype=np.float64)
+        if default is None:
+            raise ValueError(
+                f"Missing {field}: provide a per-trade field or a global value. "
+                "Per-trade SL/TP values are required."
+            )
+        return np.full(n_trades, default, dtype=np.float64)
+
+    sl_pct = _pct_column("stop_loss_pct", stop_loss_pct)
+    tp_pct = _pct_column("take_profit_pct", take_profit_pct)
+
+    side = np.asarray(entries["side"])
+    if side.dtype.kind in ("U", "S", "O"):
+        is_long = side.astype(str) == "LONG"
+    else:
+        is_long = side > 0
+
+    entry_idx = np.asarray(entries["entry_index"], dtype=np.int64)
+    entry_price = np.asarray(entries["entry_price"], dtype=np.float64)
+
+    if _NUMBA_AVAILABLE:
+        exit_idx, exit_price, reasons = _run_exit_kernel(
+            entry_idx,
+            entry_price,
+            is_long,
+            sl_pct,
+            tp_pct,
+            prices_high,
+            prices_low,
+            prices_close,
+            trailing_config,
+            indicators,
+            max_lookahead,
+        )
+    else:
+        # Fallback: reuse the vectorized reference path
+        dict_results = _simulate_trades_vectorized(
+            [
+                {
+                    "entry_index": int(entry_idx[k]),
+                    "entry_price": float(entry_price[k]),
+                    "side": "LONG" if is_long[k] else "SHORT",
+                    "stop_loss_pct": float(sl_pct[k]),
+                    "take_profit_pct": float(tp_pct[k]),
+                }
+                for k in range(n_trades)
+            ],
+            pd.DataFrame(
+                {"high": prices_high, "low": prices_low, "close": prices_close}
+            ),
+            trailing_config=trailing_config,
+            indicators=indicators,
+            max_lookahead=max_lookahead,
+        )
+        exit_idx = np.array([r["exit_index"] for r in dict_results], dtype=np.int64)
+        exit_price = np.array([r["exit_price"] for r in dict_results], dtype=np.float64)
+        reasons = np.array(
+            [EXIT_REASON_NAMES.index(r["exit_reason"]) for r in dict_results],
+            dtype=np.int8,
+        )
+
+    out = np.empty(n_trades, dtype=SIM_RESULT_DTYPE)
+    out["entry_index"] = entry_idx
+    out["exit_index"] = exit_idx
+    out["exit_price"] = exit_price
+    out["exit_reason"] = reasons
+    out["holding_duration"] = exit_idx - entry_idx
+    out["pnl"] = np.where(
+        is_long,
+        (exit_price - entry_price) / entry_price,
+        (entry_price - exit_price) / entry_price,
+    )
+    return out
@@ -0,0 +1,808 @@
+"""Walk-forward optimization built on the parameter sweep machinery.
+
+Train/test windows slide over the full history of each pair. For every
+fold the sweep's combinations are scored on the train window, the winner
+(by the sweep ranking metric) is applied to the following out-of-sample
+window, and the out-of-sample equity of successive folds is stitched into
+one curve.
+
+Data is ingested once for the full range and each combination's indicators
+and signals are computed once on the full history; windows are zero-copy
+row slices of the enriched frames (no per-window indicator warm-up). Work
+is split into (combination, folds) tasks that run in parallel worker
+processes attached to the shared price arrays, as in run_sweep.
+
+Example:
+    >>> config = WalkForwardConfig(train_days=365, test_days=90)
+    >>> result = run_walk_forward(combinations, ["EURUSD"], config)  # doctest: +SKIP
+    >>> result.oos_equity.tail(1)                                   # doctest: +SKIP
+"""
+
+import logging
+import math
+import multiprocessing
+import time
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import polars as pl
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+)
+
+from ..models.enums import DirectionMode
+from ..models.signal_batch import SignalBatch
+from ..risk.blackout.windows import timestamps_to_epoch_ns
+from ..strategy.trend_pullback.strategy import TREND_PULLBACK_STRATEGY
+from .engine import (
+    STRATEGY_MAP,
+    construct_data_paths,
+    enrich_symbol_data,
+    generate_pair_signals,
+    load_symbol_data,
+    simulate_portfolio,
+)
+from .indicator_cache import IndicatorCache
+from .metrics_kernel import performance_from_arrays
+from .parallel import (
+    SharedArrays,
+    get_shared_arrays,
+    get_worker_count,
+    init_shared_worker,
+)
+from .sweep import (
+    ParameterSet,
+    PreloadedSweepData,
+    SingleResult,
+    build_strategy_params,
+    rank_results,
+    ranking_metrics,
+    summarize_portfolio_result,
+)
+from .timestamp_index import TimestampIndex
+from .trade_ledger import equity_arrays, trade_column
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class WalkForwardConfig:
+    """Window layout and selection settings for a walk-forward run.
+
+    Attributes:
+        train_days: Length of each in-sample (train) window in days.
+        test_days: Length of each out-of-sample (test) window in days.
+        step_days: Offset between consecutive folds. Must equal test_days
+            (the default when None): the out-of-sample curve is stitched
+            from consecutive test windows, which would overlap (counting
+            the same P&L twice) for a shorter step and leave gaps for a
+            longer one.
+        anchored: If True, every train window starts at the beginning of
+            the data (expanding window) instead of sliding.
+        ranking_metric: SingleResult metric used to pick each fold's winner.
+        starting_equity: Capital each window is simulated with.
+    """
+
+    train_days: float
+    test_days: float
+    step_days: float | None = None
+    anchored: bool = False
+    ranking_metric: str = "sharpe_ratio"
+    starting_equity: float = 2500.0
+
+    def __post_init__(self) -> None:
+        """Validate window lengths and the fold step."""
+        if self.train_days <= 0 or self.test_days <= 0:
+            raise ValueError("train_days and test_days must be positive")
+        if self.step_days is not None and self.step_days != self.test_days:
+            raise ValueError(
+                f"step_days ({self.step_days}) must equal test_days "
+                f"({self.test_days}) so the stitched out-of-sample test "
+                "windows neither overlap nor leave gaps"
+            )
+
+    @property
+    def step(self) -> timedelta:
+        """Offset between consecutive folds."""
+        return timedelta(days=self.step_days or self.test_days)
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """Train and test ranges of one fold (half-open: [start, end)).
+
+    Attributes:
+        fold: Zero-based fold number.
+        train_start: First timestamp of the train window.
+        train_end: End of the train window (= test_start).
+        test_start: First timestamp of the test window.
+        test_end: End of the test window (may extend past the data).
+    """
+
+    fold: int
+    train_start: datetime
+    train_end: datetime
+    test_start: datetime
+    test_end: datetime
+
+
+@dataclass
+class WindowRun:
+    """Metrics and equity of one parameter set on one window.
+
+    Attributes:
+        result: Sweep metrics for the window.
+        equity_ns: Equity curve timestamps (int64 epoch ns).
+        equity: Equity curve values (window starts at starting_equity).
+        r_multiples: pnl_r of every closed trade, in close order.
+    """
+
+    result: SingleResult
+    equity_ns: np.ndarray = field(default_factory=lambda: np.empty(0, np.int64))
+    equity: np.ndarray = field(default_factory=lambda: np.empty(0))
+    r_multiples: np.ndarray = field(default_factory=lambda: np.empty(0))
+
+
+@dataclass
+class WalkForwardFold:
+    """Selected parameters and their in/out-of-sample results for one fold.
+
+    Attributes:
+        window: Train/test ranges of the fold.
+        best_params: Winner on the train window (None if every
+            combination failed).
+        train_result: Winner's in-sample metrics.
+        test_result: Winner's out-of-sample metrics.
+    """
+
+    window: WalkForwardWindow
+    best_params: ParameterSet | None = None
+    train_result: SingleResult | None = None
+    test_result: SingleResult | None = None
+
+
+@dataclass
+class ParameterStability:
+    """How consistently one parameter was selected across folds.
+
+    Attributes:
+        name: Parameter label ("indicator.param").
+        values: Selected value per fold (folds with a winner only).
+        mean: Mean selected value.
+        std: Population standard deviation of the selected values.
+        min: Smallest selected value.
+        max: Largest selected value.
+        distinct: Number of distinct selected values.
+        mode_share: Fraction of folds that selected the most common value.
+        changes: Number of consecutive folds whose selection differs.
+    """
+
+    name: str
+    values: list[int | float]
+    mean: float
+    std: float
+    min: float
+    max: float
+    distinct: int
+    mode_share: float
+    changes: int
+
+
+@dataclass
+class WalkForwardResult:
+    """Aggregated walk-forward report.
+
+    Attributes:
+        folds: Per-fold winners and results, in time order.
+        oos_equity: Stitched out-of-sample equity (timestamp_utc, equity,
+            fold). Each fold's curve is scaled to start at the equity the
+            previous fold ended with.
+        oos_summary: Metrics over all out-of-sample trades and the
+            stitched equity curve.
+        parameter_stability: Selection statistics per swept parameter.
+        efficiency: Mean out-of-sample over mean in-sample ranking metric
+            of the winners (None if the in-sample mean is not positive).
+        ranking_metric: Metric used to select winners.
+        total_combinations: Number of combinations scored per fold.
+        execution_time_seconds: Total run duration.
+    """
+
+    folds: list[WalkForwardFold] = field(default_factory=list)
+    oos_equity: pl.DataFrame = field(default_factory=pl.DataFrame)
+    oos_summary: SingleResult | None = None
+    parameter_stability: list[ParameterStability] = field(default_factory=list)
+    efficiency: float | None = None
+    ranking_metric: str = "sharpe_ratio"
+    total_combinations: int = 0
+    execution_time_seconds: float = 0.0
+
+
+def _from_epoch_ns(value: int) -> datetime:
+    """UTC datetime of an epoch-nanosecond timestamp (microsecond precision)."""
+    return _EPOCH + timedelta(microseconds=int(value) // 1000)
+
+
+def build_windows(
+    start: datetime, end: datetime, config: WalkForwardConfig
+) -> list[WalkForwardWindow]:
+    """Lay out train/test windows over [start, end].
+
+    Folds are generated while the test window still starts at or before
+    the last timestamp; the final test window may be partial.
+
+    Args:
+        start: First timestamp of the data.
+        end: Last timestamp of the data.
+        config: Window lengths and anchoring.
+
+    Returns:
+        Windows in time order (empty if the history is shorter than one
+        train window).
+    """
+    train = timedelta(days=config.train_days)
+    test = timedelta(days=config.test_days)
+    windows = []
+    fold = 0
+    while True:
+        offset = config.step * fold
+        train_end = start + train + offset
+        if train_end > end:
+            break
+        windows.append(
+            WalkForwardWindow(
+                fold=fold,
+                train_start=start if config.anchored else start + offset,
+                train_end=train_end,
+                test_start=train_end,
+                test_end=train_end + test,
+            )
+        )
+        fold += 1
+    return windows
+
+
+def load_history(
+    pairs: list[str],
+    datasets: Sequence[str] = ("test", "validate"),
+    base_dir: Path = Path("price_data/processed"),
+) -> PreloadedSweepData:
+    """Ingest every partition of each pair once as one chronological frame.
+
+    Args:
+        pairs: Currency pair codes.
+        datasets: Partitions to concatenate, oldest first.
+        base_dir: Base directory for processed data.
+
+    Returns:
+        PreloadedSweepData with one full-history frame per pair.
+    """
+    parts: dict[str, list[pl.DataFrame]] = {}
+    for dataset in datasets:
+        for pair, data_path in construct_data_paths(pairs, dataset, base_dir):
+            logger.info("Loading %s history from %s", pair, data_path)
+            parts.setdefault(pair, []).append(
+                load_symbol_data(data_path, show_progress=False)
+            )
+
+    data = PreloadedSweepData()
+    for pair, frames in parts.items():
+        frame = pl.concat(frames, how="vertical_relaxed")
+        data.frames[pair] = frame.unique(
+            "timestamp_utc", keep="first", maintain_order=True
+        ).sort("timestamp_utc")
+        data.indicator_caches[pair] = IndicatorCache(dataset_id=pair)
+    return data
+
+
+def _window_signals(signals: Any, lo: int, hi: int, index: TimestampIndex) -> Any:
+    """Signals of one symbol that fall on rows [lo, hi) of its frame."""
+    if isinstance(signals, SignalBatch):
+        return signals.window(lo, hi)
+    if not signals:
+        return signals
+    signal_ns = timestamps_to_epoch_ns([s.timestamp_utc for s in signals])
+    keep = (signal_ns >= index.epoch_ns[lo]) & (signal_ns <= index.epoch_ns[hi - 1])
+    return [s for s, kept in zip(signals, keep) if kept]
+
+
+def _run_window(
+    params: ParameterSet,
+    strategy_params: Any,
+    enriched: dict[str, pl.DataFrame],
+    signals: dict[str, Any],
+    start: datetime,
+    end: datetime,
+    direction_mode: DirectionMode,
+    starting_equity: float,
+) -> WindowRun:
+    """Simulate one parameter set on the [start, end) slice of every symbol.
+
+    Positions still open at the end of the slice are closed on its last bar.
+    """
+    symbol_data: dict[str, pl.DataFrame] = {}
+    symbol_signals: dict[str, Any] = {}
+    for pair, frame in enriched.items():
+        index = TimestampIndex.for_frame(frame)
+        lo, hi = index.rows_between(start, end)
+        if hi > lo:
+            symbol_data[pair] = frame.slice(lo, hi - lo)
+            symbol_signals[pair] = _window_signals(signals[pair], lo, hi, index)
+
+    if not symbol_data:
+        return WindowRun(result=SingleResult(params=params))
+
+    portfolio = simulate_portfolio(
+        symbol_data,
+        symbol_signals,
+        direction_mode,
+        strategy_params,
+        starting_equity=starting_equity,
+        max_workers=1,
+    )
+    equity_ns, equity = equity_arrays(portfolio.equity_curve)
+    return WindowRun(
+        result=summarize_portfolio_result(params, portfolio),
+        equity_ns=equity_ns,
+        equity=equity,
+        r_multiples=trade_column(portfolio.closed_trades, "pnl_r"),
+    )
+
+
+def evaluate_combination(
+    params: ParameterSet,
+    data: PreloadedSweepData,
+    windows: Sequence[WalkForwardWindow],
+    direction_mode: DirectionMode = DirectionMode.LONG,
+    starting_equity: float = 2500.0,
+) -> dict[int, tuple[WindowRun, WindowRun]]:
+    """Score one parameter set on the train and test slice of each window.
+
+    Indicators and signals are computed once on the full history; every
+    window only slices the enriched frames.
+
+    Args:
+        params: Parameter set to evaluate.
+        data: Full-history frames and indicator caches per pair.
+        windows: Folds to evaluate.
+        direction_mode: Trading direction.
+        starting_equity: Capital each window is simulated with.
+
+    Returns:
+        Fold number -> (train run, test run). If the combination fails,
+        every fold reports the error in its results.
+    """
+    try:
+        strategy_params = build_strategy_params(params)
+        strategy_name = getattr(strategy_params, "strategy_name", "trend-pullback")
+        strategy = STRATEGY_MAP.get(strategy_name, TREND_PULLBACK_STRATEGY)
+
+        enriched: dict[str, pl.DataFrame] = {}
+        signals: dict[str, Any] = {}
+        for pair, frame in data.frames.items():
+            enriched[pair] = enrich_symbol_data(
+                frame,
+                strategy,
+                strategy_params,
+                indicator_overrides=params.params,
+                indicator_cache=data.indicator_caches.get(pair),
+                data_hash=data.data_hash(pair),
+            )
+            signals[pair] = generate_pair_signals(
+                pair,
+                enriched[pair],
+                strategy,
+                strategy_name,
+                strategy_params,
+                direction_mode,
+                use_gpu=False,
+            )
+
+        runs = {}
+        for window in windows:
+            train, test = (
+                _run_window(
+                    params,
+                    strategy_params,
+                    enriched,
+                    signals,
+                    start,
+                    end,
+                    direction_mode,
+                    starting_equity,
+                )
+                for start, end in (
+                    (window.train_start, window.train_end),
+                    (window.test_start, window.test_end),
+                )
+            )
+            runs[window.fold] = (train, test)
+        return runs
+
+    except Exception as e:
+        logger.exception("Walk-forward evaluation failed for params %s", params.label)
+        failed = WindowRun(result=SingleResult(params=params, error=str(e)))
+        return {window.fold: (failed, failed) for window in windows}
+
+
+@dataclass
+class WalkForwardTask:
+    """One combination evaluated on a subset of the folds."""
+
+    combination: int
+    params: ParameterSet
+    folds: list[int]
+
+
+# Per-process walk-forward state, populated by init_walk_forward_worker
+_WORKER_DATA: PreloadedSweepData | None = None
+_WORKER_WINDOWS: dict[int, WalkForwardWindow] = {}
+_WORKER_SETTINGS: tuple[DirectionMode, float] = (DirectionMode.LONG, 2500.0)
+
+
+def init_walk_forward_worker(
+    schemas: dict[str, list[tuple[str, pl.DataType]]],
+    windows: list[WalkForwardWindow],
+    direction_mode: DirectionMode,
+    starting_equity: float,
+) -> None:
+    """Process-pool initializer: wrap the shared arrays and store the folds.
+
+    Runs after parallel.init_shared_worker has attached the arrays.
+    """
+    # pylint: disable-next=global-statement
+    global _WORKER_DATA, _WORKER_WINDOWS, _WORKER_SETTINGS
+    _WORKER_DATA = PreloadedSweepData.from_shared_arrays(get_shared_arrays(), schemas)
+    _WORKER_WINDOWS = {window.fold: window for window in windows}
+    _WORKER_SETTINGS = (direction_mode, starting_equity)
+
+
+def execute_walk_forward_task(
+    task: WalkForwardTask,
+) -> tuple[int, dict[int, tuple[WindowRun, WindowRun]]]:
+    """Worker function to evaluate one combination on its folds."""
+    direction_mode, starting_equity = _WORKER_SETTINGS
+    runs = evaluate_combination(
+        task.params,
+        _WORKER_DATA,
+        [_WORKER_WINDOWS[fold] for fold in task.folds],
+        direction_mode=direction_mode,
+        starting_equity=starting_equity,
+    )
+    return task.combination, runs
+
+
+def _split_tasks(
+    combinations: list[ParameterSet], folds: list[int], worker_count: int
+) -> list[WalkForwardTask]:
+    """One task per combination, split by folds when combinations < workers.
+
+    Each task enriches its combination once, so folds are only split as far
+    as needed to occupy every worker.
+    """
+    chunks = max(1, min(len(folds), math.ceil(worker_count / len(combinations))))
+    fold_chunks = [list(chunk) for chunk in np.array_split(folds, chunks) if len(chunk)]
+    return [
+        WalkForwardTask(combination=i, params=params, folds=[int(f) for f in chunk])
+        for i, params in enumerate(combinations)
+        for chunk in fold_chunks
+    ]
+
+
+def _parameter_stability(folds: list[WalkForwardFold]) -> list[ParameterStability]:
+    """Selection statistics for every parameter of the fold winners."""
+    selected = [f.best_params for f in folds if f.best_params is not None]
+    if not selected:
+        return []
+
+    names = sorted(
+        {
+            (ind, param)
+            for ps in selected
+            for ind, values in ps.params.items()
+            for param in values
+        }
+    )
+    stability = []
+    for ind, param in names:
+        values = [ps.params.get(ind, {}).get(param) for ps in selected]
+        values = [v for v in values if v is not None]
+        if not values:
+            continue
+        array = np.asarray(values, dtype=np.float64)
+        _, mode_count = Counter(values).most_common(1)[0]
+        stability.append(
+            ParameterStability(
+                name=f"{ind}.{param}",
+                values=values,
+                mean=float(array.mean()),
+                std=float(array.std()),
+                min=float(array.min()),
+                max=float(array.max()),
+                distinct=len(set(values)),
+                mode_share=mode_count / len(values),
+                changes=sum(a != b for a, b in zip(values, values[1:])),
+            )
+        )
+    return stability
+
+
+def _stitch_oos(
+    folds: list[WalkForwardFold],
+    test_runs: dict[int, WindowRun],
+    starting_equity: float,
+) -> tuple[pl.DataFrame, SingleResult]:
+    """Chain the winners' test-window equity curves and summarize them."""
+    timestamps, equity, fold_ids, r_multiples = [], [], [], []
+    balance = starting_equity
+    for fold in folds:
+        run = test_runs.get(fold.window.fold)
+        if run is None or run.equity.size == 0:
+            continue
+        # Sizing is proportional to equity, so scaling the curve carries the
+        # previous fold's ending balance into this one
+        scaled = run.equity * (balance / starting_equity)
+        timestamps.append(run.equity_ns)
+        equity.append(scaled)
+        fold_ids.append(np.full(scaled.size, fold.window.fold, dtype=np.int32))
+        r_multiples.append(run.r_multiples)
+        balance = float(scaled[-1])
+
+    if not equity:
+        empty = pl.DataFrame(
+            schema={
+                "timestamp_utc": pl.Datetime("ns", "UTC"),
+                "equity": pl.Float64,
+                "fold": pl.Int32,
+            }
+        )
+        summary = SingleResult(params=ParameterSet(params={}, label="out-of-sample"))
+        return empty, summary
+
+    curve = np.concatenate(equity)
+    epoch_ns = np.concatenate(timestamps)
+    frame = pl.DataFrame(
+        {
+            "timestamp_utc": pl.Series(epoch_ns).cast(pl.Datetime("ns", "UTC")),
+            "equity": curve,
+            "fold": np.concatenate(fold_ids),
+        }
+    )
+
+    returns = np.concatenate(r_multiples)
+    sharpe, max_drawdown = ranking_metrics(
+        performance_from_arrays(returns, epoch_ns, curve)
+    )
+    summary = SingleResult(
+        params=ParameterSet(params={}, label="out-of-sample"),
+        sharpe_ratio=sharpe,
+        total_pnl=float(curve[-1] - starting_equity),
+        win_rate=float(np.mean(returns > 0)) if returns.size else 0.0,
+        trade_count=int(returns.size),
+        max_drawdown=max_drawdown,
+    )
+    return frame, summary
+
+
+def run_walk_forward(
+    combinations: list[ParameterSet],
+    pairs: list[str],
+    config: WalkForwardConfig,
+    datasets: Sequence[str] = ("test", "validate"),
+    processed_path: Path = Path("price_data/processed"),
+    direction: str = "LONG",
+    max_workers: int | None = None,
+    sequential: bool = False,
+    data: PreloadedSweepData | None = None,
+) -> WalkForwardResult:
+    """Run a walk-forward optimization over the full history.
+
+    Args:
+        combinations: Parameter sets to choose from in every fold.
+        pairs: Currency pairs traded together as one portfolio.
+        config: Window layout and ranking metric.
+        datasets: Partitions concatenated into the full history.
+        processed_path: Base directory of the processed partitions.
+        direction: Trading direction (LONG/SHORT/BOTH).
+        max_workers: Worker processes (None = one less than the cores).
+        sequential: If True, evaluate in-process.
+        data: Optional preloaded full-history frames (skips ingestion).
+
+    Returns:
+        WalkForwardResult with per-fold winners, stitched out-of-sample
+        equity and parameter-stability statistics.
+
+    Raises:
+        ValueError: If there are no combinations or the history is shorter
+            than one train window.
+    """
+    if not combinations:
+        raise ValueError("Walk-forward requires at least one parameter combination")
+
+    start_time = time.time()
+    direction_mode = DirectionMode[direction]
+    if data is None:
+        data = load_history(pairs, datasets, processed_path)
+
+    bounds = [
+        ns
+        for ns in (TimestampIndex.for_frame(f).epoch_ns for f in data.frames.values())
+        if ns.size
+    ]
+    if not bounds:
+        raise ValueError("Walk-forward requires price data")
+    windows = build_windows(
+        _from_epoch_ns(min(ns[0] for ns in bounds)),
+        _from_epoch_ns(max(ns[-1] for ns in bounds)),
+        config,
+    )
+    if not windows:
+        raise ValueError(
+            f"History is shorter than one {config.train_days}-day train window"
+        )
+
+    worker_count = 1 if sequential else get_worker_count(max_workers)
+    tasks = _split_tasks(combinations, [w.fold for w in windows], worker_count)
+    logger.info(
+        "Walk-forward: %d folds x %d combinations (%d tasks, %d workers)",
+        len(windows),
+        len(combinations),
+        len(tasks),
+        worker_count,
+    )
+
+    runs: dict[tuple[int, int], tuple[WindowRun, WindowRun]] = {}
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        transient=True,
+    ) as progress:
+        task_id = progress.add_task("Running walk-forward...", total=len(tasks))
+
+        if worker_count > 1:
+            arrays, schemas = data.to_shared_arrays()
+            # Spawn: forking after Polars has started its thread pool can deadlock
+            with (
+                SharedArrays(arrays) as shared,
+                ProcessPoolExecutor(
+                    max_workers=worker_count,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_shared_worker,
+                    initargs=(
+                        shared.specs,
+                        init_walk_forward_worker,
+                        (schemas, windows, direction_mode, config.starting_equity),
+                    ),
+                ) as executor,
+            ):
+                del arrays
+                futures = [executor.submit(execute_walk_forward_task, t) for t in tasks]
+                for future in as_completed(futures):
+                    combination, task_runs = future.result()
+                    for fold, pair_runs in task_runs.items():
+                        runs[(combination, fold)] = pair_runs
+                    progress.advance(task_id)
+        else:
+            by_fold = {window.fold: window for window in windows}
+            for task in tasks:
+                task_runs = evaluate_combination(
+                    task.params,
+                    data,
+                    [by_fold[fold] for fold in task.folds],
+                    direction_mode=direction_mode,
+                    starting_equity=config.starting_equity,
+                )
+                for fold, pair_runs in task_runs.items():
+                    runs[(task.combination, fold)] = pair_runs
+                progress.advance(task_id)
+
+    folds = []
+    test_runs: dict[int, WindowRun] = {}
+    for window in windows:
+        fold = WalkForwardFold(window=window)
+        # Combination order breaks ties, so selection is deterministic
+        train_results = [
+            runs[(i, window.fold)][0].result for i in range(len(combinations))
+        ]
+        ranked = rank_results(train_results, metric=config.ranking_metric)
+        if ranked:
+            winner = next(i for i, r in enumerate(train_results) if r is ranked[0])
+            fold.best_params = combinations[winner]
+            fold.train_result = ranked[0]
+            test_runs[window.fold] = runs[(winner, window.fold)][1]
+            fold.test_result = test_runs[window.fold].result
+        folds.append(fold)
+
+    oos_equity, oos_summary = _stitch_oos(folds, test_runs, config.starting_equity)
+
+    efficiency = None
+    scored = [f for f in folds if f.train_result and f.test_result]
+    if scored:
+        metric = config.ranking_metric
+        in_sample = np.mean([getattr(f.train_result, metric) for f in scored])
+        out_sample = np.mean([getattr(f.test_result, metric) for f in scored])
+        if in_sample > 0:
+            efficiency = float(out_sample / in_sample)
+
+    return WalkForwardResult(
+        folds=folds,
+        oos_equity=oos_equity,
+        oos_summary=oos_summary,
+        parameter_stability=_parameter_stability(folds),
+        efficiency=efficiency,
+        ranking_metric=config.ranking_metric,
+        total_combinations=len(combinations),
+        execution_time_seconds=time.time() - start_time,
+    )
+
+
+def export_walk_forward_report(
+    result: WalkForwardResult, output_dir: Path
+) -> dict[str, Path]:
+    """Write fold, equity and stability tables as CSV files.
+
+    Args:
+        result: Walk-forward result to export.
+        output_dir: Destination directory (created if missing).
+
+    Returns:
+        Table name -> written path.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    fold_rows = []
+    for fold in result.folds:
+        row: dict[str, Any] = {
+            "fold": fold.window.fold,
+            "train_start": fold.window.train_start,
+            "train_end": fold.window.train_end,
+            "test_start": fold.window.test_start,
+            "test_end": fold.window.test_end,
+            "best_params": fold.best_params.label if fold.best_params else "",
+        }
+        for prefix, metrics in (("is", fold.train_result), ("oos", fold.test_result)):
+            row[f"{prefix}_sharpe"] = metrics.sharpe_ratio if metrics else None
+            row[f"{prefix}_pnl"] = metrics.total_pnl if metrics else None
+            row[f"{prefix}_trades"] = metrics.trade_count if metrics else None
+            row[f"{prefix}_max_drawdown"] = metrics.max_drawdown if metrics else None
+        fold_rows.append(row)
+
+    stability = pl.DataFrame(
+        [
+            {
+                "parameter": s.name,
+                "mean": s.mean,
+                "std": s.std,
+                "min": s.min,
+                "max": s.max,
+                "distinct": s.distinct,
+                "mode_share": s.mode_share,
+                "changes": s.changes,
+            }
+            for s in result.parameter_stability
+        ]
+    )
+
+    paths = {
+        "folds": output_dir / "walk_forward_folds.csv",
+        "oos_equity": output_dir / "walk_forward_oos_equity.csv",
+        "stability": output_dir / "walk_forward_stability.csv",
+    }
+    pl.DataFrame(fold_rows).write_csv(paths["folds"])
+    result.oos_equity.write_csv(paths["oos_equity"])
+    stability.write_csv(paths["stability"])
+    logger.info("Walk-forward report exported to %s", output_dir)
+    return paths
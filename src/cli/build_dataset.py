@@ -14,7 +14,11 @@ from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 
-from ..data_io.dataset_builder import build_symbol_dataset, build_all_symbols
+from ..data_io.dataset_builder import (
+    INCREMENTAL_SPLIT_TOLERANCE,
+    build_all_symbols,
+    build_symbol_dataset,
+)
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -37,7 +41,23 @@ def configure_ingest_parser(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Force rebuild even if processed output exists (future enhancement)",
+        help="Force a full rebuild (overrides --incremental)",
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Append only new or grown raw files to the previous build",
+    )
+
+    parser.add_argument(
+        "--split-tolerance",
+        type=float,
+        default=INCREMENTAL_SPLIT_TOLERANCE,
+        help=(
+            "Test-share drift below 80%% allowed for --incremental before a "
+            f"full rebuild (default: {INCREMENTAL_SPLIT_TOLERANCE})"
+        ),
     )
 
     parser.add_argument(
@@ -54,6 +74,13 @@ def configure_ingest_parser(parser: argparse.ArgumentParser) -> None:
         help="Path to processed output directory (default: price_data/processed)",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Worker processes for --all builds (default: CPU count - 1)",
+    )
+
     parser.add_argument(
         "--log-level",
         type=str,
@@ -94,7 +121,15 @@ def run_ingest_command(args: argparse.Namespace) -> int:
             console.print(
                 f"\n[cyan]Building dataset for symbol: {args.symbol}[/cyan]\n"
             )
-            result = build_symbol_dataset(args.symbol, args.raw_path, args.output_path)
+            result = build_symbol_dataset(
+                args.symbol,
+                args.raw_path,
+                args.output_path,
+                incremental=getattr(args, "incremental", False) and not args.force,
+                split_tolerance=getattr(
+                    args, "split_tolerance", INCREMENTAL_SPLIT_TOLERANCE
+                ),
+            )
 
             if result["success"]:
                 metadata = result["metadata"]
@@ -113,7 +148,16 @@ def run_ingest_command(args: argparse.Namespace) -> int:
             console.print(f"Raw path: {args.raw_path}")
             console.print(f"Output path: {args.output_path}\n")
 
-            summary = build_all_symbols(args.raw_path, args.output_path, args.force)
+            summary = build_all_symbols(
+                args.raw_path,
+                args.output_path,
+                args.force,
+                max_workers=getattr(args, "max_workers", None),
+                incremental=getattr(args, "incremental", False),
+                split_tolerance=getattr(
+                    args, "split_tolerance", INCREMENTAL_SPLIT_TOLERANCE
+                ),
+            )
 
             _display_build_summary(summary)
 
@@ -3,6 +3,10 @@ import sys
 from typing import Optional
 
 from .run_backtest import configure_backtest_parser, run_backtest_command
+from .run_walk_forward import (
+    configure_walk_forward_parser,
+    run_walk_forward_command,
+)
 from .build_dataset import configure_ingest_parser, run_ingest_command
 from .scaffold_strategy import configure_scaffold_parser, run_scaffold_command
 
@@ -48,6 +52,16 @@ def main(args: Optional[list[str]] = None) -> int:
     )
     configure_scaffold_parser(scaffold_parser)
 
+    # -------------------------------------------------------------------------
+    # Subcommand: walk-forward
+    # -------------------------------------------------------------------------
+    walk_forward_parser = subparsers.add_parser(
+        "walk-forward",
+        help="Run a walk-forward parameter optimization",
+        description="Optimize parameters on sliding train windows and evaluate them out of sample.",
+    )
+    configure_walk_forward_parser(walk_forward_parser)
+
     # -------------------------------------------------------------------------
     # Parse & Execute
     # -------------------------------------------------------------------------
@@ -59,6 +73,8 @@ def main(args: Optional[list[str]] = None) -> int:
         return run_ingest_command(parsed_args)
     if parsed_args.command == "scaffold":
         return run_scaffold_command(parsed_args)
+    if parsed_args.command == "walk-forward":
+        return run_walk_forward_command(parsed_args)
 
     return 0
 
@@ -44,6 +44,7 @@ import json
 import logging
 import sys
 import re  # Import re for regex in _prompt
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -55,7 +56,14 @@ from ..backtest.engine import (
     construct_data_paths,
     run_portfolio_backtest,
 )
+from ..backtest.indicator_cache import (
+    INDICATOR_CACHE_DIR,
+    IndicatorCache,
+    merge_cache_stats,
+)
+from ..backtest.memory_sampler import MemorySampler
 from ..backtest.portfolio.portfolio_simulator import PortfolioResult
+from ..backtest.profiling import write_benchmark_record
 from ..cli.logging_setup import setup_logging
 from ..config.parameters import StrategyParameters
 from src.risk.blackout.config import (
@@ -66,7 +74,8 @@ from src.risk.blackout.config import (
 )
 from src.risk.prop_firm.loader import load_cti_config, load_scaling_plan
 from src.risk.prop_firm.scaling import evaluate_scaling
-from src.risk.prop_firm.reporter import format_cti_report
+from src.risk.prop_firm.monte_carlo import simulate_challenge
+from src.risk.prop_firm.reporter import format_cti_report, format_monte_carlo_report
 from ..data_io.formatters import (
     format_json_output,
     format_text_output,
@@ -234,6 +243,17 @@ def _multi_select_prompt(msg: str, default=None, coerce=str, choices=None):
         return []
 
 
+def _parse_utc_datetime(value: str) -> datetime:
+    """Parse a --start/--end value; naive values are taken as UTC."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(
+            f"Invalid date '{value}'. Use YYYY-MM-DD or an ISO datetime."
+        ) from exc
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
+
+
 def configure_backtest_parser(
     parser: argparse.ArgumentParser,
 ) -> argparse.ArgumentParser:
@@ -284,6 +304,21 @@ def configure_backtest_parser(
             Looks for price_data/processed/<pair>/<dataset>/<pair>_<dataset>.parquet",
     )
 
+    parser.add_argument(
+        "--start",
+        type=_parse_utc_datetime,
+        default=None,
+        help="First bar to trade (UTC, YYYY-MM-DD or ISO datetime). Only the range "
+        "plus an indicator warm-up margin is read from disk.",
+    )
+
+    parser.add_argument(
+        "--end",
+        type=_parse_utc_datetime,
+        default=None,
+        help="Last bar to trade, inclusive (UTC, YYYY-MM-DD or ISO datetime).",
+    )
+
     parser.add_argument(
         "--timeframe",
         type=str,
@@ -346,6 +381,18 @@ def configure_backtest_parser(
         ),
     )
 
+    parser.add_argument(
+        "--indicator-cache-dir",
+        type=Path,
+        nargs="?",
+        const=INDICATOR_CACHE_DIR,
+        help=(
+            "Persist computed indicator columns as Parquet files for reuse "
+            f"across runs (default directory: {INDICATOR_CACHE_DIR}; off unless "
+            "given; entries are not evicted automatically)"
+        ),
+    )
+
     # Parallel execution flags (Phase 7: T059)
     parser.add_argument(
         "--max-workers",
@@ -689,6 +736,22 @@ def configure_backtest_parser(
         help="Strategy for handling account buybacks after Attempt 1 (defaults to --cti-mode).",
     )
 
+    parser.add_argument(
+        "--cti-mc-paths",
+        type=int,
+        default=0,
+        help="Add a Monte Carlo pass-probability estimate over this many "
+        "resampled trade orderings to the CTI report (0 = off).",
+    )
+
+    parser.add_argument(
+        "--cti-mc-block-size",
+        type=int,
+        default=1,
+        help="Block length (trades) for the Monte Carlo block bootstrap "
+        "(default: 1, i.i.d. resampling).",
+    )
+
     parser.add_argument(
         "--disable-scaling",
         action="store_true",
@@ -717,6 +780,36 @@ def configure_backtest_parser(
         help="Run parameter sweep sequentially for debugging (only with --test-range).",
     )
 
+    parser.add_argument(
+        "--search",
+        type=str,
+        choices=["grid", "halving", "hyperband", "tpe"],
+        default="grid",
+        help="Parameter search method (only with --test-range). 'grid' runs every "
+        "combination; 'halving' and 'hyperband' discard weak combinations on "
+        "subsets of the data; 'tpe' samples combinations adaptively "
+        "(default: grid).",
+    )
+
+    parser.add_argument(
+        "--max-evals",
+        type=float,
+        help="Search budget in full-data backtests (only with --test-range).",
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        help="Search budget in seconds (only with --test-range).",
+    )
+
+    parser.add_argument(
+        "--compare-exhaustive",
+        action="store_true",
+        help="Also run the full grid (up to 256 combinations) and report the rank "
+        "correlation with the search (only with --test-range).",
+    )
+
     parser.add_argument(
         "--non-interactive",
         action="store_true",
@@ -743,12 +836,15 @@ def run_backtest_command(args: argparse.Namespace) -> int:
     # These imports are only needed if the parameter sweep mode is activated.
     # Moved here to avoid potential circular dependencies or unnecessary imports
     # in standard runs.
+    from ..backtest.engine import STRATEGY_MAP
+    from ..backtest.search import run_search
     from ..backtest.sweep import (
+        PreloadedSweepData,
         display_results_table,
         export_results_to_csv,
         filter_invalid_combinations,
         generate_combinations,
-        run_sweep,
+        rank_results,
     )
     from .prompts.range_input import (
         collect_all_ranges,
@@ -1233,50 +1329,80 @@ def run_backtest_command(args: argparse.Namespace) -> int:
     if args.test_range:
         logger.info("Starting parameter sweep mode.")
 
-        # Collect ranges for indicators (e.g., ATR period, ATR multiplier, RRR)
-        # This function should prompt the user for ranges if not provided via CLI args
+        # Collect ranges for the indicators the strategy requires
+        strategy = STRATEGY_MAP.get(args.strategy[0])
+        if strategy is None:
+            logger.error("Parameter sweep not supported for '%s'", args.strategy[0])
+            return 1
         try:
-            indicator_ranges = collect_all_ranges(
-                args
-            )  # Pass args to reuse values if already set
+            sweep_config = collect_all_ranges(strategy)
         except Exception as e:
             logger.error("Failed to collect indicator ranges: %s", e)
             return 1
-
-        # Generate combinations of parameters
-        try:
-            combinations = list(generate_combinations(indicator_ranges))
-        except Exception as e:
-            logger.error("Failed to generate parameter combinations: %s", e)
+        if sweep_config is None:
+            logger.info("Parameter sweep cancelled by user.")
             return 1
 
-        # Filter out invalid combinations (e.g., if a parameter depends on another)
+        # Count valid combinations for the confirmation prompt
         try:
+            combinations = generate_combinations(sweep_config.ranges)
             valid_combinations, skipped = filter_invalid_combinations(combinations)
         except Exception as e:
-            logger.error("Failed to filter invalid parameter combinations: %s", e)
+            logger.error("Failed to generate parameter combinations: %s", e)
             return 1
 
-        if not confirm_sweep(indicator_ranges, len(valid_combinations), skipped):
+        if is_interactive and not confirm_sweep(
+            sweep_config, len(valid_combinations), skipped
+        ):
             logger.info("Parameter sweep cancelled by user.")
             return 1  # Indicate cancellation
 
+        sweep_config.search = args.search
+        sweep_config.max_evaluations = args.max_evals
+        sweep_config.time_budget_seconds = args.time_budget
+        sweep_config.compare_exhaustive = args.compare_exhaustive
+
         # Run the sweep
         try:
-            results = run_sweep(args, valid_combinations)
+            sweep_data = None
+            start, end = getattr(args, "start", None), getattr(args, "end", None)
+            if start or end:
+                sweep_data = PreloadedSweepData.load(
+                    construct_data_paths(
+                        args.pair or ["EURUSD"], args.dataset or "test"
+                    ),
+                    start=start,
+                    end=end,
+                )
+            result = run_search(
+                sweep_config,
+                pairs=args.pair or ["EURUSD"],
+                dataset=args.dataset or "test",
+                direction=args.direction or "LONG",
+                max_workers=args.max_workers,
+                sequential=args.sequential,
+                data=sweep_data,
+            )
         except Exception as e:
             logger.error("Error during parameter sweep execution: %s", e)
             return 1
 
         # Display and export results
-        display_results_table(results)
+        display_results_table(rank_results(result.results, result.ranking_metric))
+        console.print(
+            f"\n{result.search}: {len(result.results)} combinations evaluated, "
+            f"cost {result.evaluation_cost:.1f} full-data backtests "
+            f"of {result.total_combinations}"
+        )
+        if result.rank_correlation is not None:
+            console.print(
+                f"Rank correlation with exhaustive sweep: "
+                f"{result.rank_correlation:.3f} "
+                f"(best found is exhaustive rank {result.exhaustive_best_rank})"
+            )
 
-        if args.csv:  # Assuming --csv argument exists for export path
-            try:
-                export_results_to_csv(results, args.csv)
-                logger.info("Results exported to %s", args.csv)
-            except Exception as e:
-                logger.error("Failed to export results to CSV: %s", e)
+        if args.export:
+            export_results_to_csv(result, args.export)
 
         logger.info("Parameter sweep finished.")
         return 0  # Success
@@ -1378,7 +1504,20 @@ def run_backtest_command(args: argparse.Namespace) -> int:
 
     # Run Portfolio Backtest
     try:
-        result, _ = run_portfolio_backtest(
+        indicator_caches = {
+            pair: IndicatorCache(
+                dataset_id=pair,
+                cache_dir=getattr(args, "indicator_cache_dir", None),
+            )
+            for pair, _ in pair_paths
+        }
+        benchmark_out = getattr(args, "benchmark_out", None)
+        sampler = MemorySampler() if benchmark_out else None
+        if sampler:
+            sampler.start()
+        run_start = time.perf_counter()
+
+        result, enriched_data = run_portfolio_backtest(
             pair_paths=pair_paths,
             direction_mode=DirectionMode[args.direction],
             strategy_params=strategy_params,
@@ -1388,8 +1527,31 @@ def run_backtest_command(args: argparse.Namespace) -> int:
             timeframe=args.timeframe if args.timeframe else "1m",
             blackout_config=blackout_config,
             use_gpu=args.gpu_accel,
+            indicator_caches=indicator_caches,
+            max_workers=getattr(args, "max_workers", None),
+            start=getattr(args, "start", None),
+            end=getattr(args, "end", None),
         )
 
+        if sampler:
+            elapsed = time.perf_counter() - run_start
+            peak_mb = sampler.get_peak_memory_mb() or 0.0
+            sampler.stop()
+            dataset_bytes = sum(df.estimated_size() for df in enriched_data.values())
+            write_benchmark_record(
+                output_path=benchmark_out,
+                dataset_rows=sum(len(df) for df in enriched_data.values()),
+                trades_simulated=result.total_trades,
+                phase_times={"portfolio_backtest": elapsed},
+                wall_clock_total=elapsed,
+                memory_peak_mb=peak_mb,
+                memory_ratio=(
+                    peak_mb * 1024 * 1024 / dataset_bytes if dataset_bytes else 0.0
+                ),
+                indicator_cache=merge_cache_stats(indicator_caches),
+            )
+            logger.info("Benchmark record written to %s", benchmark_out)
+
         # Display Results
         output_content = ""
         if args.output_format == "json":
@@ -1418,6 +1580,16 @@ def run_backtest_command(args: argparse.Namespace) -> int:
                     cti_text = format_cti_report(report)
                     output_content += "\n" + cti_text
 
+                    mc_paths = getattr(args, "cti_mc_paths", 0)
+                    if mc_paths and result.closed_trades:
+                        mc_result = simulate_challenge(
+                            result.closed_trades,
+                            challenge_config,
+                            n_paths=mc_paths,
+                            block_size=getattr(args, "cti_mc_block_size", 1),
+                        )
+                        output_content += "\n" + format_monte_carlo_report(mc_result)
+
                 except Exception as e:
                     logger.error("Failed to run CTI evaluation: %s", e)
                     output_content += f"\n\n[CTI Evaluation Failed: {e}]"
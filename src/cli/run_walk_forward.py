@@ -0,0 +1,267 @@
+"""CLI command for walk-forward parameter optimization.
+
+Slides train/test windows over the full history of the selected pairs,
+picks the best parameter combination on each train window and applies it
+to the following out-of-sample window.
+
+Usage:
+    quantpipe walk-forward --pairs EURUSD --train-days 365 --test-days 90 \\
+        --range fast_ema.period="10-30 step 5" --range slow_ema.period="50-100 step 25"
+"""
+
+# pylint: disable=line-too-long broad-exception-caught
+
+import argparse
+import logging
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from ..backtest.sweep import (
+    ParameterRange,
+    filter_invalid_combinations,
+    generate_combinations,
+    parse_range_input,
+)
+from ..backtest.walk_forward import (
+    WalkForwardConfig,
+    WalkForwardResult,
+    export_walk_forward_report,
+    run_walk_forward,
+)
+from .logging_setup import setup_logging
+
+logger = logging.getLogger(__name__)
+console = Console()
+
+
+def configure_walk_forward_parser(parser: argparse.ArgumentParser) -> None:
+    """Configure the argument parser for the 'walk-forward' command."""
+    parser.add_argument(
+        "--pairs",
+        type=str,
+        nargs="+",
+        default=["EURUSD"],
+        help="Currency pairs traded as one portfolio (default: EURUSD)",
+    )
+
+    parser.add_argument(
+        "--range",
+        dest="ranges",
+        action="append",
+        default=[],
+        metavar="INDICATOR.PARAM=VALUES",
+        help="Parameter values to optimize, e.g. fast_ema.period='10-30 step 5'. "
+        "Repeatable.",
+    )
+
+    parser.add_argument(
+        "--train-days",
+        type=float,
+        required=True,
+        help="Length of each in-sample (train) window in days",
+    )
+
+    parser.add_argument(
+        "--test-days",
+        type=float,
+        required=True,
+        help="Length of each out-of-sample (test) window in days",
+    )
+
+    parser.add_argument(
+        "--step-days",
+        type=float,
+        help="Offset between folds in days; must equal --test-days so the "
+        "stitched out-of-sample windows tile the history (default: --test-days)",
+    )
+
+    parser.add_argument(
+        "--anchored",
+        action="store_true",
+        help="Expand train windows from the start of the data instead of sliding",
+    )
+
+    parser.add_argument(
+        "--metric",
+        type=str,
+        choices=["sharpe_ratio", "total_pnl", "win_rate"],
+        default="sharpe_ratio",
+        help="Metric used to select each fold's parameters (default: sharpe_ratio)",
+    )
+
+    parser.add_argument(
+        "--direction",
+        type=str,
+        choices=["LONG", "SHORT", "BOTH"],
+        default="LONG",
+        help="Trading direction (default: LONG)",
+    )
+
+    parser.add_argument(
+        "--datasets",
+        type=str,
+        nargs="+",
+        default=["test", "validate"],
+        help="Partitions concatenated into the full history, oldest first",
+    )
+
+    parser.add_argument(
+        "--processed-path",
+        type=Path,
+        default=Path("price_data/processed"),
+        help="Path to processed partitions directory (default: price_data/processed)",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Worker processes (default: one less than the logical cores)",
+    )
+
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run in-process without worker processes (for debugging)",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("results/walk_forward"),
+        help="Output directory for the CSV report (default: results/walk_forward)",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        type=str,
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="INFO",
+        help="Logging level (default: INFO)",
+    )
+
+
+def parse_range_args(values: list[str]) -> list[ParameterRange]:
+    """Parse ``indicator.param=values`` arguments into parameter ranges.
+
+    Args:
+        values: Raw --range arguments.
+
+    Returns:
+        One ParameterRange per argument.
+
+    Raises:
+        ValueError: If an argument is malformed.
+    """
+    ranges = []
+    for value in values:
+        name, sep, spec = value.partition("=")
+        indicator, dot, param = name.strip().partition(".")
+        if not sep or not dot or not indicator or not param:
+            raise ValueError(
+                f"Invalid range '{value}'. Use indicator.param=VALUES, "
+                "e.g. fast_ema.period='10-30 step 5'."
+            )
+        param_type = float if "." in spec else int
+        parsed, is_range = parse_range_input(spec, 0, param_type)
+        ranges.append(
+            ParameterRange(
+                indicator_name=indicator,
+                param_name=param,
+                values=parsed,
+                is_range=is_range,
+            )
+        )
+    return ranges
+
+
+def display_walk_forward_table(result: WalkForwardResult) -> None:
+    """Print per-fold winners and the out-of-sample summary."""
+    table = Table(title=f"Walk-Forward Folds (selected by {result.ranking_metric})")
+    table.add_column("Fold", style="dim", width=4)
+    table.add_column("Test Window", style="cyan")
+    table.add_column("Parameters", style="cyan")
+    table.add_column("IS Sharpe", style="green")
+    table.add_column("OOS Sharpe", style="green")
+    table.add_column("OOS PnL", style="magenta")
+    table.add_column("OOS Trades", style="dim")
+
+    for fold in result.folds:
+        window = fold.window
+        test = fold.test_result
+        table.add_row(
+            str(window.fold),
+            f"{window.test_start:%Y-%m-%d} → {window.test_end:%Y-%m-%d}",
+            fold.best_params.label if fold.best_params else "-",
+            f"{fold.train_result.sharpe_ratio:.2f}" if fold.train_result else "-",
+            f"{test.sharpe_ratio:.2f}" if test else "-",
+            f"${test.total_pnl:.2f}" if test else "-",
+            str(test.trade_count) if test else "-",
+        )
+
+    console.print()
+    console.print(table)
+
+    summary = result.oos_summary
+    if summary is not None:
+        efficiency = (
+            f"{result.efficiency:.2f}" if result.efficiency is not None else "n/a"
+        )
+        console.print(
+            f"\n[bold]Out-of-sample:[/bold] PnL ${summary.total_pnl:.2f}, "
+            f"{summary.trade_count} trades, win rate {summary.win_rate:.1%}, "
+            f"Sharpe {summary.sharpe_ratio:.2f}, max DD {summary.max_drawdown:.1%}, "
+            f"WF efficiency {efficiency}"
+        )
+
+    for stability in result.parameter_stability:
+        console.print(
+            f"  {stability.name}: mean {stability.mean:g} ± {stability.std:g}, "
+            f"{stability.distinct} distinct, mode share {stability.mode_share:.0%}, "
+            f"{stability.changes} changes"
+        )
+
+
+def run_walk_forward_command(args: argparse.Namespace) -> int:
+    """Execute the 'walk-forward' command."""
+    setup_logging(level=args.log_level)
+
+    try:
+        ranges = parse_range_args(args.ranges)
+        config = WalkForwardConfig(
+            train_days=args.train_days,
+            test_days=args.test_days,
+            step_days=args.step_days,
+            anchored=args.anchored,
+            ranking_metric=args.metric,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        return 1
+
+    combinations, _ = filter_invalid_combinations(generate_combinations(ranges))
+    if not combinations:
+        console.print("[red]Error: No valid parameter combinations (use --range)[/red]")
+        return 1
+
+    try:
+        result = run_walk_forward(
+            combinations,
+            args.pairs,
+            config,
+            datasets=args.datasets,
+            processed_path=args.processed_path,
+            direction=args.direction,
+            max_workers=args.max_workers,
+            sequential=args.sequential,
+        )
+    except Exception as e:
+        logger.error("Walk-forward run failed: %s", e)
+        return 1
+
+    display_walk_forward_table(result)
+    paths = export_walk_forward_report(result, args.output)
+    console.print(f"\nReport written to {paths['folds'].parent}")
+    logger.info("Walk-forward finished in %.1fs", result.execution_time_seconds)
+    return 0
@@ -0,0 +1,296 @@
+"""Fast content fingerprints for data files and frames.
+
+Cache validation used to re-read and SHA-256 every source file on each load,
+and frame hashes serialized whole columns to CSV text first. This module
+replaces both with cheaper primitives:
+
+- Files are hashed from a read-only memory map in large chunks.
+- Frames are hashed from their column buffers (one contiguous NumPy view
+  per numeric/temporal column), without text serialization.
+- The hash is xxh3-128 when ``xxhash`` is installed, else BLAKE3 when
+  ``blake3`` is installed, else SHA-256 (the fastest hashlib digest with
+  hardware SHA extensions). Digests record their algorithm, so a digest
+  made under another backend is recomputed rather than miscompared.
+
+File fingerprints have a stat fast path: a file whose size, mtime and inode
+are unchanged is trusted without reading it. The content digest is only
+computed when the stat changed (touch, copy, rewrite) or a caller needs it,
+and is then kept in a sidecar next to the file so each file version is
+hashed at most once.
+
+Sidecar Location:
+- <directory>/.<file name>.fingerprint.json
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+# Optional fast hashes, in order of preference
+_XXHASH_AVAILABLE = False
+try:
+    import xxhash
+
+    _XXHASH_AVAILABLE = True
+except ImportError:
+    xxhash = None
+
+_BLAKE3_AVAILABLE = False
+try:
+    import blake3
+
+    _BLAKE3_AVAILABLE = True
+except ImportError:
+    blake3 = None
+
+logger = logging.getLogger(__name__)
+
+if _XXHASH_AVAILABLE:
+    HASH_ALGORITHM = "xxh3_128"
+elif _BLAKE3_AVAILABLE:
+    HASH_ALGORITHM = "blake3"
+else:
+    HASH_ALGORITHM = "sha256"
+
+# Bytes fed to the hasher per update when hashing a mapped file
+HASH_CHUNK_SIZE = 16 * 1024 * 1024
+
+SIDECAR_SUFFIX = ".fingerprint.json"
+
+
+def new_hasher(algorithm: str = HASH_ALGORITHM) -> Any:
+    """Create a hasher with update()/hexdigest().
+
+    Raises:
+        ValueError: If the algorithm is unknown or not installed.
+    """
+    if algorithm == "xxh3_128" and _XXHASH_AVAILABLE:
+        return xxhash.xxh3_128()
+    if algorithm == "blake3" and _BLAKE3_AVAILABLE:
+        return blake3.blake3()
+    if algorithm == "sha256":
+        return hashlib.sha256()
+    raise ValueError(f"Hash algorithm {algorithm!r} is not available")
+
+
+def hash_file(path: Path, algorithm: str = HASH_ALGORITHM) -> str:
+    """Hash a file's bytes through a read-only memory map.
+
+    Args:
+        path: File to hash.
+        algorithm: Hash algorithm (see new_hasher).
+
+    Returns:
+        Hexadecimal digest.
+    """
+    hasher = new_hasher(algorithm)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return hasher.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for start in range(0, size, HASH_CHUNK_SIZE):
+                    hasher.update(view[start : start + HASH_CHUNK_SIZE])
+            finally:
+                view.release()
+    return hasher.hexdigest()
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Stat identity and (lazily computed) content digest of a file.
+
+    Attributes:
+        size: File size in bytes.
+        mtime_ns: Modification time in nanoseconds.
+        inode: Inode number (changes when a file is replaced).
+        algorithm: Algorithm of the digest.
+        digest: Content digest, or None if not computed yet.
+    """
+
+    size: int
+    mtime_ns: int
+    inode: int
+    algorithm: str = HASH_ALGORITHM
+    digest: str | None = None
+
+    @classmethod
+    def from_stat(cls, stat: os.stat_result) -> FileFingerprint:
+        """Fingerprint without a digest from a stat result."""
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, inode=stat.st_ino)
+
+    def stat_matches(self, stat: os.stat_result) -> bool:
+        """True if size, mtime and inode are unchanged."""
+        return (
+            stat.st_size == self.size
+            and stat.st_mtime_ns == self.mtime_ns
+            and stat.st_ino == self.inode
+        )
+
+    def to_json(self) -> str:
+        """Compact JSON record (for sidecars and file metadata)."""
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> FileFingerprint:
+        """Parse a record written by to_json."""
+        return cls(**json.loads(raw))
+
+
+def sidecar_path(path: Path) -> Path:
+    """Sidecar file holding a file's fingerprint."""
+    path = Path(path)
+    return path.with_name(f".{path.name}{SIDECAR_SUFFIX}")
+
+
+def _read_sidecar_digests(path: Path, stat: os.stat_result) -> dict[str, str]:
+    """Digests recorded for the file's current version (by algorithm)."""
+    try:
+        record = json.loads(sidecar_path(path).read_bytes())
+        recorded = FileFingerprint(record["size"], record["mtime_ns"], record["inode"])
+        if recorded.stat_matches(stat):
+            return dict(record["digests"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return {}
+
+
+def _write_sidecar(
+    path: Path, fingerprint: FileFingerprint, digests: dict[str, str]
+) -> None:
+    """Write a sidecar atomically; read-only directories are skipped."""
+    target = sidecar_path(path)
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    record = {
+        "size": fingerprint.size,
+        "mtime_ns": fingerprint.mtime_ns,
+        "inode": fingerprint.inode,
+        "digests": digests,
+    }
+    try:
+        tmp_path.write_text(json.dumps(record), encoding="utf-8")
+        os.replace(tmp_path, target)
+    except OSError as e:
+        logger.debug("Could not write fingerprint sidecar %s: %s", target, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def file_fingerprint(
+    path: Path,
+    with_digest: bool = False,
+    algorithm: str = HASH_ALGORITHM,
+) -> FileFingerprint:
+    """Fingerprint a file, reusing sidecar digests while the stat is unchanged.
+
+    Args:
+        path: File to fingerprint.
+        with_digest: Compute the content digest if the sidecar has none for
+            the file's current version.
+        algorithm: Digest algorithm. The sidecar keeps one digest per
+            algorithm, so SHA-256 consumers (manifests) and fast-hash
+            consumers share it.
+
+    Returns:
+        FileFingerprint of the current file (digest None unless known or
+        requested).
+    """
+    path = Path(path)
+    stat = path.stat()
+    fingerprint = replace(FileFingerprint.from_stat(stat), algorithm=algorithm)
+    digests = _read_sidecar_digests(path, stat)
+    digest = digests.get(algorithm)
+    if digest is None and with_digest:
+        digest = hash_file(path, algorithm)
+        # Only remember the digest if the file did not change while hashing
+        if fingerprint.stat_matches(path.stat()):
+            _write_sidecar(path, fingerprint, {**digests, algorithm: digest})
+    return replace(fingerprint, digest=digest)
+
+
+def fingerprint_matches(path: Path, recorded: FileFingerprint) -> bool:
+    """Check a file against a previously recorded fingerprint.
+
+    Unchanged size, mtime and inode match without reading the file. A
+    same-size file with a new stat is compared by content digest (computed
+    once per file version, see file_fingerprint).
+
+    Args:
+        path: Current file.
+        recorded: Fingerprint recorded when the dependent artifact was built.
+
+    Returns:
+        True if the file content is unchanged.
+    """
+    stat = Path(path).stat()
+    if recorded.stat_matches(stat):
+        return True
+    if stat.st_size != recorded.size or recorded.digest is None:
+        return False
+    try:
+        current = file_fingerprint(path, with_digest=True, algorithm=recorded.algorithm)
+    except ValueError:
+        return False
+    return current.digest == recorded.digest
+
+
+def _column_buffers(series: pl.Series) -> list[Any]:
+    """Byte buffers that identify a column's values."""
+    buffers = []
+    if series.null_count():
+        buffers.append(np.packbits(series.is_null().to_numpy()))
+    dtype = series.dtype
+    if dtype.is_numeric() or dtype.is_temporal() or dtype == pl.Boolean:
+        values = series.to_physical()
+        if values.null_count():
+            values = values.fill_null(False if dtype == pl.Boolean else 0)
+        buffers.append(np.ascontiguousarray(values.to_numpy()))
+    else:
+        text = series.cast(pl.String).fill_null("")
+        buffers.append(text.str.len_bytes().to_numpy())
+        buffers.append(text.str.join("").item().encode("utf-8"))
+    return buffers
+
+
+def hash_frame(
+    df: pd.DataFrame | pl.DataFrame,
+    columns: list[str],
+    algorithm: str = HASH_ALGORITHM,
+) -> str:
+    """Hash the values of selected columns from their buffers.
+
+    Each column contributes its name, dtype, length, null mask and value
+    buffer, so the digest is independent of chunking but changes with any
+    value, dtype or order change.
+
+    Args:
+        df: Pandas or Polars DataFrame.
+        columns: Columns to hash, in order.
+        algorithm: Hash algorithm.
+
+    Returns:
+        Hexadecimal digest.
+    """
+    frame = df.select(columns) if isinstance(df, pl.DataFrame) else None
+    if frame is None:
+        frame = pl.from_pandas(df[columns])
+
+    hasher = new_hasher(algorithm)
+    for name in columns:
+        series = frame[name]
+        hasher.update(f"{name}\x00{series.dtype}\x00{len(series)}\x00".encode())
+        for buffer in _column_buffers(series):
+            hasher.update(memoryview(buffer).cast("B"))
+    return hasher.hexdigest()
@@ -10,6 +10,9 @@ import json
 import logging
 from datetime import datetime
 
+import numpy as np
+
+from src.backtest.metrics_kernel import compute_performance
 from src.models.directional import BacktestResult, SplitModeResult
 from src.models.enums import DirectionMode, OutputFormat
 
@@ -697,6 +700,72 @@ def format_multi_symbol_json_output(multi_result) -> str:
     return json.dumps(data, indent=2)
 
 
+def _portfolio_trade_metrics(result) -> dict:
+    """Aggregate metrics of a PortfolioResult from one metrics-kernel pass.
+
+    Losses include breakeven trades (pnl_r <= 0). Max drawdown is measured
+    on the closed-balance equity curve relative to the running peak
+    (starting from the starting equity). Time-based statistics use the
+    curve's daily returns; undefined values are reported as 0.0.
+    """
+    performance = compute_performance(
+        result.closed_trades,
+        result.equity_curve,
+        starting_equity=result.starting_equity,
+        breakdowns=False,
+    )
+    total_trades = performance.trade_count
+    win_count = performance.win_count
+    loss_count = total_trades - win_count
+
+    metrics = {
+        "trade_count": total_trades,
+        "win_count": win_count,
+        "loss_count": loss_count,
+    }
+    if total_trades == 0:
+        metrics.update(
+            dict.fromkeys(
+                [
+                    "win_rate",
+                    "avg_win_r",
+                    "avg_loss_r",
+                    "avg_r",
+                    "expectancy",
+                    "profit_factor",
+                    "max_drawdown",
+                ],
+                0.0,
+            )
+        )
+        return metrics
+
+    gross_wins = performance.gross_profit_r
+    gross_losses = performance.gross_loss_r if loss_count else 0.001
+    profit_factor = gross_wins / gross_losses if gross_losses > 0 else 0.0
+
+    def finite(value: float) -> float:
+        return float(value) if np.isfinite(value) else 0.0
+
+    metrics.update(
+        {
+            "win_rate": performance.win_rate,
+            "avg_win_r": finite(performance.avg_win_r),
+            "avg_loss_r": -gross_losses / loss_count if loss_count else 0.0,
+            "avg_r": performance.avg_r,
+            "expectancy": performance.expectancy,
+            "profit_factor": profit_factor,
+            "max_drawdown": finite(performance.max_drawdown_pct),
+            "max_consecutive_wins": performance.max_consecutive_wins,
+            "max_consecutive_losses": performance.max_consecutive_losses,
+            "time_under_water_pct": finite(performance.time_under_water_pct),
+            "volatility_annualized": finite(performance.volatility_annualized),
+            "sharpe_annualized": finite(performance.sharpe_annualized),
+        }
+    )
+    return metrics
+
+
 def format_portfolio_text_output(result, strategy_name: str | None = None) -> str:
     """Format portfolio-mode backtest results as human-readable text.
 
@@ -756,42 +825,21 @@ def format_portfolio_text_output(result, strategy_name: str | None = None) -> st
     lines.append("-" * 80)
 
     # Calculate aggregate metrics from closed trades
-    trades = result.closed_trades
-    total_trades = len(trades)
-    wins = [t for t in trades if t.pnl_r > 0]
-    losses = [t for t in trades if t.pnl_r <= 0]
-    win_count = len(wins)
-    loss_count = len(losses)
+    metrics = _portfolio_trade_metrics(result)
+    total_trades = metrics["trade_count"]
 
     lines.append(f"  Trades:           {total_trades}")
-    lines.append(f"  Wins:             {win_count}")
-    lines.append(f"  Losses:           {loss_count}")
+    lines.append(f"  Wins:             {metrics['win_count']}")
+    lines.append(f"  Losses:           {metrics['loss_count']}")
 
     if total_trades > 0:
-        win_rate = win_count / total_trades
-        total_r = sum(t.pnl_r for t in trades)
-        avg_r = total_r / total_trades
-
-        avg_win_r = sum(t.pnl_r for t in wins) / win_count if wins else 0.0
-        avg_loss_r = sum(t.pnl_r for t in losses) / loss_count if losses else 0.0
-
-        # Expectancy
-        expectancy = avg_r
-
-        # Profit factor
-        gross_wins = sum(t.pnl_r for t in wins) if wins else 0.0
-        gross_losses = abs(sum(t.pnl_r for t in losses)) if losses else 0.001
-        profit_factor = gross_wins / gross_losses if gross_losses > 0 else 0.0
-
-        # Max drawdown from equity curve
-        max_equity = result.starting_equity
-        max_drawdown = 0.0
-        for _ts, equity in result.equity_curve:
-            if equity > max_equity:
-                max_equity = equity
-            drawdown = (max_equity - equity) / max_equity if max_equity > 0 else 0
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
+        win_rate = metrics["win_rate"]
+        avg_win_r = metrics["avg_win_r"]
+        avg_loss_r = metrics["avg_loss_r"]
+        avg_r = metrics["avg_r"]
+        expectancy = metrics["expectancy"]
+        profit_factor = metrics["profit_factor"]
+        max_drawdown = metrics["max_drawdown"]
 
         lines.append(f"  Win Rate:         {win_rate:.2%}")
         lines.append(f"  Avg Win (R):      {avg_win_r:.2f}")
@@ -800,14 +848,12 @@ def format_portfolio_text_output(result, strategy_name: str | None = None) -> st
         lines.append(f"  Expectancy (R):   {expectancy:.2f}")
         lines.append(f"  Profit Factor:    {profit_factor:.2f}")
         lines.append(f"  Max Drawdown:     {max_drawdown:.2%}")
+        lines.append(f"  Time Under Water: {metrics['time_under_water_pct']:.2%}")
+        lines.append(f"  Volatility (ann): {metrics['volatility_annualized']:.2%}")
+        lines.append(f"  Sharpe (ann):     {metrics['sharpe_annualized']:.2f}")
 
-        # Calculate streaks for aggregate
-        import numpy as np
-        from src.backtest.metrics import compute_streaks
-
-        pnl_values = np.array([t.pnl_r for t in trades])
-        max_win_streak = compute_streaks(pnl_values, win=True)
-        max_loss_streak = compute_streaks(pnl_values, win=False)
+        max_win_streak = metrics["max_consecutive_wins"]
+        max_loss_streak = metrics["max_consecutive_losses"]
 
         lines.append(f"  Max Consec Wins:  {max_win_streak}")
         lines.append(f"  Max Consec Loss:  {max_loss_streak}")
@@ -859,62 +905,7 @@ def format_portfolio_json_output(result) -> str:
             return str(ts)
 
     # Calculate aggregate metrics from closed trades
-    trades = result.closed_trades
-    total_trades = len(trades)
-    wins = [t for t in trades if t.pnl_r > 0]
-    losses = [t for t in trades if t.pnl_r <= 0]
-    win_count = len(wins)
-    loss_count = len(losses)
-
-    metrics = {
-        "trade_count": total_trades,
-        "win_count": win_count,
-        "loss_count": loss_count,
-    }
-
-    if total_trades > 0:
-        win_rate = win_count / total_trades
-        total_r = sum(t.pnl_r for t in trades)
-        avg_r = total_r / total_trades
-        avg_win_r = sum(t.pnl_r for t in wins) / win_count if wins else 0.0
-        avg_loss_r = sum(t.pnl_r for t in losses) / loss_count if losses else 0.0
-        gross_wins = sum(t.pnl_r for t in wins) if wins else 0.0
-        gross_losses = abs(sum(t.pnl_r for t in losses)) if losses else 0.001
-        profit_factor = gross_wins / gross_losses if gross_losses > 0 else 0.0
-
-        # Max drawdown from equity curve
-        max_equity = result.starting_equity
-        max_drawdown = 0.0
-        for ts, equity in result.equity_curve:
-            if equity > max_equity:
-                max_equity = equity
-            drawdown = (max_equity - equity) / max_equity if max_equity > 0 else 0
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-
-        metrics.update(
-            {
-                "win_rate": win_rate,
-                "avg_win_r": avg_win_r,
-                "avg_loss_r": avg_loss_r,
-                "avg_r": avg_r,
-                "expectancy": avg_r,
-                "profit_factor": profit_factor,
-                "max_drawdown": max_drawdown,
-            }
-        )
-    else:
-        metrics.update(
-            {
-                "win_rate": 0.0,
-                "avg_win_r": 0.0,
-                "avg_loss_r": 0.0,
-                "avg_r": 0.0,
-                "expectancy": 0.0,
-                "profit_factor": 0.0,
-                "max_drawdown": 0.0,
-            }
-        )
+    metrics = _portfolio_trade_metrics(result)
 
     data = {
         "run_id": result.run_id,
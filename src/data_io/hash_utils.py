@@ -2,15 +2,18 @@
 
 This module provides utilities for computing deterministic hashes of DataFrames
 to verify that core datasets remain unchanged during enrichment operations.
+Hashes are computed from the column buffers (see fingerprint.hash_frame), not
+from a text serialization of the frame.
 """
 from __future__ import annotations
 
-import hashlib
 from typing import List, Union
 
 import pandas as pd
 from polars import DataFrame as PolarsDataFrame
 
+from src.data_io.fingerprint import hash_frame
+
 
 def compute_dataframe_hash(df: pd.DataFrame | PolarsDataFrame, columns: List[str], is_polars: bool = False) -> str:
     """Compute a deterministic hash of specified DataFrame columns.
@@ -18,7 +21,8 @@ def compute_dataframe_hash(df: pd.DataFrame | PolarsDataFrame, columns: List[str
     Args:
         df: The DataFrame to hash (Pandas or Polars).
         columns: List of column names to include in the hash.
-        is_polars: If True, df is a Polars DataFrame.
+        is_polars: If True, df is a Polars DataFrame (the frame type is
+            also detected, so this is only kept for existing callers).
 
     Returns:
         str: Hexadecimal hash digest.
@@ -26,18 +30,11 @@ def compute_dataframe_hash(df: pd.DataFrame | PolarsDataFrame, columns: List[str
     Raises:
         ValueError: If any specified columns are missing from the DataFrame.
     """
-    if is_polars:
-        missing_columns = set(columns) - set(df.columns)
-        if missing_columns:
-            raise ValueError(f"Missing columns for hash: {missing_columns}")
-        content = df.select(columns).write_csv(separator=',').encode("utf-8")
-    else:
-        missing_columns = set(columns) - set(df.columns)
-        if missing_columns:
-            raise ValueError(f"Missing columns for hash: {missing_columns}")
-        content = df[columns].to_csv(index=False).encode("utf-8")
-
-    return hashlib.sha256(content).hexdigest()
+    missing_columns = set(columns) - set(df.columns)
+    if missing_columns:
+        raise ValueError(f"Missing columns for hash: {missing_columns}")
+
+    return hash_frame(df, list(columns))
 
 
 def verify_immutability(
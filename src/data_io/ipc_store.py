@@ -0,0 +1,234 @@
+"""Memory-mapped Arrow IPC store for ingested price partitions.
+
+The ingestion pipeline (read, sort, deduplicate, cadence checks, schema
+restriction) is deterministic for a given source file, so its Polars output
+is stored once as an uncompressed Arrow IPC (Feather v2) file and memory
+mapped on later loads:
+
+- Opening a stored partition only reads the file footer; column pages are
+  faulted in by the OS when they are first touched.
+- The mapping is backed by the page cache, so concurrent backtest processes
+  reading the same partition share one copy of the data.
+- Each file is written as a single record batch, so columns are contiguous
+  and ``Series.to_numpy()`` views the mapping without copying.
+
+Store Location:
+- .ipc_cache/ directory in project root (like .parquet_cache)
+
+Validation:
+The source fingerprint (size, mtime and SHA-256 checksum, the same digest
+``manifest.py`` records) is kept in the Arrow schema metadata. A store is
+reused when the source size and mtime are unchanged, or when its checksum
+still matches after a touch/copy. If a manifest is given, its checksum must
+match the stored one as well. Checksums go through the fingerprint sidecar
+(see fingerprint.py), so each version of a source is hashed at most once.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import polars as pl
+import pyarrow as pa
+
+from .fingerprint import file_fingerprint
+from .manifest import load_manifest
+
+logger = logging.getLogger(__name__)
+
+# Store directory relative to project root
+IPC_CACHE_DIR = Path(".ipc_cache")
+
+# Schema metadata key holding the source fingerprint
+FINGERPRINT_KEY = b"quantpipe.source_fingerprint"
+
+
+@dataclass(frozen=True)
+class SourceFingerprint:
+    """Identity of the source file a store was built from.
+
+    Attributes:
+        size: Source size in bytes.
+        mtime_ns: Source modification time in nanoseconds.
+        checksum: SHA-256 of the source content (manifest format).
+    """
+
+    size: int
+    mtime_ns: int
+    checksum: str
+
+    @classmethod
+    def from_path(cls, path: Path) -> "SourceFingerprint":
+        """Fingerprint a file (reads it once per version for the checksum)."""
+        fingerprint = file_fingerprint(path, with_digest=True, algorithm="sha256")
+        return cls(
+            size=fingerprint.size,
+            mtime_ns=fingerprint.mtime_ns,
+            checksum=fingerprint.digest,
+        )
+
+    def stat_matches(self, path: Path) -> bool:
+        """True if the file's size and mtime are unchanged."""
+        stat = path.stat()
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+
+@dataclass
+class StoredPartition:
+    """A memory-mapped partition and its provenance.
+
+    Attributes:
+        data: Polars frame whose buffers view the mapped file.
+        core_hash: Core-column hash recorded when the store was built.
+        fingerprint: Fingerprint of the source the store was built from.
+        path: Location of the IPC file.
+    """
+
+    data: pl.DataFrame
+    core_hash: str
+    fingerprint: SourceFingerprint
+    path: Path
+
+
+def get_store_path(source_path: Path, cache_dir: Path = IPC_CACHE_DIR) -> Path:
+    """IPC store location for a source file (unique per absolute path)."""
+    source_path = Path(source_path)
+    path_hash = hashlib.sha256(str(source_path.resolve()).encode()).hexdigest()
+    return cache_dir / f"{source_path.stem}_{path_hash[:16]}.arrow"
+
+
+def _read_metadata(store_path: Path) -> tuple[SourceFingerprint, str] | None:
+    """Fingerprint and core hash from a store's schema metadata."""
+    with pa.memory_map(str(store_path)) as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    raw = metadata.get(FINGERPRINT_KEY)
+    if raw is None:
+        return None
+    record = json.loads(raw)
+    core_hash = record.pop("core_hash", "")
+    return SourceFingerprint(**record), core_hash
+
+
+def _is_current(
+    source_path: Path,
+    fingerprint: SourceFingerprint,
+    manifest_path: Path | None,
+) -> bool:
+    """Check a stored fingerprint against the source (and manifest)."""
+    if manifest_path is not None:
+        manifest = load_manifest(Path(manifest_path), verify_checksum=False)
+        if manifest.checksum != fingerprint.checksum:
+            logger.debug("IPC store checksum differs from manifest %s", manifest_path)
+            return False
+    if fingerprint.stat_matches(source_path):
+        return True
+    # Touched or copied: trust the content, not the timestamps
+    current = file_fingerprint(source_path, with_digest=True, algorithm="sha256")
+    return current.digest == fingerprint.checksum
+
+
+def open_ipc_store(
+    source_path: Path,
+    manifest_path: Path | None = None,
+    cache_dir: Path = IPC_CACHE_DIR,
+) -> StoredPartition | None:
+    """Memory-map the stored partition for a source file, if still valid.
+
+    Args:
+        source_path: Original Parquet/CSV partition.
+        manifest_path: Optional data manifest whose checksum must match.
+        cache_dir: Store directory.
+
+    Returns:
+        StoredPartition, or None if there is no valid store.
+    """
+    source_path = Path(source_path)
+    store_path = get_store_path(source_path, cache_dir)
+    if not store_path.exists() or not source_path.exists():
+        return None
+
+    try:
+        stored = _read_metadata(store_path)
+        if stored is None or not _is_current(source_path, stored[0], manifest_path):
+            logger.info("IPC store for %s is stale", source_path)
+            return None
+        # Zero-copy: the table's buffers point into the mapping
+        table = pa.ipc.open_file(pa.memory_map(str(store_path))).read_all()
+        data = pl.from_arrow(table, rechunk=False)
+    except (OSError, ValueError, TypeError, pa.ArrowException) as exc:
+        logger.warning("Failed to open IPC store %s: %s", store_path, exc)
+        return None
+
+    logger.info("Memory-mapped %d rows from IPC store %s", data.height, store_path)
+    return StoredPartition(
+        data=data,
+        core_hash=stored[1],
+        fingerprint=stored[0],
+        path=store_path,
+    )
+
+
+def write_ipc_store(
+    df: pl.DataFrame,
+    source_path: Path,
+    core_hash: str = "",
+    cache_dir: Path = IPC_CACHE_DIR,
+) -> Path:
+    """Write an ingested frame as the uncompressed IPC store of its source.
+
+    The file is written under a temporary name and renamed into place, so
+    concurrent readers never observe a partial store.
+
+    Args:
+        df: Ingested Polars frame.
+        source_path: Partition the frame was ingested from.
+        core_hash: Core-column hash to keep with the store.
+        cache_dir: Store directory.
+
+    Returns:
+        Path of the written store.
+    """
+    source_path = Path(source_path)
+    store_path = get_store_path(source_path, cache_dir)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+
+    fingerprint = SourceFingerprint.from_path(source_path)
+    record = {**asdict(fingerprint), "core_hash": core_hash}
+    table = df.to_arrow()
+    table = table.replace_schema_metadata(
+        {**(table.schema.metadata or {}), FINGERPRINT_KEY: json.dumps(record)}
+    )
+
+    tmp_path = store_path.with_name(f"{store_path.name}.{os.getpid()}.tmp")
+    try:
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                # One record batch keeps every column contiguous in the file
+                writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+        os.replace(tmp_path, store_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    logger.info("Wrote IPC store %s (%d rows)", store_path, df.height)
+    return store_path
+
+
+def clear_ipc_store(
+    source_path: Path | None = None,
+    cache_dir: Path = IPC_CACHE_DIR,
+) -> None:
+    """Remove the IPC store of one source file, or all stores.
+
+    Args:
+        source_path: Source whose store to remove; None removes all stores.
+        cache_dir: Store directory.
+    """
+    if source_path is not None:
+        get_store_path(Path(source_path), cache_dir).unlink(missing_ok=True)
+        return
+    for store in Path(cache_dir).glob("*.arrow"):
+        store.unlink()
+    logger.info("Cleared all IPC stores in %s", cache_dir)
@@ -50,12 +50,9 @@ def _compute_file_checksum(file_path: Path) -> str:
     if not file_path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    sha256 = hashlib.sha256()
+    # file_digest reads into one reusable buffer (no per-chunk bytes objects)
     with open(file_path, "rb") as f:
-        while chunk := f.read(8192):
-            sha256.update(chunk)
-
-    return sha256.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def load_manifest(manifest_path: Path, verify_checksum: bool = True) -> DataManifest:
@@ -3,6 +3,10 @@
 This module provides functionality to cache processed CSV data as Parquet files
 to accelerate subsequent loads. It includes mechanisms for cache invalidation
 based on source CSV modification times and content hashes.
+
+The CSV's FileFingerprint (size, mtime, inode and content digest) is stored in
+the Parquet footer. Validating a cache reads only that footer and stats the
+CSV; the CSV is hashed only if its stat changed (see fingerprint.py).
 """
 from __future__ import annotations
 
@@ -15,6 +19,12 @@ import pandas as pd
 from polars import DataFrame as PolarsDataFrame
 import polars as pl # Keep for pl.read_parquet, etc.
 
+from src.data_io.fingerprint import (
+    FileFingerprint,
+    file_fingerprint,
+    fingerprint_matches,
+)
+
 
 logger = logging.getLogger(__name__)
 
@@ -30,13 +40,8 @@ def _get_cache_path(csv_path: Path) -> Path:
     return CACHE_DIR / f"{csv_path.stem}_{path_hash}.parquet"
 
 
-def _get_csv_hash(csv_path: Path) -> str:
-    """Compute SHA256 hash of a CSV file's content."""
-    hasher = hashlib.sha256()
-    with open(csv_path, "rb") as f:
-        while chunk := f.read(8192):  # Read in 8KB chunks
-            hasher.update(chunk)
-    return hasher.hexdigest()
+# Parquet footer key holding the source CSV fingerprint
+CSV_FINGERPRINT_KEY = b"csv_fingerprint"
 
 
 def _is_cache_valid(csv_path: Path, cache_path: Path) -> bool:
@@ -45,8 +50,7 @@ def _is_cache_valid(csv_path: Path, cache_path: Path) -> bool:
         return False
 
     try:
-        # Read metadata from Parquet file
-        # We store CSV hash and mtime in Parquet metadata
+        # Read the CSV fingerprint from the Parquet footer
         # This requires pyarrow to be installed
         import pyarrow.parquet as pq
 
@@ -57,30 +61,18 @@ def _is_cache_valid(csv_path: Path, cache_path: Path) -> bool:
             logger.debug("Parquet metadata is empty for %s", cache_path)
             return False
 
-        # Decode byte strings from metadata
-        cached_csv_mtime = file_metadata.get(b"csv_mtime")
-        cached_csv_hash = file_metadata.get(b"csv_hash")
-
-        if cached_csv_mtime is None or cached_csv_hash is None:
-            logger.debug("Missing csv_mtime or csv_hash in Parquet metadata for %s", cache_path)
+        raw_fingerprint = file_metadata.get(CSV_FINGERPRINT_KEY)
+        if raw_fingerprint is None:
+            logger.debug("Missing csv_fingerprint in metadata for %s", cache_path)
             return False
 
-        cached_csv_mtime = float(cached_csv_mtime.decode("utf-8"))
-        cached_csv_hash = cached_csv_hash.decode("utf-8")
-
-        # Compare with current CSV file
-        current_csv_mtime = csv_path.stat().st_mtime
-        current_csv_hash = _get_csv_hash(csv_path)
-
-        if (
-            abs(current_csv_mtime - cached_csv_mtime) < 0.001
-            and current_csv_hash == cached_csv_hash
-        ):
+        # Stat fast path; the CSV is only hashed if its stat changed
+        if fingerprint_matches(csv_path, FileFingerprint.from_json(raw_fingerprint)):
             logger.debug("Parquet cache for %s is valid.", csv_path)
             return True
         else:
             logger.debug(
-                "Parquet cache for %s is invalid (mtime or hash mismatch).", csv_path
+                "Parquet cache for %s is invalid (CSV content changed).", csv_path
             )
             return False
     except Exception as e:  # pylint: disable=broad-except-caught
@@ -127,12 +119,11 @@ def load_with_cache(csv_path: Path, return_polars: bool = False) -> pd.DataFrame
         else:
             df = pd.read_csv(csv_path)
 
-        if df.empty:
+        if (df.is_empty() if return_polars else df.empty):
             raise ValueError(f"CSV file is empty: {csv_path}")
 
-        # Store CSV mtime and hash in Parquet metadata
-        csv_mtime = csv_path.stat().st_mtime
-        csv_hash = _get_csv_hash(csv_path)
+        # Store the CSV fingerprint (with digest) in Parquet metadata
+        csv_fingerprint = file_fingerprint(csv_path, with_digest=True)
 
         # Convert to pyarrow table to write metadata
         import pyarrow as pa
@@ -149,13 +140,13 @@ def load_with_cache(csv_path: Path, return_polars: bool = False) -> pd.DataFrame
         else:
             metadata = {k.decode("utf-8"): v.decode("utf-8") for k, v in metadata.items()}
 
-        metadata["csv_mtime"] = str(csv_mtime)
-        metadata["csv_hash"] = csv_hash
+        metadata[CSV_FINGERPRINT_KEY.decode("utf-8")] = csv_fingerprint.to_json()
 
         # Encode metadata keys/values to bytes
         encoded_metadata = {k.encode("utf-8"): v.encode("utf-8") for k, v in metadata.items()}
 
-        pq.write_table(table, cache_path, metadata_collector=[encoded_metadata])
+        table = table.replace_schema_metadata(encoded_metadata)
+        pq.write_table(table, cache_path)
 
         logger.info("Parquet cache built and saved to %s", cache_path)
         return df
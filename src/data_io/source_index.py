@@ -0,0 +1,213 @@
+"""Per-symbol source index for incremental dataset builds.
+
+A full dataset build records, next to the symbol's processed outputs, which
+raw CSV files it was built from and where the data ends:
+
+- One SourceFingerprint (size, mtime, SHA-256 as in ``manifest.py``) per
+  raw file.
+- The last merged timestamp and the median bar spacing (for gap counting).
+- Row, gap and overlap counts, the column order of the written partitions
+  and the size of the validation CSV after the last successful write.
+
+An incremental build compares the raw directory against this index to find
+files that are new, grew by appending (the recorded checksum still matches
+the file's prefix), were rewritten or were removed. Only new and grown files
+are read; anything else requires a full rebuild.
+
+Index Location:
+- <output_path>/<symbol>/source_index.json
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .ipc_store import SourceFingerprint
+from .manifest import _compute_file_checksum
+
+logger = logging.getLogger(__name__)
+
+SOURCE_INDEX_FILE = "source_index.json"
+SOURCE_INDEX_VERSION = "v1"
+
+
+def _prefix_checksum(file_path: Path, size: int) -> str:
+    """SHA-256 of the first ``size`` bytes of a file."""
+    sha256 = hashlib.sha256()
+    remaining = size
+    with open(file_path, "rb") as f:
+        while remaining > 0 and (chunk := f.read(min(8192, remaining))):
+            sha256.update(chunk)
+            remaining -= len(chunk)
+    return sha256.hexdigest()
+
+
+@dataclass
+class SourceChanges:
+    """Raw files of a symbol classified against its source index.
+
+    Attributes:
+        new: Files not in the index.
+        grown: Indexed files that only had data appended.
+        rewritten: Indexed files whose existing content changed.
+        removed: Indexed file names that no longer exist.
+        unchanged: Indexed files with identical content.
+    """
+
+    new: list[Path] = field(default_factory=list)
+    grown: list[Path] = field(default_factory=list)
+    rewritten: list[Path] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[Path] = field(default_factory=list)
+
+    @property
+    def requires_rebuild(self) -> bool:
+        """True if existing rows may have changed or disappeared."""
+        return bool(self.rewritten or self.removed)
+
+    @property
+    def to_append(self) -> list[Path]:
+        """Files whose rows have to be read for an append."""
+        return sorted(self.new + self.grown)
+
+
+def fingerprint_sources(
+    files: list[Path],
+    known: dict[str, SourceFingerprint] | None = None,
+) -> dict[str, SourceFingerprint]:
+    """Fingerprint raw files by name.
+
+    Args:
+        files: Raw CSV files.
+        known: Existing fingerprints, reused when size and mtime match.
+
+    Returns:
+        Mapping of file name to fingerprint.
+    """
+    known = known or {}
+    sources = {}
+    for path in files:
+        fingerprint = known.get(path.name)
+        if fingerprint is None or not fingerprint.stat_matches(path):
+            fingerprint = SourceFingerprint.from_path(path)
+        sources[path.name] = fingerprint
+    return sources
+
+
+@dataclass
+class SourceIndex:
+    """Raw sources and data extent of one built symbol.
+
+    Row and gap/overlap counts are kept here rather than read back from
+    metadata.json, because the index is written last: a build interrupted
+    before it leaves the previous index, whose counts still match the
+    validation CSV once it is truncated to ``validation_csv_bytes``.
+
+    Attributes:
+        sources: Fingerprint per raw file name.
+        last_timestamp: Latest timestamp in the processed data.
+        median_delta_ns: Median bar spacing in nanoseconds.
+        columns: Column order of the written partitions.
+        total_rows: Rows across both partitions.
+        gap_count: Gaps counted so far.
+        overlap_count: Overlapping timestamps dropped so far.
+        validation_csv_bytes: Size of the validation CSV after the last write.
+        version: Index format version.
+    """
+
+    sources: dict[str, SourceFingerprint]
+    last_timestamp: datetime
+    median_delta_ns: int
+    columns: list[str]
+    total_rows: int
+    gap_count: int
+    overlap_count: int
+    validation_csv_bytes: int
+    version: str = SOURCE_INDEX_VERSION
+
+    @classmethod
+    def load(cls, symbol_output_path: Path) -> "SourceIndex | None":
+        """Load a symbol's index, or None if missing or unreadable."""
+        index_path = Path(symbol_output_path) / SOURCE_INDEX_FILE
+        if not index_path.exists():
+            return None
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != SOURCE_INDEX_VERSION:
+                logger.info("Source index %s has an old version", index_path)
+                return None
+            sources = data.pop("sources")
+            return cls(
+                sources={
+                    name: SourceFingerprint(**record)
+                    for name, record in sources.items()
+                },
+                last_timestamp=datetime.fromisoformat(data.pop("last_timestamp")),
+                **data,
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Failed to read source index %s: %s", index_path, e)
+            return None
+
+    def save(self, symbol_output_path: Path) -> Path:
+        """Write the index atomically next to the symbol's outputs."""
+        index_path = Path(symbol_output_path) / SOURCE_INDEX_FILE
+        data = asdict(self)
+        data["last_timestamp"] = self.last_timestamp.isoformat()
+        data["sources"] = dict(sorted(data["sources"].items()))
+        tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, index_path)
+        logger.debug("Wrote source index %s", index_path)
+        return index_path
+
+    def diff(self, files: list[Path]) -> SourceChanges:
+        """Classify the current raw files against the index.
+
+        Files with unchanged size and mtime are trusted without reading
+        them; otherwise the checksum decides between unchanged, grown
+        (recorded checksum matches the file's prefix) and rewritten.
+
+        Args:
+            files: Current raw CSV files of the symbol.
+
+        Returns:
+            SourceChanges for the files.
+        """
+        changes = SourceChanges()
+        names = {path.name for path in files}
+        changes.removed = sorted(set(self.sources) - names)
+
+        for path in sorted(files):
+            fingerprint = self.sources.get(path.name)
+            if fingerprint is None:
+                changes.new.append(path)
+            elif fingerprint.stat_matches(path):
+                changes.unchanged.append(path)
+            else:
+                size = path.stat().st_size
+                if size == fingerprint.size:
+                    unchanged = _compute_file_checksum(path) == fingerprint.checksum
+                    target = changes.unchanged if unchanged else changes.rewritten
+                elif size > fingerprint.size and (
+                    _prefix_checksum(path, fingerprint.size) == fingerprint.checksum
+                ):
+                    target = changes.grown
+                else:
+                    target = changes.rewritten
+                target.append(path)
+
+        logger.debug(
+            "Source changes: %d new, %d grown, %d rewritten, %d removed",
+            len(changes.new),
+            len(changes.grown),
+            len(changes.rewritten),
+            len(changes.removed),
+        )
+        return changes
@@ -0,0 +1,272 @@
+"""
+Batched multi-period indicator kernels for parameter sweeps.
+
+Each function takes one input series and a list of periods and returns a
+2-D (bars x periods) block, computed in one pass per indicator family
+instead of one pass per period:
+
+- EMA-based families (EMA, ATR, RSI) update every period's state in the
+  same walk over the bars (a numba loop when available, otherwise one
+  Polars query with an expression per period).
+- Rolling families (StochRSI, mean, std, z-score) evaluate every window in
+  one Polars query, sharing the input column.
+
+Values match the single-period functions in
+``src.backtest.vectorized_rolling_window`` and ``src.indicators.stats``
+(same recurrences, same warm-up), with missing warm-up values returned as
+NaN. Blocks are float32 by default to halve the memory of wide sweeps;
+pass ``dtype=np.float64`` for bit-identical values.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+import polars as pl
+
+# Optional numba JIT for the multi-period EMA recurrence
+_NUMBA_AVAILABLE = False
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    njit = None
+
+
+def _periods_array(periods: Sequence[int]) -> np.ndarray:
+    """Validate periods and return them as an int64 array."""
+    periods = np.asarray(list(periods), dtype=np.int64)
+    if periods.ndim != 1 or periods.size == 0:
+        raise ValueError("periods must be a non-empty sequence")
+    if (periods < 1).any():
+        raise ValueError(f"periods must be >= 1, got {periods.tolist()}")
+    return periods
+
+
+def _ema_loop(values: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """EMA recurrence for every alpha in one walk over the values.
+
+    Matches Polars ``ewm_mean(adjust=False)``: leading NaNs stay NaN and
+    the first finite value seeds the state. Interior NaNs are output as NaN
+    and leave the state unchanged; like Polars (``ignore_nulls=False``), the
+    state decays by (1 - alpha) per missing bar when the next value arrives.
+    """
+    n_bars = values.shape[0]
+    n_periods = alphas.shape[0]
+    out = np.empty((n_bars, n_periods), dtype=np.float64)
+    state = np.empty(n_periods, dtype=np.float64)
+    seeded = False
+    missing = 0
+    for i in range(n_bars):
+        x = values[i]
+        if np.isnan(x):
+            out[i, :] = np.nan
+            if seeded:
+                missing += 1
+            continue
+        if not seeded:
+            state[:] = x
+            seeded = True
+        elif missing == 0:
+            for j in range(n_periods):
+                # Same operation order as Polars, so results are bit-identical
+                state[j] = state[j] + alphas[j] * (x - state[j])
+        else:
+            for j in range(n_periods):
+                old_weight = (1.0 - alphas[j]) ** (missing + 1)
+                weight = alphas[j] / (old_weight + alphas[j])
+                state[j] = state[j] + weight * (x - state[j])
+            missing = 0
+        out[i, :] = state
+    return out
+
+
+if _NUMBA_AVAILABLE:
+    _ema_loop_jit = njit(cache=True, nogil=True)(_ema_loop)
+else:
+    _ema_loop_jit = None
+
+
+def _ema_polars(values: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    """Fallback: one Polars query with an EMA expression per period."""
+    source = pl.Series("x", values, nan_to_null=True)
+    block = pl.DataFrame(source).select(
+        pl.col("x").ewm_mean(span=int(p), adjust=False).alias(str(k))
+        for k, p in enumerate(periods)
+    )
+    return block.to_numpy().astype(np.float64, copy=False)
+
+
+def _ema_matrix(values: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    """Float64 EMA block (numba loop, or the Polars fallback)."""
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if _ema_loop_jit is not None:
+        alphas = 2.0 / (periods.astype(np.float64) + 1.0)
+        return _ema_loop_jit(values, alphas)
+    return _ema_polars(values, periods)
+
+
+def _rolling_block(
+    values: np.ndarray,
+    periods: np.ndarray,
+    expression,
+) -> np.ndarray:
+    """Evaluate ``expression(col, period)`` for every period in one query."""
+    source = pl.Series("x", np.asarray(values, dtype=np.float64), nan_to_null=True)
+    block = pl.DataFrame(source).select(
+        expression(pl.col("x"), int(p)).alias(str(k)) for k, p in enumerate(periods)
+    )
+    return block.to_numpy().astype(np.float64, copy=False)
+
+
+def ema_block(
+    values: np.ndarray,
+    periods: Sequence[int],
+    dtype: np.dtype = np.float32,
+) -> np.ndarray:
+    """Exponential moving averages for several periods.
+
+    Args:
+        values: Input series (e.g. close prices).
+        periods: EMA periods (span; alpha = 2 / (period + 1)).
+        dtype: Output dtype.
+
+    Returns:
+        Array of shape (len(values), len(periods)).
+
+    Raises:
+        ValueError: If periods is empty or contains a period < 1.
+    """
+    periods = _periods_array(periods)
+    return _ema_matrix(values, periods).astype(dtype, copy=False)
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range; the first bar (no previous close) uses high - low."""
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    prev_close = np.r_[np.nan, np.asarray(close, dtype=np.float64)[:-1]]
+    # fmax skips the NaN gaps of the first bar, like max_horizontal skips nulls
+    return np.fmax(
+        high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+
+
+def atr_block(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    periods: Sequence[int],
+    dtype: np.dtype = np.float32,
+) -> np.ndarray:
+    """Average true range (EMA of the true range) for several periods.
+
+    Args:
+        high: High prices.
+        low: Low prices.
+        close: Close prices.
+        periods: ATR periods.
+        dtype: Output dtype.
+
+    Returns:
+        Array of shape (len(close), len(periods)).
+    """
+    periods = _periods_array(periods)
+    return _ema_matrix(true_range(high, low, close), periods).astype(dtype, copy=False)
+
+
+def rsi_block(
+    values: np.ndarray,
+    periods: Sequence[int],
+    dtype: np.dtype = np.float32,
+) -> np.ndarray:
+    """Relative strength index for several periods.
+
+    Gains and losses are smoothed with the EMA recurrence (as in
+    calculate_rsi); the first bar has no change and is NaN.
+
+    Args:
+        values: Input series (e.g. close prices).
+        periods: RSI periods.
+        dtype: Output dtype.
+
+    Returns:
+        Array of shape (len(values), len(periods)).
+    """
+    periods = _periods_array(periods)
+    delta = np.diff(np.asarray(values, dtype=np.float64), prepend=np.nan)
+    avg_gain = _ema_matrix(np.clip(delta, 0, None), periods)
+    avg_loss = _ema_matrix(np.abs(np.clip(delta, None, 0)), periods)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    rsi = np.where(avg_loss == 0, 100.0, rsi)
+    return rsi.astype(dtype, copy=False)
+
+
+def _stoch_expression(col: pl.Expr, period: int) -> pl.Expr:
+    rsi_min = col.rolling_min(window_size=period)
+    rsi_max = col.rolling_max(window_size=period)
+    return (
+        pl.when(rsi_max == rsi_min)
+        .then(0.5)
+        .otherwise((col - rsi_min) / (rsi_max - rsi_min))
+    )
+
+
+def stoch_rsi_block(
+    rsi: np.ndarray,
+    periods: Sequence[int],
+    dtype: np.dtype = np.float32,
+) -> np.ndarray:
+    """Stochastic RSI of one RSI series for several lookback periods.
+
+    Args:
+        rsi: RSI series (NaN during its warm-up).
+        periods: Stochastic lookback periods.
+        dtype: Output dtype.
+
+    Returns:
+        Array of shape (len(rsi), len(periods)); flat windows are 0.5.
+    """
+    periods = _periods_array(periods)
+    return _rolling_block(rsi, periods, _stoch_expression).astype(dtype, copy=False)
+
+
+def rolling_mean_block(
+    values: np.ndarray,
+    periods: Sequence[int],
+    dtype: np.dtype = np.float32,
+) -> np.ndarray:
+    """Rolling means (simple moving averages) for several windows."""
+    periods = _periods_array(periods)
+    return _rolling_block(
+        values, periods, lambda col, p: col.rolling_mean(window_size=p)
+    ).astype(dtype, copy=False)
+
+
+def rolling_std_block(
+    values: np.ndarray,
+    periods: Sequence[int],
+    dtype: np.dtype = np.float32,
+) -> np.ndarray:
+    """Rolling sample standard deviations for several windows."""
+    periods = _periods_array(periods)
+    return _rolling_block(
+        values, periods, lambda col, p: col.rolling_std(window_size=p)
+    ).astype(dtype, copy=False)
+
+
+def _zscore_expression(col: pl.Expr, period: int) -> pl.Expr:
+    mean = col.rolling_mean(window_size=period)
+    std = col.rolling_std(window_size=period)
+    return ((col - mean) / std).fill_nan(0.0)
+
+
+def zscore_block(
+    values: np.ndarray,
+    periods: Sequence[int],
+    dtype: np.dtype = np.float32,
+) -> np.ndarray:
+    """Rolling z-scores for several windows (flat windows are 0)."""
+    periods = _periods_array(periods)
+    return _rolling_block(values, periods, _zscore_expression).astype(dtype, copy=False)
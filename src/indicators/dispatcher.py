@@ -5,19 +5,34 @@ Parses indicator definitions (e.g., "ema20", "zscore(20)") and dispatches
 to the appropriate calculation functions, preserving Polars performance.
 """
 
+import hashlib
+import inspect
 import logging
 import re
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import polars as pl
 
+from src.backtest.indicator_cache import IndicatorCache, make_indicator_key
 from src.backtest.vectorized_rolling_window import (
     calculate_atr,
     calculate_ema,
     calculate_rsi,
     calculate_stoch_rsi,
 )
+from src.data_io.resample_cache import compute_data_hash
+from src.indicators.batched import (
+    atr_block,
+    ema_block,
+    rolling_mean_block,
+    rolling_std_block,
+    rsi_block,
+    stoch_rsi_block,
+    zscore_block,
+)
 from src.indicators.stats import (
     calculate_rolling_mean,
     calculate_rolling_std,
@@ -132,12 +147,135 @@ def _parse_value(val_str: str) -> int | float | str:
         return val_str
 
 
+# Raw price columns covered by the source data hash
+OHLCV_COLUMNS = frozenset({"open", "high", "low", "close", "volume"})
+
+
+def _column_digest(series: pl.Series) -> str:
+    """Content hash of a column, used to key indicators on derived inputs."""
+    return hashlib.sha256(series.to_numpy().tobytes()).hexdigest()[:16]
+
+
+def source_data_hash(df: pl.DataFrame, timestamp_col: str = "timestamp_utc") -> str:
+    """Hash of the source data: span/row-count hash plus OHLCV contents.
+
+    compute_data_hash alone only covers the first/last timestamps and row
+    count, which is not enough for a persistent cache shared across runs.
+    Hashing the contents is linear in the frame size, so callers that run
+    many indicator passes over one frame compute it once and pass it to
+    calculate_indicators as data_hash.
+
+    Args:
+        df: Source Polars DataFrame.
+        timestamp_col: Timestamp column name.
+
+    Returns:
+        16-character hex digest.
+    """
+    digest = hashlib.sha256(compute_data_hash(df, timestamp_col).encode())
+    for column in sorted(OHLCV_COLUMNS & set(df.columns)):
+        digest.update(df[column].to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _prepare_stoch_rsi(columns: list[str], kwargs: dict[str, Any]) -> int | None:
+    """Resolve stoch_rsi kwargs in place.
+
+    Args:
+        columns: Columns already present in the frame.
+        kwargs: Indicator kwargs (modified in place).
+
+    Returns:
+        RSI period to compute into an "rsi" column first, or None if an
+        existing RSI column is used.
+    """
+    # Map stoch_period -> period for the stoch calculation
+    if "stoch_period" in kwargs:
+        kwargs["period"] = kwargs.pop("stoch_period")
+
+    # Handle rsi_period for base RSI calculation
+    # We pop it so it's not passed to calculate_stoch_rsi
+    rsi_period = kwargs.pop("rsi_period", 14)
+
+    if "rsi_col" in kwargs:
+        return None
+
+    # Look for existing RSI column with matching period
+    # Heuristic: try "rsi" or "rsi{rsi_period}"
+    candidates = ["rsi", f"rsi{rsi_period}"]
+    found_col = next((c for c in candidates if c in columns), None)
+
+    if not found_col:
+        # Fallback: check any column starting with "rsi"
+        rsi_cols = [col for col in columns if col.startswith("rsi")]
+        if rsi_cols:
+            found_col = rsi_cols[0]
+
+    if found_col:
+        kwargs["rsi_col"] = found_col
+        return None
+
+    # Calculate base RSI
+    # We MUST output to "rsi" column because generate_signals_vectorized
+    # expects "rsi" to exist.
+    kwargs["rsi_col"] = "rsi"
+    return rsi_period
+
+
+def _resolve_indicator(
+    ind_str: str,
+    overrides: dict[str, dict[str, Any]],
+    custom_registry: dict[str, Callable] | None,
+    use_gpu: bool,
+) -> tuple[str, IndicatorFunc, dict[str, Any]] | None:
+    """Parse an indicator string and resolve its function and kwargs.
+
+    Returns:
+        Tuple of (name, function, kwargs), or None if the indicator is unknown.
+    """
+    name, kwargs = parse_indicator_string(ind_str)
+
+    # Pass use_gpu flag
+    kwargs["use_gpu"] = use_gpu
+
+    # Apply overrides if present
+    # matching either the full string (rare) or the parsed name
+    if ind_str in overrides:
+        kwargs.update(overrides[ind_str])
+    elif name in overrides:
+        kwargs.update(overrides[name])
+
+    logger.info("Parsing indicator: %s -> name=%s, kwargs=%s", ind_str, name, kwargs)
+
+    if custom_registry and name in custom_registry:
+        func = custom_registry[name]
+        logger.debug("Using custom indicator for '%s' -> %s", name, func)
+    elif name in REGISTRY:
+        func = REGISTRY[name]
+    else:
+        logger.warning(
+            "Unknown indicator '%s' (parsed from '%s'). Registry: %s",
+            name,
+            ind_str,
+            list(REGISTRY.keys()),
+        )
+        return None
+    # Pass the original indicator string as output_col to preserve naming
+    # (e.g., rsi14 instead of just rsi)
+    if "output_col" not in kwargs:
+        kwargs["output_col"] = ind_str
+    return name, func, kwargs
+
+
 def calculate_indicators(
     df: pl.DataFrame,
     indicators: list[str],
     overrides: dict[str, dict[str, Any]] | None = None,
     custom_registry: dict[str, Callable] | None = None,
     use_gpu: bool = False,
+    cache: IndicatorCache | None = None,
+    timestamp_col: str = "timestamp_utc",
+    data_hash: str | None = None,
 ) -> pl.DataFrame:
     """
     Calculate a list of indicators and append them to the DataFrame.
@@ -148,6 +286,12 @@ def calculate_indicators(
         overrides: Optional dict mapping indicator strings to parameter overrides.
                    e.g. {"fast_ema": {"period": 10}}
         use_gpu: Whether to use GPU acceleration.
+        cache: Optional IndicatorCache. Each indicator's output columns are
+               keyed by the source data hash plus its normalized name and
+               kwargs, and reused instead of recomputed.
+        timestamp_col: Timestamp column used for the source data hash.
+        data_hash: Precomputed source_data_hash of df's raw columns; computed
+                   here (a full pass over the OHLCV columns) if omitted.
 
     Returns:
         DataFrame with all calculated indicator columns.
@@ -158,85 +302,385 @@ def calculate_indicators(
     if overrides is None:
         overrides = {}
 
-    for ind_str in indicators:
-        try:
-            name, kwargs = parse_indicator_string(ind_str)
-
-            # Pass use_gpu flag
-            kwargs["use_gpu"] = use_gpu
+    if cache is not None:
+        if timestamp_col in df.columns:
+            if data_hash is None:
+                data_hash = source_data_hash(df, timestamp_col)
+        else:
+            logger.debug("No '%s' column; indicator cache disabled", timestamp_col)
+            cache = None
 
-            # Apply overrides if present
-            # Apply overrides if present
-            # matching either the full string (rare) or the parsed name
-            if ind_str in overrides:
-                kwargs.update(overrides[ind_str])
-            elif name in overrides:
-                kwargs.update(overrides[name])
+    # Derived column -> cache key of the indicator that produced it
+    column_keys: dict[str, str] = {}
 
-            logger.info(
-                "Parsing indicator: %s -> name=%s, kwargs=%s", ind_str, name, kwargs
-            )
-
-            if custom_registry and name in custom_registry:
-                func = custom_registry[name]
-                logger.debug("Using custom indicator for '%s' -> %s", name, func)
-            elif name in REGISTRY:
-                func = REGISTRY[name]
-            else:
-                logger.warning(
-                    "Unknown indicator '%s' (parsed from '%s'). Registry: %s",
-                    name,
-                    ind_str,
-                    list(REGISTRY.keys()),
-                )
+    for ind_str in indicators:
+        try:
+            resolved = _resolve_indicator(ind_str, overrides, custom_registry, use_gpu)
+            if resolved is None:
                 continue
-            # Pass the original indicator string as output_col to preserve naming
-            # (e.g., rsi14 instead of just rsi)
-            if "output_col" not in kwargs:
-                kwargs["output_col"] = ind_str
+            name, func, kwargs = resolved
 
             # Special handling for stoch_rsi
+            base_rsi_period = None
             if name in ("stoch_rsi", "stochrsi"):
-                # Map stoch_period -> period for the stoch calculation
-                if "stoch_period" in kwargs:
-                    kwargs["period"] = kwargs.pop("stoch_period")
-
-                # Handle rsi_period for base RSI calculation
-                # We pop it so it's not passed to calculate_stoch_rsi
-                rsi_period = kwargs.pop("rsi_period", 14)
-
-                if "rsi_col" not in kwargs:
-                    # Look for existing RSI column with matching period
-                    # Heuristic: try "rsi" or "rsi{rsi_period}"
-                    candidates = ["rsi", f"rsi{rsi_period}"]
-                    found_col = next((c for c in candidates if c in df.columns), None)
-
-                    if not found_col:
-                        # Fallback: check any column starting with "rsi"
-                        rsi_cols = [col for col in df.columns if col.startswith("rsi")]
-                        if rsi_cols:
-                            found_col = rsi_cols[0]
-
-                    if not found_col:
-                        # Calculate base RSI
-                        # We MUST output to "rsi" column because generate_signals_vectorized
-                        # expects "rsi" to exist.
-                        logger.info(
-                            "Calculating base RSI for stoch_rsi with period %s",
-                            rsi_period,
-                        )
-                        rsi_out_col = "rsi"
-                        df = REGISTRY["rsi"](
-                            df, period=rsi_period, output_col=rsi_out_col
-                        )
-                        kwargs["rsi_col"] = rsi_out_col
-                    else:
-                        kwargs["rsi_col"] = found_col
+                base_rsi_period = _prepare_stoch_rsi(df.columns, kwargs)
+
+            def compute(
+                source: pl.DataFrame,
+                func=func,
+                kwargs=kwargs,
+                base_rsi_period=base_rsi_period,
+            ) -> pl.DataFrame:
+                if base_rsi_period is not None:
+                    logger.info(
+                        "Calculating base RSI for stoch_rsi with period %s",
+                        base_rsi_period,
+                    )
+                    source = REGISTRY["rsi"](
+                        source, period=base_rsi_period, output_col="rsi"
+                    )
+                return func(source, **kwargs)
+
+            if cache is None:
+                df = compute(df)
+                continue
+
+            # Key on function identity, kwargs, and the provenance of any
+            # derived input columns the indicator reads
+            key_kwargs = dict(kwargs)
+            key_kwargs["_func"] = f"{func.__module__}.{func.__qualname__}"
+            key_kwargs["_base_rsi_period"] = base_rsi_period
+            for arg, value in kwargs.items():
+                if arg == "output_col" or not isinstance(value, str):
+                    continue
+                if value in column_keys:
+                    key_kwargs[f"_source_{arg}"] = column_keys[value]
+                elif value in df.columns and value not in OHLCV_COLUMNS:
+                    key_kwargs[f"_source_{arg}"] = _column_digest(df[value])
+            key = make_indicator_key(data_hash, name, key_kwargs, cache.dataset_id)
+
+            def compute_new_columns(df=df, compute=compute, kwargs=kwargs):
+                out = compute(df)
+                return out.select(
+                    [
+                        c
+                        for c in out.columns
+                        if c not in df.columns or c == kwargs["output_col"]
+                    ]
+                )
 
-            df = func(df, **kwargs)
+            new_columns = cache.get_or_compute(key, compute_new_columns)
+            df = df.with_columns(new_columns.get_columns())
+            for column in new_columns.columns:
+                column_keys[column] = key
 
         except (ValueError, TypeError, pl.exceptions.PolarsError) as e:
             logger.error("Failed to calculate indicator '%s': %s", ind_str, e)
             continue
 
     return df
+
+
+# Price columns every backtest reads (fills, stops and ATR use the full bar)
+BAR_COLUMNS = ("open", "high", "low", "close")
+
+
+@dataclass(frozen=True)
+class IndicatorRequirements:
+    """Source data an indicator list needs.
+
+    Attributes:
+        columns: Raw OHLCV columns read, or None if unknown (custom
+            indicators may read any column).
+        lookback: Longest chain of periods feeding one output (e.g. RSI
+            period + stochastic period), in bars.
+    """
+
+    columns: frozenset[str] | None
+    lookback: int
+
+
+def indicator_requirements(
+    indicators: list[str],
+    overrides: dict[str, dict[str, Any]] | None = None,
+    custom_registry: dict[str, Callable] | None = None,
+) -> IndicatorRequirements:
+    """Derive the raw columns and lookback of a list of indicators.
+
+    Columns come from the indicators' column arguments (after overrides and
+    signature defaults) on top of the OHLC bar, so e.g. volume is only read
+    when an indicator is computed on it.
+
+    Args:
+        indicators: Indicator definition strings (as for calculate_indicators).
+        overrides: Optional parameter overrides per indicator.
+        custom_registry: Optional strategy-specific indicator functions.
+
+    Returns:
+        IndicatorRequirements for the list.
+    """
+    columns: set[str] | None = set(BAR_COLUMNS)
+    lookback = 0
+    for ind_str in indicators:
+        resolved = _resolve_indicator(
+            ind_str, overrides or {}, custom_registry, use_gpu=False
+        )
+        if resolved is None:
+            continue
+        name, func, kwargs = resolved
+        if custom_registry and name in custom_registry:
+            columns = None
+        params = {
+            param.name: param.default
+            for param in inspect.signature(func).parameters.values()
+            if param.default is not inspect.Parameter.empty
+        }
+        params.update(kwargs)
+        if name in ("stoch_rsi", "stochrsi"):
+            params.setdefault("rsi_period", 14)
+            params["period"] = params.pop("stoch_period", params.get("period"))
+        lookback = max(
+            lookback,
+            sum(
+                value
+                for key, value in params.items()
+                if key.endswith("period") and isinstance(value, int)
+            ),
+        )
+        if columns is not None:
+            columns.update(
+                value
+                for value in params.values()
+                if isinstance(value, str) and value in OHLCV_COLUMNS
+            )
+    return IndicatorRequirements(
+        columns=frozenset(columns) if columns is not None else None,
+        lookback=lookback,
+    )
+
+
+@dataclass
+class IndicatorVariants:
+    """Indicator columns for many override sets, in one frame.
+
+    Attributes:
+        frame: Source columns plus every distinct indicator column, named
+            ``<output_col>__<k>``.
+        source_columns: Columns of the input frame.
+        mappings: Per variant, output column name -> column of ``frame``.
+    """
+
+    frame: pl.DataFrame
+    source_columns: list[str]
+    mappings: list[dict[str, str]]
+
+    def __len__(self) -> int:
+        return len(self.mappings)
+
+    def variant(self, index: int) -> pl.DataFrame:
+        """The frame calculate_indicators returns for one override set.
+
+        Columns are shared with ``frame``, not copied.
+        """
+        mapping = self.mappings[index]
+        return self.frame.select(
+            [pl.col(c) for c in self.source_columns if c not in mapping]
+            + [pl.col(column).alias(name) for name, column in mapping.items()]
+        )
+
+
+def _compute_columns(
+    func: IndicatorFunc,
+    source: pl.DataFrame,
+    kwargs: dict[str, Any],
+    period: Any,
+    base_rsi_period: int | None,
+) -> dict[str, pl.Series]:
+    """New columns of one indicator call, as calculate_indicators caches them."""
+    call_kwargs = dict(kwargs)
+    if period is not None:
+        call_kwargs["period"] = period
+    existing = set(source.columns)
+    if base_rsi_period is not None:
+        source = REGISTRY["rsi"](source, period=base_rsi_period, output_col="rsi")
+    out = func(source, **call_kwargs)
+    return {
+        c: out[c]
+        for c in out.columns
+        if c not in existing or c == call_kwargs["output_col"]
+    }
+
+
+def _batched_columns(
+    func: IndicatorFunc,
+    source: pl.DataFrame,
+    kwargs: dict[str, Any],
+    variants: list[tuple[Any, int | None]],
+) -> list[dict[str, pl.Series]] | None:
+    """New columns of a built-in indicator for several periods at once.
+
+    Args:
+        func: Single-period indicator function.
+        source: Frame holding the indicator's input columns.
+        kwargs: Kwargs shared by the variants (period excluded).
+        variants: (period, base RSI period) of each variant.
+
+    Returns:
+        New columns per variant, or None if the function has no batched
+        kernel (or GPU execution was requested).
+    """
+    periods = [period for period, _ in variants]
+    if kwargs.get("use_gpu") or any(not isinstance(p, int) for p in periods):
+        return None
+    # Reject kwargs the single-period function would reject
+    inspect.signature(func).bind(source, period=periods[0], **kwargs)
+    output_col = kwargs["output_col"]
+
+    def values(name: str) -> np.ndarray:
+        return source[name].cast(pl.Float64).to_numpy()
+
+    def columns(block: np.ndarray, distinct: list[int]) -> list[dict[str, pl.Series]]:
+        position = {p: k for k, p in enumerate(distinct)}
+        return [
+            {output_col: pl.Series(output_col, block[:, position[p]], nan_to_null=True)}
+            for p in periods
+        ]
+
+    distinct = sorted(set(periods))
+    column = kwargs.get("column", "close")
+    kernels = {
+        calculate_ema: ema_block,
+        calculate_rsi: rsi_block,
+        calculate_zscore: zscore_block,
+        calculate_rolling_mean: rolling_mean_block,
+        calculate_rolling_std: rolling_std_block,
+    }
+    if func in kernels:
+        return columns(kernels[func](values(column), distinct, np.float64), distinct)
+    if func is calculate_atr:
+        high, low, close = (values(c) for c in ("high", "low", "close"))
+        return columns(atr_block(high, low, close, distinct, np.float64), distinct)
+    if func is not calculate_stoch_rsi:
+        return None
+
+    # StochRSI: one RSI block over the base periods, then one stoch block
+    # per RSI series
+    rsi_series: dict[int | None, np.ndarray] = {}
+    bases = sorted({base for _, base in variants if base is not None})
+    if bases:
+        # The base RSI is computed on close (see calculate_indicators)
+        block = rsi_block(values("close"), bases, np.float64)
+        rsi_series.update({base: block[:, k] for k, base in enumerate(bases)})
+    if any(base is None for _, base in variants):
+        rsi_series[None] = values(kwargs["rsi_col"])
+
+    stoch: dict[tuple[int, int | None], np.ndarray] = {}
+    for base, rsi in rsi_series.items():
+        windows = sorted({p for p, b in variants if b == base})
+        block = stoch_rsi_block(rsi, windows, np.float64)
+        stoch.update({(p, base): block[:, k] for k, p in enumerate(windows)})
+
+    outputs = []
+    for period, base in variants:
+        new = {}
+        if base is not None:
+            new["rsi"] = pl.Series("rsi", rsi_series[base], nan_to_null=True)
+        new[output_col] = pl.Series(output_col, stoch[(period, base)], nan_to_null=True)
+        outputs.append(new)
+    return outputs
+
+
+def calculate_indicator_variants(
+    df: pl.DataFrame,
+    indicators: list[str],
+    override_sets: list[dict[str, dict[str, Any]]],
+    custom_registry: dict[str, Callable] | None = None,
+    use_gpu: bool = False,
+) -> IndicatorVariants:
+    """Calculate indicators for many override sets at once.
+
+    Override sets whose kwargs differ only in ``period`` are computed
+    together by the batched kernels (one pass per indicator family, see
+    src.indicators.batched); identical kwargs share one column. Indicators
+    without a batched kernel are computed once per distinct kwargs.
+
+    Args:
+        df: Input Polars DataFrame.
+        indicators: List of indicator definition strings.
+        override_sets: One overrides dict (as for calculate_indicators)
+            per variant.
+        custom_registry: Optional strategy-specific indicator functions.
+        use_gpu: Whether to use GPU acceleration (disables batching).
+
+    Returns:
+        IndicatorVariants; ``variant(i)`` equals calculate_indicators(df,
+        indicators, override_sets[i], ...).
+    """
+    mappings: list[dict[str, str]] = [{} for _ in override_sets]
+    new_columns: dict[str, pl.Series] = {}
+    versions: dict[str, int] = {}
+
+    for ind_str in indicators:
+        # Variants grouped by everything except period (and base RSI period)
+        groups: dict[str, tuple] = {}
+        for v, overrides in enumerate(override_sets):
+            resolved = _resolve_indicator(
+                ind_str, overrides or {}, custom_registry, use_gpu
+            )
+            if resolved is None:
+                continue
+            name, func, kwargs = resolved
+            base_rsi_period = None
+            if name in ("stoch_rsi", "stochrsi"):
+                base_rsi_period = _prepare_stoch_rsi(
+                    df.columns + list(mappings[v]), kwargs
+                )
+            period = kwargs.pop("period", None)
+            # Derived input columns come from this variant's earlier outputs
+            inputs = {
+                value: mappings[v][value]
+                for arg, value in kwargs.items()
+                if arg != "output_col"
+                and isinstance(value, str)
+                and value in mappings[v]
+            }
+            key = repr(
+                (
+                    f"{func.__module__}.{func.__qualname__}",
+                    sorted(kwargs.items()),
+                    sorted(inputs.items()),
+                )
+            )
+            group = groups.setdefault(key, (func, kwargs, inputs, {}))
+            group[3].setdefault((period, base_rsi_period), []).append(v)
+
+        frame = df.with_columns(new_columns.values()) if new_columns else df
+        for func, kwargs, inputs, members in groups.values():
+            source = frame.with_columns(
+                pl.col(column).alias(name) for name, column in inputs.items()
+            )
+            variants = list(members)
+            try:
+                outputs = _batched_columns(func, source, kwargs, variants)
+                if outputs is None:
+                    outputs = [
+                        _compute_columns(func, source, kwargs, period, base)
+                        for period, base in variants
+                    ]
+            except (ValueError, TypeError, pl.exceptions.PolarsError) as e:
+                logger.error("Failed to calculate indicator '%s': %s", ind_str, e)
+                continue
+            for variant, columns in zip(variants, outputs):
+                names = {}
+                for name, series in columns.items():
+                    version = versions.get(name, 0)
+                    versions[name] = version + 1
+                    names[name] = f"{name}__{version}"
+                    new_columns[names[name]] = series.alias(names[name])
+                for v in members[variant]:
+                    mappings[v].update(names)
+
+    frame = df.with_columns(new_columns.values()) if new_columns else df
+    return IndicatorVariants(
+        frame=frame, source_columns=list(df.columns), mappings=mappings
+    )
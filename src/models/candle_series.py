@@ -0,0 +1,248 @@
+"""Columnar, lazily indexed candle sequence.
+
+CandleSeries wraps an enriched Polars DataFrame and implements the sequence
+protocol that candle-based ``generate_signals`` implementations expect
+(``len``, indexing, negative indexing, slicing, iteration). Each access
+returns a lightweight ``CandleView`` that reads its fields straight from
+the column buffers, so no per-row ``Candle`` objects or ``indicators``
+dicts are materialized up front.
+
+CandleView mirrors the ``Candle`` interface: ``timestamp_utc``, OHLCV
+fields, ``indicators`` (a read-only mapping of every non-OHLCV column),
+``is_gap``, and the semantic indicator properties (``fast_ema``, ``atr``,
+...). Null values read as ``None``, matching ``DataFrame.to_dicts()``.
+
+Examples:
+    >>> import polars as pl
+    >>> from datetime import datetime, timezone
+    >>> df = pl.DataFrame({
+    ...     "timestamp_utc": [datetime(2025, 1, 1, tzinfo=timezone.utc)],
+    ...     "open": [1.1], "high": [1.2], "low": [1.0], "close": [1.15],
+    ...     "volume": [100.0], "atr14": [0.01],
+    ... })
+    >>> candles = CandleSeries(df)
+    >>> candles[-1].close
+    1.15
+    >>> candles[0].indicators.get("atr14")
+    0.01
+"""
+
+from collections.abc import Iterator, Mapping, Sequence
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import polars as pl
+
+from src.models.core import Candle
+
+# Columns exposed as Candle fields rather than indicators
+BASE_COLUMNS = ("timestamp_utc", "open", "high", "low", "close", "volume")
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+
+
+class _Column:
+    """NumPy buffer plus null mask for one column."""
+
+    __slots__ = ("values", "nulls")
+
+    def __init__(self, series: pl.Series):
+        self.nulls = series.is_null().to_numpy() if series.null_count() else None
+        self.values = series.to_numpy()
+
+    def get(self, row: int) -> Any:
+        if self.nulls is not None and self.nulls[row]:
+            return None
+        return self.values.item(row)
+
+
+class _TimestampColumn:
+    """Datetime column stored as int64 microseconds since the epoch."""
+
+    __slots__ = ("micros", "tz")
+
+    def __init__(self, series: pl.Series):
+        self.micros = series.dt.cast_time_unit("us").to_physical().to_numpy()
+        time_zone = getattr(series.dtype, "time_zone", None)
+        self.tz = ZoneInfo(time_zone) if time_zone else None
+
+    def get(self, row: int) -> datetime:
+        delta = timedelta(microseconds=int(self.micros[row]))
+        if self.tz is None:
+            return _EPOCH_NAIVE + delta
+        return (_EPOCH_UTC + delta).astimezone(self.tz)
+
+
+class CandleIndicators(Mapping):
+    """Read-only indicator mapping for one row (replaces the per-row dict)."""
+
+    __slots__ = ("_series", "_row")
+
+    def __init__(self, series: "CandleSeries", row: int):
+        self._series = series
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        column = self._series._indicator_columns.get(
+            key
+        )  # pylint: disable=protected-access
+        if column is None:
+            raise KeyError(key)
+        return column.get(self._row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._series._indicator_columns)  # pylint: disable=protected-access
+
+    def __len__(self) -> int:
+        return len(self._series._indicator_columns)  # pylint: disable=protected-access
+
+    def __repr__(self) -> str:
+        return f"CandleIndicators({dict(self)!r})"
+
+
+class CandleView:
+    """Lazy, Candle-compatible view of one row of a CandleSeries."""
+
+    __slots__ = ("_series", "_row")
+
+    is_gap = False
+
+    def __init__(self, series: "CandleSeries", row: int):
+        self._series = series
+        self._row = row
+
+    @property
+    def timestamp_utc(self) -> datetime:
+        return self._series._timestamps.get(
+            self._row
+        )  # pylint: disable=protected-access
+
+    @property
+    def open(self) -> float:
+        return self._series._base["open"].get(
+            self._row
+        )  # pylint: disable=protected-access
+
+    @property
+    def high(self) -> float:
+        return self._series._base["high"].get(
+            self._row
+        )  # pylint: disable=protected-access
+
+    @property
+    def low(self) -> float:
+        return self._series._base["low"].get(
+            self._row
+        )  # pylint: disable=protected-access
+
+    @property
+    def close(self) -> float:
+        return self._series._base["close"].get(
+            self._row
+        )  # pylint: disable=protected-access
+
+    @property
+    def volume(self) -> float:
+        return self._series._base["volume"].get(
+            self._row
+        )  # pylint: disable=protected-access
+
+    @property
+    def indicators(self) -> CandleIndicators:
+        return CandleIndicators(self._series, self._row)
+
+    # Same semantic accessors as Candle (they only read self.indicators)
+    ema20 = Candle.ema20
+    ema50 = Candle.ema50
+    fast_ema = Candle.fast_ema
+    slow_ema = Candle.slow_ema
+    atr = Candle.atr
+    rsi = Candle.rsi
+    stoch_rsi = Candle.stoch_rsi
+
+    def to_candle(self) -> Candle:
+        """Materialize an owning Candle for this row."""
+        return Candle(
+            timestamp_utc=self.timestamp_utc,
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+            indicators=dict(self.indicators),
+        )
+
+    def __repr__(self) -> str:
+        return f"CandleView(row={self._row}, timestamp_utc={self.timestamp_utc!r})"
+
+
+class CandleSeries(Sequence):
+    """Array-backed sequence of candles over an enriched Polars DataFrame.
+
+    Slices are views sharing the same column buffers.
+
+    Attributes:
+        columns: Indicator column names (every column except BASE_COLUMNS).
+    """
+
+    __slots__ = ("_timestamps", "_base", "_indicator_columns", "_rows")
+
+    def __init__(self, df: pl.DataFrame | None = None, *, _parent=None, _rows=None):
+        """Build a candle sequence over df.
+
+        Args:
+            df: DataFrame with timestamp_utc, open, high, low, close, volume
+                and any indicator columns.
+        """
+        if _parent is not None:
+            self._timestamps = _parent._timestamps
+            self._base = _parent._base
+            self._indicator_columns = _parent._indicator_columns
+            self._rows = _rows
+            return
+
+        self._timestamps = _TimestampColumn(df["timestamp_utc"])
+        self._base = {name: _Column(df[name]) for name in BASE_COLUMNS[1:]}
+        self._indicator_columns = {
+            name: _Column(df[name]) for name in df.columns if name not in BASE_COLUMNS
+        }
+        self._rows = range(len(df))
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._indicator_columns)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CandleSeries(_parent=self, _rows=self._rows[index])
+        return CandleView(self, self._rows[index])
+
+    def __iter__(self) -> Iterator[CandleView]:
+        for row in self._rows:
+            yield CandleView(self, row)
+
+    def column(self, name: str) -> np.ndarray:
+        """Raw NumPy buffer for a base or indicator column over this view.
+
+        Lets strategies that know about CandleSeries skip per-row access.
+        """
+        if name == "timestamp_utc":
+            values = self._timestamps.micros
+        elif name in self._base:
+            values = self._base[name].values
+        else:
+            values = self._indicator_columns[name].values
+        rows = self._rows
+        if rows.step == 1:
+            return values[rows.start : rows.stop]
+        return values[np.asarray(rows, dtype=np.int64)]
+
+    def to_candles(self) -> list[Candle]:
+        """Materialize owning Candle objects (legacy escape hatch)."""
+        return [view.to_candle() for view in self]
@@ -0,0 +1,220 @@
+"""Columnar (struct-of-arrays) batch of trade signals.
+
+SignalBatch holds every signal a vectorized strategy produced for one pair
+as columns of a Polars DataFrame - source row index, timestamp, direction,
+entry/stop/target prices, position size and a 64-bit signal ID - instead of
+one ``TradeSignal`` object per signal. Simulators read the NumPy columns
+directly; ``TradeSignal`` objects are only built when a caller indexes,
+iterates or calls ``to_signals()``.
+
+Examples:
+    >>> batch = generate_signal_batch(df, parameters)  # doctest: +SKIP
+    >>> batch.indices, batch.stop_prices               # doctest: +SKIP
+    >>> batch[0].id                                    # doctest: +SKIP
+    'c3a4e1f09b2d7e65'
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+import numpy as np
+import polars as pl
+
+from src.models.core import TradeSignal
+from src.strategy.id_factory import format_signal_id
+
+# Column schema of SignalBatch.frame (timestamp keeps its source dtype)
+BATCH_COLUMNS = (
+    "row_index",
+    "timestamp_utc",
+    "direction",
+    "entry_price",
+    "stop_price",
+    "target_price",
+    "position_size",
+    "signal_id",
+)
+
+_DIRECTION_NAMES = {1: "LONG", -1: "SHORT"}
+
+
+class SignalBatch(Sequence):
+    """Signals for one pair stored as columns.
+
+    Behaves as a read-only sequence of TradeSignal (materialized on
+    access); integer slices and ``filter`` return new batches.
+
+    Attributes:
+        frame: DataFrame with the BATCH_COLUMNS columns.
+        pair: Currency pair of every signal in the batch.
+        risk_per_trade_pct: Risk allocation shared by the batch.
+        tags: Tags shared by every signal (the lowercase direction is
+            appended per signal).
+        version: Strategy version identifier.
+    """
+
+    def __init__(
+        self,
+        frame: pl.DataFrame,
+        pair: str,
+        risk_per_trade_pct: float = 0.0,
+        tags: Sequence[str] = (),
+        version: str = "",
+    ):
+        """Wrap a signal frame.
+
+        Args:
+            frame: DataFrame with (at least) the BATCH_COLUMNS columns.
+            pair: Currency pair symbol.
+            risk_per_trade_pct: Risk allocation shared by the batch.
+            tags: Tags shared by every signal.
+            version: Strategy version identifier.
+
+        Raises:
+            ValueError: If required columns are missing.
+        """
+        missing = [c for c in BATCH_COLUMNS if c not in frame.columns]
+        if missing:
+            raise ValueError(f"Signal frame missing columns: {missing}")
+        self.frame = frame.select(BATCH_COLUMNS)
+        self.pair = pair
+        self.risk_per_trade_pct = risk_per_trade_pct
+        self.tags = tuple(tags)
+        self.version = version
+
+    # Columns as NumPy arrays
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Row index of each signal in the source DataFrame (int64)."""
+        return self.frame["row_index"].to_numpy()
+
+    @property
+    def timestamps(self) -> pl.Series:
+        """Signal timestamps (source column dtype)."""
+        return self.frame["timestamp_utc"]
+
+    @property
+    def directions(self) -> np.ndarray:
+        """Signal directions (int8: 1 = LONG, -1 = SHORT)."""
+        return self.frame["direction"].to_numpy()
+
+    @property
+    def entry_prices(self) -> np.ndarray:
+        """Proposed entry prices."""
+        return self.frame["entry_price"].to_numpy()
+
+    @property
+    def stop_prices(self) -> np.ndarray:
+        """Initial stop-loss prices."""
+        return self.frame["stop_price"].to_numpy()
+
+    @property
+    def target_prices(self) -> np.ndarray:
+        """Take-profit prices."""
+        return self.frame["target_price"].to_numpy()
+
+    @property
+    def position_sizes(self) -> np.ndarray:
+        """Position sizes in lots."""
+        return self.frame["position_size"].to_numpy()
+
+    @property
+    def ids(self) -> np.ndarray:
+        """64-bit signal IDs (uint64)."""
+        return self.frame["signal_id"].to_numpy()
+
+    def signal_id(self, position: int) -> str:
+        """Hex signal ID (TradeSignal.id) of the signal at ``position``."""
+        return format_signal_id(self.frame["signal_id"][position])
+
+    # Batch operations
+
+    def _with_frame(self, frame: pl.DataFrame) -> "SignalBatch":
+        return SignalBatch(
+            frame,
+            pair=self.pair,
+            risk_per_trade_pct=self.risk_per_trade_pct,
+            tags=self.tags,
+            version=self.version,
+        )
+
+    def filter(self, mask: Any) -> "SignalBatch":
+        """Batch of the signals where ``mask`` is True."""
+        return self._with_frame(self.frame.filter(pl.Series(np.asarray(mask, bool))))
+
+    def direction(self, direction: str) -> "SignalBatch":
+        """Batch of the ``"LONG"`` or ``"SHORT"`` signals only."""
+        value = 1 if direction == "LONG" else -1
+        return self._with_frame(self.frame.filter(pl.col("direction") == value))
+
+    def window(self, start: int, stop: int) -> "SignalBatch":
+        """Signals on source rows [start, stop), re-based to that row slice.
+
+        The result lines up with ``df.slice(start, stop - start)``.
+        """
+        frame = self.frame.filter(
+            (pl.col("row_index") >= start) & (pl.col("row_index") < stop)
+        ).with_columns(pl.col("row_index") - start)
+        return self._with_frame(frame)
+
+    @classmethod
+    def concat(cls, batches: Iterable["SignalBatch"]) -> "SignalBatch":
+        """Concatenate batches of the same pair (metadata of the first)."""
+        batches = list(batches)
+        if not batches:
+            raise ValueError("concat requires at least one SignalBatch")
+        frame = pl.concat([b.frame for b in batches], how="vertical")
+        return batches[0]._with_frame(frame)
+
+    # TradeSignal materialization
+
+    def _make_signal(self, row: tuple) -> TradeSignal:
+        _, timestamp, direction, entry, stop, target, size, signal_hash = row
+        name = _DIRECTION_NAMES[direction]
+        return TradeSignal(
+            id=format_signal_id(signal_hash),
+            pair=self.pair,
+            direction=name,
+            entry_price=entry,
+            initial_stop_price=stop,
+            target_price=target,
+            risk_per_trade_pct=self.risk_per_trade_pct,
+            calc_position_size=size,
+            tags=[*self.tags, name.lower()],
+            version=self.version,
+            timestamp_utc=timestamp,
+        )
+
+    def to_signals(self) -> list[TradeSignal]:
+        """Materialize every signal as a TradeSignal."""
+        return [self._make_signal(row) for row in self.frame.iter_rows()]
+
+    def __len__(self) -> int:
+        return self.frame.height
+
+    @overload
+    def __getitem__(self, index: int) -> TradeSignal: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "SignalBatch": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                positions = np.arange(start, stop, step)
+                return self._with_frame(self.frame[positions])
+            return self._with_frame(self.frame.slice(start, max(stop - start, 0)))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SignalBatch index out of range")
+        return self._make_signal(self.frame.row(index))
+
+    def __iter__(self) -> Iterator[TradeSignal]:
+        for row in self.frame.iter_rows():
+            yield self._make_signal(row)
+
+    def __repr__(self) -> str:
+        return f"SignalBatch(pair={self.pair!r}, signals={len(self)})"
@@ -30,6 +30,7 @@ from src.risk.blackout.holidays import (
     is_us_market_holiday,
 )
 from src.risk.blackout.windows import (
+    BlackoutIndex,
     BlackoutWindow,
     expand_news_windows,
     expand_session_windows,
@@ -54,6 +55,7 @@ __all__ = [
     # Data classes
     "NewsEvent",
     "BlackoutWindow",
+    "BlackoutIndex",
     "TradingSession",
     # Calendar generation
     "generate_nfp_events",
@@ -2,14 +2,19 @@
 Blackout window dataclass and window management functions.
 
 This module provides the core BlackoutWindow dataclass and functions for
-expanding, merging, and checking blackout windows.
+expanding, merging, and checking blackout windows, plus BlackoutIndex for
+vectorized membership checks over whole timestamp columns.
 """
 
 import logging
 from collections.abc import Sequence
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Literal
+from datetime import datetime, timedelta, timezone
+from typing import Any, Literal
+
+import numpy as np
+import pandas as pd
+import polars as pl
 
 from src.risk.blackout.calendar import NewsEvent
 from src.risk.blackout.config import NewsBlackoutConfig
@@ -174,16 +179,179 @@ def merge_overlapping_windows(
     return merged
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_epoch_ns(value: Any) -> int:
+    """Convert a datetime-like scalar to int64 nanoseconds since the epoch.
+
+    Naive datetimes and np.datetime64 values are treated as UTC.
+    """
+    if isinstance(value, np.datetime64):
+        return int(value.astype("datetime64[ns]").astype(np.int64))
+    if hasattr(value, "value") and hasattr(value, "tz_localize"):  # pd.Timestamp
+        return int(value.value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+    return int(value)
+
+
+def timestamps_to_epoch_ns(timestamps: Any) -> np.ndarray:
+    """Convert a timestamp column/array/sequence to int64 epoch nanoseconds.
+
+    Accepts Polars/pandas datetime columns (naive or tz-aware), datetime64
+    and integer arrays, and sequences of datetime-like scalars. Naive
+    values are treated as UTC.
+    """
+    if isinstance(timestamps, pl.Series):
+        if timestamps.dtype == pl.Datetime:
+            timestamps = timestamps.dt.cast_time_unit("ns")
+        return timestamps.to_physical().to_numpy().astype(np.int64, copy=False)
+    if getattr(getattr(timestamps, "dtype", None), "tz", None) is not None:
+        # pandas tz-aware column/index (asi8 is UTC epoch ns)
+        return pd.DatetimeIndex(timestamps).as_unit("ns").asi8.astype(np.int64)
+    array = np.asarray(timestamps)
+    if np.issubdtype(array.dtype, np.datetime64):
+        return array.astype("datetime64[ns]").astype(np.int64)
+    if np.issubdtype(array.dtype, np.integer):
+        return array.astype(np.int64, copy=False)
+    return np.fromiter((to_epoch_ns(t) for t in array), np.int64, len(array))
+
+
+@dataclass(frozen=True)
+class BlackoutIndex:
+    """
+    Sorted, non-overlapping blackout intervals for vectorized lookups.
+
+    Stores window bounds as int64 epoch nanoseconds so membership for a
+    whole timestamp column is one searchsorted pass: O(n log w) instead of
+    O(n * w). Bounds are inclusive, matching is_in_blackout.
+
+    Attributes:
+        starts: Sorted window start times (epoch ns).
+        ends: Matching window end times (epoch ns).
+
+    Example:
+        >>> from datetime import datetime, timezone
+        >>> index = BlackoutIndex.from_windows([
+        ...     (datetime(2023, 1, 6, 13, 0, tzinfo=timezone.utc),
+        ...      datetime(2023, 1, 6, 14, 0, tzinfo=timezone.utc)),
+        ... ])
+        >>> index.contains(np.array(['2023-01-06T13:30', '2023-01-06T15:00'],
+        ...                         dtype='datetime64[m]')).tolist()
+        [True, False]
+    """
+
+    starts: np.ndarray
+    ends: np.ndarray
+
+    @classmethod
+    def from_windows(cls, windows: Sequence[Any]) -> "BlackoutIndex":
+        """
+        Build an index from windows.
+
+        Overlapping or touching windows are merged with the same rule as
+        merge_overlapping_windows, so merged or unmerged input both work.
+
+        Args:
+            windows: BlackoutWindow objects or (start_utc, end_utc) tuples.
+
+        Returns:
+            BlackoutIndex over the union of the windows.
+        """
+        if not windows:
+            empty = np.array([], dtype=np.int64)
+            return cls(empty, empty)
+
+        bounds = np.array(
+            [
+                (to_epoch_ns(w.start_utc), to_epoch_ns(w.end_utc))
+                if isinstance(w, BlackoutWindow)
+                else (to_epoch_ns(w[0]), to_epoch_ns(w[1]))
+                for w in windows
+            ],
+            dtype=np.int64,
+        )
+        bounds = bounds[np.argsort(bounds[:, 0], kind="stable")]
+        starts, ends = bounds[:, 0], np.maximum.accumulate(bounds[:, 1])
+
+        # A window opens a new group when it starts after every prior end
+        new_group = np.empty(len(starts), dtype=bool)
+        new_group[0] = True
+        new_group[1:] = starts[1:] > ends[:-1]
+        group_starts = np.flatnonzero(new_group)
+        group_ends = np.append(group_starts[1:], len(starts)) - 1
+
+        return cls(starts[group_starts].copy(), ends[group_ends].copy())
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def contains(self, timestamps: Any) -> np.ndarray:
+        """
+        Vectorized membership test.
+
+        Args:
+            timestamps: np.datetime64 array, int64 epoch-ns array, Polars
+                Datetime Series, or sequence of datetimes (naive = UTC).
+
+        Returns:
+            Boolean array, True where the timestamp is inside a window.
+        """
+        ts = timestamps_to_epoch_ns(timestamps)
+        if len(self.starts) == 0 or len(ts) == 0:
+            return np.zeros(len(ts), dtype=bool)
+
+        # Last window starting at or before each timestamp
+        idx = np.searchsorted(self.starts, ts, side="right") - 1
+        valid = idx >= 0
+        return valid & (ts <= self.ends[np.maximum(idx, 0)])
+
+    def contains_one(self, timestamp: Any) -> bool:
+        """Check a single timestamp (O(log w))."""
+        if len(self.starts) == 0:
+            return False
+        ts = to_epoch_ns(timestamp)
+        idx = int(np.searchsorted(self.starts, ts, side="right")) - 1
+        return idx >= 0 and ts <= int(self.ends[idx])
+
+    def polars_mask(
+        self, df: pl.DataFrame, timestamp_col: str = "timestamp_utc"
+    ) -> pl.Series:
+        """
+        Boolean mask for a Polars frame, True for bars inside a blackout.
+
+        Args:
+            df: Frame with a Datetime timestamp column.
+            timestamp_col: Name of the timestamp column.
+
+        Returns:
+            Polars Boolean Series aligned with df rows.
+        """
+        return pl.Series("in_blackout", self.contains(df[timestamp_col]))
+
+    def drop_blocked(
+        self, df: pl.DataFrame, timestamp_col: str = "timestamp_utc"
+    ) -> pl.DataFrame:
+        """Return df without the bars that fall inside a blackout."""
+        return df.filter(~self.polars_mask(df, timestamp_col))
+
+
 def is_in_blackout(
     timestamp: datetime,
-    windows: Sequence[BlackoutWindow],
+    windows: "Sequence[BlackoutWindow] | BlackoutIndex",
 ) -> bool:
     """
     Check if a timestamp falls within any blackout window.
 
     Args:
         timestamp: UTC timestamp to check (must be timezone-aware).
-        windows: List of blackout windows.
+        windows: List of blackout windows (scanned in O(w)), or a
+            BlackoutIndex (O(log w)). Callers checking many timestamps
+            should build the index once with BlackoutIndex.from_windows
+            and pass it in.
 
     Returns:
         True if timestamp is within any window (inclusive bounds).
@@ -198,6 +366,8 @@ def is_in_blackout(
         >>> is_in_blackout(datetime(2023, 1, 6, 13, 30, tzinfo=timezone.utc), [window])
         True
     """
+    if isinstance(windows, BlackoutIndex):
+        return windows.contains_one(timestamp)
     return any(window.start_utc <= timestamp <= window.end_utc for window in windows)
 
 
@@ -9,6 +9,8 @@ more than the specified percentage of account equity.
 import logging
 import math
 
+import polars as pl
+
 from ..models.core import TradeSignal
 
 
@@ -125,6 +127,65 @@ def calculate_position_size(
     return position_size
 
 
+def position_size_expr(
+    entry_price: pl.Expr,
+    stop_price: pl.Expr,
+    pair: str,
+    account_balance: float,
+    risk_per_trade_pct: float,
+    pip_value: float = 10.0,
+    lot_step: float = 0.01,
+    max_position_size: float = 10.0,
+) -> pl.Expr:
+    """
+    Polars expression computing position sizes for a column of signals.
+
+    Columnar counterpart of calculate_position_size: applies the same
+    formula, rounding, cap and floor (in the same floating point order, so
+    results are identical) to whole entry/stop columns at once.
+
+    Args:
+        entry_price: Expression for entry prices.
+        stop_price: Expression for stop-loss prices.
+        pair: Currency pair (JPY pairs use 0.01 pips).
+        account_balance: Current account balance in base currency.
+        risk_per_trade_pct: Percentage of account to risk (e.g., 0.25 for 0.25%).
+        pip_value: Value of 1 pip in base currency for 1 lot (default 10.0 for forex).
+        lot_step: Minimum lot size increment (default 0.01).
+        max_position_size: Maximum allowed position size in lots (default 10.0).
+
+    Returns:
+        Float expression of position sizes in lots.
+
+    Raises:
+        ValueError: If account_balance <= 0 or risk_per_trade_pct <= 0.
+    """
+    if account_balance <= 0:
+        raise ValueError(f"Account balance must be positive, got {account_balance}")
+
+    if risk_per_trade_pct <= 0:
+        raise ValueError(
+            f"Risk per trade percentage must be positive, got {risk_per_trade_pct}"
+        )
+
+    risk_amount = account_balance * (risk_per_trade_pct / 100.0)
+    pip_multiplier = 100.0 if "JPY" in pair.upper() else 10000.0
+    stop_distance_pips = (entry_price - stop_price).abs() * pip_multiplier
+
+    raw_position_size = risk_amount / (stop_distance_pips * pip_value)
+    position_size = (raw_position_size / lot_step).floor() * lot_step
+
+    return (
+        pl.when(stop_distance_pips == 0)
+        .then(lot_step)
+        .when(position_size > max_position_size)
+        .then(max_position_size)
+        .when(position_size < lot_step)
+        .then(lot_step)
+        .otherwise(position_size)
+    )
+
+
 def calculate_atr_stop(
     entry_price: float,
     atr_value: float,
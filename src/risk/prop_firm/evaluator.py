@@ -2,19 +2,105 @@
 Evaluator for Prop Firm rules (CTI).
 """
 
-from datetime import UTC, datetime
-from typing import Optional
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, NamedTuple, Optional
 
+import numpy as np
+
+from src.backtest.trade_ledger import TradeLedger
 from src.models.core import TradeExecution
+from src.risk.blackout.windows import to_epoch_ns
 
 from .models import ChallengeConfig, LevelResult
 
+if TYPE_CHECKING:
+    from src.backtest.portfolio.mark_to_market import MarkToMarketEquity
+
+_NS_PER_DAY = 86_400 * 10**9
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+class _EquityBreach(NamedTuple):
+    """First bar at which the mark-to-market equity broke a rule."""
+
+    epoch_ns: int
+    status: str
+    reason: str
+    balance: float
+
+
+def _first_equity_breach(
+    equity_curve: "MarkToMarketEquity",
+    config: ChallengeConfig,
+    start_time: datetime,
+    end_time: datetime,
+) -> Optional[_EquityBreach]:
+    """
+    Check drawdown and daily-loss rules on every bar of an equity curve.
+
+    The curve's equity is rebased so the bar before ``start_time`` equals
+    the account size. Trailing drawdown follows the equity high-water mark;
+    the daily limit is measured from the equity at the previous day's last
+    bar (the account size on the first day).
+
+    Returns:
+        The first breach between start_time and end_time, or None.
+    """
+    epoch_ns = equity_curve.epoch_ns
+    lo = int(np.searchsorted(epoch_ns, to_epoch_ns(start_time), "left"))
+    hi = int(np.searchsorted(epoch_ns, to_epoch_ns(end_time), "right"))
+    if hi <= lo:
+        return None
+
+    account = config.account_size
+    base = float(equity_curve.equity[lo - 1]) if lo else equity_curve.starting_equity
+    balance = account + (equity_curve.equity[lo:hi].astype(np.float64) - base)
+    max_dd = account * config.max_total_drawdown_pct
+    if config.drawdown_type == "STATIC":
+        dd_floor = np.full_like(balance, account - max_dd)
+    else:
+        dd_floor = np.maximum(np.maximum.accumulate(balance), account) - max_dd
+    dd_breach = balance < dd_floor
+
+    daily_breach = np.zeros_like(dd_breach)
+    if config.max_daily_loss_pct is not None:
+        days = epoch_ns[lo:hi] // _NS_PER_DAY
+        new_day = np.r_[True, days[1:] != days[:-1]]
+        day_first = np.maximum.accumulate(np.where(new_day, np.arange(days.size), 0))
+        day_start = np.r_[account, balance[:-1]][day_first]
+        daily_limit = day_start - account * config.max_daily_loss_pct
+        daily_breach = balance < daily_limit
+
+    breach = dd_breach | daily_breach
+    if not breach.any():
+        return None
+
+    i = int(breach.argmax())
+    bal = float(balance[i])
+    if dd_breach[i]:
+        kind = "Static" if config.drawdown_type == "STATIC" else "Trailing"
+        return _EquityBreach(
+            int(epoch_ns[lo + i]),
+            "FAILED_DRAWDOWN",
+            f"{kind} Drawdown Violation (equity): Bal {bal:.2f} < "
+            f"Floor {dd_floor[i]:.2f}",
+            bal,
+        )
+    return _EquityBreach(
+        int(epoch_ns[lo + i]),
+        "FAILED_DAILY",
+        f"Daily Loss Violation (equity): Bal {bal:.2f} < "
+        f"Limit {daily_limit[i]:.2f} (DayStart {day_start[i]:.2f})",
+        bal,
+    )
+
 
 def evaluate_challenge(
     executions: list[TradeExecution],
     config: ChallengeConfig,
     level_id: int = 1,
     start_date: Optional[datetime] = None,
+    equity_curve: Optional["MarkToMarketEquity"] = None,
 ) -> LevelResult:
     """
     Evaluate a sequence of trades against CTI rules.
@@ -24,6 +110,10 @@ def evaluate_challenge(
         config: Challenge configuration.
         level_id: Identifier for this level/attempt segment.
         start_date: Override start date (e.g. for resets). If None, uses first trade open.
+        equity_curve: Bar-resolution mark-to-market equity of the same trades
+            (PortfolioResult.mark_to_market). When given, drawdown and daily
+            loss are also checked on every bar, so open-position drawdown
+            fails the level at the breaching bar.
 
     Returns:
         LevelResult object containing status and metrics.
@@ -42,7 +132,10 @@ def evaluate_challenge(
         )
 
     # Sort executions by close time
-    sorted_execs = sorted(executions, key=lambda x: x.close_timestamp)
+    if isinstance(executions, TradeLedger):
+        sorted_execs = executions.sort_by_close()
+    else:
+        sorted_execs = sorted(executions, key=lambda x: x.close_timestamp)
 
     start_time = start_date if start_date else sorted_execs[0].open_timestamp
     end_time = sorted_execs[-1].close_timestamp
@@ -68,6 +161,10 @@ def evaluate_challenge(
 
     total_net_pnl = 0.0
 
+    equity_breach = None
+    if equity_curve is not None:
+        equity_breach = _first_equity_breach(equity_curve, config, start_time, end_time)
+
     idx = 0
     for idx, trade in enumerate(sorted_execs):
         trade_date = trade.close_timestamp.date()
@@ -99,6 +196,22 @@ def evaluate_challenge(
         if pnl_dollars > 0:
             profitable_days.add(trade_date)
 
+        # 0. Mark-to-market breach while this trade was open (or earlier)
+        if (
+            equity_breach is not None
+            and to_epoch_ns(trade.close_timestamp) >= equity_breach.epoch_ns
+        ):
+            status = equity_breach.status
+            failure_reason = equity_breach.reason
+            failure_date = _EPOCH + timedelta(
+                microseconds=equity_breach.epoch_ns // 1000
+            )
+            if trade.close_timestamp.tzinfo is None:
+                failure_date = failure_date.replace(tzinfo=None)
+            current_balance = equity_breach.balance
+            total_net_pnl = current_balance - config.account_size
+            break
+
         # 1. Total Drawdown
         if config.drawdown_type == "STATIC":
             dd_floor = config.account_size - max_total_dd_amount
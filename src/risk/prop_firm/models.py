@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
+import numpy as np
 from pydantic import BaseModel
 
 
@@ -97,3 +98,61 @@ class ScalingReport:
                 stats[balance][level.status] = current_count + 1
 
         return stats
+
+
+# Path statuses of a Monte Carlo run (same labels as evaluate_challenge)
+MONTE_CARLO_STATUSES = (
+    "PASSED",
+    "FAILED_DRAWDOWN",
+    "FAILED_DAILY",
+    "FAILED_TIME",
+    "IN_PROGRESS",
+)
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    """Outcome of a Monte Carlo challenge simulation, one entry per path."""
+
+    statuses: np.ndarray  # Status label per path
+    trades_to_pass: np.ndarray  # Trades taken until the pass, -1 if not passed
+    days_to_pass: np.ndarray  # Calendar days until the pass, -1 if not passed
+    end_balances: np.ndarray  # Balance when the path stopped
+    n_trades: int  # Trades per path
+
+    @property
+    def n_paths(self) -> int:
+        """Number of simulated paths."""
+        return len(self.statuses)
+
+    @property
+    def pass_rate(self) -> float:
+        """Fraction of paths that passed."""
+        return float(np.mean(self.statuses == "PASSED")) if self.n_paths else 0.0
+
+    @property
+    def status_breakdown(self) -> dict[str, float]:
+        """Fraction of paths per status (all statuses, including zeros)."""
+        return {
+            status: float(np.mean(self.statuses == status)) if self.n_paths else 0.0
+            for status in MONTE_CARLO_STATUSES
+        }
+
+    def time_to_pass_quantiles(
+        self, quantiles: tuple[float, ...] = (0.1, 0.5, 0.9), unit: str = "days"
+    ) -> dict[float, float]:
+        """
+        Quantiles of the time to pass over the paths that passed.
+
+        Args:
+            quantiles: Quantiles to compute (0-1).
+            unit: "days" (calendar days) or "trades".
+
+        Returns:
+            Mapping of quantile to value (NaN if no path passed).
+        """
+        values = self.days_to_pass if unit == "days" else self.trades_to_pass
+        passed = values[self.statuses == "PASSED"]
+        if passed.size == 0:
+            return {q: float("nan") for q in quantiles}
+        return {q: float(v) for q, v in zip(quantiles, np.quantile(passed, quantiles))}
@@ -0,0 +1,309 @@
+"""
+Monte Carlo pass-probability engine for Prop Firm challenges.
+
+Resamples the per-trade P&L of a trade history into a (paths x trades)
+matrix and applies the rules of ``evaluate_challenge`` to every path at once
+with cumulative NumPy operations instead of a per-trade Python loop:
+
+- Static drawdown: balance against a fixed floor.
+- Trailing drawdown: balance against the running peak
+  (``np.maximum.accumulate``) less the drawdown allowance.
+- Daily loss: balance against the balance at the start of the trade's day.
+- Time limit, profit target and minimum profitable trading days.
+
+Only the P&L is resampled. The calendar is that of the history: the k-th
+trade of every path closes on the day the k-th historical trade closed, so
+daily-loss grouping and time limits keep the strategy's real cadence.
+"""
+
+from datetime import date
+from typing import Optional
+
+import numpy as np
+
+from src.backtest.trade_ledger import TradeLedger
+
+from .models import MONTE_CARLO_STATUSES, ChallengeConfig, MonteCarloResult
+
+# Status codes (indexes into MONTE_CARLO_STATUSES)
+_PASSED, _FAILED_DRAWDOWN, _FAILED_DAILY, _FAILED_TIME, _IN_PROGRESS = range(5)
+
+RESAMPLE_METHODS = ("bootstrap", "shuffle")
+
+_NS_PER_DAY = 86_400 * 10**9
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def resample_indices(
+    n_source: int,
+    n_paths: int,
+    n_trades: int,
+    method: str = "bootstrap",
+    block_size: int = 1,
+    rng: Optional[np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Trade indices for resampled paths.
+
+    Args:
+        n_source: Number of historical trades.
+        n_paths: Number of paths.
+        n_trades: Trades per path.
+        method: "bootstrap" (with replacement; circular blocks of
+            ``block_size`` consecutive trades keep streaks together) or
+            "shuffle" (random orderings without replacement).
+        block_size: Block length for the bootstrap (1 = i.i.d.).
+        rng: Random generator.
+
+    Returns:
+        Integer array of shape (n_paths, n_trades).
+
+    Raises:
+        ValueError: For an unknown method, block_size < 1, or a shuffle
+            longer than the history.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    if method == "shuffle":
+        if n_trades > n_source:
+            raise ValueError(f"shuffle needs n_trades <= {n_source} historical trades")
+        orderings = np.tile(np.arange(n_source), (n_paths, 1))
+        return rng.permuted(orderings, axis=1)[:, :n_trades]
+    if method != "bootstrap":
+        raise ValueError(f"method must be one of {RESAMPLE_METHODS}, got {method!r}")
+    if block_size < 1:
+        raise ValueError(f"block_size must be >= 1, got {block_size}")
+
+    n_blocks = -(-n_trades // block_size)
+    starts = rng.integers(0, n_source, size=(n_paths, n_blocks))
+    indices = (starts[:, :, None] + np.arange(block_size)) % n_source
+    return indices.reshape(n_paths, -1)[:, :n_trades]
+
+
+def _first_true(mask: np.ndarray) -> np.ndarray:
+    """Column of the first True per row (row length if none)."""
+    return np.where(mask.any(axis=1), mask.argmax(axis=1), mask.shape[1])
+
+
+def evaluate_paths(
+    pnl: np.ndarray,
+    day_ids: np.ndarray,
+    elapsed_days: np.ndarray,
+    config: ChallengeConfig,
+    stop_at_pass: bool = True,
+) -> MonteCarloResult:
+    """
+    Apply the challenge rules to a matrix of P&L paths.
+
+    Rules are checked per trade in the order of ``evaluate_challenge``
+    (drawdown, daily loss, time limit), so a path fails at its first breach
+    with that breach as the reason.
+
+    Args:
+        pnl: Dollar P&L, shape (paths, trades).
+        day_ids: Calendar day of each trade slot (non-decreasing).
+        elapsed_days: Days from the challenge start to each trade slot.
+        config: Challenge rules.
+        stop_at_pass: End a path at the first trade where the profit target
+            and minimum trading days are met. If False, the pass is decided
+            after the last trade, as ``evaluate_challenge`` does.
+
+    Returns:
+        MonteCarloResult for the paths.
+    """
+    n_paths, n_trades = pnl.shape
+    rows = np.arange(n_paths)
+    account = config.account_size
+
+    balance = account + np.cumsum(pnl, axis=1)
+    prev_balance = np.empty_like(balance)
+    prev_balance[:, 0] = account
+    prev_balance[:, 1:] = balance[:, :-1]
+
+    # 1. Total drawdown
+    max_dd = account * config.max_total_drawdown_pct
+    if config.drawdown_type == "STATIC":
+        dd_breach = balance < account - max_dd
+    else:
+        peak = np.maximum(np.maximum.accumulate(balance, axis=1), account)
+        dd_breach = balance < peak - max_dd
+
+    # First trade slot of each slot's day
+    new_day = np.r_[True, day_ids[1:] != day_ids[:-1]]
+    day_first = np.maximum.accumulate(np.where(new_day, np.arange(n_trades), 0))
+
+    # 2. Daily loss, against the balance when the day's first trade opened
+    failed = dd_breach.copy()
+    daily_breach = None
+    if config.max_daily_loss_pct is not None:
+        daily_limit = prev_balance[:, day_first] - account * config.max_daily_loss_pct
+        daily_breach = balance < daily_limit
+        failed |= daily_breach
+
+    # 3. Time limit (same for every path)
+    time_breach = None
+    if config.max_time_days:
+        time_breach = np.asarray(elapsed_days) > config.max_time_days
+        failed |= time_breach
+
+    fail_idx = _first_true(failed)
+    has_fail = fail_idx < n_trades
+
+    # Profitable days: the first winning trade of a day adds one
+    positive = pnl > 0
+    wins = np.cumsum(positive, axis=1)
+    wins_before_day = (wins - positive)[:, day_first]
+    profitable_days = np.cumsum(positive & (wins - wins_before_day == 1), axis=1)
+    target_met = (balance - account >= account * config.profit_target_pct) & (
+        profitable_days >= config.min_trading_days
+    )
+
+    if stop_at_pass:
+        pass_idx = _first_true(target_met)
+        passed = pass_idx < fail_idx
+    else:
+        passed = ~has_fail & target_met[:, -1]
+        pass_idx = np.full(n_paths, n_trades - 1)
+
+    # Reason of the first breach, in evaluate_challenge's check order
+    at_fail = np.minimum(fail_idx, n_trades - 1)
+    codes = np.full(n_paths, _IN_PROGRESS, dtype=np.int8)
+    failed_paths = has_fail & ~passed
+    if time_breach is not None:
+        codes[failed_paths & time_breach[at_fail]] = _FAILED_TIME
+    if daily_breach is not None:
+        codes[failed_paths & daily_breach[rows, at_fail]] = _FAILED_DAILY
+    codes[failed_paths & dd_breach[rows, at_fail]] = _FAILED_DRAWDOWN
+    codes[passed] = _PASSED
+
+    stop_idx = np.where(passed, pass_idx, np.where(has_fail, fail_idx, n_trades - 1))
+    stop_idx = np.minimum(stop_idx, n_trades - 1)
+    return MonteCarloResult(
+        statuses=np.asarray(MONTE_CARLO_STATUSES)[codes],
+        trades_to_pass=np.where(passed, pass_idx + 1, -1),
+        days_to_pass=np.where(passed, np.asarray(elapsed_days)[stop_idx], -1),
+        end_balances=balance[rows, stop_idx],
+        n_trades=n_trades,
+    )
+
+
+def _trade_pnl(
+    executions: list,
+    config: ChallengeConfig,
+    risk_per_trade: Optional[float],
+) -> np.ndarray:
+    """Dollar P&L per trade, sized like evaluate_challenge (or at a fixed risk)."""
+    if isinstance(executions, TradeLedger):
+        pnl_r = executions.pnl_r
+    else:
+        pnl_r = np.array([t.pnl_r for t in executions], dtype=np.float64)
+    if risk_per_trade is not None:
+        return pnl_r * config.account_size * risk_per_trade
+    if isinstance(executions, TradeLedger):
+        risk = executions.risk_amount
+        risk_percent = executions.risk_percent
+        fallback = config.account_size * np.where(risk_percent != 0, risk_percent, 0.01)
+    else:
+        risk = np.array([t.risk_amount for t in executions], dtype=np.float64)
+        fallback = np.array(
+            [
+                config.account_size * (getattr(t, "risk_percent", None) or 0.01)
+                for t in executions
+            ]
+        )
+    return pnl_r * np.where((risk == 0) & (pnl_r != 0), fallback, risk)
+
+
+def _trade_calendar(executions: list, n_trades: int) -> tuple[np.ndarray, np.ndarray]:
+    """Day ids and elapsed days per trade slot from the history's calendar.
+
+    Slots beyond the history continue at the historical trade rate.
+    """
+    if isinstance(executions, TradeLedger):
+        # Ledger timestamps are UTC epoch nanoseconds
+        close_ns = executions.close_ns
+        day_ids = close_ns // _NS_PER_DAY + _EPOCH_ORDINAL
+        elapsed = (close_ns - executions.open_ns[0]) // _NS_PER_DAY
+    else:
+        start_time = executions[0].open_timestamp
+        day_ids = np.array([t.close_timestamp.date().toordinal() for t in executions])
+        elapsed = np.array([(t.close_timestamp - start_time).days for t in executions])
+
+    n_extra = n_trades - len(executions)
+    if n_extra > 0:
+        days_per_trade = (max(elapsed[-1], 0) + 1) / len(executions)
+        offsets = np.floor(np.arange(1, n_extra + 1) * days_per_trade).astype(int)
+        day_ids = np.r_[day_ids, day_ids[-1] + offsets]
+        elapsed = np.r_[elapsed, elapsed[-1] + offsets]
+    return day_ids[:n_trades], elapsed[:n_trades]
+
+
+def simulate_challenge(
+    executions: list,
+    config: ChallengeConfig,
+    n_paths: int = 10_000,
+    method: str = "bootstrap",
+    block_size: int = 1,
+    n_trades: Optional[int] = None,
+    risk_per_trade: Optional[float] = None,
+    stop_at_pass: bool = True,
+    seed: Optional[int] = None,
+    chunk_size: int = 2_000,
+) -> MonteCarloResult:
+    """
+    Estimate challenge pass/fail probabilities by resampling a trade history.
+
+    Args:
+        executions: Completed trades (TradeExecution-like: pnl_r,
+            risk_amount, open/close timestamps).
+        config: Challenge rules.
+        n_paths: Number of resampled paths.
+        method: "bootstrap" or "shuffle" (see resample_indices).
+        block_size: Bootstrap block length in trades.
+        n_trades: Trades per path (default: length of the history).
+        risk_per_trade: Risk per trade as a fraction of the account size
+            (P&L = pnl_r x risk). Default: the historical dollar risk.
+        stop_at_pass: End paths at their first pass (see evaluate_paths).
+        seed: Random seed.
+        chunk_size: Paths evaluated per batch (bounds memory).
+
+    Returns:
+        MonteCarloResult with one entry per path.
+
+    Raises:
+        ValueError: If there are no trades or the resampling is invalid.
+    """
+    if not executions:
+        raise ValueError("Monte Carlo simulation needs at least one trade")
+
+    if isinstance(executions, TradeLedger):
+        sorted_execs = executions.sort_by_close()
+    else:
+        sorted_execs = sorted(executions, key=lambda x: x.close_timestamp)
+    n_trades = n_trades or len(sorted_execs)
+    trade_pnl = _trade_pnl(sorted_execs, config, risk_per_trade)
+    day_ids, elapsed_days = _trade_calendar(sorted_execs, n_trades)
+    rng = np.random.default_rng(seed)
+
+    chunks = []
+    for start in range(0, n_paths, chunk_size):
+        indices = resample_indices(
+            len(sorted_execs),
+            min(chunk_size, n_paths - start),
+            n_trades,
+            method=method,
+            block_size=block_size,
+            rng=rng,
+        )
+        chunks.append(
+            evaluate_paths(
+                trade_pnl[indices], day_ids, elapsed_days, config, stop_at_pass
+            )
+        )
+
+    return MonteCarloResult(
+        statuses=np.concatenate([c.statuses for c in chunks]),
+        trades_to_pass=np.concatenate([c.trades_to_pass for c in chunks]),
+        days_to_pass=np.concatenate([c.days_to_pass for c in chunks]),
+        end_balances=np.concatenate([c.end_balances for c in chunks]),
+        n_trades=n_trades,
+    )
@@ -2,7 +2,7 @@
 Reporting module for CTI Prop Firm simulation results.
 """
 
-from .models import ScalingReport, LevelResult
+from .models import MonteCarloResult, ScalingReport, LevelResult
 
 
 def format_cti_report(report: ScalingReport) -> str:
@@ -125,3 +125,37 @@ def format_cti_report(report: ScalingReport) -> str:
             lines.append("")
 
     return "\n".join(lines)
+
+
+def format_monte_carlo_report(result: MonteCarloResult) -> str:
+    """
+    Format a Monte Carlo challenge simulation as a human-readable string.
+
+    [CTI Monte Carlo: N paths x T trades]
+      Pass Rate: ...% | Failed Drawdown: ...% | Failed Daily: ...% | ...
+      Days to Pass (p10/p50/p90): ... | Trades to Pass (p10/p50/p90): ...
+    """
+    breakdown = result.status_breakdown
+    labels = {
+        "PASSED": "Pass Rate",
+        "FAILED_DRAWDOWN": "Failed Drawdown",
+        "FAILED_DAILY": "Failed Daily",
+        "FAILED_TIME": "Failed Time",
+        "IN_PROGRESS": "Unresolved",
+    }
+    rates = " | ".join(
+        f"{labels[status]}: {rate:.1%}" for status, rate in breakdown.items()
+    )
+
+    def _quantiles(unit: str) -> str:
+        values = result.time_to_pass_quantiles(unit=unit).values()
+        return "/".join(f"{v:.0f}" if v == v else "-" for v in values)
+
+    lines = [
+        "",
+        f"[CTI Monte Carlo: {result.n_paths:,} paths x {result.n_trades} trades]",
+        f"  {rates}",
+        f"  Days to Pass (p10/p50/p90): {_quantiles('days')} | "
+        f"Trades to Pass (p10/p50/p90): {_quantiles('trades')}",
+    ]
+    return "\n".join(lines)
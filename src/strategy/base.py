@@ -26,6 +26,8 @@ class StrategyMetadata:
         tags: Classification tags for filtering/grouping.
         max_concurrent_positions: Maximum simultaneous open positions allowed.
             Default is 1 (one trade at a time). Set to None for unlimited.
+        max_holding_bars: Maximum bars a trade is held before it times out at
+            the close. Default is None (hold until stop/target or end of data).
     """
 
     name: str
@@ -33,6 +35,7 @@ class StrategyMetadata:
     required_indicators: list[str]
     tags: list[str] = None
     max_concurrent_positions: int | None = 1
+    max_holding_bars: int | None = None
 
     def __post_init__(self):
         """Ensure tags is always a list."""
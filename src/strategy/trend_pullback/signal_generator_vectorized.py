@@ -6,6 +6,12 @@ columnar operations using Polars expressions. It implements the same logic:
 1. Trend Classification (EMA crossovers)
 2. Pullback Detection (Oscillator extremes)
 3. Reversal Confirmation (Momentum turns + Candlestick patterns)
+
+Signals are produced as a columnar SignalBatch (prices, sizes and IDs are
+computed with column expressions); generate_signals_vectorized materializes
+the batch as TradeSignal objects for callers that need them.
+generate_signal_batches evaluates many indicator-parameter variants (e.g.
+the combinations of a sweep) in one query.
 """
 
 import logging
@@ -14,13 +20,19 @@ from typing import Any
 import polars as pl
 
 from src.models.core import TradeSignal
-from src.risk.manager import calculate_position_size
-from src.strategy.id_factory import compute_parameters_hash, generate_signal_id
+from src.models.signal_batch import BATCH_COLUMNS, SignalBatch
+from src.risk.blackout.windows import timestamps_to_epoch_ns
+from src.risk.manager import position_size_expr
+from src.strategy.id_factory import compute_parameters_hash, generate_signal_id_hashes
 
 
 logger = logging.getLogger(__name__)
 
 
+SIGNAL_VERSION = "0.1.0"
+SIGNAL_TAGS = ("pullback", "reversal")
+
+
 def generate_signals_vectorized(
     df: pl.DataFrame,
     parameters: dict[str, Any],
@@ -41,41 +53,165 @@ def generate_signals_vectorized(
     """
     if df.is_empty():
         return []
+    return generate_signal_batch(
+        df, parameters, direction_mode=direction_mode, use_gpu=use_gpu
+    ).to_signals()
+
+
+def generate_signal_batch(
+    df: pl.DataFrame,
+    parameters: dict[str, Any],
+    direction_mode: str = "BOTH",  # "LONG", "SHORT", "BOTH"
+    use_gpu: bool = False,
+) -> SignalBatch:
+    """
+    Generate trade signals for the entire dataset as a columnar batch.
+
+    Args:
+        df: Polars DataFrame with OHLCV and indicator columns.
+        parameters: Strategy parameters.
+        direction_mode: Direction to generate signals for.
+        use_gpu: Whether to use GPU acceleration.
+
+    Returns:
+        SignalBatch sorted by timestamp (LONG before SHORT on ties), with
+        row indices into ``df``.
+
+    Raises:
+        ValueError: If required columns are missing.
+    """
+
+    _check_columns(df, DEFAULT_COLUMNS)
+
+    df = df.with_columns(
+        _trend_state_expr(DEFAULT_COLUMNS, parameters).alias("trend_state")
+    ).with_row_index("row_index")
 
-    # Ensure required columns exist
-    required_cols = [
-        "timestamp_utc",
-        "open",
-        "high",
-        "low",
-        "close",
-        "fast_ema",
-        "slow_ema",
-        "rsi",
-        "stoch_rsi",
-        "atr",
+    frames: list[pl.DataFrame] = []
+
+    if direction_mode in ["LONG", "BOTH"]:
+        frames.append(_generate_long_signals_vec(df, parameters, use_gpu=use_gpu))
+
+    if direction_mode in ["SHORT", "BOTH"]:
+        frames.append(_generate_short_signals_vec(df, parameters, use_gpu=use_gpu))
+
+    return _assemble_batch(frames, df, parameters)
+
+
+def generate_signal_batches(
+    df: pl.DataFrame,
+    parameter_sets: list[dict[str, Any]],
+    column_sets: list[dict[str, str]],
+    direction_mode: str = "BOTH",
+) -> list[SignalBatch]:
+    """
+    Generate signals for many indicator-parameter variants in one pass.
+
+    Every variant's trend state and entry conditions are evaluated as
+    columns of a single Polars query over ``df`` (shared subexpressions
+    such as the candlestick patterns are computed once), instead of one
+    query per variant.
+
+    Args:
+        df: Polars DataFrame with OHLCV columns and every variant's
+            indicator columns (e.g. from calculate_indicator_variants).
+        parameter_sets: Strategy parameters per variant.
+        column_sets: Per variant, indicator name (fast_ema, slow_ema, rsi,
+            stoch_rsi, atr) -> column of ``df`` holding it. Missing names
+            default to the column of the same name.
+        direction_mode: Direction to generate signals for.
+
+    Returns:
+        One SignalBatch per variant, identical to generate_signal_batch on
+        a frame holding that variant's columns under the default names.
+
+    Raises:
+        ValueError: If the lists differ in length or columns are missing.
+    """
+    if len(parameter_sets) != len(column_sets):
+        raise ValueError("parameter_sets and column_sets must have the same length")
+    if not parameter_sets:
+        return []
+
+    variants = [
+        {name: columns.get(name, name) for name in DEFAULT_COLUMNS}
+        for columns in column_sets
+    ]
+    for columns in variants:
+        _check_columns(df, columns)
+
+    directions = [
+        (direction, condition)
+        for direction, mode, condition in (
+            (1, "LONG", _long_condition),
+            (-1, "SHORT", _short_condition),
+        )
+        if direction_mode in (mode, "BOTH")
     ]
+
+    # All trend states, then all entry masks, in one query each
+    trend_cols = [f"trend_state__{k}" for k in range(len(variants))]
+    states = df.select(
+        _trend_state_expr(columns, parameters).alias(name)
+        for columns, parameters, name in zip(variants, parameter_sets, trend_cols)
+    )
+    masks = pl.concat([df, states], how="horizontal").select(
+        condition(columns, parameters, trend_col).alias(f"{direction}__{k}")
+        for k, (columns, parameters, trend_col) in enumerate(
+            zip(variants, parameter_sets, trend_cols)
+        )
+        for direction, condition in directions
+    )
+
+    indexed = df.with_row_index("row_index")
+    batches = []
+    for k, (columns, parameters) in enumerate(zip(variants, parameter_sets)):
+        frames = [
+            _build_signal_frame(
+                indexed.filter(masks[f"{direction}__{k}"]),
+                direction,
+                parameters,
+                atr_col=columns["atr"],
+            )
+            for direction, _ in directions
+        ]
+        batches.append(_assemble_batch(frames, indexed, parameters))
+    return batches
+
+
+# Indicator columns read by the signal expressions
+DEFAULT_COLUMNS = {
+    name: name for name in ("fast_ema", "slow_ema", "rsi", "stoch_rsi", "atr")
+}
+
+
+def _check_columns(df: pl.DataFrame, columns: dict[str, str]) -> None:
+    """Raise ValueError if price or indicator columns are missing."""
+    required_cols = ["timestamp_utc", "open", "high", "low", "close"]
+    required_cols += list(columns.values())
     missing = [c for c in required_cols if c not in df.columns]
 
     if missing:
         msg = f"Missing required columns: {missing}"
         raise ValueError(msg)
 
-    # compute parameters hash
-    parameters_hash = compute_parameters_hash(parameters)
 
+def _trend_state_expr(columns: dict[str, str], parameters: dict[str, Any]) -> pl.Expr:
+    """Trend state per bar: 1 = UP, -1 = DOWN, 0 = RANGE."""
     # --- Step 1: Trend Classification ---
     # UP: EMA20 > EMA50, DOWN: EMA20 < EMA50
     # We also need to check for "RANGE" condition (too many crossovers),
     # but for vectorization we can simplify or implement the rolling count.
 
     cross_threshold = parameters.get("trend_cross_count_threshold", 3)
+    fast = pl.col(columns["fast_ema"])
+    slow = pl.col(columns["slow_ema"])
 
     # Optimized via Polars native engine
 
     # Calculate crossovers (where relationship changes)
     # 1 where EMA20 > EMA50, 0 otherwise
-    ema_rel = (pl.col("fast_ema") > pl.col("slow_ema")).cast(pl.Int8)
+    ema_rel = (fast > slow).cast(pl.Int8)
     # Detect change: current != prev
     crossovers = (ema_rel != ema_rel.shift(1)).cast(pl.Int8).fill_null(0)
 
@@ -84,46 +220,147 @@ def generate_signals_vectorized(
 
     # Define Trend State
     # 1 = UP, -1 = DOWN, 0 = RANGE
-    trend_state = (
+    return (
         pl.when(rolling_crosses >= cross_threshold)
         .then(0)
-        .when(pl.col("fast_ema") > pl.col("slow_ema"))
+        .when(fast > slow)
         .then(1)
-        .when(pl.col("fast_ema") < pl.col("slow_ema"))
+        .when(fast < slow)
         .then(-1)
         .otherwise(0)
-    ).alias("trend_state")
+    )
 
-    df = df.with_columns(trend_state)
 
-    signals: list[TradeSignal] = []
+def _assemble_batch(
+    frames: list[pl.DataFrame],
+    df: pl.DataFrame,
+    parameters: dict[str, Any],
+) -> SignalBatch:
+    """Sort per-direction signal frames and attach signal IDs."""
+    # compute parameters hash
+    parameters_hash = compute_parameters_hash(parameters)
 
-    if direction_mode in ["LONG", "BOTH"]:
-        long_signals = _generate_long_signals_vec(
-            df, parameters, parameters_hash, use_gpu=use_gpu
+    # Sort by timestamp (stable: LONG rows stay ahead of SHORT rows on ties)
+    if frames:
+        signal_frame = pl.concat(frames, how="vertical").sort(
+            "timestamp_utc", maintain_order=True
         )
-        signals.extend(long_signals)
+    else:
+        signal_frame = _build_signal_frame(df.clear(), 1, parameters)
 
-    if direction_mode in ["SHORT", "BOTH"]:
-        short_signals = _generate_short_signals_vec(
-            df, parameters, parameters_hash, use_gpu=use_gpu
-        )
-        signals.extend(short_signals)
+    pair = parameters.get("pair", "EURUSD")
+    timestamps = signal_frame["timestamp_utc"]
+    timestamps_ns = (
+        timestamps_to_epoch_ns(timestamps)
+        if timestamps.dtype.is_temporal()
+        else timestamps.cast(pl.Int64).to_numpy()
+    )
+    signal_ids = generate_signal_id_hashes(
+        pair=pair,
+        timestamps_ns=timestamps_ns,
+        directions=signal_frame["direction"].to_numpy(),
+        entry_prices=signal_frame["entry_price"].to_numpy(),
+        stop_prices=signal_frame["stop_price"].to_numpy(),
+        position_sizes=signal_frame["position_size"].to_numpy(),
+        parameters_hash=parameters_hash,
+    )
+    signal_frame = signal_frame.with_columns(
+        pl.Series("signal_id", signal_ids, dtype=pl.UInt64)
+    )
+
+    return SignalBatch(
+        signal_frame,
+        pair=pair,
+        risk_per_trade_pct=parameters.get("risk_per_trade_pct", 0.25),
+        tags=SIGNAL_TAGS,
+        version=SIGNAL_VERSION,
+    )
 
-    # Deduplicate by timestamp if BOTH mode generated duplicate signals (shouldn't happen with logic)
-    # Sort by timestamp
-    signals.sort(key=lambda x: x.timestamp_utc)
 
-    return signals
+def _build_signal_frame(
+    signal_df: pl.DataFrame,
+    direction: int,
+    parameters: dict[str, Any],
+    atr_col: str = "atr",
+) -> pl.DataFrame:
+    """Entry/stop/target/size columns for the rows that fired a signal.
+
+    Args:
+        signal_df: Rows (with ``row_index``) where the signal condition holds.
+        direction: 1 for LONG, -1 for SHORT.
+        parameters: Strategy parameters.
+        atr_col: Column holding the ATR used for stop distances.
+
+    Returns:
+        DataFrame with every SignalBatch column except ``signal_id``.
+    """
+    stop_mult = parameters.get("stop_loss_atr_multiplier", 2.0)
+    target_r_mult = parameters.get("target_r_mult", 2.0)  # Strategy's reward/risk
+    risk_pct = parameters.get("risk_per_trade_pct", 0.25)
+    pair = parameters.get("pair", "EURUSD")
+    account_balance = parameters.get("account_balance", 2500.0)
+
+    entry_price = pl.col("close")
+    stop_distance = pl.col(atr_col).fill_null(0.002) * stop_mult
+    # Stop below / target above for longs, mirrored for shorts
+    if direction == 1:
+        stop_price = entry_price - stop_distance
+        target_price = entry_price + (stop_distance * target_r_mult)
+    else:
+        stop_price = entry_price + stop_distance
+        target_price = entry_price - (stop_distance * target_r_mult)
+
+    priced = signal_df.select(
+        pl.col("row_index").cast(pl.Int64),
+        pl.col("timestamp_utc"),
+        pl.lit(direction, dtype=pl.Int8).alias("direction"),
+        entry_price.cast(pl.Float64).alias("entry_price"),
+        stop_price.cast(pl.Float64).alias("stop_price"),
+        target_price.cast(pl.Float64).alias("target_price"),
+    )
+    return priced.with_columns(
+        position_size_expr(
+            pl.col("entry_price"),
+            pl.col("stop_price"),
+            pair=pair,
+            account_balance=account_balance,
+            risk_per_trade_pct=risk_pct,
+            pip_value=10.0,
+            lot_step=0.01,
+            max_position_size=10.0,
+        )
+        .cast(pl.Float64)
+        .alias("position_size"),
+        pl.lit(0, dtype=pl.UInt64).alias("signal_id"),
+    ).select(BATCH_COLUMNS)
 
 
 def _generate_long_signals_vec(
     df: pl.DataFrame,
     parameters: dict[str, Any],
-    parameters_hash: str,
     use_gpu: bool = False,
-) -> list[TradeSignal]:
-    """Generate LONG signals using Polars expressions."""
+) -> pl.DataFrame:
+    """Generate LONG signal rows using Polars expressions."""
+
+    if use_gpu:
+        # Research note: GPU acceleration for pullback propagation
+        pass
+
+    # Filter df to rows with signals and price them as columns
+    signal_condition = _long_condition(DEFAULT_COLUMNS, parameters, "trend_state")
+    return _build_signal_frame(df.filter(signal_condition), 1, parameters)
+
+
+def _long_condition(
+    columns: dict[str, str],
+    parameters: dict[str, Any],
+    trend_col: str,
+) -> pl.Expr:
+    """LONG entry condition over the given indicator and trend columns."""
+
+    trend_state = pl.col(trend_col)
+    rsi = pl.col(columns["rsi"])
+    stoch_rsi = pl.col(columns["stoch_rsi"])
 
     rsi_oversold = parameters.get("rsi_oversold", 30.0)
     stoch_rsi_low = parameters.get("stoch_rsi_low", 0.2)
@@ -134,8 +371,8 @@ def _generate_long_signals_vec(
     # and remains valid for `pullback_max_age` candles.
 
     # Identify candles where oscillator is extreme
-    is_extreme = (pl.col("trend_state") == 1) & (
-        (pl.col("rsi") < rsi_oversold) | (pl.col("stoch_rsi") < stoch_rsi_low)
+    is_extreme = (trend_state == 1) & (
+        (rsi < rsi_oversold) | (stoch_rsi < stoch_rsi_low)
     )
 
     # We need to propagate the "active pullback" state forward.
@@ -143,26 +380,22 @@ def _generate_long_signals_vec(
     # AND the trend is still UP.
     pullback_max_age = parameters.get("pullback_max_age", 20)
 
-    if use_gpu:
-        # Research note: GPU acceleration for pullback propagation
-        pass
-
     # Use rolling_max on the boolean (cast to int) to check if any in window was true
     # Optimized via Polars native engine
     pullback_active = (
         is_extreme.cast(pl.Int8).rolling_max(window_size=pullback_max_age).fill_null(0)
         == 1
-    ) & (pl.col("trend_state") == 1)
+    ) & (trend_state == 1)
 
     # --- Step 3: Reversal Detection (LONG) ---
     # 1. Momentum Turn:
     #    RSI low (<40) then rising, OR StochRSI low (<0.3) then rising.
 
-    prev_rsi = pl.col("rsi").shift(1)
-    rsi_turn_up = (prev_rsi < 40) & (pl.col("rsi") > prev_rsi)
+    prev_rsi = rsi.shift(1)
+    rsi_turn_up = (prev_rsi < 40) & (rsi > prev_rsi)
 
-    prev_stoch = pl.col("stoch_rsi").shift(1)
-    stoch_turn_up = (prev_stoch < 0.3) & (pl.col("stoch_rsi") > prev_stoch)
+    prev_stoch = stoch_rsi.shift(1)
+    stoch_turn_up = (prev_stoch < 0.3) & (stoch_rsi > prev_stoch)
 
     momentum_turn = rsi_turn_up | stoch_turn_up
 
@@ -195,96 +428,35 @@ def _generate_long_signals_vec(
 
     # Combined Signal Condition
     # Pullback Active AND Momentum Turn AND Pattern
-    signal_condition = pullback_active & momentum_turn & has_pattern
-
-    # Filter df to rows with signals
-    signal_df = df.filter(signal_condition)
+    return pullback_active & momentum_turn & has_pattern
 
-    if signal_df.is_empty():
-        return []
-
-    # Create TradeSignal objects
-    signals = []
-    stop_mult = parameters.get("stop_loss_atr_multiplier", 2.0)
-    target_r_mult = parameters.get("target_r_mult", 2.0)  # Strategy's reward/risk
-    risk_pct = parameters.get("risk_per_trade_pct", 0.25)
-    pair = parameters.get("pair", "EURUSD")
 
-    # We iterate over the *filtered* rows, which should be very few compared to total data
-    # iterating over Polars rows is slow if many, but signals are sparse.
-    for row in signal_df.iter_rows(named=True):
-        entry_price = row["close"]
-        atr_val = row["atr"] if row["atr"] is not None else 0.002
-        stop_distance = atr_val * stop_mult
-        stop_price = entry_price - stop_distance
-        target_price = entry_price + (stop_distance * target_r_mult)
-        timestamp = row["timestamp_utc"]
-
-        # Determine tags
-        tags = ["pullback", "reversal", "long"]
-
-        signal_id = generate_signal_id(
-            pair=pair,
-            timestamp_utc=timestamp,
-            direction="LONG",
-            entry_price=entry_price,
-            stop_price=stop_price,
-            position_size=0.01,  # Placeholder
-            parameters_hash=parameters_hash,
-        )
-
-        # Create signal with placeholder position size first
-        signal = TradeSignal(
-            id=signal_id,
-            pair=pair,
-            direction="LONG",
-            entry_price=entry_price,
-            initial_stop_price=stop_price,
-            target_price=target_price,  # Strategy-defined TP
-            risk_per_trade_pct=risk_pct,
-            calc_position_size=0.01,  # Placeholder, will be calculated
-            tags=tags,
-            version="0.1.0",
-            timestamp_utc=timestamp,
-        )
-
-        # Calculate actual position size based on risk parameters
-        account_balance = parameters.get("account_balance", 2500.0)
-        calculated_position_size = calculate_position_size(
-            signal=signal,
-            account_balance=account_balance,
-            risk_per_trade_pct=signal.risk_per_trade_pct,
-            pip_value=10.0,
-            lot_step=0.01,
-            max_position_size=10.0,
-        )
+def _generate_short_signals_vec(
+    df: pl.DataFrame,
+    parameters: dict[str, Any],
+    use_gpu: bool = False,
+) -> pl.DataFrame:
+    """Generate SHORT signal rows using Polars expressions."""
 
-        # Create final signal with correct position size
-        signal = TradeSignal(
-            id=signal_id,
-            pair=pair,
-            direction="LONG",
-            entry_price=entry_price,
-            initial_stop_price=stop_price,
-            target_price=target_price,  # Strategy-defined TP
-            risk_per_trade_pct=risk_pct,
-            calc_position_size=calculated_position_size,
-            tags=tags,
-            version="0.1.0",
-            timestamp_utc=timestamp,
-        )
-        signals.append(signal)
+    if use_gpu:
+        # Research note: GPU acceleration
+        pass
 
-    return signals
+    # Filter df to rows with signals and price them as columns
+    signal_condition = _short_condition(DEFAULT_COLUMNS, parameters, "trend_state")
+    return _build_signal_frame(df.filter(signal_condition), -1, parameters)
 
 
-def _generate_short_signals_vec(
-    df: pl.DataFrame,
+def _short_condition(
+    columns: dict[str, str],
     parameters: dict[str, Any],
-    parameters_hash: str,
-    use_gpu: bool = False,
-) -> list[TradeSignal]:
-    """Generate SHORT signals using Polars expressions."""
+    trend_col: str,
+) -> pl.Expr:
+    """SHORT entry condition over the given indicator and trend columns."""
+
+    trend_state = pl.col(trend_col)
+    rsi = pl.col(columns["rsi"])
+    stoch_rsi = pl.col(columns["stoch_rsi"])
 
     rsi_overbought = parameters.get("rsi_overbought", 70.0)
     stoch_rsi_high = parameters.get("stoch_rsi_high", 0.8)
@@ -292,27 +464,23 @@ def _generate_short_signals_vec(
     # --- Step 2: Pullback Detection (SHORT) ---
     # Condition: Trend is DOWN AND (RSI > overbought OR StochRSI > high)
 
-    is_extreme = (pl.col("trend_state") == -1) & (
-        (pl.col("rsi") > rsi_overbought) | (pl.col("stoch_rsi") > stoch_rsi_high)
+    is_extreme = (trend_state == -1) & (
+        (rsi > rsi_overbought) | (stoch_rsi > stoch_rsi_high)
     )
 
     pullback_max_age = parameters.get("pullback_max_age", 20)
 
-    if use_gpu:
-        # Research note: GPU acceleration
-        pass
-
     pullback_active = (
         is_extreme.cast(pl.Int8).rolling_max(window_size=pullback_max_age).fill_null(0)
         == 1
-    ) & (pl.col("trend_state") == -1)
+    ) & (trend_state == -1)
     # Optimized via Polars native engine
 
-    prev_rsi = pl.col("rsi").shift(1)
-    rsi_turn_down = (prev_rsi > 60) & (pl.col("rsi") < prev_rsi)
+    prev_rsi = rsi.shift(1)
+    rsi_turn_down = (prev_rsi > 60) & (rsi < prev_rsi)
 
-    prev_stoch = pl.col("stoch_rsi").shift(1)
-    stoch_turn_down = (prev_stoch > 0.7) & (pl.col("stoch_rsi") < prev_stoch)
+    prev_stoch = stoch_rsi.shift(1)
+    stoch_turn_down = (prev_stoch > 0.7) & (stoch_rsi < prev_stoch)
 
     momentum_turn = rsi_turn_down | stoch_turn_down
 
@@ -344,81 +512,4 @@ def _generate_short_signals_vec(
     has_pattern = bearish_engulfing | is_shooting_star
 
     # Combined Signal Condition
-    signal_condition = pullback_active & momentum_turn & has_pattern
-
-    # Filter df to rows with signals
-    signal_df = df.filter(signal_condition)
-
-    if signal_df.is_empty():
-        return []
-
-    # Create TradeSignal objects
-    signals = []
-    stop_mult = parameters.get("stop_loss_atr_multiplier", 2.0)
-    target_r_mult = parameters.get("target_r_mult", 2.0)  # Strategy's reward/risk
-    risk_pct = parameters.get("risk_per_trade_pct", 0.25)
-    pair = parameters.get("pair", "EURUSD")
-
-    for row in signal_df.iter_rows(named=True):
-        entry_price = row["close"]
-        atr_val = row["atr"] if row["atr"] is not None else 0.002
-        stop_distance = atr_val * stop_mult
-        stop_price = entry_price + stop_distance  # Stop above for shorts
-        target_price = entry_price - (stop_distance * target_r_mult)  # Target below
-        timestamp = row["timestamp_utc"]
-
-        tags = ["pullback", "reversal", "short"]
-
-        signal_id = generate_signal_id(
-            pair=pair,
-            timestamp_utc=timestamp,
-            direction="SHORT",
-            entry_price=entry_price,
-            stop_price=stop_price,
-            position_size=0.01,
-            parameters_hash=parameters_hash,
-        )
-
-        # Create signal with placeholder position size first
-        signal = TradeSignal(
-            id=signal_id,
-            pair=pair,
-            direction="SHORT",
-            entry_price=entry_price,
-            initial_stop_price=stop_price,
-            target_price=target_price,  # Strategy-defined TP
-            risk_per_trade_pct=risk_pct,
-            calc_position_size=0.01,  # Placeholder, will be calculated
-            tags=tags,
-            version="0.1.0",
-            timestamp_utc=timestamp,
-        )
-
-        # Calculate actual position size based on risk parameters
-        account_balance = parameters.get("account_balance", 2500.0)
-        calculated_position_size = calculate_position_size(
-            signal=signal,
-            account_balance=account_balance,
-            risk_per_trade_pct=signal.risk_per_trade_pct,
-            pip_value=10.0,
-            lot_step=0.01,
-            max_position_size=10.0,
-        )
-
-        # Create final signal with correct position size
-        signal = TradeSignal(
-            id=signal_id,
-            pair=pair,
-            direction="SHORT",
-            entry_price=entry_price,
-            initial_stop_price=stop_price,
-            target_price=target_price,  # Strategy-defined TP
-            risk_per_trade_pct=risk_pct,
-            calc_position_size=calculated_position_size,
-            tags=tags,
-            version="0.1.0",
-            timestamp_utc=timestamp,
-        )
-        signals.append(signal)
-
-    return signals
+    return pullback_active & momentum_turn & has_pattern
@@ -41,6 +41,7 @@ try:
 except ImportError:
     HAS_DATASHADER = False
 
+from src.backtest.timestamp_index import TimestampIndex
 from src.models.directional import BacktestResult
 from src.models.visualization_config import (
     VisualizationConfig,
@@ -538,29 +539,25 @@ def _create_trade_boxes(
     if not result.executions:
         return None
 
-    # Get the time range of the visible data (using consistent dtype)
+    # Only include trades whose entry lies within the visible data range
     if "timestamp_utc" in pdf.columns:
-        data_min_time = _to_naive_datetime(pdf["timestamp_utc"].min())
-        data_max_time = _to_naive_datetime(pdf["timestamp_utc"].max())
+        ts_index = TimestampIndex(pdf["timestamp_utc"])
     else:
-        data_min_time = _to_naive_datetime(pdf.index.min())
-        data_max_time = _to_naive_datetime(pdf.index.max())
+        ts_index = TimestampIndex(pdf.index)
+    trades = [t for t in result.executions if hasattr(t, "open_timestamp")]
+    visible = ts_index.within([t.open_timestamp for t in trades])
 
     entries = []
     exits = []
 
-    for trade in result.executions:
-        if not hasattr(trade, "open_timestamp"):
+    for trade, is_visible in zip(trades, visible.tolist()):
+        if not is_visible:
             continue
 
         # Use helper for consistent datetime dtype
         entry_time = _to_naive_datetime(trade.open_timestamp)
         exit_time = _to_naive_datetime(trade.close_timestamp)
 
-        # Only include trades within the visible data range
-        if entry_time < data_min_time or entry_time > data_max_time:
-            continue
-
         entry_price = trade.entry_fill_price
         exit_price = trade.exit_fill_price
         pnl_r = trade.pnl_r
@@ -13,7 +13,7 @@ Validates:
 
 # pylint: disable=unused-argument, unused-import
 
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 import pytest
 from src.backtest.orchestrator import BacktestOrchestrator
 from src.models.enums import DirectionMode
@@ -40,6 +40,39 @@ def dummy_strategy_beta(candles):
     }
 
 
+def _daily_equity(daily_pnl):
+    """(timestamp, equity) points, one per calendar day from 2025-01-06."""
+    start = datetime(2025, 1, 6, 21, tzinfo=UTC)
+    equity = 10_000.0
+    points = []
+    for day, pnl in enumerate(daily_pnl):
+        equity += pnl
+        points.append((start + timedelta(days=day), equity))
+    return points
+
+
+def dummy_strategy_gamma(candles):
+    """Strategy that also reports its equity curve."""
+    return {
+        "name": "gamma",
+        "pnl": 30.0,
+        "max_drawdown": 0.02,
+        "exposure": {"EURUSD": 0.01},
+        "equity_curve": _daily_equity([40.0, -25.0, 60.0, -15.0, 10.0, -40.0]),
+    }
+
+
+def dummy_strategy_delta(candles):
+    """Second equity-reporting strategy on an offset timeline."""
+    return {
+        "name": "delta",
+        "pnl": 20.0,
+        "max_drawdown": 0.01,
+        "exposure": {"USDJPY": 0.01},
+        "equity_curve": _daily_equity([-10.0, 35.0, -20.0, 15.0, 0.0])[1:],
+    }
+
+
 def test_multi_strategy_baseline_execution():
     """
     Test baseline multi-strategy run with 2 strategies.
@@ -111,6 +144,7 @@ def test_multi_strategy_baseline_execution():
     assert metrics.strategies_count == 2
     assert metrics.instruments_count == 2
     assert metrics.aggregate_pnl == pytest.approx(80.0)
+    assert metrics.volatility_annualized == 0.0  # no equity curves reported
     assert metrics.weights_applied == [0.6, 0.4]
     assert metrics.global_abort_triggered is False
     assert len(metrics.risk_breaches) == 0
@@ -210,3 +244,26 @@ def test_multi_strategy_determinism():
         result1["run_manifest"].deterministic_run_id
         == result2["run_manifest"].deterministic_run_id
     )
+
+
+def test_multi_strategy_volatility_from_equity_curves():
+    """Strategy equity curves give a weighted portfolio curve and volatility."""
+    orchestrator = BacktestOrchestrator(direction_mode=DirectionMode.LONG)
+
+    result = orchestrator.run_multi_strategy_full(
+        strategies=[
+            ("gamma", dummy_strategy_gamma),
+            ("delta", dummy_strategy_delta),
+            ("alpha", dummy_strategy_alpha),
+        ],
+        candles_by_strategy={"gamma": [], "delta": [], "alpha": []},
+        weights=[0.5, 0.3, 0.2],
+        run_id="test_volatility_001",
+    )
+
+    curve = result["portfolio_summary"]["equity_curve"]
+    # alpha has no curve, so gamma and delta are renormalized to 5/8 and 3/8
+    assert len(curve) == 6
+    assert curve.equity[0] == pytest.approx((5 * 10_040.0 + 3 * 10_025.0) / 8)
+    assert curve.equity[-1] == pytest.approx((5 * 10_030.0 + 3 * 10_020.0) / 8)
+    assert result["structured_metrics"].volatility_annualized > 0.0
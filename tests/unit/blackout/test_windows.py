@@ -11,6 +11,7 @@ import numpy as np
 import pytest
 
 from src.risk.blackout.windows import (
+    BlackoutIndex,
     BlackoutWindow,
     expand_news_windows,
     expand_session_windows,
@@ -218,3 +219,75 @@ class TestIsInBlackout:
     def test_empty_windows(self):
         """Empty window list should return False."""
         assert is_in_blackout(utc(2023, 1, 6, 13, 0), []) is False
+
+
+class TestBlackoutIndex:
+    """Test sorted-interval blackout index."""
+
+    def test_matches_linear_scan(self):
+        """Vectorized membership matches a per-window scan."""
+        rng = np.random.default_rng(3)
+        base = utc(2023, 1, 2)
+        windows = []
+        for offset in rng.integers(0, 60 * 24 * 30, 400):
+            start = base + timedelta(minutes=int(offset))
+            length = timedelta(minutes=int(rng.integers(1, 240)))
+            windows.append(BlackoutWindow(start, start + length, "news"))
+        probes = [
+            base + timedelta(minutes=int(m))
+            for m in rng.integers(-60, 60 * 24 * 31, 2_000)
+        ]
+
+        index = BlackoutIndex.from_windows(merge_overlapping_windows(windows))
+        expected = [
+            any(w.start_utc <= t <= w.end_utc for w in windows) for t in probes
+        ]
+
+        assert index.contains(probes).tolist() == expected
+        assert BlackoutIndex.from_windows(windows).contains(probes).tolist() == expected
+        assert len(index) == len(merge_overlapping_windows(windows))
+
+    def test_inclusive_bounds_and_types(self):
+        """Bounds are inclusive for datetime, datetime64, and tuple input."""
+        index = BlackoutIndex.from_windows(
+            [(utc(2023, 1, 6, 13, 0), utc(2023, 1, 6, 14, 0))]
+        )
+        probes = np.array(
+            ["2023-01-06T12:59", "2023-01-06T13:00", "2023-01-06T14:00", "2023-01-06T14:01"],
+            dtype="datetime64[m]",
+        )
+
+        assert index.contains(probes).tolist() == [False, True, True, False]
+        assert index.contains_one(utc(2023, 1, 6, 13, 30)) is True
+        assert [index.contains_one(p) for p in probes] == index.contains(
+            probes
+        ).tolist()
+        assert is_in_blackout(utc(2023, 1, 6, 13, 30), index) is True
+
+    def test_empty_index(self):
+        """An empty index blocks nothing."""
+        index = BlackoutIndex.from_windows([])
+
+        assert len(index) == 0
+        assert index.contains_one(utc(2023, 1, 6)) is False
+        assert index.contains([utc(2023, 1, 6)]).tolist() == [False]
+
+    def test_polars_mask_drops_blocked_bars(self):
+        """Polars mask lines up with frame rows for tz-aware timestamps."""
+        pl = pytest.importorskip("polars")
+        frame = pl.DataFrame(
+            {
+                "timestamp_utc": [utc(2023, 1, 6, 12, 50) + timedelta(minutes=10 * i) for i in range(9)],
+                "close": np.arange(9, dtype=float),
+            }
+        )
+        index = BlackoutIndex.from_windows(
+            [BlackoutWindow(utc(2023, 1, 6, 13, 20), utc(2023, 1, 6, 14, 0), "news")]
+        )
+
+        mask = index.polars_mask(frame)
+        kept = index.drop_blocked(frame)
+
+        # 13:20 and 14:00 are inclusive bounds
+        assert mask.to_list() == [False, False, False, True, True, True, True, True, False]
+        assert kept["close"].to_list() == [0.0, 1.0, 2.0, 8.0]
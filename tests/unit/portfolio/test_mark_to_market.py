@@ -0,0 +1,141 @@
+"""Unit tests for bar-resolution mark-to-market equity."""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from src.backtest.drawdown import (
+    compute_equity_drawdown_curve,
+    compute_max_equity_drawdown,
+)
+from src.backtest.portfolio.mark_to_market import (
+    compute_mark_to_market,
+    symbol_open_pnl,
+)
+from src.backtest.portfolio.portfolio_simulator import ClosedTrade, PortfolioSimulator
+
+T0 = pd.Timestamp("2024-01-01 00:00")
+
+
+def _frame(n_bars, step_min, seed):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 5e-4, n_bars))
+    return pl.DataFrame(
+        {
+            "timestamp_utc": pd.date_range(T0, periods=n_bars, freq=f"{step_min}min"),
+            "high": close + 2e-4,
+            "low": close - 2e-4,
+            "close": close,
+        }
+    )
+
+
+def _trades(symbol, df, n_trades, seed):
+    """Candidate trades at random bars, exiting at the exit bar's close."""
+    rng = np.random.default_rng(seed)
+    close = df["close"].to_numpy()
+    timestamps = df["timestamp_utc"].to_numpy()
+    trades = []
+    for entry in np.sort(rng.choice(len(df) - 20, n_trades, replace=False)):
+        exit_ = int(entry + rng.integers(0, 20))
+        sign = 1 if rng.random() < 0.5 else -1
+        stop_distance = 1e-3
+        trades.append(
+            ClosedTrade(
+                symbol=symbol,
+                signal_id=f"{symbol}-{entry}",
+                direction="LONG" if sign == 1 else "SHORT",
+                open_timestamp=pd.Timestamp(timestamps[entry]),
+                close_timestamp=pd.Timestamp(timestamps[exit_]),
+                entry_price=close[entry],
+                exit_price=close[exit_],
+                exit_reason="take_profit",
+                pnl_dollars=0.0,
+                pnl_r=sign * (close[exit_] - close[entry]) / stop_distance,
+                risk_amount=0.0,
+                entry_index=int(entry),
+                exit_index=exit_,
+                stop_distance=stop_distance,
+            )
+        )
+    return trades
+
+
+def _naive_equity(symbol_data, trades, starting_equity, intrabar):
+    """Per-bar loop over the master timeline."""
+    frames = {
+        s: df.to_pandas().set_index("timestamp_utc") for s, df in symbol_data.items()
+    }
+    master = sorted(set().union(*(f.index for f in frames.values())))
+    equity = []
+    for ts in master:
+        value = starting_equity
+        for t in trades:
+            if t.close_timestamp <= ts:
+                value += t.pnl_dollars
+            elif t.open_timestamp <= ts:
+                bars = frames[t.symbol].loc[:ts].iloc[-1]
+                sign = 1 if t.direction == "LONG" else -1
+                if intrabar == "worst":
+                    mark = bars["low"] if sign == 1 else bars["high"]
+                else:
+                    mark = bars["close"]
+                units = sign * t.risk_amount / t.stop_distance
+                value += units * (mark - t.entry_price)
+        equity.append(value)
+    return np.array(equity)
+
+
+def test_symbol_open_pnl_matches_loop():
+    """Cumsum/scatter-add open P&L equals summing open positions per bar."""
+    rng = np.random.default_rng(3)
+    close = 1.0 + np.cumsum(rng.normal(0, 1e-3, 200))
+    entry = rng.integers(0, 190, 40)
+    exit_ = entry + rng.integers(0, 10, 40)
+    units = rng.choice([-2.0, 1.0, 3.0], 40)
+    price = close[entry]
+
+    expected = np.zeros(200)
+    for e, x, u, p in zip(entry, exit_, units, price):
+        expected[e:x] += u * (close[e:x] - p)
+
+    result = symbol_open_pnl(entry, exit_, units, price, close)
+    np.testing.assert_allclose(result, expected, atol=1e-9)
+    both = symbol_open_pnl(entry, exit_, units, price, close, close)
+    np.testing.assert_allclose(both, expected, atol=1e-9)
+
+
+@pytest.mark.parametrize("intrabar", ["close", "worst"])
+def test_portfolio_equity_matches_loop(intrabar):
+    """Two symbols on different bar grids, sized by the event loop."""
+    symbol_data = {"EURUSD": _frame(300, 1, 1), "GBPUSD": _frame(100, 3, 2)}
+    sim = PortfolioSimulator(starting_equity=2500.0)
+    sim._process_events(
+        _trades("EURUSD", symbol_data["EURUSD"], 30, 1)
+        + _trades("GBPUSD", symbol_data["GBPUSD"], 10, 2)
+    )
+
+    mtm = compute_mark_to_market(
+        symbol_data, sim.closed_trades, 2500.0, intrabar=intrabar
+    )
+    expected = _naive_equity(symbol_data, sim.closed_trades, 2500.0, intrabar)
+
+    assert mtm.equity.dtype == np.float32
+    assert len(mtm) == 300
+    np.testing.assert_allclose(mtm.equity, expected, rtol=1e-6)
+    assert mtm.equity[-1] == pytest.approx(sim.current_equity, rel=1e-6)
+    last = sim.closed_trades[-1]
+    assert mtm.equity_at(last.close_timestamp) == pytest.approx(
+        last.portfolio_balance_at_exit, rel=1e-6
+    )
+
+    drawdown = compute_equity_drawdown_curve(mtm.equity, 2500.0)
+    assert drawdown.dtype == np.float32
+    assert (drawdown <= 0).all()
+    assert compute_max_equity_drawdown(mtm.equity, 2500.0) == drawdown.min()
+
+
+def test_unknown_intrabar_mode():
+    with pytest.raises(ValueError):
+        compute_mark_to_market({}, [], 2500.0, intrabar="open")
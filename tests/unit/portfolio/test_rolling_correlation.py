@@ -0,0 +1,112 @@
+"""Unit tests for the incremental and batch rolling correlation engine."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.backtest.portfolio.correlation_service import CorrelationService
+from src.backtest.portfolio.rolling_correlation import rolling_correlation_series
+from src.models.correlation import CorrelationMatrix, CorrelationWindowState
+from src.models.portfolio import CurrencyPair
+
+SYMBOLS = ["AUDUSD", "EURUSD", "GBPUSD", "USDJPY"]
+
+
+def _price_paths(n_bars: int = 400, seed: int = 3) -> np.ndarray:
+    """Correlated random walks with a few missing prices (NaN)."""
+    rng = np.random.default_rng(seed)
+    common = rng.normal(0, 1e-3, (n_bars, 1))
+    steps = 0.6 * common + rng.normal(0, 1e-3, (n_bars, len(SYMBOLS)))
+    prices = np.array([0.65, 1.10, 1.25, 110.0]) * np.exp(np.cumsum(steps, axis=0))
+    prices[rng.random(prices.shape) < 0.05] = np.nan
+    return prices
+
+
+def _reference(prices: np.ndarray) -> list[dict[str, float]]:
+    """Per-bar matrix values from the per-pair deque implementation."""
+    pairs = [CurrencyPair(code=code) for code in SYMBOLS]
+    windows: dict[str, CorrelationWindowState] = {}
+    values: dict[str, float] = {}
+    history = []
+    for row in prices:
+        for i, pair_a in enumerate(pairs):
+            for j in range(i + 1, len(pairs)):
+                if np.isnan(row[i]) or np.isnan(row[j]):
+                    continue
+                key = CorrelationMatrix.make_key(pair_a, pairs[j])
+                window = windows.setdefault(
+                    key, CorrelationWindowState(pair_a=pair_a, pair_b=pairs[j])
+                )
+                corr = window.update(row[i], row[j])
+                if corr is not None:
+                    values[key] = corr
+        history.append(dict(values))
+    return history
+
+
+def test_streaming_matches_per_pair_reference():
+    """Vectorized updates reproduce the per-pair np.corrcoef results."""
+    prices = _price_paths()
+    service = CorrelationService(window_size=100, provisional_min=20)
+    for code in SYMBOLS:
+        service.register_symbol(CurrencyPair(code=code))
+
+    for row, expected in zip(prices, _reference(prices)):
+        service.update(
+            {code: float(p) for code, p in zip(SYMBOLS, row) if not np.isnan(p)}
+        )
+        actual = service.get_matrix().values
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            assert actual[key] == pytest.approx(value, abs=1e-9)
+
+    assert service.is_window_ready(
+        CurrencyPair(code="EURUSD"), CurrencyPair(code="GBPUSD")
+    )
+    assert set(service.window_lengths().values()) == {100}
+
+
+def test_batch_series_matches_streaming():
+    """correlation_series equals the streamed matrix bar by bar."""
+    prices = _price_paths(seed=11)
+    start = datetime(2024, 1, 1)
+    frame = pl.DataFrame(
+        {
+            "timestamp_utc": [start + timedelta(minutes=i) for i in range(len(prices))],
+            **{code: prices[:, k] for k, code in enumerate(SYMBOLS)},
+        }
+    ).with_columns(pl.col(SYMBOLS).fill_nan(None))
+
+    service = CorrelationService(window_size=50, provisional_min=10)
+    for code in SYMBOLS:
+        service.register_symbol(CurrencyPair(code=code))
+    series = service.correlation_series(frame)
+
+    assert series.columns[0] == "timestamp_utc"
+    assert len(series.columns) == 1 + 6
+    for t, row in enumerate(prices):
+        service.update(
+            {code: float(p) for code, p in zip(SYMBOLS, row) if not np.isnan(p)}
+        )
+        streamed = service.get_matrix().values
+        for key in series.columns[1:]:
+            batch_value = series[key][t]
+            if batch_value is None:
+                assert key not in streamed
+            else:
+                assert batch_value == pytest.approx(streamed[key], abs=1e-9)
+
+    ranged = service.correlation_series(frame, start=start + timedelta(minutes=100))
+    assert len(ranged) == len(prices) - 100
+
+
+def test_series_zero_variance_and_warmup():
+    """Flat series report 0.0 and values are NaN before min_periods."""
+    n = 30
+    prices = np.column_stack([np.full(n, 1.1), np.linspace(1.0, 2.0, n)])
+    series = rolling_correlation_series(prices, window=20, min_periods=5)
+
+    assert np.isnan(series[:4, 0]).all()
+    assert (series[4:, 0] == 0.0).all()
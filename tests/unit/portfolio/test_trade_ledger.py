@@ -0,0 +1,141 @@
+"""Unit tests for the columnar trade ledger."""
+
+import pickle
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.drawdown import compute_drawdown_curve
+from src.backtest.metrics import compute_metrics
+from src.backtest.trade_ledger import (
+    ClosedTrade,
+    EquityCurve,
+    TradeLedger,
+    equity_arrays,
+    trade_column,
+)
+from src.models.core import TradeExecution
+
+T0 = pd.Timestamp("2024-01-01 00:00")
+
+
+def _closed_trades(n_trades: int = 50, seed: int = 0) -> list[ClosedTrade]:
+    rng = np.random.default_rng(seed)
+    trades = []
+    for k in range(n_trades):
+        opened = T0 + pd.Timedelta(hours=int(rng.integers(0, 500)))
+        held = pd.Timedelta(minutes=int(rng.integers(1, 900)))
+        trades.append(
+            ClosedTrade(
+                symbol=["EURUSD", "GBPUSD"][k % 2],
+                signal_id=f"sig-{k}",
+                direction="LONG" if rng.random() < 0.5 else "SHORT",
+                open_timestamp=opened,
+                close_timestamp=opened + held,
+                entry_price=1.1,
+                exit_price=1.2,
+                exit_reason="take_profit",
+                pnl_dollars=float(rng.normal(0, 5)),
+                pnl_r=float(rng.choice([-1.0, 0.0, 2.0])),
+                risk_amount=6.25 if k % 7 else 0.0,
+                portfolio_balance_at_exit=2500.0 + k,
+                risk_percent=0.0025 if k % 5 else 0.0,
+                entry_index=k,
+                exit_index=k + 3,
+                stop_distance=1e-3,
+            )
+        )
+    return trades
+
+
+def test_round_trip_and_sequence_protocol():
+    """Trades survive ledger round trips; slices and masks return ledgers."""
+    trades = _closed_trades()
+    ledger = TradeLedger.from_trades(trades)
+
+    assert len(ledger) == len(trades)
+    assert list(ledger) == trades
+    assert ledger[-1] == trades[-1]
+    assert TradeLedger.from_trades(ledger) is ledger
+    with pytest.raises(IndexError):
+        ledger[len(trades)]
+
+    longs = ledger[ledger.direction == 1]
+    assert isinstance(longs, TradeLedger)
+    assert list(longs) == [t for t in trades if t.direction == "LONG"]
+    assert list(ledger[2:5]) == trades[2:5]
+
+    ordered = ledger.sort_by_close()
+    assert list(ordered) == sorted(trades, key=lambda t: t.close_timestamp)
+
+    # Materialized trades are snapshots
+    ledger[0].pnl_r = 99.0
+    assert ledger.pnl_r[0] == trades[0].pnl_r
+
+    restored = pickle.loads(pickle.dumps(ledger))
+    assert list(restored) == trades
+    parts = [ledger[:10], TradeLedger.empty(), ledger[10:]]
+    assert list(TradeLedger.concat(parts)) == trades
+
+    frame = ledger.to_polars()
+    assert frame.height == len(trades)
+    assert frame["open_timestamp"].to_list()[0] == trades[0].open_timestamp
+
+
+def test_invalid_columns():
+    with pytest.raises(ValueError):
+        TradeLedger({"pnl_r": [1.0], "bogus": [1]})
+    with pytest.raises(ValueError):
+        TradeLedger({"pnl_r": [1.0, 2.0], "risk_amount": [1.0]})
+
+
+def test_from_trade_executions():
+    """TradeExecution fields map onto the ledger (fill prices, UTC times)."""
+    base = datetime(2025, 1, 2, 9, tzinfo=UTC)
+    executions = [
+        TradeExecution(
+            signal_id=str(k),
+            open_timestamp=base + timedelta(days=k),
+            close_timestamp=base + timedelta(days=k, hours=k + 1),
+            entry_fill_price=1.0,
+            exit_fill_price=1.0 + k / 10,
+            exit_reason="TARGET",
+            pnl_r=float(k - 1),
+            slippage_entry_pips=0,
+            slippage_exit_pips=0,
+        )
+        for k in range(4)
+    ]
+    ledger = TradeLedger.from_trades(executions)
+
+    assert ledger.tz == "UTC"
+    np.testing.assert_array_equal(ledger.exit_price, [1.0, 1.1, 1.2, 1.3])
+    assert ledger[1].open_timestamp == executions[1].open_timestamp
+    assert ledger[0].direction == ""
+
+    # Column consumers give the same answers for either form
+    by_ledger = compute_metrics(ledger)
+    by_list = compute_metrics(executions)
+    assert by_ledger == by_list
+    np.testing.assert_array_equal(
+        compute_drawdown_curve(ledger), compute_drawdown_curve(executions)
+    )
+    np.testing.assert_array_equal(trade_column(executions, "pnl_r"), ledger.pnl_r)
+
+
+def test_equity_curve():
+    ns = pd.date_range(T0, periods=4, freq="h").as_unit("ns").asi8
+    curve = EquityCurve(ns, [2500.0, 2510.0, 2490.0, 2495.0])
+
+    assert len(curve) == 4
+    assert curve[1] == (T0 + pd.Timedelta(hours=1), 2510.0)
+    assert curve == list(curve)
+    assert curve[1:] == EquityCurve(ns[1:], [2510.0, 2490.0, 2495.0])
+    assert pickle.loads(pickle.dumps(curve)) == curve
+
+    as_tuples = list(curve)
+    for arrays, expected in zip(equity_arrays(as_tuples), equity_arrays(curve)):
+        np.testing.assert_array_equal(arrays, expected)
+    assert len(EquityCurve.empty()) == 0
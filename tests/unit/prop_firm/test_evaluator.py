@@ -2,6 +2,11 @@
 Unit tests for Prop Firm Evaluator.
 """
 
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+
+from src.backtest.portfolio.mark_to_market import MarkToMarketEquity
 from src.risk.prop_firm.evaluator import evaluate_challenge
 from src.risk.prop_firm.models import ChallengeConfig
 
@@ -122,3 +127,42 @@ def test_static_drawdown(create_trade):
     trades.append(create_trade(-600.0, 2))
     result = evaluate_challenge(trades, config)
     assert result.status == "FAILED_DRAWDOWN"
+
+
+def _hourly_equity(values, starting_equity=10000.0):
+    """Equity curve with one bar per hour from 2025-01-01 12:00 UTC."""
+    start = datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+    hours = [start + timedelta(hours=h) for h in range(len(values))]
+    epoch_ns = np.array([int(ts.timestamp()) * 10**9 for ts in hours])
+    return MarkToMarketEquity(
+        epoch_ns=epoch_ns,
+        equity=np.asarray(values, dtype=np.float32),
+        starting_equity=starting_equity,
+    )
+
+
+def test_open_position_drawdown(base_config, create_trade):
+    """An intraday equity dip fails the level even if the trade recovers."""
+    trades = [create_trade(100.0, 0)]
+    assert evaluate_challenge(trades, base_config).status == "IN_PROGRESS"
+
+    # Trade open 12:00-13:00; marked at -$600 on the 12:00 bar (floor $9500)
+    equity = _hourly_equity([9400.0, 10100.0])
+    result = evaluate_challenge(trades, base_config, equity_curve=equity)
+    assert result.status == "FAILED_DRAWDOWN"
+    assert "(equity)" in result.failure_reason
+    assert result.end_balance == 9400.0
+    assert result.end_date == datetime(2025, 1, 1, 12, 0, tzinfo=UTC)
+
+    # A shallower dip is still a daily-loss breach with a 2% daily limit
+    config = base_config.model_copy(update={"max_daily_loss_pct": 0.02})
+    result = evaluate_challenge(
+        trades, config, equity_curve=_hourly_equity([9750.0, 10100.0])
+    )
+    assert result.status == "FAILED_DAILY"
+
+    result = evaluate_challenge(
+        trades, config, equity_curve=_hourly_equity([9900.0, 10100.0])
+    )
+    assert result.status == "IN_PROGRESS"
+    assert result.end_balance == 10100.0
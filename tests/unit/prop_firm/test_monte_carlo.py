@@ -0,0 +1,134 @@
+"""
+Unit tests for the Monte Carlo prop-firm engine.
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from src.backtest.trade_ledger import TradeLedger
+from src.risk.prop_firm.evaluator import evaluate_challenge
+from src.risk.prop_firm.monte_carlo import (
+    _trade_calendar,
+    _trade_pnl,
+    evaluate_paths,
+    resample_indices,
+    simulate_challenge,
+)
+
+
+def _random_trades(create_trade, seed, n_trades=60):
+    rng = np.random.default_rng(seed)
+    days = np.sort(rng.integers(0, 40, n_trades))
+    pnls = rng.choice([-200.0, -100.0, 80.0, 150.0, 200.0], n_trades)
+    return [create_trade(float(p), int(d)) for p, d in zip(pnls, days)]
+
+
+@pytest.mark.parametrize("seed", range(12))
+@pytest.mark.parametrize("drawdown_type", ["STATIC", "TRAILING"])
+def test_single_path_matches_evaluator(base_config, create_trade, seed, drawdown_type):
+    """The historical ordering evaluates exactly like evaluate_challenge."""
+    config = base_config.model_copy(
+        update={
+            "drawdown_type": drawdown_type,
+            "max_time_days": 30 if seed % 3 == 0 else None,
+            "max_daily_loss_pct": 0.02 if seed % 2 else 0.04,
+        }
+    )
+    trades = _random_trades(create_trade, seed)
+    expected = evaluate_challenge(trades, config)
+
+    day_ids, elapsed = _trade_calendar(trades, len(trades))
+    pnl = _trade_pnl(trades, config, None)[None, :]
+    result = evaluate_paths(pnl, day_ids, elapsed, config, stop_at_pass=False)
+
+    assert result.statuses[0] == expected.status
+    assert result.end_balances[0] == pytest.approx(expected.end_balance)
+
+
+def test_stop_at_pass(base_config, create_trade):
+    """Paths end at the first pass even if a later trade would breach."""
+    trades = [
+        create_trade(500.0, 0),
+        create_trade(300.0, 1),
+        create_trade(300.0, 2),
+        create_trade(-2000.0, 3),
+    ]
+    day_ids, elapsed = _trade_calendar(trades, len(trades))
+    pnl = _trade_pnl(trades, base_config, None)[None, :]
+
+    stopped = evaluate_paths(pnl, day_ids, elapsed, base_config)
+    assert stopped.statuses[0] == "PASSED"
+    assert stopped.trades_to_pass[0] == 3
+    assert stopped.days_to_pass[0] == 2
+    assert stopped.end_balances[0] == 11100.0
+
+    held = evaluate_paths(pnl, day_ids, elapsed, base_config, stop_at_pass=False)
+    assert held.statuses[0] == "FAILED_DRAWDOWN"
+
+
+def test_simulation_outputs(base_config, create_trade):
+    """10k paths: reproducible, complete breakdown, sensible risk response."""
+    trades = _random_trades(create_trade, 0, n_trades=200)
+
+    result = simulate_challenge(trades, base_config, n_paths=10_000, seed=1)
+    again = simulate_challenge(trades, base_config, n_paths=10_000, seed=1)
+
+    assert result.n_paths == 10_000
+    assert np.array_equal(result.statuses, again.statuses)
+    assert sum(result.status_breakdown.values()) == pytest.approx(1.0)
+    assert 0.0 < result.pass_rate < 1.0
+    passed = result.statuses == "PASSED"
+    assert (result.trades_to_pass[passed] >= base_config.min_trading_days).all()
+    assert (result.days_to_pass[~passed] == -1).all()
+    quantiles = result.time_to_pass_quantiles()
+    assert quantiles[0.1] <= quantiles[0.5] <= quantiles[0.9]
+
+    # Doubling the risk per trade makes drawdown failures more likely
+    low = simulate_challenge(trades, base_config, 2_000, risk_per_trade=0.005, seed=2)
+    high = simulate_challenge(trades, base_config, 2_000, risk_per_trade=0.02, seed=2)
+    assert (
+        high.status_breakdown["FAILED_DRAWDOWN"]
+        > low.status_breakdown["FAILED_DRAWDOWN"]
+    )
+
+
+def test_resample_indices():
+    """Blocks are consecutive (circular); shuffles are permutations."""
+    rng = np.random.default_rng(0)
+    blocks = resample_indices(10, 5, 12, block_size=4, rng=rng)
+    assert blocks.shape == (5, 12)
+    assert ((blocks[:, 1:4] - blocks[:, :3]) % 10 == 1).all()
+
+    shuffled = resample_indices(10, 5, 10, method="shuffle", rng=rng)
+    assert (np.sort(shuffled, axis=1) == np.arange(10)).all()
+
+    with pytest.raises(ValueError):
+        resample_indices(10, 5, 11, method="shuffle")
+    with pytest.raises(ValueError):
+        resample_indices(10, 5, 10, block_size=0)
+
+
+@pytest.mark.parametrize("risk_per_trade", [None, 0.01])
+def test_ledger_input_matches_trade_objects(base_config, create_trade, risk_per_trade):
+    """A TradeLedger is evaluated from its columns like the trade objects."""
+    trades = _random_trades(create_trade, 3)
+    trades[5] = dataclasses.replace(trades[5], risk_amount=0.0)
+    ledger = TradeLedger.from_trades(trades)
+
+    np.testing.assert_allclose(
+        _trade_pnl(ledger, base_config, risk_per_trade),
+        _trade_pnl(trades, base_config, risk_per_trade),
+    )
+    for from_ledger, from_objects in zip(
+        _trade_calendar(ledger, 90), _trade_calendar(trades, 90)
+    ):
+        np.testing.assert_array_equal(from_ledger, from_objects)
+
+    by_ledger = simulate_challenge(ledger, base_config, 500, seed=4)
+    by_objects = simulate_challenge(trades, base_config, 500, seed=4)
+    assert np.array_equal(by_ledger.statuses, by_objects.statuses)
+    assert evaluate_challenge(ledger, base_config) == evaluate_challenge(
+        trades, base_config
+    )
@@ -0,0 +1,175 @@
+"""Unit tests for batched multi-period indicators and signal variants."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.backtest.vectorized_rolling_window import (
+    calculate_atr,
+    calculate_ema,
+    calculate_rsi,
+    calculate_stoch_rsi,
+)
+from src.indicators import batched
+from src.indicators.dispatcher import (
+    calculate_indicator_variants,
+    calculate_indicators,
+)
+from src.indicators.stats import calculate_zscore
+from src.strategy.trend_pullback.signal_generator_vectorized import (
+    generate_signal_batch,
+    generate_signal_batches,
+)
+
+PERIODS = [5, 14, 30]
+
+
+@pytest.fixture(name="ohlcv")
+def fixture_ohlcv():
+    """Random-walk bars with a flat stretch."""
+    rng = np.random.default_rng(3)
+    n_bars = 5_000
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    close[100:140] = close[100]
+    start = datetime(2024, 1, 1)
+    return pl.DataFrame(
+        {
+            "timestamp_utc": pl.datetime_range(
+                start, start + timedelta(minutes=n_bars - 1), "1m", eager=True
+            ),
+            "open": np.r_[close[0], close[:-1]] + rng.normal(0, 1e-4, n_bars),
+            "high": close + np.abs(rng.normal(0, 3e-4, n_bars)),
+            "low": close - np.abs(rng.normal(0, 3e-4, n_bars)),
+            "close": close,
+        }
+    )
+
+
+def assert_block_matches(block, expected_columns):
+    for k, expected in enumerate(expected_columns):
+        assert np.array_equal(block[:, k], expected.to_numpy(), equal_nan=True)
+
+
+@pytest.mark.parametrize("jit", [True, False])
+def test_blocks_match_single_period_functions(ohlcv, monkeypatch, jit):
+    """Float64 blocks are bit-identical to the per-period calculations."""
+    if not jit:
+        monkeypatch.setattr(batched, "_ema_loop_jit", None)
+    close = ohlcv["close"].to_numpy()
+    high, low = ohlcv["high"].to_numpy(), ohlcv["low"].to_numpy()
+    f64 = np.float64
+
+    assert_block_matches(
+        batched.ema_block(close, PERIODS, f64),
+        [calculate_ema(ohlcv, p)[f"ema{p}"] for p in PERIODS],
+    )
+    assert_block_matches(
+        batched.atr_block(high, low, close, PERIODS, f64),
+        [calculate_atr(ohlcv, p)[f"atr{p}"] for p in PERIODS],
+    )
+    assert_block_matches(
+        batched.rsi_block(close, PERIODS, f64),
+        [calculate_rsi(ohlcv, p)["rsi"] for p in PERIODS],
+    )
+    with_rsi = calculate_rsi(ohlcv, 14)
+    assert_block_matches(
+        batched.stoch_rsi_block(with_rsi["rsi"].to_numpy(), PERIODS, f64),
+        [calculate_stoch_rsi(with_rsi, p)["stoch_rsi"] for p in PERIODS],
+    )
+    assert_block_matches(
+        batched.zscore_block(close, PERIODS, f64),
+        [calculate_zscore(ohlcv, p)[f"zscore_{p}"] for p in PERIODS],
+    )
+
+
+def test_interior_nan_matches_polars_fallback(ohlcv, monkeypatch):
+    """A missing bar after seeding gives the same blocks with and without numba."""
+    if batched._ema_loop_jit is None:
+        pytest.skip("numba not installed")
+    close = ohlcv["close"].to_numpy().copy()
+    high, low = ohlcv["high"].to_numpy(), ohlcv["low"].to_numpy()
+    close[[0, 1, 250, 1_000, 1_001, 1_002]] = np.nan
+
+    def blocks():
+        return [
+            batched.ema_block(close, PERIODS, np.float64),
+            batched.atr_block(high, low, close, PERIODS, np.float64),
+            batched.rsi_block(close, PERIODS, np.float64),
+        ]
+
+    compiled = blocks()
+    monkeypatch.setattr(batched, "_ema_loop_jit", None)
+    for block, fallback in zip(compiled, blocks()):
+        assert np.isfinite(block[-1]).all()
+        assert np.array_equal(block, fallback, equal_nan=True)
+
+
+def test_block_shape_dtype_and_validation(ohlcv):
+    """Blocks default to float32 (bars x periods); bad periods raise."""
+    block = batched.ema_block(ohlcv["close"].to_numpy(), [10, 20])
+
+    assert block.shape == (ohlcv.height, 2)
+    assert block.dtype == np.float32
+    with pytest.raises(ValueError):
+        batched.ema_block(ohlcv["close"].to_numpy(), [])
+    with pytest.raises(ValueError):
+        batched.rolling_mean_block(ohlcv["close"].to_numpy(), [0])
+
+
+OVERRIDE_SETS = [
+    {
+        "fast_ema": {"period": fast},
+        "slow_ema": {"period": slow},
+        "atr": {"period": atr},
+        "stoch_rsi": {"rsi_period": rsi, "stoch_period": 14},
+    }
+    for fast, slow, atr, rsi in [
+        (10, 50, 14, 14),
+        (20, 50, 14, 14),
+        (10, 60, 7, 10),
+        (10, 50, 14, 14),
+    ]
+]
+INDICATORS = [
+    "fast_ema",
+    "slow_ema",
+    "atr",
+    "stoch_rsi",
+    "ema(period=5, column='fast_ema')",
+]
+
+
+def test_variants_match_calculate_indicators(ohlcv):
+    """Each variant equals a separate calculate_indicators call."""
+    variants = calculate_indicator_variants(ohlcv, INDICATORS, OVERRIDE_SETS)
+
+    assert len(variants) == len(OVERRIDE_SETS)
+    # Identical override sets share columns
+    assert variants.mappings[0] == variants.mappings[3]
+    for k, overrides in enumerate(OVERRIDE_SETS):
+        expected = calculate_indicators(ohlcv, INDICATORS, overrides=overrides)
+        assert variants.variant(k).equals(expected)
+
+
+def test_signal_variants_match_single_generation(ohlcv):
+    """One multi-variant pass yields the same batches as one pass per variant."""
+    variants = calculate_indicator_variants(
+        ohlcv, ["fast_ema", "slow_ema", "atr", "stoch_rsi"], OVERRIDE_SETS
+    )
+    parameter_sets = [
+        {"pair": "EURUSD", "rsi_oversold": 40.0, "ema_fast": fast}
+        for fast in (10, 20, 10, 10)
+    ]
+
+    batches = generate_signal_batches(
+        variants.frame, parameter_sets, variants.mappings, direction_mode="BOTH"
+    )
+
+    assert sum(len(b) for b in batches) > 0
+    for k, batch in enumerate(batches):
+        expected = generate_signal_batch(variants.variant(k), parameter_sets[k])
+        assert batch.frame.equals(expected.frame)
+    with pytest.raises(ValueError):
+        generate_signal_batches(variants.frame, parameter_sets, [{}])
@@ -0,0 +1,106 @@
+"""Unit tests for the columnar CandleSeries used by candle-based strategies."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.models.candle_series import CandleSeries, CandleView
+from src.models.core import Candle
+from src.strategy.zscore_mean_reversion.strategy import ZScoreMeanReversionStrategy
+
+
+def _enriched_frame(n: int = 600, seed: int = 7) -> pl.DataFrame:
+    """Random-walk OHLCV frame with zscore/mean/atr columns (leading nulls)."""
+    rng = np.random.default_rng(seed)
+    close = 1.10 + np.cumsum(rng.normal(0, 0.0008, n))
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    df = pl.DataFrame(
+        {
+            "timestamp_utc": [start + timedelta(minutes=i) for i in range(n)],
+            "open": close + rng.normal(0, 0.0001, n),
+            "high": close + 0.0005,
+            "low": close - 0.0005,
+            "close": close,
+            "volume": rng.integers(50, 500, n).astype(np.float64),
+        }
+    )
+    return df.with_columns(
+        pl.col("close").rolling_mean(100).alias("mean_100"),
+        (
+            (pl.col("close") - pl.col("close").rolling_mean(100))
+            / pl.col("close").rolling_std(100)
+        ).alias("zscore_100"),
+        (pl.col("high") - pl.col("low")).rolling_mean(14).alias("atr14"),
+    )
+
+
+def _candles_from_dicts(df: pl.DataFrame) -> list[Candle]:
+    """Reference conversion (previous engine behaviour)."""
+    base = ["timestamp_utc", "open", "high", "low", "close", "volume"]
+    return [
+        Candle(
+            timestamp_utc=r["timestamp_utc"],
+            open=r["open"],
+            high=r["high"],
+            low=r["low"],
+            close=r["close"],
+            volume=r["volume"],
+            indicators={k: v for k, v in r.items() if k not in base},
+        )
+        for r in df.to_dicts()
+    ]
+
+
+def test_rows_match_to_dicts():
+    """Every field, including nulls and tz-aware timestamps, matches to_dicts."""
+    df = _enriched_frame(200)
+    series = CandleSeries(df)
+    reference = _candles_from_dicts(df)
+
+    assert len(series) == len(reference)
+    for view, candle in zip(series, reference):
+        assert view.timestamp_utc == candle.timestamp_utc
+        assert view.timestamp_utc.tzinfo is not None
+        assert (view.open, view.high, view.low, view.close, view.volume) == (
+            candle.open,
+            candle.high,
+            candle.low,
+            candle.close,
+            candle.volume,
+        )
+        assert dict(view.indicators) == candle.indicators
+        assert view.atr == candle.atr
+    assert series[0].indicators.get("zscore_100") is None
+
+
+def test_indexing_and_slicing():
+    """Negative indices and slices behave like a list and share buffers."""
+    df = _enriched_frame(50)
+    series = CandleSeries(df)
+    closes = df["close"].to_list()
+
+    assert series[-1].close == closes[-1]
+    assert [c.close for c in series[-5:]] == closes[-5:]
+    assert [c.close for c in series[1:10:3]] == closes[1:10:3]
+    assert series[10:20][-1].close == closes[19]
+    np.testing.assert_array_equal(series[5:8].column("close"), closes[5:8])
+    assert isinstance(series[3], CandleView)
+    with pytest.raises(IndexError):
+        series[50]
+    with pytest.raises(KeyError):
+        series[0].indicators["missing"]
+
+
+def test_zscore_signals_identical_to_candle_list():
+    """generate_signals produces the same signals from either representation."""
+    df = _enriched_frame()
+    params = {"pair": "EURUSD"}
+    strategy = ZScoreMeanReversionStrategy()
+
+    expected = strategy.generate_signals(_candles_from_dicts(df), params, "BOTH")
+    actual = strategy.generate_signals(CandleSeries(df), params, "BOTH")
+
+    assert len(actual) > 0
+    assert actual == expected
@@ -9,6 +9,7 @@ and load+slice timing (SC-003: ≤60s for 10M rows).
 import time
 import pytest
 import pandas as pd
+import polars as pl
 from src.backtest.chunking import (
     slice_dataset,
     slice_dataset_list,
@@ -142,6 +143,14 @@ class TestSliceDatasetDispatch:
         assert isinstance(result, pd.DataFrame)
         assert len(result) == 50
 
+    def test_dispatch_to_polars(self):
+        """Polars frames slice to the same rows as pandas frames."""
+        df = pl.DataFrame({"value": range(1, 101)})
+        assert slice_dataset(df, fraction=0.5)["value"].to_list() == list(range(1, 51))
+        second = slice_dataset(df, fraction=0.25, portion=2)
+        assert isinstance(second, pl.DataFrame)
+        assert second["value"].to_list() == list(range(26, 51))
+
 
 class TestChunkData:
     """Test chunk_data function."""
@@ -0,0 +1,93 @@
+"""Unit tests for the Polars sort-merge and parallel dataset build."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data_io import dataset_builder
+from src.data_io.dataset_builder import build_all_symbols, merge_and_sort
+
+
+def _write_year(path, start, periods, seed, header="timestamp"):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, periods))
+    pd.DataFrame(
+        {
+            header: pd.date_range(start, periods=periods, freq="1min", tz="UTC"),
+            "open": close,
+            "high": close + 1e-4,
+            "low": close - 1e-4,
+            "close": close,
+            "volume": rng.integers(1, 100, periods),
+        }
+    ).to_csv(path, index=False)
+
+
+@pytest.fixture(name="raw_path")
+def fixture_raw_path(tmp_path):
+    """Two symbols with yearly files; eurusd's files overlap by 30 bars."""
+    raw = tmp_path / "raw"
+    for symbol, seed in (("eurusd", 0), ("usdjpy", 10)):
+        (raw / symbol).mkdir(parents=True)
+        _write_year(raw / symbol / "2021.csv", "2021-12-31 22:00", 400, seed + 1)
+        _write_year(raw / symbol / "2020.csv", "2020-12-31 20:00", 500, seed)
+    _write_year(
+        raw / "eurusd" / "2022.csv", "2022-01-01 04:10", 300, 7, header="Timestamp"
+    )
+    return raw
+
+
+def test_merge_matches_pandas_reference(raw_path):
+    """Merged rows equal a pandas concat, sort and keep-first dedup."""
+    files = sorted(str(f) for f in (raw_path / "eurusd").glob("*.csv"))
+
+    merged, gap_count, overlap_count = merge_and_sort("eurusd", files)
+
+    frames = [pd.read_csv(f) for f in files]
+    for frame in frames:
+        frame.columns = frame.columns.str.lower()
+    expected = pd.concat(frames, ignore_index=True)
+    expected["timestamp"] = pd.to_datetime(expected["timestamp"], utc=True)
+    expected = (
+        expected.sort_values("timestamp", kind="stable")
+        .drop_duplicates("timestamp", keep="first")
+        .reset_index(drop=True)
+    )
+
+    assert overlap_count == 30
+    assert gap_count == 1
+    assert merged["timestamp"].is_sorted()
+    pd.testing.assert_frame_equal(
+        merged.to_pandas(), expected, check_dtype=False, check_index_type=False
+    )
+
+
+def test_parallel_build_matches_serial(raw_path, tmp_path, monkeypatch):
+    """Worker processes write the same partitions as a serial build."""
+    serial = build_all_symbols(str(raw_path), str(tmp_path / "serial"), max_workers=1)
+    monkeypatch.setattr(dataset_builder, "get_worker_count", lambda requested: 2)
+    parallel = build_all_symbols(str(raw_path), str(tmp_path / "parallel"))
+
+    assert (
+        parallel.symbols_processed
+        == serial.symbols_processed
+        == [
+            "eurusd",
+            "usdjpy",
+        ]
+    )
+    assert parallel.total_rows_processed == serial.total_rows_processed == 2_070
+    for symbol in serial.symbols_processed:
+        for part in ("test", "validate"):
+            name = f"{symbol}/{part}/{symbol}_{part}.csv"
+            serial_text = (tmp_path / "serial" / name).read_text()
+            assert (tmp_path / "parallel" / name).read_text() == serial_text
+        metadata = json.loads(
+            (tmp_path / "parallel" / symbol / "metadata.json").read_text()
+        )
+        assert metadata["start_timestamp"].startswith("2020-12-31T20:00:00")
+
+    written = pd.read_csv(tmp_path / "serial/eurusd/test/eurusd_test.csv")
+    assert str(pd.to_datetime(written["timestamp"]).dt.tz) == "UTC"
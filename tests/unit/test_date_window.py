@@ -0,0 +1,123 @@
+"""Unit tests for date-range and column pushdown in the backtest entry path."""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.backtest import engine
+from src.config.parameters import StrategyParameters
+from src.data_io.sorted_write import write_parquet_sorted
+from src.indicators.dispatcher import indicator_requirements
+from src.models.enums import DirectionMode
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture(name="frame")
+def fixture_frame():
+    """Ten days of one-minute bars with weekend-sized gaps."""
+    rng = np.random.default_rng(5)
+    timestamps = pl.datetime_range(
+        START, START + timedelta(days=10), "1m", eager=True, time_zone="UTC"
+    )
+    # Drop a two-day block so the warm-up search has to widen its window
+    timestamps = timestamps.filter(
+        (timestamps < START + timedelta(days=4))
+        | (timestamps >= START + timedelta(days=6))
+    )
+    n_bars = len(timestamps)
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    return pl.DataFrame(
+        {
+            "timestamp_utc": timestamps,
+            "open": np.r_[close[0], close[:-1]] + rng.normal(0, 1e-4, n_bars),
+            "high": close + np.abs(rng.normal(0, 3e-4, n_bars)),
+            "low": close - np.abs(rng.normal(0, 3e-4, n_bars)),
+            "close": close,
+            "volume": np.ones(n_bars),
+            "is_gap": np.zeros(n_bars, dtype=bool),
+        }
+    )
+
+
+@pytest.fixture(name="parquet_path")
+def fixture_parquet_path(frame, tmp_path):
+    """The frame as a sorted Parquet file with small row groups."""
+    path = tmp_path / "eurusd_test.parquet"
+    write_parquet_sorted(
+        frame.drop("is_gap").rename({"timestamp_utc": "timestamp"}),
+        str(path),
+        row_group_size=1_000,
+    )
+    return path
+
+
+def test_indicator_requirements():
+    """Columns follow the indicators' inputs; lookback chains periods."""
+    requirements = indicator_requirements(
+        ["fast_ema", "atr", "stoch_rsi"],
+        {"fast_ema": {"period": 20}, "stoch_rsi": {"rsi_period": 10}},
+    )
+    assert requirements.columns == {"open", "high", "low", "close"}
+    assert requirements.lookback == 24
+
+    on_volume = indicator_requirements(["ema(period=5, column='volume')"])
+    assert "volume" in on_volume.columns
+    custom = indicator_requirements(["mine"], custom_registry={"mine": len})
+    assert custom.columns is None
+
+
+def test_window_load_matches_full_load(frame, parquet_path):
+    """The pushed-down read equals slicing the fully loaded frame."""
+    start = START + timedelta(days=6, hours=3)
+    end = START + timedelta(days=7)
+    columns = frozenset({"open", "high", "low", "close"})
+
+    window = engine.load_symbol_window(
+        parquet_path, start, end, columns=columns, warmup_bars=3_000
+    )
+    expected = engine.window_frame(frame, start, end, warmup_bars=3_000)
+
+    assert window.columns == ["timestamp_utc", "open", "high", "low", "close"]
+    assert window.equals(expected.select(window.columns))
+    # The warm-up reaches back across the gap
+    assert window["timestamp_utc"][0] < START + timedelta(days=4)
+
+    naive_end = datetime(2024, 1, 8)
+    full = engine.load_symbol_window(parquet_path, end=naive_end)
+    assert full.equals(engine.window_frame(frame, end=naive_end))
+
+
+def test_ranged_backtest_trades_only_in_range(frame, parquet_path):
+    """Ranged runs read only the window and trade only inside it."""
+    start = START + timedelta(days=6)
+    end = START + timedelta(days=8)
+    kwargs = {
+        "direction_mode": DirectionMode.BOTH,
+        "strategy_params": StrategyParameters(),
+        "show_progress": False,
+        "use_indicator_cache": False,
+        "start": start,
+        "end": end,
+    }
+
+    from_disk, data = engine.run_portfolio_backtest(
+        [("EURUSD", parquet_path)], **kwargs
+    )
+    preloaded, _ = engine.run_portfolio_backtest(
+        [("EURUSD", parquet_path)], preloaded_data={"EURUSD": frame}, **kwargs
+    )
+
+    timestamps = data["EURUSD"]["timestamp_utc"]
+    assert timestamps[0] >= start and timestamps[-1] <= end
+    assert from_disk.total_trades > 0
+    opened = [t.open_timestamp.replace(tzinfo=UTC) for t in from_disk.closed_trades]
+    assert all(start <= t <= end for t in opened)
+    assert from_disk.final_equity == preloaded.final_equity
+    with pytest.raises(ValueError):
+        engine.run_portfolio_backtest(
+            [("EURUSD", parquet_path)],
+            **{**kwargs, "start": START + timedelta(days=30), "end": None},
+        )
@@ -0,0 +1,207 @@
+"""Unit tests for the early-exit stop/target search engine."""
+
+import numpy as np
+import pytest
+
+from src.backtest import exit_search
+from src.backtest.batch_simulation import BatchSimulation
+from src.backtest.exit_search import (
+    EXIT_STOP_LOSS,
+    EXIT_TAKE_PROFIT,
+    EXIT_TIMEOUT,
+    find_first_exits,
+    find_sequential_exits,
+)
+
+SEARCH_MODES = [
+    pytest.param(False, id="chunked"),
+    pytest.param(
+        True,
+        id="jit",
+        marks=pytest.mark.skipif(
+            not exit_search._NUMBA_AVAILABLE, reason="numba not installed"
+        ),
+    ),
+]
+
+
+def _reference_exits(entries, stops, targets, directions, highs, lows, closes, horizon):
+    """Naive per-bar reference implementation."""
+    n_bars = len(highs)
+    out = []
+    for entry, stop, target, direction in zip(entries, stops, targets, directions):
+        last = n_bars - 1 if horizon is None else min(entry + horizon, n_bars - 1)
+        last = max(last, entry)
+        result = (last, closes[last], EXIT_TIMEOUT)
+        for i in range(entry + 1, last + 1):
+            if direction == 1:
+                stop_hit, target_hit = lows[i] <= stop, highs[i] >= target
+            else:
+                stop_hit, target_hit = highs[i] >= stop, lows[i] <= target
+            if stop_hit:
+                result = (i, stop, EXIT_STOP_LOSS)
+                break
+            if target_hit:
+                result = (i, target, EXIT_TAKE_PROFIT)
+                break
+        out.append(result)
+    return out
+
+
+@pytest.fixture(name="market")
+def fixture_market():
+    """Random-walk prices with mixed-direction entries."""
+    rng = np.random.default_rng(7)
+    n_bars = 5_000
+    closes = 1.1 + np.cumsum(rng.normal(0, 2e-4, n_bars))
+    highs = closes + np.abs(rng.normal(0, 1e-4, n_bars))
+    lows = closes - np.abs(rng.normal(0, 1e-4, n_bars))
+
+    entries = np.sort(rng.choice(n_bars, 300, replace=False))
+    entries[-1] = n_bars - 1
+    directions = np.where(rng.random(300) < 0.5, 1, -1).astype(np.int8)
+    stop_dist = rng.uniform(2e-4, 3e-3, 300)
+    target_dist = rng.uniform(2e-4, 6e-3, 300)
+    stops = closes[entries] - directions * stop_dist
+    targets = closes[entries] + directions * target_dist
+    return entries, stops, targets, directions, highs, lows, closes
+
+
+@pytest.mark.parametrize("use_jit", SEARCH_MODES)
+@pytest.mark.parametrize("horizon", [None, 1, 50, 500])
+def test_matches_reference(market, use_jit, horizon):
+    """Both search paths match a naive bar-by-bar scan."""
+    expected = _reference_exits(*market, horizon)
+
+    exit_idx, exit_price, reasons = find_first_exits(
+        *market, max_holding_bars=horizon, use_jit=use_jit
+    )
+
+    assert exit_idx.tolist() == [e[0] for e in expected]
+    assert exit_price.tolist() == [float(e[1]) for e in expected]
+    assert reasons.tolist() == [e[2] for e in expected]
+
+
+@pytest.mark.parametrize("use_jit", SEARCH_MODES)
+@pytest.mark.parametrize("horizon", [None, 50])
+def test_sequential_matches_greedy_filter(market, use_jit, horizon):
+    """Skip-ahead search equals searching every entry then filtering overlaps."""
+    expected = _reference_exits(*market, horizon)
+    accepted_ref, last_exit = [], -1
+    for pos, entry in enumerate(market[0]):
+        if entry > last_exit:
+            accepted_ref.append(pos)
+            last_exit = expected[pos][0]
+
+    accepted, exit_idx, exit_price, reasons = find_sequential_exits(
+        *market, max_holding_bars=horizon, use_jit=use_jit
+    )
+
+    assert accepted.tolist() == accepted_ref
+    assert exit_idx.tolist() == [expected[p][0] for p in accepted_ref]
+    assert exit_price.tolist() == [float(expected[p][1]) for p in accepted_ref]
+    assert reasons.tolist() == [expected[p][2] for p in accepted_ref]
+
+    entries, *rest = market
+    with pytest.raises(ValueError, match="sorted"):
+        find_sequential_exits(entries[::-1].copy(), *rest, use_jit=use_jit)
+
+
+@pytest.mark.parametrize("use_jit", SEARCH_MODES)
+def test_same_bar_prefers_stop(use_jit):
+    """Stop wins when stop and target hit on the same candle."""
+    highs = np.array([1.0, 1.2, 1.0])
+    lows = np.array([1.0, 0.8, 1.0])
+    closes = np.array([1.0, 1.0, 1.0])
+
+    exit_idx, exit_price, reasons = find_first_exits(
+        np.array([0]),
+        np.array([0.9]),
+        np.array([1.1]),
+        np.array([1]),
+        highs,
+        lows,
+        closes,
+        use_jit=use_jit,
+    )
+
+    assert exit_idx.tolist() == [1]
+    assert exit_price.tolist() == [0.9]
+    assert reasons.tolist() == [EXIT_STOP_LOSS]
+
+
+@pytest.mark.parametrize("use_jit", SEARCH_MODES)
+def test_timeout_exits_on_close(use_jit):
+    """Trades with no hit exit on the close of the last bar in the horizon."""
+    highs = np.full(10, 1.01)
+    lows = np.full(10, 0.99)
+    closes = np.linspace(1.0, 1.009, 10)
+
+    exit_idx, exit_price, reasons = find_first_exits(
+        np.array([2]),
+        np.array([0.5]),
+        np.array([2.0]),
+        np.array([1]),
+        highs,
+        lows,
+        closes,
+        max_holding_bars=4,
+        use_jit=use_jit,
+    )
+
+    assert exit_idx.tolist() == [6]
+    assert exit_price.tolist() == [closes[6]]
+    assert reasons.tolist() == [EXIT_TIMEOUT]
+
+
+def test_invalid_horizon_raises():
+    """Non-positive horizons are rejected."""
+    prices = np.ones(3)
+    with pytest.raises(ValueError, match="max_holding_bars"):
+        find_first_exits(
+            np.array([0]),
+            prices[:1],
+            prices[:1],
+            np.array([1]),
+            prices,
+            prices,
+            prices,
+            max_holding_bars=0,
+        )
+
+
+def test_batch_simulation_holds_past_old_lookahead():
+    """BatchSimulation is no longer capped at a 100-candle lookahead."""
+    n_bars = 500
+    opens = np.full(n_bars, 1.1000)
+    highs = opens + 0.0001
+    lows = opens - 0.0001
+    highs[300] = 1.1100  # Target only reachable after 300 candles
+    closes = opens.copy()
+    timestamps = np.arange(n_bars)
+
+    simulator = BatchSimulation(enable_progress=False)
+    result = simulator.simulate(
+        signal_indices=np.array([0]),
+        stop_prices=np.array([1.0900]),
+        target_prices=np.array([1.1050]),
+        position_sizes=np.array([1.0]),
+        timestamps=timestamps,
+        ohlc_arrays=(timestamps, opens, highs, lows, closes),
+    )
+
+    assert result.exit_indices.tolist() == [300]
+    assert result.exit_reasons.tolist() == [EXIT_TAKE_PROFIT]
+
+    capped = BatchSimulation(enable_progress=False, max_holding_bars=100)
+    result = capped.simulate(
+        signal_indices=np.array([0]),
+        stop_prices=np.array([1.0900]),
+        target_prices=np.array([1.1050]),
+        position_sizes=np.array([1.0]),
+        timestamps=timestamps,
+        ohlc_arrays=(timestamps, opens, highs, lows, closes),
+    )
+
+    assert result.exit_indices.tolist() == [100]
+    assert result.exit_reasons.tolist() == [EXIT_TIMEOUT]
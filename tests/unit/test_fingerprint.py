@@ -0,0 +1,129 @@
+"""Unit tests for file and frame fingerprints."""
+
+import os
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from src.data_io import fingerprint, parquet_cache
+from src.data_io.fingerprint import (
+    file_fingerprint,
+    fingerprint_matches,
+    hash_file,
+    hash_frame,
+    new_hasher,
+    sidecar_path,
+)
+
+
+@pytest.fixture(name="csv_file")
+def fixture_csv_file(tmp_path):
+    path = tmp_path / "eurusd.csv"
+    rng = np.random.default_rng(0)
+    pd.DataFrame({"close": rng.normal(size=2_000), "volume": range(2_000)}).to_csv(
+        path, index=False
+    )
+    return path
+
+
+@pytest.fixture(name="count_hashes")
+def fixture_count_hashes(monkeypatch):
+    """Count full-file hashes."""
+    calls = []
+
+    def counting(path, algorithm=fingerprint.HASH_ALGORITHM):
+        calls.append(path)
+        return hash_file(path, algorithm)
+
+    monkeypatch.setattr(fingerprint, "hash_file", counting)
+    return calls
+
+
+def test_hash_file_matches_in_memory_hash(csv_file, monkeypatch):
+    """Chunked mmap hashing equals hashing the bytes at once."""
+    monkeypatch.setattr(fingerprint, "HASH_CHUNK_SIZE", 1_000)
+    hasher = new_hasher()
+    hasher.update(csv_file.read_bytes())
+    assert hash_file(csv_file) == hasher.hexdigest()
+
+    empty = csv_file.with_name("empty.csv")
+    empty.touch()
+    assert hash_file(empty) == new_hasher().hexdigest()
+
+
+def test_stat_fast_path_and_sidecar(csv_file, count_hashes):
+    """Unchanged files are never read; touched files are hashed once."""
+    recorded = file_fingerprint(csv_file, with_digest=True)
+    assert len(count_hashes) == 1
+    assert sidecar_path(csv_file).exists()
+
+    assert fingerprint_matches(csv_file, recorded)
+    assert file_fingerprint(csv_file, with_digest=True) == recorded
+    assert len(count_hashes) == 1
+
+    # Touch: same content, new mtime -> one hash, then served by the sidecar
+    stat = csv_file.stat()
+    os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert fingerprint_matches(csv_file, recorded)
+    assert fingerprint_matches(csv_file, recorded)
+    assert len(count_hashes) == 2
+
+    # Same size, different content
+    data = bytearray(csv_file.read_bytes())
+    data[-2] = ord("9") if data[-2] != ord("9") else ord("8")
+    csv_file.write_bytes(bytes(data))
+    assert not fingerprint_matches(csv_file, recorded)
+
+    # One sidecar serves several algorithms
+    sha = file_fingerprint(csv_file, with_digest=True, algorithm="sha256")
+    assert file_fingerprint(csv_file, algorithm="sha256").digest == sha.digest
+
+
+def test_parquet_cache_validation_skips_hashing(
+    csv_file, tmp_path, monkeypatch, count_hashes
+):
+    """A cached CSV is validated from its stat, not its content."""
+    monkeypatch.setattr(parquet_cache, "CACHE_DIR", tmp_path / "cache")
+    parquet_cache.CACHE_DIR.mkdir()
+    cache_path = parquet_cache._get_cache_path(csv_file)
+
+    first = parquet_cache.load_with_cache(csv_file)
+    hashes = len(count_hashes)
+    assert parquet_cache._is_cache_valid(csv_file, cache_path)
+    second = parquet_cache.load_with_cache(csv_file, return_polars=True)
+    assert len(count_hashes) == hashes
+    assert second.to_pandas().equals(first)
+
+    csv_file.write_text("close,volume\n1.0,1\n", encoding="utf-8")
+    assert not parquet_cache._is_cache_valid(csv_file, cache_path)
+
+
+def test_hash_frame():
+    """Buffer hashes are chunk-independent and value/dtype sensitive."""
+    frame = pl.DataFrame(
+        {
+            "timestamp": pl.datetime_range(
+                pl.datetime(2024, 1, 1),
+                pl.datetime(2024, 1, 1, 0, 9),
+                "1m",
+                eager=True,
+            ),
+            "close": np.linspace(1.0, 2.0, 10),
+            "symbol": ["EURUSD"] * 9 + [None],
+        }
+    )
+    columns = ["timestamp", "close", "symbol"]
+    digest = hash_frame(frame, columns)
+
+    chunked = pl.concat([frame[:4], frame[4:]], rechunk=False)
+    assert hash_frame(chunked, columns) == digest
+    assert hash_frame(frame, ["close", "timestamp"]) != hash_frame(
+        frame, ["timestamp", "close"]
+    )
+    changed = frame.with_columns(pl.col("close").shift(1))
+    assert hash_frame(changed, columns) != digest
+    as_float32 = frame.with_columns(pl.col("close").cast(pl.Float32))
+    assert hash_frame(as_float32, columns) != digest
+    assert hash_frame(frame.to_pandas(), ["close"]) == hash_frame(frame, ["close"])
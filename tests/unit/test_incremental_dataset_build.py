@@ -0,0 +1,135 @@
+"""Unit tests for incremental (append-only) dataset builds."""
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from src.data_io.dataset_builder import build_symbol_dataset
+from src.data_io.source_index import SourceIndex
+
+SYMBOL = "eurusd"
+
+
+def _bars(start, periods, seed):
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, periods))
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start, periods=periods, freq="1min", tz="UTC"),
+            "open": close,
+            "high": close + 1e-4,
+            "low": close - 1e-4,
+            "close": close,
+            "volume": rng.integers(1, 100, periods),
+        }
+    )
+
+
+def _read_all(output_path):
+    base = output_path / SYMBOL
+    return pd.concat(
+        [
+            pd.read_csv(base / "test" / f"{SYMBOL}_test.csv"),
+            pd.read_csv(base / "validate" / f"{SYMBOL}_validate.csv"),
+        ],
+        ignore_index=True,
+    )
+
+
+@pytest.fixture(name="raw_path")
+def fixture_raw_path(tmp_path):
+    """Three monthly files of 2000 bars each."""
+    raw = tmp_path / "raw" / SYMBOL
+    raw.mkdir(parents=True)
+    for month in (1, 2, 3):
+        _bars(f"2024-{month:02d}-01", 2_000, month).to_csv(
+            raw / f"{SYMBOL}_2024{month:02d}.csv", index=False
+        )
+    return raw.parent
+
+
+def test_new_file_is_appended(raw_path, tmp_path, caplog):
+    """A new month is appended; rows and counts match a full build."""
+    out = tmp_path / "out"
+    build_symbol_dataset(SYMBOL, str(raw_path), str(out))
+    test_file = out / SYMBOL / "test" / f"{SYMBOL}_test.csv"
+    test_bytes = test_file.read_bytes()
+    validation_file = out / SYMBOL / "validate" / f"{SYMBOL}_validate.csv"
+    parquet_file = validation_file.with_suffix(".parquet")
+    pl.read_csv(validation_file, try_parse_dates=True).write_parquet(parquet_file)
+
+    # New month overlapping nothing, plus a stale partial append to undo
+    _bars("2024-04-01", 50, 4).to_csv(
+        raw_path / SYMBOL / f"{SYMBOL}_202404.csv", index=False
+    )
+    with open(validation_file, "a", encoding="utf-8") as f:
+        f.write("2024-04-01 00:00:00+00:00,1,1,1,1,1\n")
+
+    caplog.set_level("INFO", logger="src.data_io.dataset_builder")
+    result = build_symbol_dataset(SYMBOL, str(raw_path), str(out), incremental=True)
+    assert "Appended 50 rows" in caplog.text
+
+    full = build_symbol_dataset(SYMBOL, str(raw_path), str(tmp_path / "full"))
+    appended, rebuilt = result["metadata"], full["metadata"]
+    assert test_file.read_bytes() == test_bytes
+    assert appended.total_rows == rebuilt.total_rows == 6_050
+    assert appended.test_rows == 4_800
+    assert appended.end_timestamp == rebuilt.end_timestamp
+    assert appended.gap_count == rebuilt.gap_count
+    pd.testing.assert_frame_equal(_read_all(out), _read_all(tmp_path / "full"))
+    assert pl.read_parquet(parquet_file).height == appended.validation_rows
+
+    # Nothing new: no raw file is read
+    caplog.clear()
+    build_symbol_dataset(SYMBOL, str(raw_path), str(out), incremental=True)
+    assert "Appended 0 rows from 0 raw files" in caplog.text
+
+
+def test_grown_and_rewritten_files(raw_path, tmp_path, caplog):
+    """Grown files append; rewritten files fall back to a full build."""
+    out = tmp_path / "out"
+    build_symbol_dataset(SYMBOL, str(raw_path), str(out))
+    last_file = raw_path / SYMBOL / f"{SYMBOL}_202403.csv"
+
+    grown = _bars("2024-03-01", 2_040, 3)
+    grown.iloc[2_000:].to_csv(last_file, mode="a", header=False, index=False)
+    assert SourceIndex.load(out / SYMBOL).diff([last_file]).grown == [last_file]
+
+    caplog.set_level("INFO", logger="src.data_io.dataset_builder")
+    result = build_symbol_dataset(SYMBOL, str(raw_path), str(out), incremental=True)
+    assert "Appended 40 rows" in caplog.text
+    assert result["metadata"].total_rows == 6_040
+
+    caplog.clear()
+    grown.iloc[:1_000].to_csv(last_file, index=False)
+    result = build_symbol_dataset(SYMBOL, str(raw_path), str(out), incremental=True)
+    assert "full build required" in caplog.text
+    assert result["metadata"].total_rows == 5_000
+    assert SourceIndex.load(out / SYMBOL).total_rows == 5_000
+
+
+def test_split_drift_tolerance(raw_path, tmp_path, caplog):
+    """Appends continue until the test share drifts past the tolerance."""
+    out = tmp_path / "out"
+    build_symbol_dataset(SYMBOL, str(raw_path), str(out))
+    _bars("2024-04-01", 50, 4).to_csv(
+        raw_path / SYMBOL / f"{SYMBOL}_202404.csv", index=False
+    )
+
+    # 4800 / 6050 = 0.793: too far below 0.8 for a 0.005 tolerance
+    caplog.set_level("INFO", logger="src.data_io.dataset_builder")
+    strict = build_symbol_dataset(
+        SYMBOL, str(raw_path), str(out), incremental=True, split_tolerance=0.005
+    )
+    assert "full build required" in caplog.text
+    assert strict["metadata"].test_rows == 4_840
+
+    # Within the default tolerance the same growth is appended
+    _bars("2024-05-01", 50, 5).to_csv(
+        raw_path / SYMBOL / f"{SYMBOL}_202405.csv", index=False
+    )
+    caplog.clear()
+    result = build_symbol_dataset(SYMBOL, str(raw_path), str(out), incremental=True)
+    assert "Appended 50 rows" in caplog.text
+    assert result["metadata"].test_rows == 4_840
@@ -6,8 +6,33 @@ improvement validation (SC-004: ≥80% reduction in repeated compute time).
 
 # pylint: disable=unused-import, fixme
 
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
 import pytest
-from src.backtest.indicator_cache import IndicatorCache
+from src.backtest.indicator_cache import IndicatorCache, merge_cache_stats
+from src.indicators.dispatcher import calculate_indicators
+
+
+@pytest.fixture(name="ohlcv")
+def fixture_ohlcv():
+    """Random-walk one-minute OHLCV frame."""
+    rng = np.random.default_rng(1)
+    n_bars = 2_000
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    start = datetime(2024, 1, 1)
+    return pl.DataFrame(
+        {
+            "timestamp_utc": [start + timedelta(minutes=i) for i in range(n_bars)],
+            "open": close,
+            "high": close + 2e-4,
+            "low": close - 2e-4,
+            "close": close,
+            "volume": np.ones(n_bars),
+        }
+    )
 
 
 class TestIndicatorCache:
@@ -25,13 +50,131 @@ class TestIndicatorCache:
 
     def test_cache_put_get(self):
         """Cache stores and retrieves series by key."""
-        # TODO: Implement test with mock pandas Series
+        cache = IndicatorCache()
+        series = pd.Series([1.0, 2.0, 3.0])
+
+        cache.put("ema_20", series)
+
+        assert cache.get("ema_20") is series
+        assert cache.stats()["hits"] == 1
 
     def test_cache_clear(self):
         """Cache clears all stored indicators."""
-        # TODO: Implement cache clear test
+        cache = IndicatorCache()
+        cache.get_or_compute("a", lambda: np.ones(4), params={"period": 4})
+
+        cache.clear()
+
+        assert cache.cache_size() == 0
+        assert cache.param_count() == 0
+        assert cache.stats()["bytes_in_memory"] == 0
+
+    def test_get_or_compute_is_lazy(self):
+        """compute_fn only runs on a miss."""
+        cache = IndicatorCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return np.arange(3)
+
+        cache.get_or_compute("k", compute, params={"period": 3})
+        cache.get_or_compute("k", compute, params={"period": 3})
+
+        assert len(calls) == 1
+        assert cache.param_count() == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+
+    def test_lru_evicts_by_bytes(self):
+        """Least recently used entries are evicted beyond the byte budget."""
+        cache = IndicatorCache(max_bytes=2 * 800)
+        for key in ("a", "b"):
+            cache.put(key, np.zeros(100))
+        cache.get("a")  # "b" becomes least recently used
+        cache.put("c", np.zeros(100))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes_in_memory"] == 1600
+
+    def test_disk_tier_survives_new_instance(self, tmp_path):
+        """Polars entries written to disk are found by a fresh cache."""
+        frame = pl.DataFrame({"ema": [1.0, 2.0, None]})
+        IndicatorCache(cache_dir=tmp_path).put("k", frame)
+
+        fresh = IndicatorCache(cache_dir=tmp_path)
+        loaded = fresh.get_or_compute("k", lambda: pytest.fail("recomputed"))
+
+        assert loaded.equals(frame)
+        assert fresh.stats()["disk_hits"] == 1
+        assert fresh.stats()["bytes_read"] > 0
+
+    def test_merge_cache_stats(self):
+        """Counters are summed across caches with an overall hit rate."""
+        first, second = IndicatorCache(), IndicatorCache()
+        first.get_or_compute("k", lambda: np.ones(2))
+        first.get_or_compute("k", lambda: np.ones(2))
+        second.get_or_compute("k", lambda: np.ones(2))
+
+        stats = merge_cache_stats({"EURUSD": first, "USDJPY": second})
+
+        assert stats["misses"] == 2
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+class TestCalculateIndicatorsCache:
+    """calculate_indicators with an IndicatorCache."""
+
+    INDICATORS = [
+        "fast_ema",
+        "slow_ema",
+        "atr",
+        "stoch_rsi",
+        "ema(period=5, column='fast_ema')",
+    ]
+
+    def test_cached_output_matches_uncached(self, ohlcv, tmp_path):
+        """Cold, warm, and on-disk runs all match a plain calculation."""
+        overrides = {"stoch_rsi": {"rsi_period": 10}}
+        expected = calculate_indicators(ohlcv, self.INDICATORS, overrides=overrides)
+
+        cache = IndicatorCache(dataset_id="EURUSD", cache_dir=tmp_path)
+        cold = calculate_indicators(
+            ohlcv, self.INDICATORS, overrides=overrides, cache=cache
+        )
+        warm = calculate_indicators(
+            ohlcv, self.INDICATORS, overrides=overrides, cache=cache
+        )
+        restarted = IndicatorCache(dataset_id="EURUSD", cache_dir=tmp_path)
+        from_disk = calculate_indicators(
+            ohlcv, self.INDICATORS, overrides=overrides, cache=restarted
+        )
+
+        assert cold.equals(expected)
+        assert warm.equals(expected)
+        assert from_disk.equals(expected)
+        assert cache.stats()["misses"] == len(self.INDICATORS)
+        assert cache.stats()["hits"] == len(self.INDICATORS)
+        assert restarted.stats()["disk_hits"] == len(self.INDICATORS)
+
+    def test_changed_params_or_data_miss(self, ohlcv):
+        """Different kwargs or different prices never reuse an entry."""
+        cache = IndicatorCache()
+        calculate_indicators(ohlcv, ["fast_ema"], cache=cache)
+
+        changed = calculate_indicators(
+            ohlcv, ["fast_ema"], overrides={"fast_ema": {"period": 7}}, cache=cache
+        )
+        shifted = ohlcv.with_columns(pl.col("close") + 0.01)
+        moved = calculate_indicators(shifted, ["fast_ema"], cache=cache)
 
-    # TODO: Add tests for:
-    # - Lazy computation integration
-    # - Parameter signature tracking
-    # - Performance improvement measurement (SC-004)
+        assert cache.stats()["misses"] == 3
+        assert changed.equals(
+            calculate_indicators(
+                ohlcv, ["fast_ema"], overrides={"fast_ema": {"period": 7}}
+            )
+        )
+        assert moved.equals(calculate_indicators(shifted, ["fast_ema"]))
@@ -139,6 +139,7 @@ def test_ingestion_only_imports_core_utilities():
         "src.data_io.errors",
         "src.data_io.logging_constants",  # Progress stage names
         "src.data_io.parquet_cache",  # Parquet caching for performance
+        "src.data_io.ipc_store",  # Memory-mapped store of ingested output
     }
 
     # Check for unexpected imports
@@ -0,0 +1,116 @@
+"""Unit tests for the memory-mapped Arrow IPC price store."""
+
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.data_io.ingestion import ingest_ohlcv_data
+from src.data_io.ipc_store import (
+    clear_ipc_store,
+    get_store_path,
+    open_ipc_store,
+    write_ipc_store,
+)
+from src.data_io.manifest import create_manifest
+
+
+@pytest.fixture(name="source")
+def fixture_source(tmp_path):
+    """Small processed Parquet partition."""
+    rng = np.random.default_rng(0)
+    n_bars = 1_000
+    start = datetime(2024, 1, 1)
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    frame = pl.DataFrame(
+        {
+            "timestamp_utc": pl.datetime_range(
+                start,
+                start + timedelta(minutes=n_bars - 1),
+                "1m",
+                eager=True,
+                time_zone="UTC",
+            ),
+            "open": close,
+            "high": close + 1e-4,
+            "low": close - 1e-4,
+            "close": close,
+            "volume": np.ones(n_bars),
+        }
+    )
+    path = tmp_path / "eurusd_test.parquet"
+    frame.write_parquet(path)
+    return path
+
+
+def test_store_round_trip_is_memory_mapped(source, tmp_path):
+    """A stored frame reopens unchanged as one zero-copy chunk per column."""
+    frame = pl.read_parquet(source)
+    store_path = write_ipc_store(frame, source, "abc", cache_dir=tmp_path)
+
+    stored = open_ipc_store(source, cache_dir=tmp_path)
+
+    assert stored is not None
+    assert stored.path == store_path
+    assert stored.core_hash == "abc"
+    assert stored.data.equals(frame)
+    assert stored.data.n_chunks() == 1
+    assert not stored.data["close"].to_numpy().flags.owndata
+
+    clear_ipc_store(source, cache_dir=tmp_path)
+    assert open_ipc_store(source, cache_dir=tmp_path) is None
+
+
+def test_store_invalidation(source, tmp_path):
+    """Content changes invalidate the store; touches and manifests do not."""
+    write_ipc_store(pl.read_parquet(source), source, cache_dir=tmp_path)
+
+    # Same content, new mtime: checksum fallback keeps the store
+    os.utime(source, ns=(0, 0))
+    assert open_ipc_store(source, cache_dir=tmp_path) is not None
+
+    manifest = tmp_path / "manifest.json"
+    create_manifest(
+        data_file_path=source,
+        pair="EURUSD",
+        timeframe="M1",
+        start_date="2024-01-01",
+        end_date="2024-01-01",
+        source_provider="test",
+        preprocessing_notes="",
+        total_candles=1_000,
+        output_path=manifest,
+    )
+    assert open_ipc_store(source, manifest, cache_dir=tmp_path) is not None
+
+    pl.read_parquet(source).head(10).write_parquet(source)
+    assert open_ipc_store(source, cache_dir=tmp_path) is None
+    assert open_ipc_store(source, manifest, cache_dir=tmp_path) is None
+
+
+def test_ingestion_reuses_store(source, tmp_path, monkeypatch, caplog):
+    """The second ingestion is memory-mapped from the store."""
+    monkeypatch.chdir(tmp_path)
+    kwargs = {
+        "path": str(source),
+        "timeframe_minutes": 1,
+        "return_polars": True,
+        "show_progress": False,
+    }
+    first = ingest_ohlcv_data(**kwargs)
+    assert get_store_path(source).exists()
+
+    caplog.set_level("INFO", logger="src.data_io.ipc_store")
+    second = ingest_ohlcv_data(**kwargs)
+    assert "Memory-mapped" in caplog.text
+
+    caplog.clear()
+    bypass = ingest_ohlcv_data(**kwargs, use_ipc_store=False)
+    assert "Memory-mapped" not in caplog.text
+
+    assert second.data.equals(first.data)
+    assert bypass.data.equals(first.data)
+    assert second.core_hash == first.core_hash
+    assert second.metrics.total_rows_output == first.metrics.total_rows_output
@@ -0,0 +1,188 @@
+"""Unit tests for the one-pass metrics kernel."""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.drawdown import (
+    compute_equity_drawdown_curve,
+    compute_max_equity_drawdown,
+)
+from src.backtest.metrics import compute_portfolio_metrics
+from src.backtest.metrics_kernel import (
+    NS_PER_DAY,
+    compute_performance,
+    group_breakdown,
+    performance_from_arrays,
+)
+from src.backtest.trade_ledger import EquityCurve, TradeLedger, direction_codes
+
+pytestmark = pytest.mark.unit
+
+PATHS = [
+    pytest.param(True, id="numba"),
+    pytest.param(False, id="numpy"),
+]
+
+
+def _equity_series(n_points: int = 400, seed: int = 0):
+    """Irregular intraday equity points with weekend and multi-day gaps."""
+    rng = np.random.default_rng(seed)
+    steps = rng.choice([15, 60, 240, 1_440, 4_320], size=n_points)
+    start = pd.Timestamp("2024-01-01").as_unit("ns").value
+    epoch_ns = start + np.cumsum(steps) * 60 * 10**9
+    equity = 2_500.0 + np.cumsum(rng.normal(0.0, 12.0, n_points))
+    return epoch_ns.astype(np.int64), equity
+
+
+def _reference(epoch_ns, equity, starting_equity):
+    """Plain-loop equity statistics."""
+    peak = starting_equity
+    max_dd = max_pct = 0.0
+    troughs, run, max_run, underwater = [], 0, 0, 0
+    for i, value in enumerate(equity):
+        if value >= peak:
+            peak = value
+            run = 0
+            continue
+        max_dd = min(max_dd, value - peak)
+        pct = (peak - value) / peak
+        max_pct = max(max_pct, pct)
+        if i == 0 or equity[i - 1] >= peak:
+            troughs.append(pct)
+        troughs[-1] = max(troughs[-1], pct)
+        if i + 1 < len(equity):
+            run += epoch_ns[i + 1] - epoch_ns[i]
+            underwater += epoch_ns[i + 1] - epoch_ns[i]
+            max_run = max(max_run, run)
+
+    closes = {}
+    for ts, value in zip(epoch_ns, equity):
+        closes[ts // NS_PER_DAY] = value
+    returns, previous, last_day = [], starting_equity, None
+    for day, close in closes.items():
+        if last_day is not None:
+            between = pd.date_range(
+                pd.Timestamp(last_day + 1, unit="D"),
+                pd.Timestamp(day - 1, unit="D"),
+            )
+            returns.extend([0.0] * int((between.dayofweek < 5).sum()))
+        returns.append(close / previous - 1.0)
+        previous, last_day = close, day
+
+    span = epoch_ns[-1] - epoch_ns[0]
+    return {
+        "max_drawdown": max_dd,
+        "max_drawdown_pct": max_pct,
+        "avg_drawdown_pct": float(np.mean(troughs)) if troughs else 0.0,
+        "time_under_water_pct": underwater / span,
+        "max_time_under_water_seconds": max_run / 1e9,
+        "trading_days": len(returns),
+        "volatility_daily": float(np.std(returns, ddof=1)),
+        "sharpe_daily": float(np.mean(returns) / np.std(returns, ddof=1)),
+    }
+
+
+@pytest.mark.parametrize("use_jit", PATHS)
+def test_equity_statistics_match_plain_loop(use_jit):
+    """Drawdowns, time under water and daily returns (with zero-return
+    weekdays) match a straightforward loop."""
+    epoch_ns, equity = _equity_series()
+    performance = performance_from_arrays(
+        np.empty(0), epoch_ns, equity, 2_500.0, use_jit=use_jit
+    )
+    expected = _reference(epoch_ns, equity, 2_500.0)
+    for name, value in expected.items():
+        assert getattr(performance, name) == pytest.approx(value, rel=1e-9), name
+    assert performance.volatility_annualized == pytest.approx(
+        expected["volatility_daily"] * math.sqrt(252)
+    )
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_numba_and_numpy_paths_agree(seed):
+    """Both paths give the same metrics for trades and equity."""
+    rng = np.random.default_rng(seed)
+    pnl_r = rng.choice([-1.0, 0.0, 0.5, 2.0], size=300)
+    epoch_ns, equity = _equity_series(seed=seed)
+
+    compiled = performance_from_arrays(pnl_r, epoch_ns, equity, use_jit=True)
+    vectorized = performance_from_arrays(pnl_r, epoch_ns, equity, use_jit=False)
+    for name, value in vars(compiled).items():
+        if isinstance(value, float):
+            assert getattr(vectorized, name) == pytest.approx(
+                value, rel=1e-12, abs=1e-12, nan_ok=True
+            ), name
+        else:
+            assert getattr(vectorized, name) == value, name
+
+
+@pytest.mark.parametrize("use_jit", PATHS)
+def test_trade_statistics(use_jit):
+    pnl_r = np.array([1.0, 2.0, -1.0, 0.0, -1.0, -1.0, 3.0])
+    performance = performance_from_arrays(pnl_r, use_jit=use_jit)
+
+    assert performance.trade_count == 7
+    assert (performance.win_count, performance.loss_count) == (3, 3)
+    assert performance.avg_r == pytest.approx(3.0 / 7)
+    assert performance.r_std_sample == pytest.approx(np.std(pnl_r, ddof=1))
+    assert performance.profit_factor == pytest.approx(2.0)
+    assert performance.max_consecutive_wins == 2
+    assert performance.max_consecutive_losses == 2
+    assert performance.max_drawdown_r == -3.0
+    assert math.isnan(performance.max_drawdown)
+
+    empty = performance_from_arrays(np.empty(0), use_jit=use_jit)
+    assert empty.trade_count == 0 and math.isnan(empty.avg_r)
+
+
+def test_float32_equity_drawdown_is_exact():
+    """A float32 mark-to-market series keeps float32 drawdown arithmetic."""
+    _, equity = _equity_series(n_points=5_000, seed=4)
+    equity = equity.astype(np.float32)
+    expected = float(np.min(compute_equity_drawdown_curve(equity, 2_500.0)))
+    assert compute_max_equity_drawdown(equity, 2_500.0) == expected
+    assert compute_max_equity_drawdown(np.empty(0, np.float32)) == 0.0
+
+
+def test_compute_performance_breakdowns():
+    ledger = TradeLedger(
+        {
+            "symbol": ["EURUSD", "USDJPY", "EURUSD", "GBPUSD"],
+            "direction": direction_codes(["LONG", "SHORT", "SHORT", "LONG"]),
+            "pnl_r": [1.0, -1.0, 0.0, 2.0],
+            "pnl_dollars": [10.0, -10.0, 0.0, 20.0],
+        }
+    )
+    performance = compute_performance(ledger)
+
+    assert list(performance.per_symbol) == ["EURUSD", "USDJPY", "GBPUSD"]
+    assert performance.per_symbol["EURUSD"] == {
+        "trade_count": 2,
+        "win_count": 1,
+        "loss_count": 1,
+        "total_pnl": 10.0,
+        "total_r": 1.0,
+        "win_rate": 0.5,
+        "avg_r": 0.5,
+    }
+    assert performance.per_direction["SHORT"]["trade_count"] == 2
+    assert performance.per_direction["LONG"]["total_r"] == 3.0
+    assert group_breakdown(np.empty(0), np.empty(0), np.empty(0)) == {}
+
+
+def test_portfolio_volatility_from_equity_curve():
+    """compute_portfolio_metrics reports the curve's annualized volatility."""
+    epoch_ns, equity = _equity_series()
+    curve = EquityCurve(epoch_ns, equity)
+    metrics = compute_portfolio_metrics(100.0, 0.05, 1.0, 1, 1, equity_curve=curve)
+
+    expected = performance_from_arrays(np.empty(0), epoch_ns, equity)
+    assert metrics["volatility_annualized"] == expected.volatility_annualized
+    assert metrics["volatility_annualized"] > 0
+    assert (
+        compute_portfolio_metrics(100.0, 0.05, 1.0, 1, 1)["volatility_annualized"]
+        == 0.0
+    )
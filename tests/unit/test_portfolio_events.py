@@ -0,0 +1,86 @@
+"""Unit tests for the event-driven portfolio equity engine."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtest.portfolio.portfolio_simulator import ClosedTrade, PortfolioSimulator
+
+T0 = pd.Timestamp("2024-01-01 00:00")
+
+
+def _trade(symbol: str, open_min: int, close_min: int, pnl_r: float) -> ClosedTrade:
+    """Candidate trade opening/closing N minutes after T0."""
+    return ClosedTrade(
+        symbol=symbol,
+        signal_id=f"{symbol}-{open_min}",
+        direction="LONG",
+        open_timestamp=T0 + pd.Timedelta(minutes=open_min),
+        close_timestamp=T0 + pd.Timedelta(minutes=close_min),
+        entry_price=1.0,
+        exit_price=1.0,
+        exit_reason="take_profit" if pnl_r > 0 else "stop_loss",
+        pnl_dollars=0.0,
+        pnl_r=pnl_r,
+        risk_amount=0.0,
+    )
+
+
+def test_concurrent_trades_sized_at_entry():
+    """A trade opened while another is still open ignores its future P&L."""
+    sim = PortfolioSimulator(starting_equity=2500.0)
+    winner = _trade("EURUSD", 0, 10, 2.0)
+    overlapping = _trade("GBPUSD", 5, 15, -1.0)
+    later = _trade("USDJPY", 20, 30, 1.0)
+
+    sim._process_events([winner, overlapping, later])
+
+    # Sizing is recorded in the ledger; the candidate objects are not mutated
+    assert sim.closed_trades[1].risk_amount == pytest.approx(2500.0 * 0.0025)
+    equity_after_two = 2500.0 + 2 * 6.25 - 6.25
+    assert sim.closed_trades[2].risk_amount == pytest.approx(equity_after_two * 0.0025)
+    assert overlapping.risk_amount == 0.0
+    assert [t.symbol for t in sim.closed_trades] == ["EURUSD", "GBPUSD", "USDJPY"]
+    assert sim.current_equity == pytest.approx(
+        equity_after_two + equity_after_two * 0.0025
+    )
+    assert sim.closed_trades[-1].portfolio_balance_at_exit == sim.current_equity
+
+
+def test_position_limits_applied_at_entry():
+    """Per-symbol and portfolio caps use positions open at entry time."""
+    sim = PortfolioSimulator(max_positions_per_symbol=1)
+    first = _trade("EURUSD", 0, 10, 1.0)
+    overlapping = _trade("EURUSD", 5, 12, 1.0)
+    at_exit = _trade("EURUSD", 10, 20, 1.0)  # exit frees the slot first
+
+    sim._process_events([first, overlapping, at_exit])
+    assert [t.signal_id for t in sim.closed_trades] == ["EURUSD-0", "EURUSD-10"]
+
+    capped = PortfolioSimulator(max_open_positions=1)
+    capped._process_events([_trade("EURUSD", 0, 10, 1.0), _trade("GBPUSD", 5, 8, 1.0)])
+    assert [t.symbol for t in capped.closed_trades] == ["EURUSD"]
+
+
+def test_event_loop_scales_to_many_symbols():
+    """20 symbols x 5k trades are processed in well under a few seconds."""
+    rng = np.random.default_rng(1)
+    candidates = []
+    for s in range(20):
+        opens = np.cumsum(rng.integers(1, 30, 5_000))
+        for open_min, hold, r in zip(
+            opens, rng.integers(1, 60, 5_000), rng.choice([-1.0, 2.0], 5_000)
+        ):
+            candidates.append(
+                _trade(f"SYM{s:02d}", int(open_min), int(open_min + hold), r)
+            )
+
+    sim = PortfolioSimulator(max_positions_per_symbol=1)
+    start = time.perf_counter()
+    sim._process_events(candidates)
+    elapsed = time.perf_counter() - start
+
+    assert 0 < len(sim.closed_trades) <= len(candidates)
+    assert elapsed < 5.0
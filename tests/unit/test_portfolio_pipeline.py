@@ -0,0 +1,99 @@
+"""Unit tests for the pipelined / parallel portfolio backtest path."""
+
+import pickle
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+from src.backtest import engine
+from src.backtest.portfolio.portfolio_simulator import PortfolioSimulator
+
+
+def _symbol_frame(seed: int, n_bars: int = 5_000) -> pl.DataFrame:
+    """Random-walk one-minute OHLCV frame."""
+    rng = np.random.default_rng(seed)
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    start = datetime(2024, 1, 1)
+    return pl.DataFrame(
+        {
+            "timestamp_utc": [start + timedelta(minutes=i) for i in range(n_bars)],
+            "open": close,
+            "high": close + 2e-4,
+            "low": close - 2e-4,
+            "close": close,
+            "volume": np.ones(n_bars),
+        }
+    )
+
+
+def _signals(symbol: str, df: pl.DataFrame, seed: int) -> list[dict]:
+    """Alternating long/short signals at random bars."""
+    rng = np.random.default_rng(seed)
+    rows = np.sort(rng.choice(len(df) - 1, size=60, replace=False))
+    timestamps = df["timestamp_utc"]
+    closes = df["close"]
+    signals = []
+    for k, row in enumerate(rows):
+        entry = closes[int(row)]
+        direction = "LONG" if k % 2 == 0 else "SHORT"
+        stop = entry - 5e-4 if direction == "LONG" else entry + 5e-4
+        signals.append(
+            {
+                "id": f"{symbol}-{k}",
+                "timestamp_utc": timestamps[int(row)],
+                "entry_price": entry,
+                "initial_stop_price": stop,
+                "direction": direction,
+            }
+        )
+    return signals
+
+
+def _result_bytes(result) -> bytes:
+    """Serialize everything except wall-clock timings."""
+    return pickle.dumps(
+        (
+            result.final_equity,
+            result.equity_curve,
+            [vars(t) for t in result.closed_trades],
+            result.per_symbol_trades,
+        )
+    )
+
+
+def test_parallel_simulation_identical_to_serial():
+    """Threaded per-symbol simulation is byte-identical to the serial path."""
+    symbols = ["EURUSD", "GBPUSD", "USDJPY", "AUDUSD"]
+    data = {s: _symbol_frame(i) for i, s in enumerate(symbols)}
+    signals = {s: _signals(s, data[s], i) for i, s in enumerate(symbols)}
+
+    serial = PortfolioSimulator().simulate(data, signals, max_workers=1)
+    parallel = PortfolioSimulator().simulate(data, signals, max_workers=4)
+
+    assert serial.total_trades > 0
+    assert _result_bytes(parallel) == _result_bytes(serial)
+
+
+def test_iter_symbol_frames_prefetches_in_order(monkeypatch):
+    """Frames are yielded in pair order; preloaded pairs skip loading."""
+    loaded = []
+
+    def fake_load(data_path, show_progress=True):
+        loaded.append(data_path.name)
+        return _symbol_frame(len(loaded), n_bars=10)
+
+    monkeypatch.setattr(engine, "load_symbol_data", fake_load)
+    preloaded = {"GBPUSD": _symbol_frame(99, n_bars=10)}
+    pair_paths = [
+        ("EURUSD", Path("eurusd.parquet")),
+        ("GBPUSD", Path("gbpusd.parquet")),
+        ("USDJPY", Path("usdjpy.parquet")),
+    ]
+
+    frames = list(engine._iter_symbol_frames(pair_paths, preloaded, False))
+
+    assert [pair for pair, _ in frames] == ["EURUSD", "GBPUSD", "USDJPY"]
+    assert frames[1][1] is preloaded["GBPUSD"]
+    assert loaded == ["eurusd.parquet", "usdjpy.parquet"]
@@ -0,0 +1,114 @@
+"""Unit tests for adaptive parameter search."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.backtest.indicator_cache import IndicatorCache
+from src.backtest.search import (
+    compare_rankings,
+    halving_fractions,
+    run_search,
+    spearman_correlation,
+)
+from src.backtest.sweep import (
+    ParameterRange,
+    PreloadedSweepData,
+    SweepConfig,
+    rank_results,
+)
+
+
+@pytest.fixture(name="data")
+def fixture_data():
+    """Four days of random-walk one-minute bars for one pair."""
+    rng = np.random.default_rng(1)
+    n_bars = 4 * 24 * 60
+    start = datetime(2024, 1, 1)
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    frame = pl.DataFrame(
+        {
+            "timestamp_utc": pl.datetime_range(
+                start, start + timedelta(minutes=n_bars - 1), "1m", eager=True
+            ),
+            "open": np.r_[close[0], close[:-1]] + rng.normal(0, 1e-4, n_bars),
+            "high": close + np.abs(rng.normal(0, 3e-4, n_bars)),
+            "low": close - np.abs(rng.normal(0, 3e-4, n_bars)),
+            "close": close,
+            "volume": np.ones(n_bars),
+        }
+    )
+    return PreloadedSweepData(
+        frames={"EURUSD": frame},
+        indicator_caches={"EURUSD": IndicatorCache(dataset_id="EURUSD")},
+    )
+
+
+def make_config(**kwargs) -> SweepConfig:
+    """Nine-combination grid over the EMA periods."""
+    return SweepConfig(
+        strategy_name="trend-pullback",
+        ranges=[
+            ParameterRange("fast_ema", "period", [10, 15, 20]),
+            ParameterRange("slow_ema", "period", [40, 50, 60]),
+        ],
+        **kwargs,
+    )
+
+
+def test_halving_fractions():
+    """Rungs grow by the reduction factor up to the full data."""
+    assert halving_fractions(1 / 9, 3) == pytest.approx([1 / 9, 1 / 3, 1.0])
+    assert halving_fractions(0.3, 3) == [1.0 / 3, 1.0]
+    assert halving_fractions(1.0, 3) == [1.0]
+    with pytest.raises(ValueError):
+        halving_fractions(0.0, 3)
+
+
+def test_spearman_and_ranking_comparison():
+    """Identical orderings correlate perfectly; reversed ones negatively."""
+    assert spearman_correlation(np.arange(5), np.arange(5) ** 2) == pytest.approx(1)
+    assert spearman_correlation(np.arange(5), -np.arange(5)) == pytest.approx(-1)
+    assert np.isnan(spearman_correlation(np.ones(3), np.arange(3)))
+    assert compare_rankings([], []) == (pytest.approx(np.nan, nan_ok=True), None)
+
+
+def test_full_fraction_halving_matches_grid(data):
+    """Halving without subsampling ranks exactly like the exhaustive grid."""
+    grid = run_search(make_config(), ["EURUSD"], sequential=True, data=data)
+    halving = run_search(
+        make_config(search="halving", min_fraction=1.0, compare_exhaustive=True),
+        ["EURUSD"],
+        sequential=True,
+        data=data,
+    )
+
+    assert len(grid.results) == 9
+    assert grid.evaluation_cost == pytest.approx(9)
+    assert grid.successful_count == 9
+    assert halving.best_params == grid.best_params
+    assert [r.sharpe_ratio for r in halving.results] == [
+        r.sharpe_ratio for r in grid.results
+    ]
+    assert halving.rank_correlation == pytest.approx(1.0)
+    assert halving.exhaustive_best_rank == 1
+
+
+@pytest.mark.parametrize("method", ["halving", "hyperband", "tpe"])
+def test_adaptive_search_respects_budget(data, method):
+    """Adaptive searches stay within the evaluation budget."""
+    config = make_config(
+        search=method, max_evaluations=4.0, compare_exhaustive=True, seed=3
+    )
+    result = run_search(config, ["EURUSD"], sequential=True, data=data)
+
+    assert config.valid_combinations == 9
+    assert 0 < result.evaluation_cost <= 4.0 + 1e-9
+    assert result.best_params is not None
+    ranked = rank_results(result.results)
+    assert ranked[0].fraction == 1.0
+    assert ranked[0].params == result.best_params
+    assert result.exhaustive_best_rank is not None
+    assert -1.0 <= result.rank_correlation <= 1.0
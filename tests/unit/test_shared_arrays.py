@@ -0,0 +1,88 @@
+"""Unit tests for shared-memory arrays used by parallel workers."""
+
+import numpy as np
+import pytest
+
+from src.backtest import parallel
+from src.backtest.parallel import (
+    SharedArrays,
+    attach_shared_arrays,
+    detach_shared_arrays,
+    get_shared_arrays,
+    run_parallel,
+)
+from src.backtest.sweep import PreloadedSweepData
+
+
+def _sum_shared(key: str) -> float:
+    """Worker: sum an attached shared array."""
+    return float(get_shared_arrays()[key].sum())
+
+
+def _is_writeable(key: str) -> bool:
+    """Worker: report whether an attached view is writeable."""
+    return bool(get_shared_arrays()[key].flags.writeable)
+
+
+def test_attach_detach_roundtrip():
+    """Attached views see the published data read-only, then detach cleanly."""
+    close = np.linspace(1.0, 2.0, 1_000)
+    with SharedArrays({"EURUSD/close": close}) as shared:
+        assert shared.nbytes >= close.nbytes
+        views = attach_shared_arrays(shared.specs)
+        try:
+            np.testing.assert_array_equal(views["EURUSD/close"], close)
+            with pytest.raises(ValueError):
+                views["EURUSD/close"][0] = 0.0
+        finally:
+            del views
+            detach_shared_arrays()
+        assert not get_shared_arrays()
+        assert not parallel._ATTACHED_BLOCKS
+
+
+def test_object_arrays_rejected():
+    """Object arrays cannot be shared."""
+    with pytest.raises(ValueError, match="object"):
+        SharedArrays({"bad": np.array(["a", None], dtype=object)})
+
+
+def test_run_parallel_with_shared_arrays():
+    """Workers read shared arrays instead of pickled copies."""
+    arrays = {"a": np.arange(100, dtype=np.float64), "b": np.ones(10)}
+
+    results = run_parallel(_sum_shared, ["a", "b"], max_workers=2, shared_arrays=arrays)
+    writeable = run_parallel(_is_writeable, ["a"], max_workers=1, shared_arrays=arrays)
+
+    assert results == [4950.0, 10.0]
+    assert writeable == [False]
+
+
+def test_sweep_frames_roundtrip_through_shared_memory():
+    """Preloaded sweep frames rebuild identically from shared arrays."""
+    pl = pytest.importorskip("polars")
+    from datetime import datetime, timedelta
+
+    frame = pl.DataFrame(
+        {
+            "timestamp_utc": [
+                datetime(2024, 1, 1) + timedelta(minutes=i) for i in range(50)
+            ],
+            "open": np.linspace(1.0, 1.1, 50),
+            "close": np.linspace(1.0, 1.1, 50),
+            "volume": np.arange(50, dtype=np.int64),
+        }
+    )
+    data = PreloadedSweepData(frames={"EURUSD": frame})
+    arrays, schemas = data.to_shared_arrays()
+
+    with SharedArrays(arrays) as shared:
+        rebuilt = PreloadedSweepData.from_shared_arrays(
+            attach_shared_arrays(shared.specs), schemas
+        )
+        try:
+            assert rebuilt.frames["EURUSD"].equals(frame)
+            assert "EURUSD" in rebuilt.indicator_caches
+        finally:
+            del rebuilt
+            detach_shared_arrays()
@@ -0,0 +1,119 @@
+"""Unit tests for columnar SignalBatch generation and consumption."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.backtest.batch_simulation import BatchSimulation
+from src.backtest.portfolio.portfolio_simulator import PortfolioSimulator
+from src.models.core import TradeSignal
+from src.models.signal_batch import SignalBatch
+from src.risk.manager import calculate_position_size
+from src.strategy.trend_pullback.signal_generator_vectorized import (
+    generate_signal_batch,
+    generate_signals_vectorized,
+)
+
+# Loose thresholds so a random walk produces plenty of signals
+PARAMS = {
+    "pair": "EURUSD",
+    "trend_cross_count_threshold": 1_000,
+    "rsi_oversold": 95.0,
+    "rsi_overbought": 5.0,
+    "stoch_rsi_low": 1.0,
+    "stoch_rsi_high": 0.0,
+}
+
+
+@pytest.fixture(name="frame")
+def fixture_frame():
+    """Random-walk bars with the trend-pullback indicator columns."""
+    n_bars = 20_000
+    rng = np.random.default_rng(5)
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    open_ = close + rng.normal(0, 2e-4, n_bars)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    atr = pl.Series(rng.uniform(5e-4, 2e-3, n_bars))
+    return pl.DataFrame(
+        {
+            "timestamp_utc": pl.datetime_range(
+                start, start + timedelta(minutes=n_bars - 1), "1m", eager=True
+            ),
+            "open": open_,
+            "high": np.maximum(open_, close) + np.abs(rng.normal(0, 2e-4, n_bars)),
+            "low": np.minimum(open_, close) - np.abs(rng.normal(0, 2e-4, n_bars)),
+            "close": close,
+            "fast_ema": pl.Series(close).ewm_mean(span=20).to_numpy(),
+            "slow_ema": pl.Series(close).ewm_mean(span=50).to_numpy(),
+            "rsi": rng.uniform(10, 90, n_bars),
+            "stoch_rsi": rng.uniform(0, 1, n_bars),
+            "atr": atr.scatter(np.flatnonzero(rng.random(n_bars) < 0.01), None),
+        }
+    )
+
+
+def test_batch_columns_match_per_row_construction(frame):
+    """Batch prices, sizes and rows equal the per-signal computation."""
+    batch = generate_signal_batch(frame, PARAMS)
+    assert len(batch) > 300
+    assert batch.ids.dtype == np.uint64
+    assert len(np.unique(batch.ids)) == len(batch)
+
+    closes = frame["close"].to_numpy()
+    atr = frame["atr"].fill_null(0.002).to_numpy()
+    timestamps = frame["timestamp_utc"]
+    for position, signal in enumerate(batch[:300]):
+        row = batch.indices[position]
+        sign = 1 if signal.direction == "LONG" else -1
+        assert signal.entry_price == closes[row]
+        assert signal.initial_stop_price == closes[row] - sign * atr[row] * 2.0
+        assert signal.timestamp_utc == timestamps[int(row)]
+        assert signal.calc_position_size == calculate_position_size(
+            signal, 2500.0, 0.25
+        )
+        assert signal.id == batch.signal_id(position)
+
+    # IDs are reproducible and the list API materializes the same signals
+    assert np.array_equal(generate_signal_batch(frame, PARAMS).ids, batch.ids)
+    signals = generate_signals_vectorized(frame, PARAMS)
+    assert isinstance(signals[0], TradeSignal)
+    assert [s.id for s in signals] == [s.id for s in batch.to_signals()]
+
+
+def test_batch_sequence_protocol(frame):
+    """Slices and filters return batches; directions split cleanly."""
+    batch = generate_signal_batch(frame, PARAMS)
+
+    assert isinstance(batch[10:20], SignalBatch)
+    assert len(batch[10:20]) == 10
+    assert batch[-1].id == batch.signal_id(len(batch) - 1)
+    longs = batch.direction("LONG")
+    shorts = batch.filter(batch.directions == -1)
+    assert len(longs) + len(shorts) == len(batch)
+    assert {s.direction for s in shorts} == {"SHORT"}
+    assert generate_signal_batch(frame.head(0), PARAMS).frame.height == 0
+
+
+def test_simulators_consume_batch(frame):
+    """Portfolio trades from a batch equal those from materialized signals."""
+    batch = generate_signal_batch(frame, PARAMS)
+
+    from_batch = PortfolioSimulator().simulate({"EURUSD": frame}, {"EURUSD": batch})
+    from_list = PortfolioSimulator().simulate(
+        {"EURUSD": frame}, {"EURUSD": batch.to_signals()}
+    )
+    assert from_batch.total_trades > 0
+    assert [vars(t) for t in from_batch.closed_trades] == [
+        vars(t) for t in from_list.closed_trades
+    ]
+
+    ohlc = tuple(
+        frame[c].to_numpy() for c in ("timestamp_utc", "open", "high", "low", "close")
+    )
+    result = BatchSimulation(enable_progress=False).simulate_signal_batch(
+        batch, ohlc[0], ohlc, direction="SHORT"
+    )
+    assert 0 < result.trade_count <= len(batch.direction("SHORT"))
+    assert set(result.directions.tolist()) == {-1}
@@ -0,0 +1,175 @@
+"""Unit tests for preloaded-data parameter sweeps."""
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.backtest import engine, sweep
+from src.indicators import dispatcher
+from src.backtest.indicator_cache import IndicatorCache
+from src.backtest.sweep import ParameterSet, PreloadedSweepData, run_single_backtest
+from src.config.parameters import StrategyParameters
+from src.models.enums import DirectionMode
+from src.strategy.trend_pullback.strategy import TREND_PULLBACK_STRATEGY
+
+
+@pytest.fixture(name="ohlcv")
+def fixture_ohlcv():
+    """Random-walk one-minute OHLCV frame."""
+    rng = np.random.default_rng(0)
+    n_bars = 3_000
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    start = datetime(2024, 1, 1)
+    return pl.DataFrame(
+        {
+            "timestamp_utc": [start + timedelta(minutes=i) for i in range(n_bars)],
+            "open": close,
+            "high": close + 2e-4,
+            "low": close - 2e-4,
+            "close": close,
+            "volume": np.ones(n_bars),
+        }
+    )
+
+
+def test_cached_enrichment_matches_uncached(ohlcv):
+    """Cached indicator columns are identical to a fresh calculation."""
+    params = StrategyParameters()
+    cache = IndicatorCache(dataset_id="EURUSD")
+
+    for fast in (20, 10, 20):
+        overrides = {"fast_ema": {"period": fast}}
+        expected = engine.enrich_symbol_data(
+            ohlcv, TREND_PULLBACK_STRATEGY, params, indicator_overrides=overrides
+        )
+        cached = engine.enrich_symbol_data(
+            ohlcv,
+            TREND_PULLBACK_STRATEGY,
+            params,
+            indicator_overrides=overrides,
+            indicator_cache=cache,
+        )
+        assert cached.equals(expected)
+
+    # One entry per indicator, plus the second fast EMA period
+    required = TREND_PULLBACK_STRATEGY.metadata.required_indicators
+    assert cache.cache_size() == len(required) + 1
+
+
+def test_run_single_backtest_skips_ingestion(ohlcv, monkeypatch):
+    """Preloaded frames are used instead of re-reading the data file."""
+
+    def fail_load(*_args, **_kwargs):
+        raise AssertionError("data should not be reloaded")
+
+    monkeypatch.setattr(engine, "load_symbol_data", fail_load)
+    preloaded = PreloadedSweepData(
+        frames={"EURUSD": ohlcv},
+        indicator_caches={"EURUSD": IndicatorCache(dataset_id="EURUSD")},
+    )
+
+    result = run_single_backtest(
+        ParameterSet(params={"fast_ema": {"period": 20}}),
+        [("EURUSD", Path("missing.parquet"))],
+        preloaded=preloaded,
+    )
+
+    assert result.error is None
+    assert preloaded.indicator_caches["EURUSD"].cache_size() > 0
+
+
+def test_source_data_hashed_once_per_frame(ohlcv, monkeypatch):
+    """Combinations and the MA-trailing pass reuse one hash per frame."""
+    calls = []
+    source_data_hash = dispatcher.source_data_hash
+
+    def counting_hash(df, timestamp_col="timestamp_utc"):
+        calls.append(df.height)
+        return source_data_hash(df, timestamp_col)
+
+    for module in (sweep, engine, dispatcher):
+        monkeypatch.setattr(module, "source_data_hash", counting_hash)
+    preloaded = PreloadedSweepData(
+        frames={"EURUSD": ohlcv},
+        indicator_caches={"EURUSD": IndicatorCache(dataset_id="EURUSD")},
+    )
+
+    for period in (10, 20, 30):
+        for fraction in (1.0, 0.5):
+            result = run_single_backtest(
+                ParameterSet(params={"fast_ema": {"period": period}}),
+                [("EURUSD", Path("missing.parquet"))],
+                preloaded=preloaded,
+                fraction=fraction,
+            )
+            assert result.error is None
+
+    assert sorted(calls) == [ohlcv.height // 2, ohlcv.height]
+
+
+def test_sequential_sweep_loads_each_pair_once(ohlcv, monkeypatch, tmp_path):
+    """A sequential sweep ingests each pair once for all combinations."""
+    loads = []
+
+    def counting_load(data_path, show_progress=True):
+        loads.append(data_path)
+        return ohlcv
+
+    monkeypatch.setattr(sweep, "load_symbol_data", counting_load)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(
+        sweep,
+        "construct_data_paths",
+        lambda pairs, dataset: [(p, tmp_path / f"{p}.parquet") for p in pairs],
+    )
+    combinations = [
+        ParameterSet(params={"fast_ema": {"period": period}}) for period in (10, 15, 20)
+    ]
+
+    result = sweep.run_sweep(combinations, ["EURUSD"], sequential=True)
+
+    assert len(loads) == 1
+    assert len(result.results) == len(combinations)
+    assert all(r.error is None for r in result.results)
+    # The disk tier is opt-in; sweeps only cache in memory
+    assert not (tmp_path / ".indicator_cache").exists()
+
+
+def test_grouped_backtests_match_single_runs(ohlcv):
+    """Shared indicator and signal passes do not change any result."""
+    rng = np.random.default_rng(1)
+    close = ohlcv["close"].to_numpy()
+    n_bars = len(close)
+    frame = ohlcv.with_columns(
+        open=np.r_[close[0], close[:-1]] + rng.normal(0, 1e-4, n_bars),
+        high=close + np.abs(rng.normal(0, 3e-4, n_bars)),
+        low=close - np.abs(rng.normal(0, 3e-4, n_bars)),
+    )
+    preloaded = PreloadedSweepData(
+        frames={"EURUSD": frame},
+        indicator_caches={"EURUSD": IndicatorCache(dataset_id="EURUSD")},
+    )
+    combinations = sweep.generate_combinations(
+        [
+            sweep.ParameterRange("fast_ema", "period", [10, 20]),
+            sweep.ParameterRange("slow_ema", "period", [40, 60]),
+            sweep.ParameterRange("stoch_rsi", "rsi_period", [10, 14]),
+        ]
+    )
+    pair_paths = [("EURUSD", Path("EURUSD"))]
+
+    grouped = sweep.run_backtest_group(
+        combinations, pair_paths, direction_mode=DirectionMode.BOTH, preloaded=preloaded
+    )
+    single = [
+        run_single_backtest(
+            params, pair_paths, direction_mode=DirectionMode.BOTH, preloaded=preloaded
+        )
+        for params in combinations
+    ]
+
+    assert sum(r.trade_count for r in grouped) > 0
+    assert [vars(r) for r in grouped] == [vars(r) for r in single]
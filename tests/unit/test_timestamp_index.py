@@ -0,0 +1,103 @@
+"""Unit tests for the sorted TimestampIndex."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from src.backtest.timestamp_index import TimestampIndex
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.fixture(name="frame")
+def fixture_frame():
+    """One-minute bars with a gap after bar 4."""
+    minutes = [0, 1, 2, 3, 4, 10, 11, 12]
+    return pl.DataFrame(
+        {
+            "timestamp_utc": [START + timedelta(minutes=m) for m in minutes],
+            "close": np.arange(len(minutes), dtype=np.float64),
+        }
+    )
+
+
+def test_resolve_reports_misses_exactly(frame):
+    """Hits map to rows; gap, pre-start and post-end timestamps are misses."""
+    index = TimestampIndex.for_frame(frame)
+    queries = [
+        START + timedelta(minutes=11),
+        START + timedelta(minutes=5),  # in the gap
+        START - timedelta(minutes=1),  # before the data
+        START,
+        START + timedelta(minutes=12, seconds=30),  # after the last bar
+    ]
+
+    lookup = index.resolve(queries)
+
+    assert lookup.indices.tolist() == [6, -1, -1, 0, -1]
+    assert lookup.found.tolist() == [True, False, False, True, False]
+    assert lookup.missing.tolist() == [1, 2, 4]
+    assert lookup.miss_count == 3
+    assert index.get(START + timedelta(minutes=3)) == 3
+    assert index.get(START + timedelta(minutes=7)) is None
+
+
+def test_accepts_mixed_timestamp_types(frame):
+    """Naive, tz-aware, pandas and numpy timestamps resolve identically."""
+    index = TimestampIndex.for_frame(frame)
+    target = START + timedelta(minutes=10)
+    queries = [
+        target,
+        target.replace(tzinfo=timezone.utc),
+        pd.Timestamp(target, tz="UTC"),
+        np.datetime64(target, "us"),
+    ]
+
+    assert index.resolve(queries).indices.tolist() == [5, 5, 5, 5]
+    aware = pd.Series(pd.DatetimeIndex([target]).tz_localize("UTC"))
+    assert index.resolve(aware).indices.tolist() == [5]
+
+
+def test_for_frame_caches_polars_frames_only(frame):
+    """Polars frames share one index; pandas frames are re-indexed per call."""
+    assert TimestampIndex.for_frame(frame) is TimestampIndex.for_frame(frame)
+    assert len(TimestampIndex.for_frame(frame)) == len(frame)
+
+    pdf = frame.to_pandas()
+    target = START + timedelta(minutes=11)
+    assert TimestampIndex.for_frame(pdf).get(target) == 6
+    pdf.loc[6, "timestamp_utc"] = pd.Timestamp(START + timedelta(minutes=20))
+    assert TimestampIndex.for_frame(pdf).get(target) is None
+
+    within = TimestampIndex.for_frame(frame).within(
+        [START + timedelta(minutes=5), START + timedelta(minutes=13)]
+    )
+    assert within.tolist() == [True, False]
+
+
+def test_unsorted_and_duplicate_timestamps_match_dict_lookup():
+    """Unsorted columns resolve like {timestamp: row}; duplicates give the
+    last row."""
+    minutes = [5, 1, 3, 1, 0, 3, 9]
+    timestamps = [START + timedelta(minutes=m) for m in minutes]
+    index = TimestampIndex(timestamps)
+    as_dict = {ts: row for row, ts in enumerate(timestamps)}
+
+    queries = [START + timedelta(minutes=m) for m in range(11)]
+    expected = [as_dict.get(ts, -1) for ts in queries]
+    assert index.resolve(queries).indices.tolist() == expected
+    assert index.get(START + timedelta(minutes=1)) == 3
+    assert not index.is_sorted
+    # epoch_ns stays in row order
+    row_ns = pd.DatetimeIndex(timestamps).as_unit("ns").asi8
+    assert index.epoch_ns.tolist() == row_ns.tolist()
+    assert index.within([START + timedelta(minutes=9)]).tolist() == [True]
+    with pytest.raises(ValueError, match="sorted"):
+        index.rows_between(START, START + timedelta(minutes=4))
+
+    sorted_dupes = TimestampIndex([START, START, START + timedelta(minutes=1)])
+    assert sorted_dupes.is_sorted
+    assert sorted_dupes.get(START) == 1
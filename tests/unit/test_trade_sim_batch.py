@@ -1,37 +1,305 @@
 """Unit tests for batch trade simulation module.
 
-Tests vectorized simulation logic, fidelity vs baseline (FR-006, SC-006),
-optional JIT paths, and speedup validation (SC-002: ≥10× improvement).
+Tests vectorized simulation logic, fidelity of the numba exit kernel vs the
+vectorized reference path (FR-006, SC-006), and the structured-array JIT API.
 """
 
-# pylint: disable=unused-import, fixme
-
+import numpy as np
+import pandas as pd
 import pytest
+from src.backtest import trade_sim_batch
 from src.backtest.trade_sim_batch import (
+    EXIT_REASON_NAMES,
     simulate_trades_batch,
     simulate_trades_batch_jit,
+    simulate_trades_sequential,
+)
+
+requires_numba = pytest.mark.skipif(
+    not trade_sim_batch._NUMBA_AVAILABLE, reason="numba not installed"
 )
 
+TRAILING_CONFIGS = [
+    None,
+    {"type": "ATR_Trailing", "multiplier": 2.0, "trigger_r": 0.5},
+    {"type": "FixedPips_Trailing", "pips": 5, "pip_size": 0.0001},
+    {"type": "MA_Trailing", "ma_col": "sma_50", "trigger_r": 1.0},
+    {"type": "MA_Trailing", "ma_col": "ema_missing"},
+]
+
+
+@pytest.fixture(name="random_market")
+def fixture_random_market():
+    """Random-walk OHLC data with NaN indicator warm-up and mixed entries."""
+    rng = np.random.default_rng(42)
+    n_bars = 20_000
+    close = 1.1 + np.cumsum(rng.normal(0, 2e-4, n_bars))
+    high = close + np.abs(rng.normal(0, 1e-4, n_bars))
+    low = close - np.abs(rng.normal(0, 1e-4, n_bars))
+    price_data = pd.DataFrame({"high": high, "low": low, "close": close})
+
+    atr = np.abs(rng.normal(3e-4, 1e-4, n_bars))
+    atr[:20] = np.nan
+    indicators = {
+        "atr": atr,
+        "sma_50": pd.Series(close).rolling(50).mean().to_numpy(),
+    }
+
+    entry_idx = np.sort(rng.choice(n_bars - 1, 500, replace=False))
+    entries = [
+        {
+            "entry_index": int(i),
+            "entry_price": float(close[i]),
+            "side": "LONG" if rng.random() < 0.5 else "SHORT",
+            "stop_loss_pct": float(rng.uniform(1e-4, 2e-3)),
+            "take_profit_pct": float(rng.uniform(1e-4, 4e-3)),
+        }
+        for i in entry_idx
+    ]
+    # Edge cases: entry on the last bar and an invalid entry
+    entries.append(
+        {
+            "entry_index": n_bars - 1,
+            "entry_price": float(close[-1]),
+            "side": "LONG",
+            "stop_loss_pct": 0.001,
+            "take_profit_pct": 0.002,
+        }
+    )
+    entries.append({"entry_index": None, "entry_price": None})
+    return entries, price_data, indicators
+
 
 class TestBatchSimulation:
     """Test suite for batch trade simulation functions."""
 
     def test_simulate_trades_batch_basic(self):
         """Batch simulation returns results for all entries."""
-        # TODO: Implement test with mock entries and price data
-
-    def test_fidelity_vs_baseline(self):
-        """Batch results match baseline within tolerances (FR-006)."""
-        # TODO: Implement fidelity comparison test
-        # - Price difference ≤ 1e-6
-        # - Index exact match
-        # - PnL difference ≤ 0.01%
-
-    def test_jit_path_optional(self):
-        """JIT path raises NotImplementedError until implemented."""
-        # TODO: Test guarded import and fallback logic
-
-    # TODO: Add tests for:
-    # - Same-bar exit edge case (duration == 1)
-    # - Overlapping trades performance (remains within SC-001)
-    # - Stop loss / take profit accuracy
+        price_data = pd.DataFrame(
+            {
+                "high": [100.0, 100.5, 103.0, 101.0],
+                "low": [99.5, 99.8, 100.2, 100.0],
+                "close": [100.0, 100.2, 102.5, 100.5],
+            }
+        )
+        entries = [
+            {
+                "entry_index": 0,
+                "entry_price": 100.0,
+                "side": "LONG",
+                "stop_loss_pct": 0.01,
+                "take_profit_pct": 0.02,
+            }
+        ]
+
+        results = simulate_trades_batch(entries, price_data, use_jit=False)
+
+        assert len(results) == 1
+        assert results[0]["exit_reason"] == "TAKE_PROFIT"
+        assert results[0]["exit_index"] == 2
+        assert results[0]["exit_price"] == pytest.approx(102.0)
+
+    @requires_numba
+    @pytest.mark.parametrize(
+        "trailing_config",
+        TRAILING_CONFIGS,
+        ids=lambda c: c["type"] + "-" + c.get("ma_col", "") if c else "static",
+    )
+    def test_fidelity_vs_baseline(self, random_market, trailing_config):
+        """Compiled kernel matches the vectorized path exactly (FR-006)."""
+        entries, price_data, indicators = random_market
+
+        vectorized = simulate_trades_batch(
+            entries,
+            price_data,
+            trailing_config=trailing_config,
+            indicators=indicators,
+            use_jit=False,
+        )
+        compiled = simulate_trades_batch(
+            entries,
+            price_data,
+            trailing_config=trailing_config,
+            indicators=indicators,
+            use_jit=True,
+        )
+
+        assert compiled == vectorized
+        reasons = {r["exit_reason"] for r in vectorized}
+        assert {"STOP_LOSS", "TAKE_PROFIT", "END_OF_DATA"} <= reasons
+
+    @requires_numba
+    def test_same_bar_hit_prefers_stop_loss(self):
+        """When SL and TP hit on the same bar, both paths exit at SL."""
+        price_data = pd.DataFrame(
+            {
+                "high": [100.0, 103.0],
+                "low": [100.0, 98.0],
+                "close": [100.0, 100.0],
+            }
+        )
+        entries = [
+            {
+                "entry_index": 0,
+                "entry_price": 100.0,
+                "side": "SHORT",
+                "stop_loss_pct": 0.01,
+                "take_profit_pct": 0.01,
+            }
+        ]
+
+        compiled = simulate_trades_batch(entries, price_data, use_jit=True)
+
+        assert compiled == simulate_trades_batch(entries, price_data, use_jit=False)
+        assert compiled[0]["exit_reason"] == "STOP_LOSS"
+        assert compiled[0]["exit_price"] == pytest.approx(101.0)
+
+    @requires_numba
+    def test_missing_sl_tp_raises(self):
+        """Compiled path enforces per-trade SL/TP like the vectorized path."""
+        price_data = pd.DataFrame(
+            {"high": [1.0, 1.1], "low": [0.9, 1.0], "close": [1.0, 1.05]}
+        )
+        entries = [{"entry_index": 0, "entry_price": 1.0, "side": "LONG"}]
+
+        with pytest.raises(ValueError, match="Per-trade SL/TP"):
+            simulate_trades_batch(entries, price_data, use_jit=True)
+
+    def test_jit_path_optional(self, monkeypatch, random_market):
+        """Array API falls back to the vectorized path without numba."""
+        entries, price_data, indicators = random_market
+        valid = [e for e in entries if e["entry_index"] is not None]
+        trailing_config = TRAILING_CONFIGS[1]
+
+        structured = np.array(
+            [
+                (e["entry_index"], e["side"], e["entry_price"], e["stop_loss_pct"])
+                for e in valid
+            ],
+            dtype=[
+                ("entry_index", np.int64),
+                ("side", "U5"),
+                ("entry_price", np.float64),
+                ("stop_loss_pct", np.float64),
+            ],
+        )
+
+        outputs = []
+        for numba_available in (False, trade_sim_batch._NUMBA_AVAILABLE):
+            monkeypatch.setattr(trade_sim_batch, "_NUMBA_AVAILABLE", numba_available)
+            outputs.append(
+                simulate_trades_batch_jit(
+                    structured,
+                    price_data["high"].to_numpy(),
+                    price_data["low"].to_numpy(),
+                    price_data["close"].to_numpy(),
+                    take_profit_pct=0.002,
+                    trailing_config=trailing_config,
+                    indicators=indicators,
+                )
+            )
+
+        reference = simulate_trades_batch(
+            [dict(e, take_profit_pct=0.002) for e in valid],
+            price_data,
+            trailing_config=trailing_config,
+            indicators=indicators,
+            use_jit=False,
+        )
+        for out in outputs:
+            assert out["exit_index"].tolist() == [r["exit_index"] for r in reference]
+            assert out["exit_price"].tolist() == [r["exit_price"] for r in reference]
+            assert [EXIT_REASON_NAMES[c] for c in out["exit_reason"]] == [
+                r["exit_reason"] for r in reference
+            ]
+            np.testing.assert_allclose(
+                out["pnl"], [r["pnl"] for r in reference], rtol=0, atol=1e-15
+            )
+
+    @pytest.mark.parametrize("max_open", [1, 2])
+    @pytest.mark.parametrize(
+        "use_jit",
+        [False, pytest.param(True, marks=requires_numba)],
+        ids=["vectorized", "jit"],
+    )
+    def test_sequential_matches_simulate_then_filter(
+        self, random_market, max_open, use_jit
+    ):
+        """Skip-ahead acceptance equals simulating all entries then filtering."""
+        entries, price_data, indicators = random_market
+        trailing = TRAILING_CONFIGS[1]
+        full = simulate_trades_batch(
+            entries, price_data, trailing_config=trailing, indicators=indicators
+        )
+
+        expected = []
+        open_exits: list[int] = []
+        for entry, result in zip(entries, full):
+            if result["exit_index"] is None:
+                expected.append(result)
+                continue
+            open_exits = [x for x in open_exits if x > entry["entry_index"]]
+            if len(open_exits) < max_open:
+                open_exits.append(result["exit_index"])
+                expected.append(result)
+            else:
+                expected.append(None)
+
+        sequential = simulate_trades_sequential(
+            entries,
+            price_data,
+            max_open_positions=max_open,
+            trailing_config=trailing,
+            indicators=indicators,
+            use_jit=use_jit,
+        )
+
+        assert sum(r is None for r in expected) > 0
+        assert [r is None for r in sequential] == [r is None for r in expected]
+        for got, want in zip(sequential, expected):
+            if want is not None:
+                assert got["exit_index"] == want["exit_index"]
+                assert got["exit_price"] == want["exit_price"]
+                assert got["exit_reason"] == want["exit_reason"]
+                assert got["pnl"] == pytest.approx(want["pnl"], abs=1e-15)
+
+    def test_sequential_rejects_unsorted_entries(self):
+        """Sequential acceptance requires entries sorted by entry index."""
+        price_data = pd.DataFrame(
+            {"high": np.ones(5), "low": np.ones(5), "close": np.ones(5)}
+        )
+        entries = [
+            {
+                "entry_index": i,
+                "entry_price": 1.0,
+                "stop_loss_pct": 0.01,
+                "take_profit_pct": 0.01,
+            }
+            for i in (3, 1)
+        ]
+
+        with pytest.raises(ValueError, match="sorted"):
+            simulate_trades_sequential(entries, price_data, use_jit=False)
+
+    def test_jit_api_requires_sl_tp(self):
+        """Array API raises when SL/TP is neither per-trade nor global."""
+        structured = np.array(
+            [(0, 1, 1.0)],
+            dtype=[
+                ("entry_index", np.int64),
+                ("side", np.int8),
+                ("entry_price", np.float64),
+            ],
+        )
+        prices = np.ones(3)
+
+        with pytest.raises(ValueError, match="stop_loss_pct"):
+            simulate_trades_batch_jit(structured, prices, prices, prices)
+
+    def test_use_jit_without_numba_raises(self, monkeypatch):
+        """Forcing the JIT path without numba is an explicit error."""
+        monkeypatch.setattr(trade_sim_batch, "_NUMBA_AVAILABLE", False)
+        price_data = pd.DataFrame({"high": [1.0], "low": [1.0], "close": [1.0]})
+
+        with pytest.raises(RuntimeError, match="numba"):
+            simulate_trades_batch([], price_data, use_jit=True)
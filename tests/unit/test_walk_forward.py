@@ -0,0 +1,171 @@
+"""Unit tests for walk-forward optimization."""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from src.backtest import engine
+from src.backtest.indicator_cache import IndicatorCache
+from src.backtest.sweep import ParameterSet, PreloadedSweepData
+from src.backtest.walk_forward import (
+    WalkForwardConfig,
+    build_windows,
+    evaluate_combination,
+    run_walk_forward,
+)
+from src.cli.run_walk_forward import parse_range_args
+from src.config.parameters import StrategyParameters
+from src.models.enums import DirectionMode
+from src.strategy.trend_pullback.strategy import TREND_PULLBACK_STRATEGY
+
+START = datetime(2024, 1, 1)
+
+
+@pytest.fixture(name="data")
+def fixture_data():
+    """Twelve days of random-walk one-minute bars for one pair."""
+    rng = np.random.default_rng(0)
+    n_bars = 12 * 24 * 60
+    close = 1.1 + np.cumsum(rng.normal(0, 3e-4, n_bars))
+    frame = pl.DataFrame(
+        {
+            "timestamp_utc": pl.datetime_range(
+                START, START + timedelta(minutes=n_bars - 1), "1m", eager=True
+            ),
+            "open": np.r_[close[0], close[:-1]] + rng.normal(0, 1e-4, n_bars),
+            "high": close + np.abs(rng.normal(0, 3e-4, n_bars)),
+            "low": close - np.abs(rng.normal(0, 3e-4, n_bars)),
+            "close": close,
+            "volume": np.ones(n_bars),
+        }
+    )
+    return PreloadedSweepData(
+        frames={"EURUSD": frame},
+        indicator_caches={"EURUSD": IndicatorCache(dataset_id="EURUSD")},
+    )
+
+
+COMBINATIONS = [
+    ParameterSet(params={"fast_ema": {"period": period}}) for period in (10, 20, 30)
+]
+
+
+def test_window_layout():
+    """Sliding windows step by the test length; anchored ones expand."""
+    end = START + timedelta(days=10)
+    sliding = build_windows(START, end, WalkForwardConfig(train_days=4, test_days=2))
+    anchored = build_windows(
+        START, end, WalkForwardConfig(train_days=4, test_days=2, anchored=True)
+    )
+
+    assert [w.train_start.day for w in sliding] == [1, 3, 5, 7]
+    assert [w.test_start.day for w in sliding] == [5, 7, 9, 11]
+    assert all(w.train_end == w.test_start for w in sliding)
+    assert {w.train_start for w in anchored} == {START}
+    assert [w.test_start for w in anchored] == [w.test_start for w in sliding]
+    too_long = WalkForwardConfig(train_days=11, test_days=2)
+    assert build_windows(START, end, too_long) == []
+    with pytest.raises(ValueError):
+        WalkForwardConfig(train_days=0, test_days=2)
+
+
+def test_fold_step_must_tile_test_windows():
+    """Overlapping or gapped test windows cannot be stitched, so are rejected."""
+    with pytest.raises(ValueError, match="step_days"):
+        WalkForwardConfig(train_days=4, test_days=2, step_days=1)  # overlap
+    with pytest.raises(ValueError, match="step_days"):
+        WalkForwardConfig(train_days=4, test_days=2, step_days=3)  # gaps
+
+    config = WalkForwardConfig(train_days=4, test_days=2, step_days=2)
+    windows = build_windows(START, START + timedelta(days=10), config)
+    assert all(a.test_end == b.test_start for a, b in zip(windows, windows[1:]))
+
+
+def test_windows_slice_full_history_signals(data):
+    """Window runs trade exactly the full-history signals inside the window."""
+    window = build_windows(
+        START, START + timedelta(days=12), WalkForwardConfig(train_days=6, test_days=3)
+    )[1]
+    params = StrategyParameters()
+    enriched = engine.enrich_symbol_data(
+        data.frames["EURUSD"], TREND_PULLBACK_STRATEGY, params
+    )
+    batch = engine.generate_pair_signals(
+        "EURUSD",
+        enriched,
+        TREND_PULLBACK_STRATEGY,
+        "trend-pullback",
+        params,
+        DirectionMode.LONG,
+        use_gpu=False,
+    )
+    in_test = batch.filter(
+        (batch.timestamps >= window.test_start) & (batch.timestamps < window.test_end)
+    )
+    lo = enriched["timestamp_utc"].search_sorted(window.test_start)
+    windowed = batch.window(lo, lo + 3 * 24 * 60)
+
+    assert len(windowed) == len(in_test) > 0
+    assert np.array_equal(windowed.ids, in_test.ids)
+    assert np.array_equal(windowed.indices + lo, in_test.indices)
+
+    runs = evaluate_combination(ParameterSet(params={}), data, [window])
+    _, test = runs[window.fold]
+    assert test.result.error is None
+    assert 0 < test.result.trade_count <= len(in_test)
+    assert test.equity_ns[0] >= np.datetime64(window.test_start, "ns").astype(np.int64)
+
+
+def test_walk_forward_selects_and_stitches(data):
+    """Winners maximize train Sharpe and OOS equity chains fold to fold."""
+    config = WalkForwardConfig(train_days=6, test_days=2)
+    result = run_walk_forward(
+        COMBINATIONS, ["EURUSD"], config, sequential=True, data=data
+    )
+    windows = [fold.window for fold in result.folds]
+    per_combination = [evaluate_combination(c, data, windows) for c in COMBINATIONS]
+
+    assert len(result.folds) == 3
+    for fold in result.folds:
+        sharpes = [
+            runs[fold.window.fold][0].result.sharpe_ratio for runs in per_combination
+        ]
+        assert fold.best_params == COMBINATIONS[int(np.argmax(sharpes))]
+        assert fold.train_result.sharpe_ratio == max(sharpes)
+
+    equity = result.oos_equity
+    assert equity["equity"][0] == config.starting_equity
+    assert equity["timestamp_utc"].is_sorted()
+    for k in range(1, len(result.folds)):
+        # Each fold starts at the equity the previous fold ended with
+        assert equity.filter(pl.col("fold") == k)["equity"][0] == pytest.approx(
+            equity.filter(pl.col("fold") == k - 1)["equity"][-1]
+        )
+    assert result.oos_summary.trade_count == sum(
+        f.test_result.trade_count for f in result.folds
+    )
+    assert result.oos_summary.total_pnl == pytest.approx(
+        equity["equity"][-1] - config.starting_equity
+    )
+
+    (stability,) = result.parameter_stability
+    assert stability.name == "fast_ema.period"
+    assert stability.values == [
+        f.best_params.params["fast_ema"]["period"] for f in result.folds
+    ]
+
+
+def test_parse_range_args():
+    """CLI ranges parse into ParameterRange objects."""
+    fast, mult = parse_range_args(["fast_ema.period=10-20 step 5", "atr.mult=1.5"])
+
+    assert (fast.indicator_name, fast.param_name, fast.values) == (
+        "fast_ema",
+        "period",
+        [10, 15, 20],
+    )
+    assert mult.values == [1.5]
+    with pytest.raises(ValueError):
+        parse_range_args(["fast_ema=10"])